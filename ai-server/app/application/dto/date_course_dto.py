@@ -48,3 +48,37 @@ class RecommendDateCourseResponse(BaseModel):
     courses: List[DateCourseDTO]
     count: int
 
+
+class FetchTimingDTO(BaseModel):
+    """데이터 소스 조회 결과 DTO"""
+    source: str
+    status: str = Field(description="ok, timeout, error, skipped(다른 경로 결과가 충분해 취소됨)")
+    elapsed_ms: float
+    item_count: int
+
+
+class RecommendStreamSummaryDTO(BaseModel):
+    """스트리밍 추천 마지막 요약 프레임 DTO"""
+    count: int
+    sources: List[FetchTimingDTO]
+
+
+class BatchRecommendDateCourseRequest(BaseModel):
+    """데이트코스 일괄 추천 요청 DTO"""
+    preferences: List[PreferenceDTO] = Field(min_length=1, description="선호도 리스트")
+
+
+class BatchRecommendItemDTO(BaseModel):
+    """일괄 추천 항목별 결과 DTO (성공 시 courses, 실패 시 error)"""
+    index: int = Field(description="요청 preferences 내 위치")
+    status_code: int = Field(description="항목 처리 결과 (200, 400, 500)")
+    courses: List[DateCourseDTO] = []
+    count: int = 0
+    error: Optional[str] = None
+
+
+class BatchRecommendDateCourseResponse(BaseModel):
+    """데이트코스 일괄 추천 응답 DTO"""
+    results: List[BatchRecommendItemDTO]
+    succeeded: int
+    failed: int
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from app.domain.entities.date_course import DateCourse
+from app.domain.value_objects.preference import Preference
+
+
+class RecommendationResultCache(ABC):
+    """선호도별 추천 결과 캐시 인터페이스"""
+
+    @abstractmethod
+    async def get(self, preference: Preference) -> Optional[List[DateCourse]]:
+        """캐시된 추천 결과 (없으면 None)"""
+        pass
+
+    @abstractmethod
+    async def set(self, preference: Preference, courses: List[DateCourse]) -> None:
+        """추천 결과 저장"""
+        pass
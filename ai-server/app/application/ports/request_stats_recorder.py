@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from app.domain.value_objects.preference import Preference
+
+
+class RequestStatsRecorder(ABC):
+    """추천 요청 통계 기록 인터페이스 (프리페치 대상 선정용)"""
+
+    @abstractmethod
+    def record(self, preference: Preference) -> None:
+        """추천 요청 하나 기록"""
+        pass
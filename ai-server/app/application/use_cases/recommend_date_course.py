@@ -1,8 +1,11 @@
-from typing import List
+from typing import AsyncIterator, List, Optional
 from app.domain.entities.date_course import DateCourse
 from app.domain.value_objects.preference import Preference
+from app.domain.value_objects.fetch_timing import FetchTiming
 from app.domain.repositories.date_course_repository import DateCourseRepository
 from app.domain.services.ai_service import AIService
+from app.application.ports.recommendation_result_cache import RecommendationResultCache
+from app.application.ports.request_stats_recorder import RequestStatsRecorder
 
 
 class RecommendDateCourseUseCase:
@@ -11,29 +14,96 @@ class RecommendDateCourseUseCase:
     def __init__(
         self,
         date_course_repository: DateCourseRepository,
-        ai_service: AIService
+        ai_service: AIService,
+        recommendation_cache: Optional[RecommendationResultCache] = None,
+        request_stats: Optional[RequestStatsRecorder] = None
     ):
         self._date_course_repository = date_course_repository
         self._ai_service = ai_service
+        self._recommendation_cache = recommendation_cache
+        self._request_stats = request_stats
 
-    async def execute(self, preference: Preference) -> List[DateCourse]:
+    async def execute(
+        self,
+        preference: Preference,
+        timings: Optional[List[FetchTiming]] = None
+    ) -> List[DateCourse]:
         """
         선호도 기반 데이트코스 추천 실행
         
         Args:
             preference: 사용자 선호도
+            timings: 외부 데이터 소스별 조회 시간을 수집할 리스트 (선택)
             
         Returns:
             추천된 데이트코스 리스트
         """
+        # 캐시 키와 실제 추천이 같은 선호도 값을 쓰도록 정규화
+        preference = preference.canonical()
+
+        # 백그라운드 프리페치 대상 선정을 위한 요청 통계
+        if self._request_stats is not None:
+            self._request_stats.record(preference)
+
+        # 동일한 선호도의 추천 결과가 캐시되어 있으면 바로 반환
+        if self._recommendation_cache is not None:
+            cached_courses = await self._recommendation_cache.get(preference)
+            if cached_courses is not None:
+                return cached_courses
+
         # 기존 데이트코스 조회
         existing_courses = await self._date_course_repository.find_by_preference(preference)
         
         # AI 서비스를 통한 추천
+        fetch_timings: List[FetchTiming] = []
         recommended_courses = await self._ai_service.recommend_date_courses(
             preference=preference,
-            existing_courses=existing_courses
+            existing_courses=existing_courses,
+            timings=fetch_timings
         )
+        if timings is not None:
+            timings.extend(fetch_timings)
+
+        # 일부 소스나 추천 경로(실제 데이터/OpenAI)가 마감 시간을 넘기거나 실패한 부분 결과는 캐시하지 않음
+        if self._recommendation_cache is not None and all(t.complete for t in fetch_timings):
+            await self._recommendation_cache.set(preference, recommended_courses)
         
         return recommended_courses
 
+    async def execute_stream(
+        self,
+        preference: Preference,
+        timings: Optional[List[FetchTiming]] = None
+    ) -> AsyncIterator[List[DateCourse]]:
+        """
+        선호도 기반 데이트코스 추천을 소스가 응답하는 대로 나눠서 반환
+
+        캐시된 결과가 있으면 한 번에 반환. 스트리밍 결과는 소스 응답 순서라
+        execute 결과와 순서가 다를 수 있으므로 추천 캐시에 저장하지 않음
+
+        Args:
+            preference: 사용자 선호도
+            timings: 외부 데이터 소스별 조회 시간을 수집할 리스트 (선택)
+
+        Yields:
+            추천된 데이트코스 묶음
+        """
+        preference = preference.canonical()
+
+        if self._request_stats is not None:
+            self._request_stats.record(preference)
+
+        if self._recommendation_cache is not None:
+            cached_courses = await self._recommendation_cache.get(preference)
+            if cached_courses is not None:
+                yield cached_courses
+                return
+
+        existing_courses = await self._date_course_repository.find_by_preference(preference)
+
+        async for courses in self._ai_service.stream_date_courses(
+            preference=preference,
+            existing_courses=existing_courses,
+            timings=timings
+        ):
+            yield courses
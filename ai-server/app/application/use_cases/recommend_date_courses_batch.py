@@ -0,0 +1,68 @@
+import asyncio
+import os
+from typing import Dict, List, Optional, Union
+from app.domain.entities.date_course import DateCourse
+from app.domain.value_objects.preference import Preference
+from app.application.use_cases.recommend_date_course import RecommendDateCourseUseCase
+
+
+class RecommendDateCoursesBatchUseCase:
+    """여러 선호도에 대한 데이트코스 일괄 추천 유스케이스"""
+
+    def __init__(
+        self,
+        recommend_use_case: RecommendDateCourseUseCase,
+        max_concurrency: Optional[int] = None,
+        max_size: Optional[int] = None
+    ):
+        self._recommend_use_case = recommend_use_case
+        self.max_concurrency = max_concurrency or int(os.getenv("RECOMMEND_BATCH_CONCURRENCY", "4"))
+        self.max_size = max_size or int(os.getenv("RECOMMEND_BATCH_MAX_SIZE", "20"))
+
+    def check_size(self, count: int) -> None:
+        """
+        요청 항목 수 검증 (변환에 실패한 항목도 포함해 검사하도록 호출자가 먼저 확인)
+
+        Raises:
+            ValueError: 항목이 없거나 max_size를 넘음
+        """
+        if count <= 0:
+            raise ValueError("추천 요청이 비어 있습니다.")
+        if count > self.max_size:
+            raise ValueError(f"한 번에 최대 {self.max_size}개까지 추천할 수 있습니다.")
+
+    async def execute(
+        self,
+        preferences: List[Preference]
+    ) -> List[Union[List[DateCourse], Exception]]:
+        """
+        여러 선호도 추천을 동시에 실행
+
+        정규화 키가 같은 선호도는 한 번만 추천하고, 서로 다른 선호도가 공유하는
+        외부 조회(같은 지역의 카페 등)는 서비스의 single-flight/캐시로 합쳐짐
+
+        Args:
+            preferences: 사용자 선호도 리스트
+
+        Returns:
+            입력 순서대로 추천된 데이트코스 리스트 또는 해당 항목의 예외
+        """
+        self.check_size(len(preferences))
+
+        keys = [preference.canonical_key() for preference in preferences]
+        unique: Dict[str, Preference] = {}
+        for key, preference in zip(keys, preferences):
+            unique.setdefault(key, preference)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(preference: Preference) -> List[DateCourse]:
+            async with semaphore:
+                return await self._recommend_use_case.execute(preference)
+
+        outcomes = await asyncio.gather(
+            *(run(preference) for preference in unique.values()),
+            return_exceptions=True
+        )
+        by_key = dict(zip(unique, outcomes))
+        return [by_key[key] for key in keys]
@@ -1,32 +1,86 @@
 """
 의존성 주입 설정
 """
+import os
 from functools import lru_cache
+from typing import Optional
 from app.domain.repositories.date_course_repository import DateCourseRepository
 from app.domain.services.ai_service import AIService
 from app.infrastructure.repositories.in_memory_date_course_repository import InMemoryDateCourseRepository
+from app.infrastructure.repositories.sqlite_date_course_repository import SqliteDateCourseRepository
+from app.infrastructure.http.pooled_http_client import PooledHttpClient
+from app.infrastructure.cache.tiered_cache import TieredCache
+from app.infrastructure.cache.recommendation_cache import RecommendationCache
+from app.infrastructure.cache.completion_cache import CompletionCache
+from app.infrastructure.catalog.place_catalog import PlaceCatalog
+from app.infrastructure.catalog.culture_store import CultureStore
+from app.infrastructure.observability.metrics import (
+    MetricsRegistry,
+    REGISTRY,
+    cache_stats_collector,
+    circuit_breaker_collector,
+)
 from app.infrastructure.services.openai_service import OpenAIService
 from app.infrastructure.services.culture_service import CultureService
 from app.infrastructure.services.place_service import PlaceService
+from app.infrastructure.prefetch.request_stats import RequestStatsTracker
+from app.infrastructure.prefetch.prefetch_scheduler import PrefetchScheduler
 from app.application.use_cases.recommend_date_course import RecommendDateCourseUseCase
+from app.application.use_cases.recommend_date_courses_batch import RecommendDateCoursesBatchUseCase
+from app.presentation.responses.fast_json_response import ResponseBodyCache
 
 
 @lru_cache()
 def get_date_course_repository() -> DateCourseRepository:
-    """데이트코스 저장소 의존성"""
+    """데이트코스 저장소 의존성 (DATE_COURSE_REPOSITORY=sqlite면 DATE_COURSE_DB_PATH 파일에 영구 저장)"""
+    backend = os.getenv("DATE_COURSE_REPOSITORY", "memory").lower().strip()
+    if backend == "sqlite":
+        return SqliteDateCourseRepository(os.getenv("DATE_COURSE_DB_PATH", "date_courses.db"))
+    if backend != "memory":
+        raise ValueError(f"지원하지 않는 DATE_COURSE_REPOSITORY 값입니다: {backend}")
     return InMemoryDateCourseRepository()
 
 
+@lru_cache()
+def get_http_client() -> PooledHttpClient:
+    """공유 HTTP 커넥션 풀 의존성 (FastAPI 시작/종료 시 열고 닫음)"""
+    return PooledHttpClient()
+
+
+@lru_cache()
+def get_upstream_cache() -> TieredCache:
+    """외부 API 응답 캐시 의존성 (L1 LRU + L2 Redis, REDIS_URL 미설정 시 L1만 사용)"""
+    return TieredCache()
+
+
+@lru_cache()
+def get_culture_store() -> Optional[CultureStore]:
+    """전시/공연 로컬 저장소 의존성 (CULTURE_STORE_PATH 미설정 시 공공데이터포털 직접 조회)"""
+    path = os.getenv("CULTURE_STORE_PATH", "")
+    if not path:
+        return None
+    return CultureStore(path)
+
+
 @lru_cache()
 def get_culture_service() -> CultureService:
     """문화 데이터 서비스 의존성"""
-    return CultureService()
+    return CultureService(http_client=get_http_client(), cache=get_upstream_cache(), store=get_culture_store())
 
 
 @lru_cache()
 def get_place_service() -> PlaceService:
     """장소 데이터 서비스 의존성"""
-    return PlaceService()
+    return PlaceService(http_client=get_http_client(), cache=get_upstream_cache())
+
+
+@lru_cache()
+def get_place_catalog() -> Optional[PlaceCatalog]:
+    """장소 카탈로그 의존성 (PLACE_CATALOG_PATH 미설정 시 내장 데이터 사용)"""
+    path = os.getenv("PLACE_CATALOG_PATH", "")
+    if not path:
+        return None
+    return PlaceCatalog.open(path)
 
 
 @lru_cache()
@@ -34,7 +88,43 @@ def get_ai_service() -> AIService:
     """AI 서비스 의존성"""
     return OpenAIService(
         culture_service=get_culture_service(),
-        place_service=get_place_service()
+        place_service=get_place_service(),
+        place_catalog=get_place_catalog(),
+        completion_cache=CompletionCache(l2=get_upstream_cache().l2)
+    )
+
+
+@lru_cache()
+def get_recommendation_cache() -> Optional[RecommendationCache]:
+    """
+    추천 결과 캐시 의존성 (저장소 데이터가 바뀌면 Redis 세대 번호로 모든 워커에서 무효화)
+
+    Redis 없이 여러 워커가 실행되면 다른 워커의 저장을 알 수 없으므로 사용하지 않음
+    """
+    l2 = get_upstream_cache().l2
+    if int(os.getenv("WEB_CONCURRENCY", "1")) > 1 and not l2.enabled:
+        return None
+    cache = RecommendationCache(l2=l2)
+    get_date_course_repository().add_change_listener(cache.invalidate)
+    return cache
+
+
+@lru_cache()
+def get_request_stats() -> RequestStatsTracker:
+    """최근 추천 요청 (지역, 관심사, 날짜) 통계 의존성"""
+    return RequestStatsTracker()
+
+
+@lru_cache()
+def get_prefetch_scheduler() -> PrefetchScheduler:
+    """인기 조합 캐시 프리페치 스케줄러 의존성 (FastAPI 시작/종료 시 실행/중지)"""
+    ai_service = get_ai_service()
+    return PrefetchScheduler(
+        ai_service=ai_service,
+        stats=get_request_stats(),
+        breakers=get_http_client().breakers,
+        store=get_upstream_cache().l2,
+        hot_locations=list(ai_service.places_db.keys())
     )
 
 
@@ -43,5 +133,39 @@ def get_recommend_date_course_use_case() -> RecommendDateCourseUseCase:
     """데이트코스 추천 유스케이스 의존성"""
     repository = get_date_course_repository()
     ai_service = get_ai_service()
-    return RecommendDateCourseUseCase(repository, ai_service)
+    return RecommendDateCourseUseCase(
+        repository,
+        ai_service,
+        get_recommendation_cache(),
+        get_request_stats()
+    )
 
+
+@lru_cache()
+def get_recommend_date_courses_batch_use_case() -> RecommendDateCoursesBatchUseCase:
+    """데이트코스 일괄 추천 유스케이스 의존성"""
+    return RecommendDateCoursesBatchUseCase(get_recommend_date_course_use_case())
+
+
+@lru_cache()
+def get_culture_response_cache() -> ResponseBodyCache:
+    """문화 API 응답 본문 캐시 의존성 (직렬화된 bytes + ETag, 워커 간 공유는 Redis)"""
+    return ResponseBodyCache(l2=get_upstream_cache().l2)
+
+
+@lru_cache()
+def get_metrics_registry() -> MetricsRegistry:
+    """메트릭 레지스트리 의존성 (캐시 통계를 /metrics 수집 시점에 읽어오도록 등록)"""
+    upstream_cache = get_upstream_cache()
+    recommendation_cache = get_recommendation_cache()
+    culture_response_cache = get_culture_response_cache()
+    REGISTRY.register_collector(cache_stats_collector({
+        "upstream": lambda: {"tiered": upstream_cache.stats()},
+        "culture": get_culture_service().cache_stats,
+        "culture_http": lambda: {"responses": culture_response_cache.stats()},
+        "place": get_place_service().cache_stats,
+        "recommendation": lambda: {"results": recommendation_cache.stats()} if recommendation_cache else {},
+        "openai": get_ai_service().cache_stats,
+    }))
+    REGISTRY.register_collector(circuit_breaker_collector(get_http_client().breakers.snapshot))
+    return REGISTRY
@@ -3,9 +3,9 @@ from typing import List, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class DateCourse:
-    """데이트코스 도메인 엔티티"""
+    """데이트코스 도메인 엔티티 (__slots__로 인스턴스별 __dict__ 없이 저장)"""
     id: Optional[str]
     title: str
     description: str
@@ -23,4 +23,6 @@ class DateCourse:
             raise ValueError("평점은 0~5 사이여야 합니다.")
         if self.duration <= 0:
             raise ValueError("소요 시간은 0보다 커야 합니다.")
+        # 정수 평점(예: 4)도 응답 JSON에서 항상 실수(4.0)로 나가도록 정규화
+        self.rating = float(self.rating)
 
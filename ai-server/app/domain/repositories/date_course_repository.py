@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+import inspect
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Union
 from app.domain.entities.date_course import DateCourse
 from app.domain.value_objects.preference import Preference
 
@@ -7,6 +8,23 @@ from app.domain.value_objects.preference import Preference
 class DateCourseRepository(ABC):
     """데이트코스 저장소 인터페이스"""
 
+    def __init__(self):
+        self._change_listeners: List[Callable[[], Union[None, Awaitable[None]]]] = []
+
+    def add_change_listener(self, listener: Callable[[], Union[None, Awaitable[None]]]) -> None:
+        """저장소 데이터 변경 시 호출할 콜백 등록 (캐시 무효화 등, 코루틴 함수면 저장이 끝나기 전에 await)"""
+        self._change_listeners.append(listener)
+
+    async def _notify_changed(self) -> None:
+        for listener in self._change_listeners:
+            result = listener()
+            if inspect.isawaitable(result):
+                await result
+
+    def close(self) -> None:
+        """저장소가 가진 연결 등 자원 반납 (애플리케이션 종료 시 호출, 반납할 자원이 없으면 아무것도 하지 않음)"""
+        pass
+
     @abstractmethod
     async def find_by_id(self, course_id: str) -> Optional[DateCourse]:
         """ID로 데이트코스 조회"""
@@ -27,3 +45,11 @@ class DateCourseRepository(ABC):
         """데이트코스 저장"""
         pass
 
+    async def save_many(self, courses: List[DateCourse]) -> List[DateCourse]:
+        """여러 데이트코스 저장 (구현체는 한 번의 배치로 처리하도록 재정의)"""
+        return [await self.save(course) for course in courses]
+
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[DateCourse]:
+        """모든 데이트코스를 순서대로 하나씩 조회 (구현체는 전체를 메모리에 올리지 않도록 재정의)"""
+        for course in await self.find_all():
+            yield course
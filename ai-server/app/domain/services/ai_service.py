@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List, Optional
 from app.domain.entities.date_course import DateCourse
 from app.domain.value_objects.preference import Preference
+from app.domain.value_objects.fetch_timing import FetchTiming
 
 
 class AIService(ABC):
@@ -11,8 +12,25 @@ class AIService(ABC):
     async def recommend_date_courses(
         self, 
         preference: Preference,
-        existing_courses: List[DateCourse]
+        existing_courses: List[DateCourse],
+        timings: Optional[List[FetchTiming]] = None
     ) -> List[DateCourse]:
-        """선호도 기반 데이트코스 추천"""
+        """선호도 기반 데이트코스 추천 (timings가 주어지면 소스별/추천 경로별 조회 시간을 추가)"""
         pass
 
+    async def stream_date_courses(
+        self,
+        preference: Preference,
+        existing_courses: List[DateCourse],
+        timings: Optional[List[FetchTiming]] = None
+    ) -> AsyncIterator[List[DateCourse]]:
+        """
+        추천 코스를 준비되는 대로 나눠서 내보내는 스트리밍 추천
+
+        기본 구현은 recommend_date_courses 결과를 한 번에 내보냄
+        """
+        yield await self.recommend_date_courses(preference, existing_courses, timings)
+
+    async def aclose(self) -> None:
+        """외부 연결 정리 (기본 구현은 정리할 자원 없음)"""
+        pass
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FetchTiming:
+    """외부 데이터 소스 조회 결과 값 객체"""
+    source: str  # 조회 소스 이름 ("영화", "전시회", "카페" 등)
+    elapsed_ms: float  # 조회 소요 시간(ms)
+    status: str  # "ok", "timeout", "error", "skipped"(다른 경로 결과가 충분해 취소됨)
+    item_count: int = 0  # 조회된 항목 수
+
+    def __post_init__(self):
+        if self.status not in ["ok", "timeout", "error", "skipped"]:
+            raise ValueError("상태는 'ok', 'timeout', 'error', 'skipped' 중 하나여야 합니다.")
+
+    @property
+    def complete(self) -> bool:
+        """결과가 빠짐없이 반영됐는지 (마감 초과/실패가 아님)"""
+        return self.status in ("ok", "skipped")
@@ -1,3 +1,4 @@
+import hashlib
 from dataclasses import dataclass
 from typing import List, Optional, Dict
 
@@ -19,3 +20,55 @@ class Preference:
         if not self.time_of_day:
             raise ValueError("시간대는 필수입니다.")
 
+    def canonical(self) -> "Preference":
+        """
+        결과에 영향이 없는 차이만 정규화한 선호도 (지역명 공백, 세부 옵션 딕셔너리 키 순서, 빈 세부 옵션)
+
+        관심사 순서는 코스 순서를, 세부 옵션 순서는 조회 조건(첫 번째 옵션)과 설명을 바꾸므로 그대로 유지
+        """
+        details = {
+            interest: list(options)
+            for interest, options in sorted((self.interest_details or {}).items())
+            if options
+        }
+        return Preference(
+            budget=self.budget,
+            location=" ".join(self.location.split()),
+            interests=list(self.interests),
+            date=self.date,
+            time_of_day=self.time_of_day,
+            interest_details=details or None,
+            weather=self.weather
+        )
+
+    def canonical_for_prompt(self) -> "Preference":
+        """
+        OpenAI 프롬프트용 정규화 선호도 (canonical()에 더해 관심사를 정렬)
+
+        프롬프트는 관심사를 나열만 하고 코스 순서를 정하지 않으므로, 관심사 순서만 다른 요청이
+        같은 프롬프트(같은 응답 캐시 항목)를 쓰도록 함. 세부 옵션은 관심사 이름순
+        """
+        canonical = self.canonical()
+        return Preference(
+            budget=canonical.budget,
+            location=canonical.location,
+            interests=sorted(canonical.interests),
+            date=canonical.date,
+            time_of_day=canonical.time_of_day,
+            interest_details=canonical.interest_details,
+            weather=canonical.weather
+        )
+
+    def canonical_key(self) -> str:
+        """canonical()이 같은 선호도끼리 같은 해시 키"""
+        canonical = self.canonical()
+        parts = (
+            canonical.budget,
+            canonical.location,
+            tuple(canonical.interests),
+            tuple((interest, tuple(options)) for interest, options in (canonical.interest_details or {}).items()),
+            canonical.date,
+            canonical.time_of_day,
+            canonical.weather,
+        )
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
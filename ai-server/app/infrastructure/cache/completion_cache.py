@@ -0,0 +1,130 @@
+import asyncio
+import hashlib
+import json
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional
+from app.infrastructure.cache.memory_cache import LRUMemoryCache, MISSING
+from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.cache.single_flight import SingleFlight
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    """
+    LLM 채팅 완성 응답 캐시 (프로세스 내 LRU + Redis, 크기 제한 + TTL)
+
+    (모델, 시스템 프롬프트, 프롬프트 해시, temperature)가 같으면 응답 본문을 재사용하고,
+    같은 워커의 동시 요청은 하나의 API 호출로 합침 (스트리밍 요청은 stream_flight로 합침).
+    Redis를 사용할 수 있으면 다른 워커가 받은 응답도 재사용. 빈 응답과 예외는 캐시하지 않음
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        l2: Optional[RedisCache] = None
+    ):
+        self.ttl = ttl or float(os.getenv("OPENAI_COMPLETION_CACHE_TTL", "3600"))
+        self._cache = LRUMemoryCache(max_size or int(os.getenv("OPENAI_COMPLETION_CACHE_MAX_SIZE", "256")))
+        self.l2 = l2 or RedisCache()
+        self.l2_hits = 0
+        self._single_flight = SingleFlight()
+        # 키 → 진행 중인 스트리밍 요청이 끝나면 완료되는 Future
+        self._streams: Dict[str, asyncio.Future] = {}
+        self.stream_shared = 0
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, prompt: str, temperature: float) -> str:
+        return _sha256(json.dumps([model, _sha256(system_prompt), _sha256(prompt), temperature]))
+
+    async def get(self, model: str, system_prompt: str, prompt: str, temperature: float) -> Optional[str]:
+        """캐시된 응답 본문 조회 (없으면 None)"""
+        return await self._lookup(self.make_key(model, system_prompt, prompt, temperature))
+
+    async def set(self, model: str, system_prompt: str, prompt: str, temperature: float, content: str) -> None:
+        """응답 본문 저장 (스트리밍처럼 get_or_create를 쓸 수 없는 호출용, 빈 응답은 무시)"""
+        if content:
+            await self._store(self.make_key(model, system_prompt, prompt, temperature), content)
+
+    async def get_or_create(
+        self,
+        model: str,
+        system_prompt: str,
+        prompt: str,
+        temperature: float,
+        create: Callable[[], Awaitable[str]]
+    ) -> str:
+        """캐시된 응답 본문 반환, 없으면 create()로 요청 후 저장"""
+        key = self.make_key(model, system_prompt, prompt, temperature)
+        content = await self._lookup(key)
+        if content is not None:
+            return content
+        return await self._single_flight.do(key, lambda: self._create(key, create))
+
+    async def _create(self, key: str, create: Callable[[], Awaitable[str]]) -> str:
+        content = await create()
+        if content:
+            await self._store(key, content)
+        return content
+
+    async def _lookup(self, key: str) -> Optional[str]:
+        """L1, 없으면 L2(다른 워커가 저장한 응답) 조회"""
+        content = self._cache.get(key)
+        if content is not MISSING:
+            return content
+        data = await self.l2.get(f"completion:{key}")
+        if data is None:
+            return None
+        content = data.decode("utf-8")
+        self.l2_hits += 1
+        self._cache.set(key, content, self.ttl)
+        return content
+
+    async def _store(self, key: str, content: str) -> None:
+        self._cache.set(key, content, self.ttl)
+        await self.l2.set(f"completion:{key}", content.encode("utf-8"), self.ttl)
+
+    @asynccontextmanager
+    async def stream_flight(
+        self,
+        model: str,
+        system_prompt: str,
+        prompt: str,
+        temperature: float
+    ) -> AsyncIterator[bool]:
+        """
+        같은 키의 동시 스트리밍 요청을 하나로 합침
+
+        진행 중인 요청이 없으면 True(리더: 블록 안에서 스트리밍하고 set으로 저장)를,
+        있으면 그 요청이 끝날 때까지 기다린 뒤 False(get으로 저장된 결과 확인)를 내줌
+        """
+        key = self.make_key(model, system_prompt, prompt, temperature)
+        leader = self._streams.get(key)
+        if leader is not None:
+            self.stream_shared += 1
+            await asyncio.shield(leader)
+            yield False
+            return
+
+        done = asyncio.get_running_loop().create_future()
+        self._streams[key] = done
+        try:
+            yield True
+        finally:
+            del self._streams[key]
+            done.set_result(None)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            **self._cache.stats(),
+            "l2_hits": self.l2_hits,
+            "shared": self._single_flight.shared,
+            "stream_shared": self.stream_shared,
+        }
@@ -0,0 +1,33 @@
+import os
+from typing import Optional
+from app.infrastructure.cache.redis_cache import RedisCache
+
+
+class DistributedLock:
+    """
+    Redis SET NX 기반 워커(프로세스) 간 락
+
+    락은 ttl이 지나면 저절로 풀리고, release는 자신이 잡은 락만 해제함.
+    Redis를 사용할 수 없으면 단일 프로세스로 보고 항상 획득 성공으로 처리
+    """
+
+    def __init__(self, store: Optional[RedisCache], name: str, ttl: float):
+        self.store = store
+        self.name = f"lock:{name}"
+        self.ttl = ttl
+        self._token = f"{os.getpid()}:{os.urandom(8).hex()}".encode("ascii")
+        self._held = False
+
+    async def acquire(self) -> bool:
+        """락 획득 시도 (기다리지 않음)"""
+        if self.store is None:
+            return True
+        acquired = await self.store.add(self.name, self._token, self.ttl)
+        self._held = acquired is True
+        return acquired is not False
+
+    async def release(self) -> None:
+        """획득한 락 해제"""
+        if self._held:
+            self._held = False
+            await self.store.delete_if_equal(self.name, self._token)
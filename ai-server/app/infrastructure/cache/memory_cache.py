@@ -0,0 +1,67 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# 캐시에 값이 없음을 나타내는 표식 (None도 캐시 가능한 값이므로 별도 사용)
+MISSING = object()
+
+
+class LRUMemoryCache:
+    """크기 제한과 항목별 TTL을 가진 프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_size: int = 1024):
+        if max_size <= 0:
+            raise ValueError("캐시 크기는 0보다 커야 합니다.")
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        """값 조회 (없거나 만료되면 MISSING)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISSING
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """값 저장 (ttl초 후 만료, 용량 초과 시 가장 오래 쓰지 않은 항목 제거)"""
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def ttl_remaining(self, key: Hashable) -> Optional[float]:
+        """남은 TTL(초) 조회 (없거나 만료되면 None, hit/miss 통계와 LRU 순서에 영향 없음)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        remaining = entry[1] - time.monotonic()
+        return remaining if remaining > 0 else None
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
@@ -0,0 +1,100 @@
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+from app.application.ports.recommendation_result_cache import RecommendationResultCache
+from app.domain.entities.date_course import DateCourse
+from app.domain.value_objects.preference import Preference
+from app.infrastructure.cache.memory_cache import LRUMemoryCache, MISSING
+from app.infrastructure.cache.redis_cache import RedisCache
+
+logger = logging.getLogger(__name__)
+
+# 저장소가 바뀔 때마다 증가시키는 워커 공용 세대 번호 (이전 세대 항목은 TTL로 만료)
+_VERSION_KEY = "recommendation:version"
+
+
+def encode_courses(courses: List[DateCourse]) -> bytes:
+    """코스 목록을 필드 순서대로 나열한 JSON 배열로 인코딩"""
+    return json.dumps([
+        [c.id, c.title, c.description, c.location, c.category, c.duration, c.price_range,
+         c.tags, c.rating, c.created_at.isoformat(), c.updated_at.isoformat()]
+        for c in courses
+    ], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_courses(data: bytes) -> List[DateCourse]:
+    """encode_courses로 인코딩한 코스 목록 복원"""
+    return [
+        DateCourse(*row[:9], datetime.fromisoformat(row[9]), datetime.fromisoformat(row[10]))
+        for row in json.loads(data)
+    ]
+
+
+class RecommendationCache(RecommendationResultCache):
+    """
+    정규화된 선호도 키 기반 추천 결과 캐시 (프로세스 내 LRU + Redis, 크기 제한 + TTL)
+
+    Redis를 사용할 수 있으면 결과를 워커 간에 공유하고, 저장소 변경 시 Redis의 세대 번호를 올려
+    모든 워커의 기존 항목을 무효화함. Redis가 없거나 장애 중이면 이 프로세스의 LRU만 사용
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        l2: Optional[RedisCache] = None
+    ):
+        self.ttl = ttl or float(os.getenv("RECOMMENDATION_CACHE_TTL", "300"))
+        self._cache = LRUMemoryCache(max_size or int(os.getenv("RECOMMENDATION_CACHE_MAX_SIZE", "512")))
+        self.l2 = l2 or RedisCache()
+        self.l2_hits = 0
+        self.invalidations = 0
+
+    async def get(self, preference: Preference) -> Optional[List[DateCourse]]:
+        """캐시된 추천 결과 (없거나 다른 워커가 무효화한 세대의 결과면 None)"""
+        key = preference.canonical_key()
+        version = await self._version()
+        entry = self._cache.get(key)
+        if entry is not MISSING and entry[0] == version:
+            return list(entry[1])
+        if version is None:
+            return None
+
+        data = await self.l2.get(f"recommendation:{version}:{key}")
+        if data is None:
+            return None
+        try:
+            courses = decode_courses(data)
+        except (ValueError, TypeError) as e:
+            logger.warning("추천 캐시 값 복원 실패 (%s): %s", key, e)
+            return None
+        self.l2_hits += 1
+        self._cache.set(key, (version, courses), self.ttl)
+        return list(courses)
+
+    async def set(self, preference: Preference, courses: List[DateCourse]) -> None:
+        key = preference.canonical_key()
+        version = await self._version()
+        self._cache.set(key, (version, list(courses)), self.ttl)
+        if version is not None:
+            await self.l2.set(f"recommendation:{version}:{key}", encode_courses(courses), self.ttl)
+
+    async def invalidate(self) -> None:
+        """전체 무효화 (저장소 데이터 변경 시 호출, Redis 세대 번호를 올려 다른 워커에도 전달)"""
+        self._cache.clear()
+        await self.l2.incr(_VERSION_KEY)
+        self.invalidations += 1
+
+    async def _version(self) -> Optional[int]:
+        """현재 세대 번호 (Redis를 사용할 수 없으면 None)"""
+        if not self.l2.available:
+            return None
+        data = await self.l2.get(_VERSION_KEY)
+        if data is None:
+            return 0 if self.l2.available else None
+        return int(data)
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._cache.stats(), "l2_hits": self.l2_hits, "invalidations": self.invalidations}
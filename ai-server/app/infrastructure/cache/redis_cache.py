@@ -0,0 +1,200 @@
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 값이 일치할 때만 삭제 (다른 프로세스가 다시 잡은 락을 지우지 않도록)
+_DELETE_IF_EQUAL_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisCache:
+    """
+    Redis 기반 분산 캐시 (L2)
+
+    redis 패키지가 없거나 REDIS_URL이 비어 있으면 비활성화되고,
+    Redis 오류가 나면 retry_after초 동안 호출을 건너뛰어 L1만으로 동작
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        key_prefix: str = "ai:",
+        socket_timeout: float = 0.2,
+        retry_after: float = 30.0
+    ):
+        self.url = url if url is not None else os.getenv("REDIS_URL", "")
+        self.key_prefix = key_prefix
+        self.socket_timeout = socket_timeout
+        self.retry_after = retry_after
+        self._client = None
+        self._down_until = 0.0
+        self.errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.url)
+
+    @property
+    def available(self) -> bool:
+        return self.enabled and time.monotonic() >= self._down_until
+
+    def _get_client(self):
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(
+                self.url,
+                socket_timeout=self.socket_timeout,
+                socket_connect_timeout=self.socket_timeout,
+            )
+        return self._client
+
+    def _mark_down(self, e: Exception) -> None:
+        self.errors += 1
+        self._down_until = time.monotonic() + self.retry_after
+        logger.warning(
+            "Redis 캐시 사용 불가, %.0f초간 L1 캐시만 사용: %s: %s", self.retry_after, type(e).__name__, e
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """값 조회 (없거나 Redis 장애 시 None)"""
+        if not self.available:
+            return None
+        try:
+            return await self._get_client().get(self.key_prefix + key)
+        except Exception as e:
+            self._mark_down(e)
+            return None
+
+    async def get_with_ttl(self, key: str) -> Tuple[Optional[bytes], Optional[float]]:
+        """
+        값과 남은 TTL(초)을 한 번의 왕복(GET + PTTL)으로 조회
+
+        Returns:
+            (값, 남은 TTL). 없거나 Redis 장애 시 (None, None), 만료가 없는 키는 TTL None
+        """
+        if not self.available:
+            return None, None
+        try:
+            pipe = self._get_client().pipeline()
+            pipe.get(self.key_prefix + key)
+            pipe.pttl(self.key_prefix + key)
+            value, ttl_ms = await pipe.execute()
+        except Exception as e:
+            self._mark_down(e)
+            return None, None
+        return value, (ttl_ms / 1000 if value is not None and ttl_ms > 0 else None)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """값 저장 (Redis 장애 시 무시)"""
+        if not self.available:
+            return
+        try:
+            await self._get_client().set(self.key_prefix + key, value, px=max(int(ttl * 1000), 1))
+        except Exception as e:
+            self._mark_down(e)
+
+    async def incr(self, key: str) -> Optional[int]:
+        """정수 값을 1 증가시키고 새 값 반환 (키가 없으면 1, Redis를 사용할 수 없으면 None)"""
+        if not self.available:
+            return None
+        try:
+            return int(await self._get_client().incr(self.key_prefix + key))
+        except Exception as e:
+            self._mark_down(e)
+            return None
+
+    async def zincrby_many(self, key: str, increments: Dict[str, float], ttl: float) -> bool:
+        """
+        정렬 집합 멤버 점수를 한 번의 왕복으로 더하고 TTL 갱신 (여러 프로세스의 집계 합산용)
+
+        Returns:
+            반영했으면 True, Redis를 사용할 수 없으면 False
+        """
+        if not self.available:
+            return False
+        try:
+            pipe = self._get_client().pipeline()
+            for member, amount in increments.items():
+                pipe.zincrby(self.key_prefix + key, amount, member)
+            pipe.pexpire(self.key_prefix + key, max(int(ttl * 1000), 1))
+            await pipe.execute()
+            return True
+        except Exception as e:
+            self._mark_down(e)
+            return False
+
+    async def ztop(self, key: str, count: int) -> Optional[List[Tuple[str, float]]]:
+        """점수가 높은 정렬 집합 멤버 count개 (Redis를 사용할 수 없으면 None)"""
+        if not self.available:
+            return None
+        try:
+            rows = await self._get_client().zrevrange(self.key_prefix + key, 0, count - 1, withscores=True)
+        except Exception as e:
+            self._mark_down(e)
+            return None
+        return [(member.decode("utf-8"), float(score)) for member, score in rows]
+
+    async def zdecay(self, key: str, factor: float, min_score: float, max_members: int, ttl: float) -> None:
+        """정렬 집합의 모든 점수에 factor를 곱하고 min_score 미만 멤버와 상위 max_members 밖 멤버 제거 (TTL 갱신)"""
+        if not self.available:
+            return
+        full_key = self.key_prefix + key
+        try:
+            pipe = self._get_client().pipeline()
+            pipe.zunionstore(full_key, {full_key: factor})
+            pipe.zremrangebyscore(full_key, "-inf", f"({min_score}")
+            pipe.zremrangebyrank(full_key, 0, -max_members - 1)
+            pipe.pexpire(full_key, max(int(ttl * 1000), 1))
+            await pipe.execute()
+        except Exception as e:
+            self._mark_down(e)
+
+    async def add(self, key: str, value: bytes, ttl: float) -> Optional[bool]:
+        """
+        키가 없을 때만 저장 (SET NX)
+
+        Returns:
+            저장했으면 True, 이미 있으면 False, Redis를 사용할 수 없으면 None
+        """
+        if not self.available:
+            return None
+        try:
+            return bool(await self._get_client().set(
+                self.key_prefix + key, value, px=max(int(ttl * 1000), 1), nx=True
+            ))
+        except Exception as e:
+            self._mark_down(e)
+            return None
+
+    async def delete_if_equal(self, key: str, value: bytes) -> None:
+        """저장된 값이 value와 같을 때만 삭제 (Redis 장애 시 무시, 키는 TTL로 만료됨)"""
+        if not self.available:
+            return
+        try:
+            await self._get_client().eval(_DELETE_IF_EQUAL_SCRIPT, 1, self.key_prefix + key, value)
+        except Exception as e:
+            self._mark_down(e)
+
+    async def aclose(self) -> None:
+        """Redis 연결 종료 (FastAPI shutdown)"""
+        if self._client is not None:
+            try:
+                await self._client.close()
+            except Exception:
+                pass
+            self._client = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "enabled": int(self.enabled),
+            "available": int(self.available),
+            "errors": self.errors,
+        }
@@ -0,0 +1,51 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+def normalize_key(*parts: Any) -> Tuple[Any, ...]:
+    """문자열 인자의 공백/대소문자를 정규화한 single-flight 키 생성"""
+    return tuple(
+        " ".join(part.split()).lower() if isinstance(part, str) else part
+        for part in parts
+    )
+
+
+class SingleFlight:
+    """
+    동일 키의 동시 호출을 하나의 진행 중 호출로 합치는 계층
+
+    같은 키로 호출이 진행 중이면 새 호출을 시작하지 않고 그 결과(또는 예외)를 공유.
+    호출자 하나가 취소되어도 공유 중인 호출은 계속 진행됨
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """key로 진행 중인 호출이 있으면 합류, 없으면 fn() 실행"""
+        task = self._calls.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 대기자가 모두 취소된 경우 예외가 경고로 남지 않도록 소비
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """upstream 호출 수와 합류(공유)된 호출 수"""
+        return {
+            "calls": self.calls,
+            "shared": self.shared,
+            "in_flight": len(self._calls),
+        }
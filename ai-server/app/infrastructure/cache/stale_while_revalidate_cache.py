@@ -0,0 +1,95 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    # 대기자가 모두 취소된 로드 태스크의 예외가 경고로 남지 않도록 소비
+    if not task.cancelled():
+        task.exception()
+
+
+class StaleWhileRevalidateCache:
+    """
+    TTL + stale-while-revalidate 인메모리 캐시
+
+    - TTL 이내: 캐시 값 즉시 반환 (hit)
+    - TTL 경과 ~ max_stale 이내: 오래된 값을 즉시 반환하고 백그라운드 태스크 하나로 갱신 (stale hit)
+    - 값이 없거나 max_stale 경과: 로더 결과를 기다림 (miss, 동일 키 동시 로드는 하나로 합침)
+    - 빈 결과: negative_ttl 동안만 보관하고 stale로 내보내지 않음 (0이면 보관하지 않음).
+      백그라운드 갱신이 빈 결과를 돌려주면 기존 값을 유지
+    """
+
+    def __init__(self, ttl: float, max_stale: Optional[float] = None, negative_ttl: float = 0.0):
+        if ttl <= 0:
+            raise ValueError("TTL은 0보다 커야 합니다.")
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.negative_ttl = negative_ttl
+        self._entries: Dict[Hashable, Tuple[Any, float]] = {}
+        self._loading: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시 조회, 없거나 만료되면 loader로 로드"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.monotonic() - stored_at
+            if age < (self.ttl if value else self.negative_ttl):
+                self.hits += 1
+                return value
+            if value and (self.max_stale is None or age < self.ttl + self.max_stale):
+                self.stale_hits += 1
+                if key not in self._loading:
+                    self.refreshes += 1
+                    self._start_load(key, loader).add_done_callback(self._on_refresh_done)
+                return value
+
+        self.misses += 1
+        task = self._loading.get(key) or self._start_load(key, loader)
+        return await asyncio.shield(task)
+
+    def _start_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = asyncio.ensure_future(self._load(key, loader))
+        task.add_done_callback(_consume_exception)
+        self._loading[key] = task
+        return task
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await loader()
+            if value:
+                self._entries[key] = (value, time.monotonic())
+            elif self.negative_ttl > 0 and not self._entries.get(key, (None, 0.0))[0]:
+                self._entries[key] = (value, time.monotonic())
+            return value
+        finally:
+            self._loading.pop(key, None)
+
+    def _on_refresh_done(self, task: asyncio.Task) -> None:
+        # 백그라운드 갱신 실패 시 기존 값을 유지
+        if task.cancelled() or task.exception() is not None:
+            self.refresh_failures += 1
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """키 하나 또는 전체 캐시 무효화"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """hit/miss 카운터"""
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "size": len(self._entries),
+        }
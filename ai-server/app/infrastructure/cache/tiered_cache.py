@@ -0,0 +1,261 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, NamedTuple, Optional, Tuple
+from app.infrastructure.cache.distributed_lock import DistributedLock
+from app.infrastructure.cache.memory_cache import LRUMemoryCache, MISSING
+from app.infrastructure.cache.redis_cache import RedisCache
+
+logger = logging.getLogger(__name__)
+
+# 미리 갱신(refresh-ahead) 모드: 남은 TTL이 이 비율 미만인 항목은 캐시를 건너뛰고 다시 로드
+_refresh_ahead_ratio: ContextVar[Optional[float]] = ContextVar("refresh_ahead_ratio", default=None)
+
+
+@contextmanager
+def refresh_ahead(ratio: float) -> Iterator[None]:
+    """
+    블록 안의 get_or_load 호출을 미리 갱신 모드로 실행 (백그라운드 프리페치용)
+
+    L1, 없으면 L2 항목의 남은 TTL이 source TTL × ratio 이상이면 그대로 사용하고,
+    그보다 적거나 어느 쪽에도 없으면 로더로 새 값을 저장
+    """
+    token = _refresh_ahead_ratio.set(ratio)
+    try:
+        yield
+    finally:
+        _refresh_ahead_ratio.reset(token)
+
+# 이 크기(바이트)를 넘는 값은 zlib으로 압축해 Redis에 저장
+_COMPRESS_THRESHOLD = 1024
+
+# 다른 워커가 같은 키를 채우는 동안 L2를 다시 확인하는 간격(초)
+_FILL_POLL_INTERVAL = 0.05
+
+
+class CachedLoadError(Exception):
+    """같은 키의 최근 로드가 실패해 error_ttl 동안 로더를 다시 호출하지 않고 실패를 돌려줌"""
+
+
+class LoadFailure(NamedTuple):
+    """캐시에 저장하는 로드 실패 표시 (워커 간 공유를 위해 예외 대신 메시지만 보관)"""
+    message: str
+
+
+def encode_value(value: Any) -> bytes:
+    """JSON 직렬화 값을 압축 여부 표시 1바이트와 함께 인코딩 (로드 실패는 메시지만)"""
+    if isinstance(value, LoadFailure):
+        return b"e" + value.message.encode("utf-8")
+    raw = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if len(raw) > _COMPRESS_THRESHOLD:
+        return b"z" + zlib.compress(raw)
+    return b"j" + raw
+
+
+def decode_value(data: bytes) -> Any:
+    """encode_value로 인코딩한 값 복원"""
+    if data[:1] == b"e":
+        return LoadFailure(data[1:].decode("utf-8"))
+    if data[:1] == b"z":
+        return json.loads(zlib.decompress(data[1:]))
+    return json.loads(data[1:])
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    """소스별 캐시 TTL 설정(초)"""
+    ttls: Dict[str, float] = field(default_factory=dict)
+    default_ttl: float = 600.0
+    negative_ttl: float = 60.0  # 빈 결과 캐시 시간
+    error_ttl: float = 5.0  # 로더 예외 캐시 시간 (0이면 캐시하지 않음)
+    l1_max_size: int = 1024
+    fill_lock_ttl: float = 10.0  # 워커 간 캐시 채우기 락 유지 시간(초)
+    fill_wait: float = 3.0  # 다른 워커가 채우는 값을 기다리는 최대 시간(초)
+
+    def ttl_for(self, source: str) -> float:
+        return self.ttls.get(source, self.default_ttl)
+
+    @classmethod
+    def from_env(cls) -> "CacheSettings":
+        """환경 변수에서 설정 로드"""
+        return cls(
+            ttls={
+                "exhibitions": float(os.getenv("CACHE_TTL_EXHIBITIONS", "3600")),
+                "performances": float(os.getenv("CACHE_TTL_PERFORMANCES", "3600")),
+                "places": float(os.getenv("CACHE_TTL_PLACES", "86400")),
+            },
+            default_ttl=float(os.getenv("CACHE_TTL_DEFAULT", "600")),
+            negative_ttl=float(os.getenv("CACHE_NEGATIVE_TTL", "60")),
+            error_ttl=float(os.getenv("CACHE_ERROR_TTL", "5")),
+            l1_max_size=int(os.getenv("CACHE_L1_MAX_SIZE", "1024")),
+            fill_lock_ttl=float(os.getenv("CACHE_FILL_LOCK_TTL", "10")),
+            fill_wait=float(os.getenv("CACHE_FILL_WAIT", "3")),
+        )
+
+
+class TieredCache:
+    """
+    2단계 캐시: 프로세스 내 LRU(L1) → Redis(L2) → 로더
+
+    빈 결과는 negative_ttl 동안만 캐시하고, 로더 예외는 호출자에게 그대로 전파하되 error_ttl 동안
+    실패를 기록해 두어 그 사이 같은 키 요청은 (다른 워커 포함) 외부 API를 다시 호출하지 않고 CachedLoadError로 실패.
+    여러 워커 프로세스가 같은 키를 동시에 놓치면 Redis 락을 잡은 한 워커만 로드하고
+    나머지는 L2에 값이 저장되기를 기다림. Redis를 사용할 수 없으면 L1만으로 동작
+    """
+
+    def __init__(
+        self,
+        settings: Optional[CacheSettings] = None,
+        l2: Optional[RedisCache] = None
+    ):
+        self.settings = settings or CacheSettings.from_env()
+        self.l1 = LRUMemoryCache(self.settings.l1_max_size)
+        self.l2 = l2 or RedisCache()
+        self.l2_hits = 0
+        self.loads = 0
+        self.negative_stores = 0
+        self.fill_waits = 0
+        self.load_errors = 0
+        self.error_hits = 0
+
+    @staticmethod
+    def make_key(source: str, key_parts: Tuple[Any, ...]) -> str:
+        digest = hashlib.blake2b(
+            json.dumps(key_parts, ensure_ascii=False, default=str).encode("utf-8"),
+            digest_size=12
+        ).hexdigest()
+        return f"{source}:{digest}"
+
+    async def get_or_load(
+        self,
+        source: str,
+        key_parts: Tuple[Any, ...],
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        source별 TTL로 캐시 조회, 없으면 loader 결과를 L1/L2에 저장
+
+        Raises:
+            CachedLoadError: error_ttl 안에 같은 키의 로드가 실패했음
+        """
+        key = self.make_key(source, key_parts)
+
+        ratio = _refresh_ahead_ratio.get()
+        if ratio is not None:
+            min_ttl = self.settings.ttl_for(source) * ratio
+            remaining = self.l1.ttl_remaining(key)
+            if remaining is not None and remaining >= min_ttl:
+                return self._unwrap(source, self.l1.get(key))
+            # 다른 워커가 채웠거나 갱신한 값이 L2에 충분히 남아 있으면 외부 API를 호출하지 않음
+            value = await self._get_l2(source, key, min_ttl)
+            if value is not MISSING:
+                return self._unwrap(source, value)
+            return await self._load(source, key, loader)
+
+        value = self.l1.get(key)
+        if value is not MISSING:
+            return self._unwrap(source, value)
+
+        value = await self._get_l2(source, key)
+        if value is not MISSING:
+            return self._unwrap(source, value)
+
+        return await self._load(source, key, loader)
+
+    def _unwrap(self, source: str, value: Any) -> Any:
+        """캐시된 로드 실패면 CachedLoadError, 아니면 값 그대로"""
+        if isinstance(value, LoadFailure):
+            self.error_hits += 1
+            raise CachedLoadError(f"{source} 최근 조회 실패: {value.message}")
+        return value
+
+    async def _get_l2(self, source: str, key: str, min_ttl: float = 0.0) -> Any:
+        """L2 조회 (남은 TTL이 min_ttl 미만이면 MISSING), 찾은 값은 L2의 남은 TTL만큼 L1에 저장"""
+        data, remaining = await self.l2.get_with_ttl(key)
+        if data is None:
+            return MISSING
+        try:
+            value = decode_value(data)
+        except (ValueError, zlib.error) as e:
+            logger.warning("캐시 값 복원 실패 (%s): %s", key, e)
+            return MISSING
+        ttl = remaining if remaining is not None else self._ttl(source, value)
+        if ttl < min_ttl:
+            return MISSING
+        self.l2_hits += 1
+        self.l1.set(key, value, ttl)
+        return value
+
+    async def _load(self, source: str, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        lock = DistributedLock(self.l2 if self.l2.enabled else None, key, self.settings.fill_lock_ttl)
+        if not await lock.acquire():
+            # 다른 워커가 로드 중: L2에 저장될 때까지 기다리고, 마감까지 없으면 직접 로드
+            value = await self._wait_for_fill(source, key)
+            if value is not MISSING:
+                self.fill_waits += 1
+                return self._unwrap(source, value)
+
+        try:
+            self.loads += 1
+            try:
+                value = await loader()
+            except Exception as e:
+                self.load_errors += 1
+                if self.settings.error_ttl > 0:
+                    await self._store(key, LoadFailure(f"{type(e).__name__}: {e}"), self.settings.error_ttl)
+                raise
+            ttl = self._ttl(source, value)
+            if not value:
+                self.negative_stores += 1
+            await self._store(key, value, ttl)
+            return value
+        finally:
+            await lock.release()
+
+    async def _store(self, key: str, value: Any, ttl: float) -> None:
+        self.l1.set(key, value, ttl)
+        await self.l2.set(key, encode_value(value), ttl)
+
+    async def _wait_for_fill(self, source: str, key: str) -> Any:
+        loop = asyncio.get_running_loop()
+        ends_at = loop.time() + self.settings.fill_wait
+        while loop.time() < ends_at:
+            value = await self._get_l2(source, key)
+            if value is not MISSING:
+                return value
+            await asyncio.sleep(_FILL_POLL_INTERVAL)
+        return MISSING
+
+    def _ttl(self, source: str, value: Any) -> float:
+        if isinstance(value, LoadFailure):
+            return self.settings.error_ttl
+        return self.settings.ttl_for(source) if value else self.settings.negative_ttl
+
+    def invalidate_local(self) -> None:
+        """L1 캐시 비우기"""
+        self.l1.clear()
+
+    async def aclose(self) -> None:
+        await self.l2.aclose()
+
+    def stats(self) -> Dict[str, int]:
+        l1 = self.l1.stats()
+        return {
+            "l1_hits": l1["hits"],
+            "l1_size": l1["size"],
+            "l1_evictions": l1["evictions"],
+            "l2_hits": self.l2_hits,
+            "loads": self.loads,
+            "negative_stores": self.negative_stores,
+            "fill_waits": self.fill_waits,
+            "load_errors": self.load_errors,
+            "error_hits": self.error_hits,
+            "l2_errors": self.l2.errors,
+            "l2_available": int(self.l2.available),
+        }
@@ -0,0 +1,42 @@
+"""
+장소 카탈로그 빌더 CLI
+
+사용법:
+    python -m app.infrastructure.catalog.build_place_catalog places.json places.catalog
+    python -m app.infrastructure.catalog.build_place_catalog --builtin places.catalog
+
+입력 JSON은 {"지역": [{"name", "category", "price", "tags", "rating", "duration", "lat", "lng"}, ...]} 형식
+"""
+import argparse
+import json
+import time
+from app.infrastructure.catalog.place_catalog import PlaceCatalog, write_place_catalog
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="장소 카탈로그 파일 생성")
+    parser.add_argument("input", nargs="?", help="지역별 장소 JSON 파일")
+    parser.add_argument("output", help="생성할 카탈로그 파일 경로")
+    parser.add_argument("--builtin", action="store_true", help="내장 장소 데이터로 생성")
+    args = parser.parse_args()
+
+    if args.builtin:
+        from app.infrastructure.services.openai_service import OpenAIService
+        places_db = OpenAIService._init_places_database()
+    elif args.input:
+        with open(args.input, encoding="utf-8") as f:
+            places_db = json.load(f)
+    else:
+        parser.error("입력 JSON 파일 또는 --builtin이 필요합니다.")
+
+    started = time.perf_counter()
+    count = write_place_catalog(places_db, args.output)
+    elapsed = time.perf_counter() - started
+
+    catalog = PlaceCatalog.open(args.output)
+    print(f"장소 {count}개, 지역 {len(catalog.areas())}개 → {args.output} ({elapsed * 1000:.0f}ms)")
+    catalog.close()
+
+
+if __name__ == "__main__":
+    main()
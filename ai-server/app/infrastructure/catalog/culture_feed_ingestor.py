@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import math
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from app.infrastructure.catalog.culture_store import CultureStore
+from app.infrastructure.services.culture_service import CultureService
+
+logger = logging.getLogger(__name__)
+
+FEED_KINDS = ("exhibitions", "performances")
+
+
+@dataclass
+class IngestResult:
+    """목록 하나의 수집 결과"""
+    kind: str
+    pages: int = 0
+    fetched: int = 0
+    stored: int = 0
+    failed_pages: int = 0
+
+
+class CultureFeedIngestor:
+    """
+    공공데이터포털 전시/공연 목록을 기간 단위로 전부 페이지 조회해 로컬 저장소에 적재
+
+    첫 페이지의 totalCount로 전체 페이지 수를 구한 뒤 나머지 페이지를 동시 실행 수 제한 아래에서 조회하고,
+    페이지가 도착하는 대로 (kind, seq/mt20id) 기준으로 upsert. 실패한 페이지는 건너뛰고 건수만 집계
+    """
+
+    def __init__(
+        self,
+        culture_service: CultureService,
+        store: CultureStore,
+        page_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        max_pages: Optional[int] = None
+    ):
+        self.culture_service = culture_service
+        self.store = store
+        self.page_size = page_size or int(os.getenv("CULTURE_INGEST_PAGE_SIZE", "100"))
+        self.max_concurrency = max_concurrency or int(os.getenv("CULTURE_INGEST_CONCURRENCY", "4"))
+        # totalCount가 비정상적으로 클 때의 상한
+        self.max_pages = max_pages or int(os.getenv("CULTURE_INGEST_MAX_PAGES", "500"))
+
+    async def ingest(self, kind: str, start_date: str, end_date: str) -> IngestResult:
+        """기간(start_date ~ end_date) 내 목록 하나를 전부 수집"""
+        result = IngestResult(kind)
+        first = await self._fetch_page(kind, start_date, end_date, 1, result)
+        if first is None:
+            return result
+        items, total_count = first
+        await self._store_page(kind, items, result)
+
+        if total_count is not None:
+            pages = min(math.ceil(total_count / self.page_size), self.max_pages)
+            await self._ingest_pages(kind, start_date, end_date, range(2, pages + 1), result)
+        else:
+            # totalCount가 없는 응답은 페이지가 덜 찰 때까지 순서대로 조회
+            page_no = 1
+            while len(items) >= self.page_size and page_no < self.max_pages:
+                page_no += 1
+                page = await self._fetch_page(kind, start_date, end_date, page_no, result)
+                if page is None:
+                    break
+                items = page[0]
+                await self._store_page(kind, items, result)
+
+        logger.info(
+            "%s 수집 완료: 페이지 %d, 조회 %d건, 저장 %d건, 실패 페이지 %d",
+            kind, result.pages, result.fetched, result.stored, result.failed_pages
+        )
+        return result
+
+    async def _ingest_pages(
+        self, kind: str, start_date: str, end_date: str, page_numbers: range, result: IngestResult
+    ) -> None:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(page_no: int) -> None:
+            async with semaphore:
+                page = await self._fetch_page(kind, start_date, end_date, page_no, result)
+            if page is not None:
+                await self._store_page(kind, page[0], result)
+
+        await asyncio.gather(*(run(page_no) for page_no in page_numbers))
+
+    async def _fetch_page(
+        self, kind: str, start_date: str, end_date: str, page_no: int, result: IngestResult
+    ) -> Optional[Tuple[List[Dict[str, Any]], Optional[int]]]:
+        try:
+            page = await self.culture_service.fetch_feed_page(kind, start_date, end_date, page_no, self.page_size)
+        except Exception as e:
+            result.failed_pages += 1
+            logger.warning("%s %d페이지 수집 실패: %s", kind, page_no, e)
+            return None
+        result.pages += 1
+        result.fetched += len(page[0])
+        return page
+
+    async def _store_page(self, kind: str, items: List[Dict[str, Any]], result: IngestResult) -> None:
+        if items:
+            stored = await asyncio.to_thread(self.store.upsert_many, kind, items)
+            result.stored += stored
@@ -0,0 +1,144 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+# 로컬 저장소에 보관하는 필드 (CultureService 응답 필드 + 지역)
+RECORD_FIELDS = ("seq", "title", "place", "area", "start_date", "end_date", "description", "genre", "image_url")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS culture_items (
+    kind TEXT NOT NULL,
+    seq TEXT NOT NULL,
+    title TEXT NOT NULL,
+    place TEXT NOT NULL DEFAULT '',
+    area TEXT NOT NULL DEFAULT '',
+    start_date TEXT NOT NULL DEFAULT '',
+    end_date TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    genre TEXT NOT NULL DEFAULT '',
+    image_url TEXT NOT NULL DEFAULT '',
+    ingested_at REAL NOT NULL,
+    PRIMARY KEY (kind, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_culture_items_period ON culture_items (kind, end_date, start_date);
+CREATE INDEX IF NOT EXISTS idx_culture_items_area ON culture_items (kind, area, end_date);
+"""
+
+_UPSERT = """
+INSERT INTO culture_items (kind, seq, title, place, area, start_date, end_date, description, genre, image_url, ingested_at)
+VALUES (:kind, :seq, :title, :place, :area, :start_date, :end_date, :description, :genre, :image_url, :ingested_at)
+ON CONFLICT (kind, seq) DO UPDATE SET
+    title = excluded.title,
+    place = excluded.place,
+    area = excluded.area,
+    start_date = excluded.start_date,
+    end_date = excluded.end_date,
+    description = excluded.description,
+    genre = excluded.genre,
+    image_url = excluded.image_url,
+    ingested_at = excluded.ingested_at
+"""
+
+# 진행 중인 항목: 시작일 <= 날짜 <= 종료일 (종료일 인덱스로 범위 탐색)
+# 지역(시도) 또는 시설명에 요청 지역이 들어간 항목을 먼저, 곧 끝나는 순서로
+_FIND = """
+SELECT seq, title, place, area, start_date, end_date, description, genre, image_url
+FROM culture_items
+WHERE kind = :kind AND end_date >= :date AND start_date <= :date {genre_filter}
+ORDER BY (area = :location OR instr(place, :location) > 0) DESC, end_date
+LIMIT :limit
+"""
+
+_DATE_DIGITS = re.compile(r"\d+")
+
+
+def normalize_date(value: str) -> str:
+    """2026.10.01 / 20261001 / 2026-10-01 형식 날짜를 YYYY-MM-DD로 (알 수 없는 형식은 빈 문자열)"""
+    digits = "".join(_DATE_DIGITS.findall(value or ""))
+    if len(digits) != 8:
+        return ""
+    return f"{digits[:4]}-{digits[4:6]}-{digits[6:]}"
+
+
+def normalize_record(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    수집한 item을 저장 형식으로 정규화 (제목이 없으면 None)
+
+    seq(공연은 mt20id)가 없으면 제목/장소/시작일로 대체 키를 만들어 같은 항목이 중복 저장되지 않게 함
+    """
+    values = {field: str(record.get(field) or "").strip() for field in RECORD_FIELDS}
+    if not values["title"]:
+        return None
+    values["start_date"] = normalize_date(values["start_date"])
+    values["end_date"] = normalize_date(values["end_date"]) or values["start_date"]
+    if not values["seq"]:
+        values["seq"] = f"{values['title']}|{values['place']}|{values['start_date']}"
+    return values
+
+
+class CultureStore:
+    """
+    전시/공연 목록을 보관하는 로컬 SQLite 저장소
+
+    수집 작업(ingest_culture_feeds)이 채우고, CultureService가 공공데이터포털 대신 조회함.
+    연결 하나를 잠금으로 보호해 여러 스레드(asyncio.to_thread)에서 공유.
+    연결은 처음 쓸 때 여는 프로세스에서 열어, preload_app으로 fork된 워커끼리 같은 연결을 나눠 쓰지 않음
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """현재 프로세스의 연결 (없거나 fork 전 부모 프로세스에서 연 연결이면 새로 열기, 잠금 안에서 호출)"""
+        if self._conn is None or self._pid != os.getpid():
+            # 부모에게서 물려받은 연결은 닫지 않고 버림 (자식에서 닫으면 부모의 파일 잠금까지 풀릴 수 있음)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def upsert_many(self, kind: str, records: Iterable[Dict[str, Any]]) -> int:
+        """정규화 후 (kind, seq) 기준으로 삽입 또는 갱신하고 저장한 건수 반환 (같은 배치 안의 중복은 마지막 값)"""
+        now = time.time()
+        rows: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            values = normalize_record(record)
+            if values is not None:
+                rows[values["seq"]] = {**values, "kind": kind, "ingested_at": now}
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(_UPSERT, rows.values())
+        return len(rows)
+
+    def find(
+        self, kind: str, date: str, location: str = "", genre: Optional[str] = None, limit: int = 15
+    ) -> List[Dict[str, Any]]:
+        """날짜에 진행 중인 항목 조회 (요청 지역과 맞는 항목 우선, genre가 있으면 장르명에 포함된 것만)"""
+        params = {"kind": kind, "date": normalize_date(date), "location": location, "limit": limit}
+        genre_filter = ""
+        if genre:
+            genre_filter = "AND instr(genre, :genre) > 0"
+            params["genre"] = genre
+        with self._lock:
+            rows = self._connection().execute(_FIND.format(genre_filter=genre_filter), params).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self, kind: str) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM culture_items WHERE kind = ?", (kind,)).fetchone()[0]
+
+    def close(self) -> None:
+        """이 프로세스에서 연 연결을 닫음 (이후 다시 조회하면 새로 열림)"""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = self._pid = None
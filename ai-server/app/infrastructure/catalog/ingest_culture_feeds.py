@@ -0,0 +1,60 @@
+"""
+전시/공연 목록 수집 CLI
+
+사용법:
+    python -m app.infrastructure.catalog.ingest_culture_feeds culture.db --from 2026-10-01 --to 2026-12-31
+    python -m app.infrastructure.catalog.ingest_culture_feeds culture.db --from 2026-10-01 --to 2026-10-31 --kind performances
+
+DATA_GO_KR_API_KEY(및 DATA_GO_KR_BASE_URL)를 사용하며, 주기적으로 실행(cron 등)해 저장소를 갱신하고
+서버에는 CULTURE_STORE_PATH로 같은 파일을 지정
+"""
+import argparse
+import asyncio
+import time
+from app.infrastructure.catalog.culture_feed_ingestor import FEED_KINDS, CultureFeedIngestor
+from app.infrastructure.catalog.culture_store import CultureStore
+from app.infrastructure.http.pooled_http_client import PooledHttpClient
+from app.infrastructure.services.culture_service import CultureService
+
+
+async def _run(args: argparse.Namespace) -> None:
+    http_client = PooledHttpClient()
+    store = CultureStore(args.output)
+    culture_service = CultureService(http_client=http_client)
+    if not culture_service.data_go_kr_api_key:
+        raise SystemExit("DATA_GO_KR_API_KEY가 설정되지 않았습니다.")
+
+    ingestor = CultureFeedIngestor(
+        culture_service,
+        store,
+        page_size=args.page_size,
+        max_concurrency=args.concurrency
+    )
+    kinds = [args.kind] if args.kind else list(FEED_KINDS)
+    try:
+        for kind in kinds:
+            started = time.perf_counter()
+            result = await ingestor.ingest(kind, args.start_date, args.end_date)
+            elapsed = time.perf_counter() - started
+            print(
+                f"{kind}: 페이지 {result.pages} (실패 {result.failed_pages}), 조회 {result.fetched}건, "
+                f"저장소 {store.count(kind)}건 ({elapsed:.1f}s)"
+            )
+    finally:
+        await http_client.aclose()
+        store.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="전시/공연 목록을 로컬 저장소로 수집")
+    parser.add_argument("output", help="SQLite 저장소 파일 경로")
+    parser.add_argument("--from", dest="start_date", required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end_date", required=True, help="종료일 (YYYY-MM-DD)")
+    parser.add_argument("--kind", choices=FEED_KINDS, help="한 종류만 수집")
+    parser.add_argument("--page-size", type=int, help="페이지당 건수 (기본 CULTURE_INGEST_PAGE_SIZE)")
+    parser.add_argument("--concurrency", type=int, help="동시 페이지 요청 수 (기본 CULTURE_INGEST_CONCURRENCY)")
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+장소 카탈로그 파일 포맷 (열 기반, 메모리 매핑)
+
+한 파일 안에 숫자 필드는 타입별 배열로, 문자열은 중복 제거된 문자열 테이블로 저장.
+장소는 지역별로 묶어 저장하므로 지역 조회는 인덱스 범위 하나로 처리됨.
+파일을 mmap으로 읽기 전용으로 열기 때문에 여러 워커 프로세스가 같은 페이지를 공유.
+
+레이아웃 (리틀/빅 엔디안은 헤더에 기록된 생성 환경 기준):
+    header: magic(8) byteorder(1) padding(3) place_count string_count tag_ref_count area_count (uint32)
+    sections: 헤더 뒤 오프셋 테이블(uint64)에 기록된 8바이트 정렬 배열들
+"""
+import math
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b"PLCAT01\x00"
+_HEADER = struct.Struct("<8sB3xIIII")
+
+# (섹션 이름, array 타입코드) - 파일에 기록되는 순서
+_SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("string_offsets", "I"),  # string_count + 1
+    ("string_data", "B"),
+    ("area_names", "I"),  # area_count, 문자열 인덱스
+    ("area_starts", "I"),  # area_count + 1, 장소 시작 인덱스
+    ("names", "I"),  # place_count, 문자열 인덱스
+    ("categories", "I"),
+    ("prices", "I"),
+    ("ratings", "d"),
+    ("durations", "I"),
+    ("latitudes", "d"),  # 좌표가 없으면 NaN
+    ("longitudes", "d"),
+    ("tag_offsets", "I"),  # place_count + 1
+    ("tag_refs", "I"),  # tag_ref_count, 문자열 인덱스
+)
+_OFFSETS = struct.Struct("<" + "Q" * len(_SECTIONS))
+_BYTEORDER = {"little": 0, "big": 1}
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def write_place_catalog(places_db: Dict[str, List[Dict[str, Any]]], path: str) -> int:
+    """
+    지역별 장소 딕셔너리를 카탈로그 파일로 저장
+
+    Returns:
+        저장한 장소 수
+    """
+    strings: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    columns = {name: array(code) for name, code in _SECTIONS}
+    columns["area_starts"].append(0)
+    columns["tag_offsets"].append(0)
+
+    for area, places in places_db.items():
+        columns["area_names"].append(intern(area))
+        for place in places:
+            columns["names"].append(intern(place["name"]))
+            columns["categories"].append(intern(place.get("category", "")))
+            columns["prices"].append(intern(place.get("price", "")))
+            columns["ratings"].append(float(place.get("rating", 0.0)))
+            columns["durations"].append(int(place.get("duration", 0)))
+            lat, lng = place.get("lat"), place.get("lng")
+            columns["latitudes"].append(math.nan if lat is None else float(lat))
+            columns["longitudes"].append(math.nan if lng is None else float(lng))
+            for tag in place.get("tags", []):
+                columns["tag_refs"].append(intern(tag))
+            columns["tag_offsets"].append(len(columns["tag_refs"]))
+        columns["area_starts"].append(len(columns["names"]))
+
+    encoded = [value.encode("utf-8") for value in strings]
+    columns["string_offsets"].append(0)
+    for value in encoded:
+        columns["string_offsets"].append(columns["string_offsets"][-1] + len(value))
+    columns["string_data"] = array("B", b"".join(encoded))
+
+    offsets = []
+    position = _align(_HEADER.size + _OFFSETS.size)
+    for name, _ in _SECTIONS:
+        offsets.append(position)
+        position = _align(position + len(columns[name]) * columns[name].itemsize)
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(
+            MAGIC,
+            _BYTEORDER[sys.byteorder],
+            len(columns["names"]),
+            len(strings),
+            len(columns["tag_refs"]),
+            len(columns["area_names"]),
+        ))
+        f.write(_OFFSETS.pack(*offsets))
+        for (name, _), offset in zip(_SECTIONS, offsets):
+            f.write(b"\x00" * (offset - f.tell()))
+            columns[name].tofile(f)
+        f.write(b"\x00" * (position - f.tell()))
+
+    return len(columns["names"])
+
+
+class PlaceCatalog:
+    """메모리 매핑된 읽기 전용 장소 카탈로그"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+        self._columns: Dict[str, memoryview] = {}
+        buffer = memoryview(self._mmap)
+        try:
+            self._load(buffer)
+        except BaseException:
+            # 헤더 검증에 실패하면 뷰를 놓아야 mmap과 파일을 닫을 수 있음
+            buffer.release()
+            self.close()
+            raise
+
+    def _load(self, buffer: memoryview) -> None:
+        """헤더를 검증하고 열 뷰와 지역 범위를 구성"""
+        magic, byteorder, place_count, string_count, tag_ref_count, area_count = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"장소 카탈로그 파일이 아닙니다: {self.path}")
+        if byteorder != _BYTEORDER[sys.byteorder]:
+            raise ValueError("카탈로그 파일의 바이트 순서가 현재 시스템과 다릅니다.")
+
+        lengths = {
+            "string_offsets": string_count + 1,
+            "area_names": area_count,
+            "area_starts": area_count + 1,
+            "tag_offsets": place_count + 1,
+            "tag_refs": tag_ref_count,
+        }
+        offsets = _OFFSETS.unpack_from(buffer, _HEADER.size)
+        for (name, code), offset in zip(_SECTIONS, offsets):
+            if name == "string_data":
+                # 문자열 데이터 길이는 마지막 문자열 오프셋으로 결정
+                size = self._columns["string_offsets"][string_count]
+            else:
+                size = lengths.get(name, place_count) * array(code).itemsize
+            self._columns[name] = buffer[offset:offset + size].cast(code)
+        self._string_data = self._columns["string_data"]
+
+        self._place_count = place_count
+        self._strings: List[Optional[str]] = [None] * string_count
+        self._area_ranges: Dict[str, range] = {
+            self.string(self._columns["area_names"][i]): range(
+                self._columns["area_starts"][i], self._columns["area_starts"][i + 1]
+            )
+            for i in range(area_count)
+        }
+
+    @classmethod
+    def open(cls, path: str) -> "PlaceCatalog":
+        return cls(path)
+
+    def close(self) -> None:
+        for column in self._columns.values():
+            column.release()
+        self._columns.clear()
+        self._mmap.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._place_count
+
+    def string(self, index: int) -> str:
+        """문자열 테이블 조회 (한 번 디코딩한 문자열은 재사용)"""
+        value = self._strings[index]
+        if value is None:
+            offsets = self._columns["string_offsets"]
+            value = bytes(self._string_data[offsets[index]:offsets[index + 1]]).decode("utf-8")
+            self._strings[index] = value
+        return value
+
+    def areas(self) -> List[str]:
+        return list(self._area_ranges)
+
+    def area_range(self, area: str) -> range:
+        return self._area_ranges[area]
+
+    def place(self, index: int) -> Dict[str, Any]:
+        """장소 하나를 기존 places_db와 같은 형태의 딕셔너리로 복원"""
+        columns = self._columns
+        tag_offsets = columns["tag_offsets"]
+        place = {
+            "name": self.string(columns["names"][index]),
+            "category": self.string(columns["categories"][index]),
+            "price": self.string(columns["prices"][index]),
+            "tags": [
+                self.string(ref)
+                for ref in columns["tag_refs"][tag_offsets[index]:tag_offsets[index + 1]]
+            ],
+            "rating": columns["ratings"][index],
+            "duration": columns["durations"][index],
+        }
+        lat, lng = columns["latitudes"][index], columns["longitudes"][index]
+        if not (math.isnan(lat) or math.isnan(lng)):
+            place["lat"] = lat
+            place["lng"] = lng
+        return place
+
+    def iter_coordinates(self) -> Iterator[Tuple[str, int, float, float]]:
+        """(지역, 지역 내 인덱스, 위도, 경도) - 장소 딕셔너리를 만들지 않고 좌표만 순회"""
+        latitudes, longitudes = self._columns["latitudes"], self._columns["longitudes"]
+        for area, places in self._area_ranges.items():
+            for offset, index in enumerate(places):
+                lat, lng = latitudes[index], longitudes[index]
+                if not (math.isnan(lat) or math.isnan(lng)):
+                    yield area, offset, lat, lng
+
+    def as_places_db(self) -> "CatalogPlacesDB":
+        """places_db(지역 → 장소 목록)처럼 쓸 수 있는 읽기 전용 뷰"""
+        return CatalogPlacesDB(self)
+
+
+class CatalogAreaPlaces(Sequence):
+    """카탈로그 한 지역의 장소 목록 뷰 (조회 시점에 딕셔너리로 복원)"""
+
+    def __init__(self, catalog: PlaceCatalog, places: range):
+        self._catalog = catalog
+        self._places = places
+
+    def __len__(self) -> int:
+        return len(self._places)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._catalog.place(i) for i in self._places[index]]
+        return self._catalog.place(self._places[index])
+
+
+class CatalogPlacesDB(Mapping):
+    """카탈로그 기반 지역 → 장소 목록 매핑"""
+
+    def __init__(self, catalog: PlaceCatalog):
+        self.catalog = catalog
+
+    def __getitem__(self, area: str) -> CatalogAreaPlaces:
+        return CatalogAreaPlaces(self.catalog, self.catalog.area_range(area))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.catalog.areas())
+
+    def __len__(self) -> int:
+        return len(self.catalog.areas())
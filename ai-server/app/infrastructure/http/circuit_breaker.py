@@ -0,0 +1,198 @@
+import math
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Tuple
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 외부 API 호출을 건너뜀"""
+
+    def __init__(self, upstream: str, retry_after: float):
+        super().__init__(f"{upstream} 회로 열림 ({retry_after:.1f}초 후 재시도)")
+        self.upstream = upstream
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class CircuitBreakerSettings:
+    """외부 API별 회로 차단기/적응형 타임아웃 설정"""
+    window_size: int = 50  # 최근 호출 기록 개수
+    window_seconds: float = 60.0  # 이보다 오래된 기록은 버림(초)
+    min_calls: int = 10  # 실패율/p99 계산에 필요한 최소 호출 수
+    failure_rate_threshold: float = 0.5  # 실패율이 이 값 이상이면 회로 열림
+    slow_call_seconds: float = 5.0  # 이보다 느린 호출은 느린 호출로 집계(초)
+    slow_call_rate_threshold: float = 0.8  # 느린 호출 비율이 이 값 이상이면 회로 열림
+    open_seconds: float = 30.0  # 회로를 열어 두는 시간(초)
+    half_open_max_calls: int = 1  # 반열림 상태에서 허용하는 시험 호출 수
+    timeout_multiplier: float = 1.5  # 적응형 타임아웃 = p99 × 배수
+    min_timeout: float = 1.0  # 적응형 타임아웃 하한(초)
+    max_timeout: float = 10.0  # 적응형 타임아웃 상한이자 기록이 부족할 때의 값(초)
+
+    def __post_init__(self):
+        if self.window_size <= 0 or self.min_calls <= 0:
+            raise ValueError("윈도우 크기와 최소 호출 수는 0보다 커야 합니다.")
+        if self.min_timeout > self.max_timeout:
+            raise ValueError("최소 타임아웃은 최대 타임아웃보다 클 수 없습니다.")
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreakerSettings":
+        """환경 변수에서 설정 로드"""
+        return cls(
+            window_size=int(os.getenv("CIRCUIT_WINDOW_SIZE", "50")),
+            window_seconds=float(os.getenv("CIRCUIT_WINDOW_SECONDS", "60")),
+            min_calls=int(os.getenv("CIRCUIT_MIN_CALLS", "10")),
+            failure_rate_threshold=float(os.getenv("CIRCUIT_FAILURE_RATE", "0.5")),
+            slow_call_seconds=float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "5.0")),
+            slow_call_rate_threshold=float(os.getenv("CIRCUIT_SLOW_CALL_RATE", "0.8")),
+            open_seconds=float(os.getenv("CIRCUIT_OPEN_SECONDS", "30")),
+            half_open_max_calls=int(os.getenv("CIRCUIT_HALF_OPEN_MAX_CALLS", "1")),
+            timeout_multiplier=float(os.getenv("ADAPTIVE_TIMEOUT_MULTIPLIER", "1.5")),
+            min_timeout=float(os.getenv("ADAPTIVE_TIMEOUT_MIN", "1.0")),
+            max_timeout=float(os.getenv("ADAPTIVE_TIMEOUT_MAX", os.getenv("HTTP_READ_TIMEOUT", "10.0"))),
+        )
+
+
+class CircuitBreaker:
+    """
+    외부 API 하나의 회로 차단기
+
+    - closed: 호출 허용. 최근 윈도우의 실패율 또는 느린 호출 비율이 임계값을 넘으면 open
+    - open: open_seconds 동안 호출 없이 CircuitOpenError로 즉시 실패
+    - half_open: 시험 호출을 제한된 수만 허용, 성공하면 closed / 실패하면 다시 open
+
+    타임아웃은 최근 성공 호출의 p99 지연 × 배수로 조정 (min_timeout~max_timeout)
+    """
+
+    def __init__(self, name: str, settings: Optional[CircuitBreakerSettings] = None):
+        self.name = name
+        self.settings = settings or CircuitBreakerSettings.from_env()
+        self.state = CLOSED
+        # (기록 시각, 소요 시간, 성공 여부)
+        self._calls: Deque[Tuple[float, float, bool]] = deque(maxlen=self.settings.window_size)
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._p99: Optional[float] = None
+        self.rejected = 0
+        self.opened = 0
+        self.attempts = 0  # 회로를 통과해 외부 API로 나간 호출 수 (누적)
+
+    def before_call(self) -> None:
+        """호출 전 확인 (회로가 열려 있으면 CircuitOpenError)"""
+        if self.state == OPEN:
+            retry_after = self._opened_at + self.settings.open_seconds - time.monotonic()
+            if retry_after > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, retry_after)
+            self.state = HALF_OPEN
+            self._half_open_in_flight = 0
+
+        if self.state == HALF_OPEN:
+            if self._half_open_in_flight >= self.settings.half_open_max_calls:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, 0.0)
+            self._half_open_in_flight += 1
+        self.attempts += 1
+
+    def record_success(self, elapsed: float) -> None:
+        if self.state == HALF_OPEN:
+            # 시험 호출 성공: 이전 장애 기록을 버리고 다시 닫음
+            self.state = CLOSED
+            self._calls.clear()
+        self._record(elapsed, True)
+
+    def record_failure(self, elapsed: float) -> None:
+        if self.state == HALF_OPEN:
+            self._open()
+            return
+        self._record(elapsed, False)
+
+    def release(self) -> None:
+        """결과 없이 끝난(취소된) 호출의 반열림 시험 호출 자리 반환"""
+        if self.state == HALF_OPEN and self._half_open_in_flight > 0:
+            self._half_open_in_flight -= 1
+
+    def timeout(self) -> float:
+        """최근 p99 지연 기반 요청 타임아웃(초)"""
+        settings = self.settings
+        p99 = self._latency_p99()
+        if p99 is None:
+            return settings.max_timeout
+        return min(max(p99 * settings.timeout_multiplier, settings.min_timeout), settings.max_timeout)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 요약 (조회 API/메트릭용)"""
+        self._trim()
+        calls = len(self._calls)
+        failures = sum(1 for _, _, ok in self._calls if not ok)
+        retry_after = 0.0
+        if self.state == OPEN:
+            retry_after = max(self._opened_at + self.settings.open_seconds - time.monotonic(), 0.0)
+        p99 = self._latency_p99()
+        return {
+            "state": self.state,
+            "calls": calls,
+            "failures": failures,
+            "failure_rate": round(failures / calls, 3) if calls else 0.0,
+            "p99_ms": round(p99 * 1000, 1) if p99 is not None else None,
+            "timeout_s": round(self.timeout(), 3),
+            "retry_after_s": round(retry_after, 1),
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+    def _record(self, elapsed: float, ok: bool) -> None:
+        self._calls.append((time.monotonic(), elapsed, ok))
+        self._p99 = None
+        self._trim()
+
+        settings = self.settings
+        calls = len(self._calls)
+        if self.state != CLOSED or calls < settings.min_calls:
+            return
+        failures = sum(1 for _, _, call_ok in self._calls if not call_ok)
+        slow = sum(1 for _, call_elapsed, _ in self._calls if call_elapsed >= settings.slow_call_seconds)
+        if failures / calls >= settings.failure_rate_threshold or slow / calls >= settings.slow_call_rate_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.opened += 1
+        self._opened_at = time.monotonic()
+        self._half_open_in_flight = 0
+
+    def _trim(self) -> None:
+        cutoff = time.monotonic() - self.settings.window_seconds
+        while self._calls and self._calls[0][0] < cutoff:
+            self._calls.popleft()
+            self._p99 = None
+
+    def _latency_p99(self) -> Optional[float]:
+        if self._p99 is None:
+            latencies = sorted(elapsed for _, elapsed, ok in self._calls if ok)
+            if len(latencies) < self.settings.min_calls:
+                return None
+            self._p99 = latencies[min(math.ceil(len(latencies) * 0.99) - 1, len(latencies) - 1)]
+        return self._p99
+
+
+class CircuitBreakerRegistry:
+    """외부 API 이름별 회로 차단기 모음"""
+
+    def __init__(self, settings: Optional[CircuitBreakerSettings] = None):
+        self.settings = settings or CircuitBreakerSettings.from_env()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(name, self.settings)
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: breaker.snapshot() for name, breaker in sorted(self._breakers.items())}
@@ -0,0 +1,206 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+import httpx
+from app.infrastructure.http.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+
+
+def _h2_available() -> bool:
+    """HTTP/2 지원 패키지(h2) 설치 여부"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+@dataclass(frozen=True)
+class HttpClientSettings:
+    """공유 HTTP 클라이언트 커넥션 풀 설정"""
+    max_connections: int = 100  # 전체 최대 커넥션 수
+    max_keepalive_connections: int = 20  # 유지할 keep-alive 커넥션 수
+    keepalive_expiry: float = 30.0  # keep-alive 유지 시간(초)
+    max_connections_per_host: int = 20  # 호스트별 동시 요청 수 상한
+    connect_timeout: float = 3.0  # 연결 타임아웃(초)
+    read_timeout: float = 10.0  # 응답 읽기 타임아웃(초)
+    pool_timeout: float = 5.0  # 풀에서 커넥션을 기다리는 시간(초)
+    http2: bool = True
+
+    def __post_init__(self):
+        if self.max_connections <= 0 or self.max_connections_per_host <= 0:
+            raise ValueError("커넥션 수는 0보다 커야 합니다.")
+
+    @classmethod
+    def from_env(cls) -> "HttpClientSettings":
+        """환경 변수에서 설정 로드"""
+        return cls(
+            max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")),
+            keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30.0")),
+            max_connections_per_host=int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "20")),
+            connect_timeout=float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.0")),
+            read_timeout=float(os.getenv("HTTP_READ_TIMEOUT", "10.0")),
+            pool_timeout=float(os.getenv("HTTP_POOL_TIMEOUT", "5.0")),
+            http2=os.getenv("HTTP_HTTP2", "true").lower().strip() == "true",
+        )
+
+
+class PooledHttpClient:
+    """
+    앱 전체에서 공유하는 커넥션 풀 기반 HTTP 클라이언트
+
+    FastAPI 시작 시 start(), 종료 시 aclose()로 생명주기를 관리하며,
+    start() 전에 호출되면 첫 요청에서 풀을 생성.
+    외부 API별 회로 차단기로 장애 중인 API는 즉시 실패시키고,
+    읽기 타임아웃은 최근 p99 지연에 맞춰 조정
+    """
+
+    def __init__(
+        self,
+        settings: Optional[HttpClientSettings] = None,
+        breakers: Optional[CircuitBreakerRegistry] = None
+    ):
+        self.settings = settings or HttpClientSettings.from_env()
+        self.breakers = breakers or CircuitBreakerRegistry()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _create_client(self) -> httpx.AsyncClient:
+        settings = self.settings
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                settings.read_timeout,
+                connect=settings.connect_timeout,
+                pool=settings.pool_timeout,
+            ),
+            http2=settings.http2 and _h2_available(),
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    async def start(self) -> None:
+        """커넥션 풀 생성 (FastAPI startup)"""
+        self.client
+
+    async def aclose(self) -> None:
+        """커넥션 풀 종료 (FastAPI shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._host_semaphores.clear()
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.settings.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def _adaptive_timeout(self, breaker: CircuitBreaker) -> httpx.Timeout:
+        return httpx.Timeout(
+            breaker.timeout(),
+            connect=self.settings.connect_timeout,
+            pool=self.settings.pool_timeout,
+        )
+
+    @staticmethod
+    def _record_status(breaker: CircuitBreaker, status_code: int, elapsed: float) -> None:
+        # 5xx와 429(요청 제한)는 외부 API 장애로 집계, 그 외 4xx는 요청 문제로 보고 정상 집계
+        if status_code >= 500 or status_code == 429:
+            breaker.record_failure(elapsed)
+        else:
+            breaker.record_success(elapsed)
+
+    async def get(self, url: str, upstream: Optional[str] = None, **kwargs) -> httpx.Response:
+        """
+        호스트별 동시 요청 수 제한과 회로 차단기를 적용한 GET 요청
+
+        Args:
+            url: 요청 URL
+            upstream: 회로 차단기 이름 (기본값은 호스트)
+            **kwargs: httpx 요청 인자 (timeout을 주지 않으면 적응형 타임아웃 사용)
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있어 호출하지 않음
+        """
+        breaker = self.breakers.get(upstream or urlsplit(url).netloc)
+
+        # 회로 확인은 동시성 슬롯을 얻은 뒤에 함: 대기 중 취소돼도 반열림 시험 호출 자리를 잡고 있지 않음
+        async with self._host_semaphore(url):
+            breaker.before_call()
+            kwargs.setdefault("timeout", self._adaptive_timeout(breaker))
+            started = time.perf_counter()
+            try:
+                response = await self.client.get(url, **kwargs)
+            except httpx.HTTPError:
+                breaker.record_failure(time.perf_counter() - started)
+                raise
+            except BaseException:
+                breaker.release()
+                raise
+            elapsed = time.perf_counter() - started
+
+        self._record_status(breaker, response.status_code, elapsed)
+        return response
+
+    @asynccontextmanager
+    async def stream(self, url: str, upstream: Optional[str] = None, **kwargs) -> AsyncIterator[httpx.Response]:
+        """
+        본문을 읽지 않은 응답을 내주는 스트리밍 GET 요청 (get()과 같은 동시성 제한/회로 차단기 적용)
+
+        호출자는 response.aiter_bytes()로 필요한 만큼만 읽고 빠져나오면 연결이 닫힘.
+        정상 종료 시 회로 차단기에 응답 헤더까지의 지연을 기록하고(필요한 만큼만 읽고 나와도 성공),
+        본문을 읽거나 파싱하다 난 예외는 실패로, 취소는 집계 없이 반납
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있어 호출하지 않음
+        """
+        breaker = self.breakers.get(upstream or urlsplit(url).netloc)
+
+        async with self._host_semaphore(url):
+            breaker.before_call()
+            kwargs.setdefault("timeout", self._adaptive_timeout(breaker))
+            request = self.client.build_request("GET", url, **kwargs)
+            started = time.perf_counter()
+            try:
+                response = await self.client.send(request, stream=True)
+            except httpx.HTTPError:
+                breaker.record_failure(time.perf_counter() - started)
+                raise
+            except BaseException:
+                breaker.release()
+                raise
+            elapsed = time.perf_counter() - started
+
+            try:
+                yield response
+            except httpx.HTTPStatusError:
+                # 호출자가 raise_for_status()로 올린 오류는 get()과 같이 응답 코드로 판단
+                self._record_status(breaker, response.status_code, elapsed)
+                raise
+            except Exception:
+                # 본문 수신/파싱 중 오류(네트워크 오류, 깨진 본문 등)는 외부 API 실패로 집계
+                breaker.record_failure(time.perf_counter() - started)
+                raise
+            except BaseException:
+                # 취소 등 호출자 사정으로 중단되면 성공/실패 어느 쪽으로도 집계하지 않음
+                breaker.release()
+                raise
+            else:
+                self._record_status(breaker, response.status_code, elapsed)
+            finally:
+                await response.aclose()
@@ -0,0 +1,152 @@
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import sys
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# 요청 단위 상관관계 ID (미들웨어에서 설정)
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+_hooks_registered = False
+# 예외 추적 문자열 변환용 (출력 포맷과 무관하게 호출 스레드에서 한 번 변환)
+_exception_formatter = logging.Formatter()
+
+
+class RequestIdFilter(logging.Filter):
+    """로그 레코드에 현재 요청의 상관관계 ID 추가 (호출 스레드에서 실행)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """extra={"sampled": True}로 남긴 항목별 DEBUG 로그를 rate 비율만 통과"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "sampled", False) and record.levelno <= logging.DEBUG:
+            return random.random() < self.rate
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 구조화 로그 포맷"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    출력 포맷(JSON 직렬화, 시각 포맷)과 쓰기를 리스너 스레드로 미루는 큐 핸들러
+
+    메시지 % 인자 치환과 예외 추적 문자열 변환은 표준 QueueHandler.prepare처럼 호출 스레드에서 끝내,
+    나중에 바뀔 수 있는 인자(코스 목록 등)나 프레임을 리스너 스레드로 넘기지 않고
+    치환 중 난 예외도 호출한 쪽의 handleError로 보고됨
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()
+        record = copy.copy(record)
+        record.msg = message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        fields = getattr(record, "fields", None)
+        if fields:
+            record.fields = dict(fields)
+        return record
+
+
+def configure_logging() -> None:
+    """
+    app 로거 설정 (여러 번 호출해도 한 번만 적용)
+
+    - LOG_LEVEL: 로그 레벨 (기본 INFO)
+    - LOG_FORMAT: json 또는 text (기본 json)
+    - LOG_DEBUG_SAMPLE_RATE: 항목별 DEBUG 로그 샘플링 비율 (기본 0.1)
+    """
+    global _listener, _queue_handler, _hooks_registered
+    if _listener is not None:
+        return
+
+    if os.getenv("LOG_FORMAT", "json").lower().strip() == "text":
+        formatter: logging.Formatter = logging.Formatter(
+            "%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s"
+        )
+    else:
+        formatter = JsonFormatter()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.addFilter(SamplingFilter(float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.1"))))
+
+    logger = logging.getLogger("app")
+    logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper().strip())
+    logger.handlers = [queue_handler]
+    logger.propagate = False
+
+    _queue_handler = queue_handler
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    if not _hooks_registered:
+        atexit.register(shutdown_logging)
+        os.register_at_fork(after_in_child=_restart_listener_after_fork)
+        _hooks_registered = True
+
+
+def _restart_listener_after_fork() -> None:
+    """
+    fork된 자식 프로세스(gunicorn 워커)에서 새 큐와 리스너 시작
+
+    스레드는 fork 시 복제되지 않으므로 새 리스너가 없으면 큐에 쌓인 로그가 출력되지 않음.
+    부모의 큐는 fork 시점의 내부 잠금 상태를 물려받을 수 있어 새 큐로 교체
+    (부모가 아직 출력하지 않은 로그는 부모 프로세스가 출력)
+    """
+    global _listener
+    if _listener is None or _queue_handler is None:
+        return
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_handler.queue = log_queue
+    _listener = QueueListener(log_queue, *_listener.handlers, respect_handler_level=_listener.respect_handler_level)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        _queue_handler = None
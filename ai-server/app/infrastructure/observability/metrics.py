@@ -0,0 +1,273 @@
+import functools
+import inspect
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# 단계별 지연 시간 버킷 (초)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+LabelValues = Tuple[str, ...]
+# 수집 시점에 값을 읽어오는 게이지: (이름, 도움말, 라벨 이름, [(라벨 값, 값)])
+GaugeSample = Tuple[str, str, Sequence[str], List[Tuple[LabelValues, float]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """라벨별 누적 카운터"""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0)
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램
+
+    관측 시에는 bisect로 찾은 버킷 하나만 증가시키고,
+    누적(cumulative) 합계는 /metrics 출력 시에만 계산
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 → [버킷별 개수..., +Inf 개수], 합계
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        counts = self._counts.get(label_values)
+        if counts is None:
+            counts = self._counts[label_values] = [0] * (len(self.buckets) + 1)
+            self._sums[label_values] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[label_values] += value
+
+    def count(self, *label_values: str) -> int:
+        return sum(self._counts.get(label_values, ()))
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="' + ("+Inf" if bound == float("inf") else repr(bound)) + '"'
+                yield f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}"
+            label_text = _format_labels(self.label_names, labels)
+            yield f"{self.name}_sum{label_text} {self._sums[labels]!r}"
+            yield f"{self.name}_count{label_text} {cumulative}"
+
+
+class MetricsRegistry:
+    """카운터/히스토그램과 수집 시점 게이지 콜백을 모아 Prometheus 텍스트로 출력"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], Iterable[GaugeSample]]] = []
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        if name not in self._metrics:
+            self._metrics[name] = Counter(name, help_text, label_names)
+        return self._metrics[name]
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        if name not in self._metrics:
+            self._metrics[name] = Histogram(name, help_text, label_names, buckets)
+        return self._metrics[name]
+
+    def register_collector(self, collector: Callable[[], Iterable[GaugeSample]]) -> None:
+        """/metrics 요청 시 호출되어 게이지 값을 돌려주는 콜백 등록"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+
+        gauges: Dict[str, Tuple[str, Sequence[str], List[Tuple[LabelValues, float]]]] = {}
+        for collector in self._collectors:
+            for name, help_text, label_names, samples in collector():
+                gauges.setdefault(name, (help_text, label_names, []))[2].extend(samples)
+        for name, (help_text, label_names, samples) in gauges.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in samples:
+                lines.append(f"{name}{_format_labels(label_names, labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+# 애플리케이션 전역 레지스트리
+REGISTRY = MetricsRegistry()
+
+STAGE_DURATION = REGISTRY.histogram(
+    "ai_server_stage_duration_seconds",
+    "Latency of instrumented hot-path stages",
+    ("stage",)
+)
+STAGE_ERRORS = REGISTRY.counter(
+    "ai_server_stage_errors_total",
+    "Exceptions raised by instrumented stages",
+    ("stage",)
+)
+UPSTREAM_ERRORS = REGISTRY.counter(
+    "ai_server_upstream_errors_total",
+    "Failed calls to external APIs",
+    ("upstream",)
+)
+SOURCE_FETCHES = REGISTRY.counter(
+    "ai_server_source_fetches_total",
+    "Recommendation data source fetches by outcome",
+    ("source", "status")
+)
+RACE_RESULTS = REGISTRY.counter(
+    "ai_server_recommend_race_total",
+    "Real-data vs OpenAI recommendation race outcomes per path (timeout includes cancelled losers)",
+    ("path", "status")
+)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """with 블록 실행 시간을 단계 히스토그램에 기록 (예외 시 에러 카운터 증가)"""
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        STAGE_ERRORS.inc(stage)
+        raise
+    finally:
+        STAGE_DURATION.observe(time.perf_counter() - started, stage)
+
+
+def timed(stage: str) -> Callable:
+    """함수 실행 시간을 단계 히스토그램에 기록하는 데코레이터 (async 함수는 await 완료까지 측정)"""
+
+    def decorator(func: Callable) -> Callable:
+        if not inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                with stage_timer(stage):
+                    return func(*args, **kwargs)
+
+            return sync_wrapper
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            except BaseException:
+                STAGE_ERRORS.inc(stage)
+                raise
+            finally:
+                STAGE_DURATION.observe(time.perf_counter() - started, stage)
+
+        return wrapper
+
+    return decorator
+
+
+def cache_stats_collector(sources: Dict[str, Callable[[], Dict[str, Dict[str, int]]]]) -> Callable[[], List[GaugeSample]]:
+    """
+    서비스별 cache_stats() 결과를 게이지로 변환하는 수집기 생성
+
+    hits/misses가 모두 있는 캐시는 적중률 게이지도 함께 출력
+    """
+
+    def collect() -> List[GaugeSample]:
+        stats_samples: List[Tuple[LabelValues, float]] = []
+        ratio_samples: List[Tuple[LabelValues, float]] = []
+        for owner, stats_fn in sources.items():
+            for cache_name, stats in stats_fn().items():
+                cache_label = f"{owner}.{cache_name}"
+                for stat, value in stats.items():
+                    stats_samples.append(((cache_label, stat), value))
+                if "misses" in stats:
+                    hits = stats.get("hits", 0) + stats.get("stale_hits", 0)
+                    total = hits + stats["misses"]
+                elif "l1_hits" in stats and "loads" in stats:
+                    hits = stats["l1_hits"] + stats.get("l2_hits", 0)
+                    total = hits + stats["loads"]
+                else:
+                    continue
+                ratio_samples.append(((cache_label,), hits / total if total else 0.0))
+        return [
+            ("ai_server_cache_stat", "Cache counters and sizes", ("cache", "stat"), stats_samples),
+            ("ai_server_cache_hit_ratio", "Cache hit ratio since start", ("cache",), ratio_samples),
+        ]
+
+    return collect
+
+
+# 회로 상태를 게이지 값으로 변환 (closed=0, half_open=1, open=2)
+_CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def circuit_breaker_collector(snapshot: Callable[[], Dict[str, Dict[str, Any]]]) -> Callable[[], List[GaugeSample]]:
+    """회로 차단기 스냅샷(외부 API 이름 → 상태)을 게이지로 변환하는 수집기 생성"""
+
+    def collect() -> List[GaugeSample]:
+        states: List[Tuple[LabelValues, float]] = []
+        timeouts: List[Tuple[LabelValues, float]] = []
+        rejected: List[Tuple[LabelValues, float]] = []
+        for upstream, state in snapshot().items():
+            states.append(((upstream,), _CIRCUIT_STATE_VALUES.get(state["state"], 0)))
+            timeouts.append(((upstream,), state["timeout_s"]))
+            rejected.append(((upstream,), state["rejected"]))
+        return [
+            ("ai_server_circuit_state", "Circuit breaker state (0=closed, 1=half_open, 2=open)", ("upstream",), states),
+            ("ai_server_circuit_timeout_seconds", "Adaptive read timeout per upstream", ("upstream",), timeouts),
+            ("ai_server_circuit_rejected_calls", "Calls skipped because the circuit was open", ("upstream",), rejected),
+        ]
+
+    return collect
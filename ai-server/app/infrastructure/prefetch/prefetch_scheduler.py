@@ -0,0 +1,215 @@
+import asyncio
+import json
+import logging
+import os
+import random
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+from app.infrastructure.cache.distributed_lock import DistributedLock
+from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.cache.tiered_cache import refresh_ahead
+from app.infrastructure.http.circuit_breaker import CLOSED, CircuitBreakerRegistry
+from app.infrastructure.observability.metrics import REGISTRY
+from app.infrastructure.prefetch.request_stats import Combination, RequestStatsTracker
+from app.infrastructure.services.openai_service import OpenAIService
+
+logger = logging.getLogger(__name__)
+
+# 관심사별 데이터 소스가 호출하는 외부 API (회로 차단기 이름)
+_INTEREST_UPSTREAMS = {"영화": "tmdb", "전시회": "data_go_kr", "문화": "data_go_kr"}
+_DEFAULT_UPSTREAM = "kakao"
+
+# 모든 워커의 요청 수를 합산하는 Redis 정렬 집합 (재시작 후에도 인기 조합을 이어 씀)
+_STATS_KEY = "prefetch:request_scores"
+_STATS_TTL = 7 * 86400
+
+# 멀티 워커에서 주기마다 한 워커만 갱신하도록 잡는 락 이름
+_CYCLE_LOCK = "prefetch:cycle"
+
+PREFETCH_FETCHES = REGISTRY.counter(
+    "ai_server_prefetch_fetches_total",
+    "Background prefetch fetches by outcome",
+    ("status",)
+)
+
+
+@dataclass(frozen=True)
+class PrefetchSettings:
+    """백그라운드 프리페치 설정"""
+    enabled: bool = True
+    interval: float = 300.0  # 갱신 주기(초)
+    jitter: float = 0.2  # 주기에 더하는 무작위 편차 비율 (±)
+    top_n: int = 20  # 주기마다 갱신할 인기 조합 수
+    request_spacing: float = 0.5  # 외부 API 요청 사이 최소 간격(초), 요청 제한 보호
+    refresh_ratio: float = 0.2  # 남은 TTL이 이 비율 미만인 캐시만 다시 로드
+    warmup_timeout: float = 20.0  # /health 준비 완료 전 워밍업을 기다리는 최대 시간(초), 지나면 워밍업은 계속 진행
+    warmup_interests: Tuple[str, ...] = ("카페", "맛집", "영화")  # 통계가 없을 때 워밍업할 관심사
+
+    @classmethod
+    def from_env(cls) -> "PrefetchSettings":
+        """환경 변수에서 설정 로드"""
+        interests = os.getenv("PREFETCH_WARMUP_INTERESTS", "카페,맛집,영화")
+        return cls(
+            enabled=os.getenv("PREFETCH_ENABLED", "true").lower().strip() == "true",
+            interval=float(os.getenv("PREFETCH_INTERVAL", "300")),
+            jitter=float(os.getenv("PREFETCH_JITTER", "0.2")),
+            top_n=int(os.getenv("PREFETCH_TOP_N", "20")),
+            request_spacing=float(os.getenv("PREFETCH_REQUEST_SPACING", "0.5")),
+            refresh_ratio=float(os.getenv("PREFETCH_REFRESH_RATIO", "0.2")),
+            warmup_timeout=float(os.getenv("PREFETCH_WARMUP_TIMEOUT", "20")),
+            warmup_interests=tuple(i.strip() for i in interests.split(",") if i.strip()),
+        )
+
+
+class PrefetchScheduler:
+    """
+    인기 (지역, 관심사, 날짜) 조합의 외부 데이터 캐시를 미리 채우는 백그라운드 스케줄러
+
+    - 시작 시 워밍업: 저장된 요청 통계(없으면 주요 지역 × 기본 관심사)로 캐시를 채우고 준비 완료 표시
+    - 이후 interval(± jitter)마다 최근 요청 통계 상위 조합의 만료 임박 캐시를 갱신
+    - 회로가 열린 외부 API는 건너뛰고, 요청 사이에 간격을 둬 요청 제한을 넘지 않도록 함
+    - 멀티 워커에서는 Redis 락을 잡은 워커만 주기 갱신을 실행 (다른 워커는 L2 캐시를 공유)하고,
+      요청 통계는 각 워커가 주기마다 Redis 정렬 집합에 합산해 모든 워커의 요청으로 순위를 매김
+    """
+
+    def __init__(
+        self,
+        ai_service: OpenAIService,
+        stats: RequestStatsTracker,
+        breakers: CircuitBreakerRegistry,
+        store: Optional[RedisCache] = None,
+        settings: Optional[PrefetchSettings] = None,
+        hot_locations: Sequence[str] = ()
+    ):
+        self.ai_service = ai_service
+        self.stats = stats
+        self.breakers = breakers
+        self.store = store
+        self.settings = settings or PrefetchSettings.from_env()
+        self.hot_locations = list(hot_locations)
+        self.ready = not self.settings.enabled
+        self.cycles = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """스케줄러 태스크 시작 (FastAPI startup)"""
+        if self.settings.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        """스케줄러 중지 후 남은 요청 통계를 Redis에 합산 (FastAPI shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._flush_stats()
+
+    async def _run(self) -> None:
+        # 워밍업이 warmup_timeout 안에 끝나지 않으면 준비 완료로 먼저 전환하고 워밍업은 끝까지 진행
+        warm_up = asyncio.create_task(self.warm_up())
+        try:
+            await asyncio.wait({warm_up}, timeout=self.settings.warmup_timeout)
+            if not warm_up.done():
+                logger.warning(
+                    "프리페치 워밍업이 %.0f초 안에 끝나지 않아 준비 완료로 전환 (워밍업은 계속 진행)",
+                    self.settings.warmup_timeout
+                )
+                self.ready = True
+            await warm_up
+        except Exception as e:
+            logger.exception("프리페치 워밍업 실패: %s", e)
+        finally:
+            self.ready = True
+            warm_up.cancel()  # aclose()로 중지되면 진행 중인 워밍업도 취소
+
+        while True:
+            await asyncio.sleep(self._next_delay())
+            try:
+                await self.run_cycle()
+            except Exception as e:
+                logger.exception("프리페치 주기 실행 실패: %s", e)
+
+    def _next_delay(self) -> float:
+        jitter = self.settings.jitter
+        return self.settings.interval * random.uniform(1 - jitter, 1 + jitter)
+
+    async def warm_up(self) -> None:
+        """저장된 인기 조합(없으면 주요 지역 × 기본 관심사)으로 캐시 채우기"""
+        today = date.today().isoformat()
+        combinations = await self._top(today)
+        if not combinations:
+            combinations = [
+                (location, interest, today)
+                for location in self.hot_locations
+                for interest in self.settings.warmup_interests
+            ][:self.settings.top_n]
+        logger.info("프리페치 워밍업 시작: %d개 조합", len(combinations))
+        await self._prefetch(combinations)
+
+    async def run_cycle(self) -> None:
+        """최근 요청 통계(모든 워커 합산) 상위 조합 중 만료가 가까운 캐시 갱신"""
+        await self._flush_stats()
+
+        # 락은 해제하지 않고 다음 주기 직전에 만료되도록 둬서 같은 주기에 다른 워커가 중복 실행하지 않음
+        lock_ttl = self.settings.interval * (1 - self.settings.jitter)
+        if not await DistributedLock(self.store, _CYCLE_LOCK, lock_ttl).acquire():
+            logger.debug("다른 워커가 이번 프리페치 주기를 실행 중이라 건너뜀")
+            self.stats.decay()
+            return
+
+        self.cycles += 1
+        combinations = await self._top(date.today().isoformat())
+        self.stats.decay()
+        if self.store is not None:
+            await self.store.zdecay(
+                _STATS_KEY, self.stats.decay_factor, self.stats.MIN_SCORE, self.stats.max_keys, _STATS_TTL
+            )
+        with refresh_ahead(self.settings.refresh_ratio):
+            await self._prefetch(combinations)
+
+    async def _prefetch(self, combinations: List[Combination]) -> None:
+        for location, interest, day in combinations:
+            breaker = self.breakers.get(_INTEREST_UPSTREAMS.get(interest, _DEFAULT_UPSTREAM))
+            if breaker.state != CLOSED:
+                PREFETCH_FETCHES.inc("skipped")
+                continue
+
+            attempts = breaker.attempts
+            timings = await self.ai_service.prefetch_sources(location, [interest], day)
+            for timing in timings:
+                PREFETCH_FETCHES.inc(timing.status)
+            # 캐시 적중이나 API 키가 없어 외부 API를 호출하지 않은 조합은 기다리지 않음
+            if breaker.attempts != attempts:
+                await asyncio.sleep(self.settings.request_spacing)
+
+    async def _top(self, min_date: str) -> List[Combination]:
+        """모든 워커의 합산 점수 상위 조합 (Redis를 사용할 수 없으면 이 워커의 점수)"""
+        if self.store is not None:
+            rows = await self.store.ztop(_STATS_KEY, self.stats.max_keys)
+            if rows is not None:
+                combinations: List[Combination] = []
+                for member, _ in rows:
+                    try:
+                        location, interest, day = json.loads(member)
+                    except (ValueError, TypeError) as e:
+                        logger.warning("저장된 요청 통계 항목 무시 (%s): %s", member, e)
+                        continue
+                    if day >= min_date:
+                        combinations.append((location, interest, day))
+                        if len(combinations) >= self.settings.top_n:
+                            break
+                return combinations
+        return self.stats.top(self.settings.top_n, min_date=min_date)
+
+    async def _flush_stats(self) -> None:
+        """이 워커가 모은 요청 수를 Redis의 합산 점수에 더함 (실패하면 다음 주기에 다시 시도)"""
+        increments = self.stats.drain()
+        if not increments or self.store is None or not self.store.enabled:
+            return
+        members = {json.dumps(list(key), ensure_ascii=False): amount for key, amount in increments.items()}
+        if not await self.store.zincrby_many(_STATS_KEY, members, _STATS_TTL):
+            self.stats.requeue(increments)
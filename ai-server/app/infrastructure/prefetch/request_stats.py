@@ -0,0 +1,73 @@
+import os
+from typing import Dict, List, Optional, Tuple
+from app.application.ports.request_stats_recorder import RequestStatsRecorder
+from app.domain.value_objects.preference import Preference
+
+# (지역, 관심사, 날짜)
+Combination = Tuple[str, str, str]
+
+
+class RequestStatsTracker(RequestStatsRecorder):
+    """
+    최근 추천 요청의 (지역, 관심사, 날짜) 조합별 빈도 집계
+
+    decay()를 호출할 때마다 점수를 줄여 최근 요청에 가중치를 두고,
+    max_keys를 넘으면 점수가 낮은 조합부터 버림.
+    마지막 drain() 이후 늘어난 점수는 따로 모아 두어 여러 워커의 집계를 합산할 수 있게 함
+    """
+
+    # decay() 후 이 점수 미만인 조합은 버림
+    MIN_SCORE = 0.05
+
+    def __init__(self, max_keys: int = 2000, decay_factor: Optional[float] = None):
+        if max_keys <= 0:
+            raise ValueError("최대 조합 수는 0보다 커야 합니다.")
+        self.max_keys = max_keys
+        self.decay_factor = decay_factor or float(os.getenv("PREFETCH_STATS_DECAY", "0.8"))
+        self._scores: Dict[Combination, float] = {}
+        self._pending: Dict[Combination, float] = {}
+
+    def record(self, preference: Preference) -> None:
+        """추천 요청 하나의 관심사별 조합 점수 증가"""
+        location = " ".join(preference.location.split())
+        for interest in set(preference.interests):
+            key = (location, interest, preference.date)
+            self._scores[key] = self._scores.get(key, 0.0) + 1.0
+            self._pending[key] = self._pending.get(key, 0.0) + 1.0
+        if len(self._scores) > self.max_keys:
+            self._prune(self.max_keys * 3 // 4)
+
+    def top(self, n: int, min_date: str = "") -> List[Combination]:
+        """점수가 높은 조합 n개 (min_date보다 이전 날짜 조합은 제외)"""
+        candidates = [(score, key) for key, score in self._scores.items() if key[2] >= min_date]
+        candidates.sort(key=lambda item: (-item[0], item[1]))
+        return [key for _, key in candidates[:n]]
+
+    def decay(self) -> None:
+        """모든 점수를 decay_factor배로 줄이고 거의 0인 조합 제거"""
+        self._scores = {
+            key: score * self.decay_factor
+            for key, score in self._scores.items()
+            if score * self.decay_factor >= self.MIN_SCORE
+        }
+
+    def _prune(self, keep: int) -> None:
+        ranked = sorted(self._scores.items(), key=lambda item: -item[1])[:keep]
+        self._scores = dict(ranked)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def drain(self) -> Dict[Combination, float]:
+        """마지막 drain() 이후 늘어난 조합별 점수를 꺼내고 비움"""
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def requeue(self, increments: Dict[Combination, float]) -> None:
+        """drain()으로 꺼냈지만 반영하지 못한 점수를 다음 drain()에 다시 포함"""
+        for key, amount in increments.items():
+            self._pending[key] = self._pending.get(key, 0.0) + amount
+        if len(self._pending) > self.max_keys:
+            # Redis 장애가 길어져도 쌓이는 조합 수는 max_keys로 제한
+            ranked = sorted(self._pending.items(), key=lambda item: -item[1])[:self.max_keys]
+            self._pending = dict(ranked)
@@ -1,89 +1,212 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set, Tuple, FrozenSet
 from datetime import datetime
 from app.domain.entities.date_course import DateCourse
 from app.domain.value_objects.preference import Preference
 from app.domain.repositories.date_course_repository import DateCourseRepository
+from app.infrastructure.observability.metrics import timed
+
+# 가장 작은 색인 후보 집합도 전체 코스의 이 비율을 넘으면 교집합/정렬보다 전체 순회가 빠름
+_SCAN_RATIO = 0.25
+
+
+def _location_grams(location: str) -> FrozenSet[str]:
+    """위치 문자열의 2-gram 집합 (부분 문자열 검색용 색인 키)"""
+    return frozenset(location[i:i + 2] for i in range(len(location) - 1))
+
+
+def sample_date_courses() -> List[DateCourse]:
+    """저장소가 비어 있을 때 채우는 샘플 데이트코스"""
+    now = datetime.now()
+    return [
+        DateCourse(
+            id="1",
+            title="한강 공원 산책",
+            description="한강에서 즐기는 낭만적인 산책 코스",
+            location="서울시 영등포구",
+            category="야외활동",
+            duration=120,
+            price_range="저렴",
+            tags=["산책", "자연", "무료"],
+            rating=4.5,
+            created_at=now,
+            updated_at=now
+        ),
+        DateCourse(
+            id="2",
+            title="카페 투어",
+            description="트렌디한 카페들을 돌아보는 코스",
+            location="서울시 강남구",
+            category="카페",
+            duration=180,
+            price_range="보통",
+            tags=["카페", "디저트", "인스타그램"],
+            rating=4.3,
+            created_at=now,
+            updated_at=now
+        ),
+        DateCourse(
+            id="3",
+            title="미술관 관람",
+            description="현대 미술 작품을 감상하는 문화 코스",
+            location="서울시 종로구",
+            category="문화",
+            duration=150,
+            price_range="보통",
+            tags=["미술", "문화", "교육"],
+            rating=4.7,
+            created_at=now,
+            updated_at=now
+        ),
+    ]
 
 
 class InMemoryDateCourseRepository(DateCourseRepository):
-    """인메모리 데이트코스 저장소 구현"""
+    """
+    인메모리 데이트코스 저장소 구현
+
+    예산, 태그, 위치 2-gram 보조 색인을 save() 시점에 갱신하여
+    find_by_preference를 전체 순회 대신 집합 교집합으로 처리
+    """
 
     def __init__(self):
+        super().__init__()
         self._courses: Dict[str, DateCourse] = {}
+        # 보조 색인: 키 → 코스 ID 집합
+        self._by_price: Dict[str, Set[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+        self._by_location_gram: Dict[str, Set[str]] = {}
+        # 코스 ID → 저장 순서 / 색인에 등록된 키 (예산, 태그, 위치 2-gram)
+        self._sequence: Dict[str, int] = {}
+        self._index_entries: Dict[str, Tuple[str, FrozenSet[str], FrozenSet[str]]] = {}
+        self._next_sequence = 0
+        # ID 없이 저장되는 코스에 부여할 다음 번호 (이미 쓰인 ID는 건너뜀)
+        self._next_id = 1
         self._initialize_sample_data()
 
     def _initialize_sample_data(self):
         """샘플 데이터 초기화"""
-        sample_courses = [
-            DateCourse(
-                id="1",
-                title="한강 공원 산책",
-                description="한강에서 즐기는 낭만적인 산책 코스",
-                location="서울시 영등포구",
-                category="야외활동",
-                duration=120,
-                price_range="저렴",
-                tags=["산책", "자연", "무료"],
-                rating=4.5,
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            ),
-            DateCourse(
-                id="2",
-                title="카페 투어",
-                description="트렌디한 카페들을 돌아보는 코스",
-                location="서울시 강남구",
-                category="카페",
-                duration=180,
-                price_range="보통",
-                tags=["카페", "디저트", "인스타그램"],
-                rating=4.3,
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            ),
-            DateCourse(
-                id="3",
-                title="미술관 관람",
-                description="현대 미술 작품을 감상하는 문화 코스",
-                location="서울시 종로구",
-                category="문화",
-                duration=150,
-                price_range="보통",
-                tags=["미술", "문화", "교육"],
-                rating=4.7,
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            ),
-        ]
-        for course in sample_courses:
+        for course in sample_date_courses():
             self._courses[course.id] = course
+            self._index(course)
+
+    def _index(self, course: DateCourse) -> None:
+        """코스를 보조 색인에 등록 (기존 색인 항목은 교체, 저장 순서는 유지)"""
+        if course.id in self._index_entries:
+            self._unindex(course.id)
+        else:
+            self._sequence[course.id] = self._next_sequence
+            self._next_sequence += 1
+
+        tags = frozenset(course.tags)
+        grams = _location_grams(course.location)
+        self._by_price.setdefault(course.price_range, set()).add(course.id)
+        for tag in tags:
+            self._by_tag.setdefault(tag, set()).add(course.id)
+        for gram in grams:
+            self._by_location_gram.setdefault(gram, set()).add(course.id)
+        self._index_entries[course.id] = (course.price_range, tags, grams)
+
+    def _unindex(self, course_id: str) -> None:
+        price_range, tags, grams = self._index_entries.pop(course_id)
+        self._discard(self._by_price, price_range, course_id)
+        for tag in tags:
+            self._discard(self._by_tag, tag, course_id)
+        for gram in grams:
+            self._discard(self._by_location_gram, gram, course_id)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, course_id: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(course_id)
+            if not ids:
+                del index[key]
 
     async def find_by_id(self, course_id: str) -> Optional[DateCourse]:
         return self._courses.get(course_id)
 
+    @timed("recommend.repository_filter")
     async def find_by_preference(self, preference: Preference) -> List[DateCourse]:
-        """선호도에 맞는 데이트코스 필터링"""
-        filtered = []
-        for course in self._courses.values():
-            # 예산 필터
-            if course.price_range != preference.budget:
-                continue
-            # 위치 필터 (간단한 문자열 포함 체크)
-            if preference.location not in course.location:
-                continue
-            # 관심사 태그 매칭
-            if not any(tag in course.tags for tag in preference.interests):
-                continue
-            filtered.append(course)
-        return filtered
+        """선호도에 맞는 데이트코스 필터링 (색인 교집합 후 저장 순서대로 반환)"""
+        # 예산 필터
+        price_ids = self._by_price.get(preference.budget)
+        if not price_ids:
+            return []
+
+        interests = frozenset(preference.interests)
+        tag_sets = [self._by_tag[tag] for tag in interests if tag in self._by_tag]
+        if not tag_sets:
+            return []
+
+        # 위치 필터: 2-gram 색인으로 후보를 좁힌 뒤 문자열 포함 여부로 최종 확인
+        location = preference.location
+        candidate_sets = [price_ids]
+        for gram in _location_grams(location):
+            candidate_sets.append(self._by_location_gram.get(gram, set()))
+        candidate_sets.sort(key=len)
+
+        tag_total = sum(len(ids) for ids in tag_sets)
+        if min(len(candidate_sets[0]), tag_total) > len(self._courses) * _SCAN_RATIO:
+            return [
+                course for course in self._courses.values()
+                if course.price_range == preference.budget
+                and location in course.location
+                and not interests.isdisjoint(course.tags)
+            ]
+
+        candidates = candidate_sets[0].intersection(*candidate_sets[1:])
+        if not candidates:
+            return []
+
+        # 관심사 태그 매칭 (하나라도 일치): 태그 색인이 후보보다 작으면 합집합과 교집합
+        if tag_total < len(candidates):
+            candidates = candidates.intersection(set().union(*tag_sets))
+        else:
+            candidates = {
+                course_id for course_id in candidates
+                if not interests.isdisjoint(self._index_entries[course_id][1])
+            }
+
+        ordered = sorted(candidates, key=self._sequence.__getitem__)
+        return [
+            self._courses[course_id]
+            for course_id in ordered
+            if location in self._courses[course_id].location
+        ]
 
     async def find_all(self) -> List[DateCourse]:
         return list(self._courses.values())
 
     async def save(self, course: DateCourse) -> DateCourse:
+        self._store(course, datetime.now())
+        await self._notify_changed()
+        return course
+
+    async def save_many(self, courses: List[DateCourse]) -> List[DateCourse]:
+        """여러 코스를 저장하고 변경 알림은 한 번만 보냄"""
+        now = datetime.now()
+        for course in courses:
+            self._store(course, now)
+        if courses:
+            await self._notify_changed()
+        return courses
+
+    def _store(self, course: DateCourse, now: datetime) -> None:
         if not course.id:
-            course.id = str(len(self._courses) + 1)
-        course.updated_at = datetime.now()
+            course.id = self._allocate_id()
+        course.updated_at = now
         self._courses[course.id] = course
-        return course
+        self._index(course)
+
+    def _allocate_id(self) -> str:
+        """
+        사용되지 않은 다음 번호 ID
+
+        len(self._courses) + 1은 명시적 ID로 저장된 코스와 겹칠 수 있어 단조 증가 번호를 사용
+        """
+        while str(self._next_id) in self._courses:
+            self._next_id += 1
+        course_id = str(self._next_id)
+        self._next_id += 1
+        return course_id
 
@@ -0,0 +1,254 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from app.domain.entities.date_course import DateCourse
+from app.domain.value_objects.preference import Preference
+from app.domain.repositories.date_course_repository import DateCourseRepository
+from app.infrastructure.observability.metrics import timed
+from app.infrastructure.repositories.in_memory_date_course_repository import sample_date_courses
+
+# seq: 저장 순서 (인메모리 저장소와 같은 조회 순서, 기존 ID를 다시 저장해도 유지)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS date_courses (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    location TEXT NOT NULL,
+    category TEXT NOT NULL,
+    duration INTEGER NOT NULL,
+    price_range TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    rating REAL NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS date_course_tags (
+    tag TEXT NOT NULL,
+    seq INTEGER NOT NULL REFERENCES date_courses (seq) ON DELETE CASCADE,
+    PRIMARY KEY (seq, tag)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_date_courses_price ON date_courses (price_range, seq);
+CREATE TABLE IF NOT EXISTS date_course_next_id (
+    singleton INTEGER PRIMARY KEY CHECK (singleton = 1),
+    next_id INTEGER NOT NULL
+);
+"""
+
+_COLUMNS = "id, title, description, location, category, duration, price_range, tags, rating, created_at, updated_at"
+
+# 아래 SQL은 문자열이 고정되어 sqlite3 문장 캐시에서 한 번 준비된 문장을 재사용
+_UPSERT = f"""
+INSERT INTO date_courses ({_COLUMNS})
+VALUES (:id, :title, :description, :location, :category, :duration, :price_range, :tags, :rating, :created_at, :updated_at)
+ON CONFLICT (id) DO UPDATE SET
+    title = excluded.title,
+    description = excluded.description,
+    location = excluded.location,
+    category = excluded.category,
+    duration = excluded.duration,
+    price_range = excluded.price_range,
+    tags = excluded.tags,
+    rating = excluded.rating,
+    updated_at = excluded.updated_at
+RETURNING seq
+"""
+_DELETE_TAGS = "DELETE FROM date_course_tags WHERE seq = ?"
+_INSERT_TAG = "INSERT OR IGNORE INTO date_course_tags (tag, seq) VALUES (?, ?)"
+_NEXT_ID = "SELECT COALESCE((SELECT next_id FROM date_course_next_id), 1)"
+_SET_NEXT_ID = """
+INSERT INTO date_course_next_id (singleton, next_id) VALUES (1, ?)
+ON CONFLICT (singleton) DO UPDATE SET next_id = excluded.next_id
+"""
+_ID_EXISTS = "SELECT 1 FROM date_courses WHERE id = ?"
+_FIND_BY_ID = f"SELECT {_COLUMNS} FROM date_courses WHERE id = ?"
+_PAGE = f"SELECT seq, {_COLUMNS} FROM date_courses WHERE seq > ? ORDER BY seq LIMIT ?"
+_COUNT = "SELECT COUNT(*) FROM date_courses"
+
+# 예산은 (price_range, seq) 인덱스로, 관심사는 태그 테이블 (seq, tag) 기본 키로 확인
+# 관심사 목록은 JSON 배열 하나로 넘겨 관심사 개수와 관계없이 같은 준비 문장을 사용
+_FIND_BY_PREFERENCE = f"""
+SELECT {_COLUMNS} FROM date_courses AS c
+WHERE c.price_range = :budget
+  AND instr(c.location, :location) > 0
+  AND EXISTS (
+      SELECT 1 FROM date_course_tags AS t
+      WHERE t.seq = c.seq AND t.tag IN (SELECT value FROM json_each(:interests))
+  )
+ORDER BY c.seq
+"""
+
+
+def _to_row(course: DateCourse) -> Dict[str, Any]:
+    return {
+        "id": course.id,
+        "title": course.title,
+        "description": course.description,
+        "location": course.location,
+        "category": course.category,
+        "duration": course.duration,
+        "price_range": course.price_range,
+        "tags": json.dumps(course.tags, ensure_ascii=False),
+        "rating": course.rating,
+        "created_at": course.created_at.isoformat(),
+        "updated_at": course.updated_at.isoformat(),
+    }
+
+
+def _from_row(row: Tuple[Any, ...]) -> DateCourse:
+    (course_id, title, description, location, category, duration,
+     price_range, tags, rating, created_at, updated_at) = row
+    return DateCourse(
+        id=course_id,
+        title=title,
+        description=description,
+        location=location,
+        category=category,
+        duration=duration,
+        price_range=price_range,
+        tags=json.loads(tags),
+        rating=rating,
+        created_at=datetime.fromisoformat(created_at),
+        updated_at=datetime.fromisoformat(updated_at)
+    )
+
+
+class SqliteDateCourseRepository(DateCourseRepository):
+    """
+    SQLite(WAL) 데이트코스 저장소 구현
+
+    연결 하나를 잠금으로 보호하고 모든 쿼리를 asyncio.to_thread로 실행해 이벤트 루프를 막지 않음.
+    연결은 처음 쓸 때 여는 프로세스에서 열어, preload_app으로 fork된 워커끼리 같은 연결을 나눠 쓰지 않음.
+    ID 없는 코스의 번호는 쓰기 트랜잭션(BEGIN IMMEDIATE) 안에서 부여해 동시 저장이나
+    같은 파일을 쓰는 다른 워커 프로세스와 겹치지 않음
+    """
+
+    def __init__(self, path: str, seed_sample_data: bool = True):
+        super().__init__()
+        self.path = path
+        self.seed_sample_data = seed_sample_data
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """현재 프로세스의 연결 (없거나 fork 전 부모 프로세스에서 연 연결이면 새로 열기, 잠금 안에서 호출)"""
+        if self._conn is None or self._pid != os.getpid():
+            # 부모에게서 물려받은 연결은 닫지 않고 버림 (자식에서 닫으면 부모의 파일 잠금까지 풀릴 수 있음)
+            # 트랜잭션은 직접 관리 (isolation_level=None)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.executescript(_SCHEMA)
+            if self.seed_sample_data and conn.execute(_COUNT).fetchone()[0] == 0:
+                self._write_courses(conn, sample_date_courses())
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    async def find_by_id(self, course_id: str) -> Optional[DateCourse]:
+        row = await asyncio.to_thread(self._fetch_one, _FIND_BY_ID, (course_id,))
+        return _from_row(row) if row is not None else None
+
+    @timed("recommend.repository_filter")
+    async def find_by_preference(self, preference: Preference) -> List[DateCourse]:
+        """선호도에 맞는 데이트코스 필터링 (예산 일치, 위치 포함, 관심사 태그 하나 이상 일치, 저장 순서)"""
+        if not preference.interests:
+            return []
+        params = {
+            "budget": preference.budget,
+            "location": preference.location,
+            "interests": json.dumps(list(preference.interests), ensure_ascii=False),
+        }
+        rows = await asyncio.to_thread(self._fetch_all, _FIND_BY_PREFERENCE, params)
+        return [_from_row(row) for row in rows]
+
+    async def find_all(self) -> List[DateCourse]:
+        return [course async for course in self.iter_all()]
+
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[DateCourse]:
+        """저장 순서(seq) 기준 키셋 커서로 batch_size개씩 읽어 하나씩 내보냄 (조회 중 저장도 막지 않음)"""
+        last_seq = 0
+        while True:
+            rows = await asyncio.to_thread(self._fetch_all, _PAGE, (last_seq, batch_size))
+            for row in rows:
+                yield _from_row(row[1:])
+            if len(rows) < batch_size:
+                return
+            last_seq = rows[-1][0]
+
+    async def save(self, course: DateCourse) -> DateCourse:
+        await self.save_many([course])
+        return course
+
+    async def save_many(self, courses: List[DateCourse]) -> List[DateCourse]:
+        """여러 코스를 한 트랜잭션으로 저장하고 변경 알림은 한 번만 보냄"""
+        if not courses:
+            return courses
+        await asyncio.to_thread(self._write, courses)
+        await self._notify_changed()
+        return courses
+
+    def close(self) -> None:
+        """이 프로세스에서 연 연결을 닫음 (이후 다시 조회하면 새로 열림)"""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = self._pid = None
+
+    def _write(self, courses: Iterable[DateCourse]) -> None:
+        with self._lock:
+            self._write_courses(self._connection(), courses)
+
+    def _write_courses(self, conn: sqlite3.Connection, courses: Iterable[DateCourse]) -> None:
+        """
+        한 쓰기 트랜잭션으로 저장 (잠금 안에서 호출)
+
+        할당한 ID와 updated_at은 COMMIT이 성공한 뒤에만 코스 객체에 반영
+        (롤백되면 저장되지 않은 ID로 다시 저장하지 않도록)
+        """
+        now = datetime.now()
+        saved = []
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            for course in courses:
+                row = _to_row(course)
+                row["id"] = course.id or self._allocate_id(cursor)
+                row["updated_at"] = now.isoformat()
+                seq = cursor.execute(_UPSERT, row).fetchone()[0]
+                cursor.execute(_DELETE_TAGS, (seq,))
+                cursor.executemany(_INSERT_TAG, ((tag, seq) for tag in course.tags))
+                saved.append((course, row["id"]))
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        for course, course_id in saved:
+            course.id = course_id
+            course.updated_at = now
+
+    @staticmethod
+    def _allocate_id(cursor: sqlite3.Cursor) -> str:
+        """
+        사용되지 않은 다음 번호 ID (인메모리 저장소와 같은 번호)
+
+        저장 순서(seq)는 ON CONFLICT로 갱신만 된 저장에도 증가하므로 별도 번호를 파일에 보관
+        """
+        candidate = cursor.execute(_NEXT_ID).fetchone()[0]
+        while cursor.execute(_ID_EXISTS, (str(candidate),)).fetchone() is not None:
+            candidate += 1
+        cursor.execute(_SET_NEXT_ID, (candidate + 1,))
+        return str(candidate)
+
+    def _fetch_one(self, sql: str, params: Any) -> Optional[Tuple[Any, ...]]:
+        with self._lock:
+            return self._connection().execute(sql, params).fetchone()
+
+    def _fetch_all(self, sql: str, params: Any) -> List[Tuple[Any, ...]]:
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
@@ -0,0 +1,71 @@
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+# 구조 문자와 이스케이프 시퀀스만 찾아 건너뛰며 스캔 (청크 끝의 단독 백슬래시는 다음 청크로 이월)
+_TOKENS = re.compile(r'\\.?|["\[\]{}]', re.DOTALL)
+
+
+class JsonArrayObjectParser:
+    """
+    조각난 LLM 응답 텍스트에서 배열 원소인 JSON 객체를 닫는 괄호가 도착하는 즉시 꺼내는 증분 파서
+
+    `[{...}, {...}]`, `{"courses": [{...}]}`, ```json 코드 블록이나 앞뒤 설명 문장이 섞인 응답 모두
+    배열 바로 아래 객체 단위로 내보냄. 객체 안에 중첩된 배열/객체는 해당 객체의 일부로 취급
+    """
+
+    def __init__(self):
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape_pending = False
+        # 수집 중인 객체 텍스트 조각과 시작 시점의 중첩 깊이
+        self._parts: List[str] = []
+        self._capture_depth: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """텍스트 조각을 추가하고 이번 조각으로 완성된 객체 목록 반환"""
+        objects: List[Dict[str, Any]] = []
+        start = 0
+        if self._escape_pending and chunk:
+            # 이전 청크 끝 백슬래시가 이스케이프하는 문자
+            self._escape_pending = False
+            start = 1
+        segment_start = 0  # 수집 중인 객체에 아직 붙이지 않은 청크 위치
+
+        for match in _TOKENS.finditer(chunk, start):
+            token = match.group()
+            if token[0] == "\\":
+                if len(token) == 1:
+                    self._escape_pending = True
+                continue
+            if self._in_string:
+                if token == '"':
+                    self._in_string = False
+                continue
+
+            position = match.start()
+            if token == '"':
+                self._in_string = bool(self._stack)
+            elif token == "{" or token == "[":
+                if token == "{" and self._capture_depth is None and self._stack and self._stack[-1] == "[":
+                    self._capture_depth = len(self._stack)
+                    self._parts = []
+                    segment_start = position
+                self._stack.append(token)
+            elif self._stack:
+                self._stack.pop()
+                if token == "}" and self._capture_depth == len(self._stack):
+                    self._parts.append(chunk[segment_start:position + 1])
+                    text = "".join(self._parts)
+                    self._parts = []
+                    self._capture_depth = None
+                    try:
+                        value = json.loads(text)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(value, dict):
+                        objects.append(value)
+
+        if self._capture_depth is not None:
+            self._parts.append(chunk[segment_start:])
+        return objects
@@ -1,11 +1,42 @@
+import asyncio
 import os
 import json
+import logging
 import random
-from typing import List, Dict, Any
+import time
+from collections import Counter
+from contextlib import aclosing
+from dataclasses import replace
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Hashable, Mapping, Optional, Sequence, Tuple
 from datetime import datetime
 from app.domain.entities.date_course import DateCourse
 from app.domain.value_objects.preference import Preference
+from app.domain.value_objects.fetch_timing import FetchTiming
 from app.domain.services.ai_service import AIService
+from app.infrastructure.services.source_fan_out import fan_out, iter_fan_out, race
+from app.infrastructure.services.place_scorer import PlaceScorer
+from app.infrastructure.spatial.grid_spatial_index import GridSpatialIndex
+from app.infrastructure.spatial.district_centers import find_district_center
+from app.infrastructure.catalog.place_catalog import PlaceCatalog, CatalogPlacesDB
+from app.infrastructure.observability.metrics import (
+    RACE_RESULTS,
+    SOURCE_FETCHES,
+    STAGE_DURATION,
+    UPSTREAM_ERRORS,
+    stage_timer,
+    timed,
+)
+from app.infrastructure.services.json_stream_parser import JsonArrayObjectParser
+from app.infrastructure.cache.completion_cache import CompletionCache
+
+logger = logging.getLogger(__name__)
+
+# 데이트 코스 추천 채팅 완성 요청 파라미터 (캐시 키에 포함)
+_SYSTEM_PROMPT = "당신은 한국의 데이트 코스 추천 전문가입니다. 사용자의 선호도에 맞는 실제 존재하는 장소와 활동을 추천해주세요."
+_TEMPERATURE = 0.7
+_MAX_TOKENS = 1500
+# OpenAI 응답에서 사용할 최대 코스 수 (스트리밍 시 이만큼 받으면 생성 중단)
+_MAX_COURSES = 3
 
 
 class OpenAIService(AIService):
@@ -16,14 +47,41 @@ class OpenAIService(AIService):
         api_key: str = None, 
         model: str = "gpt-4",
         culture_service = None,
-        place_service = None
+        place_service = None,
+        fetch_deadline: float = None,
+        place_catalog: Optional[PlaceCatalog] = None,
+        completion_cache: Optional[CompletionCache] = None
     ):
         self.api_key = api_key or os.getenv("AI_API_KEY", "")
         self.model = model or os.getenv("AI_MODEL", "gpt-4")
-        self.base_url = "https://api.openai.com/v1"
-        
-        # 지역별 장소 데이터
-        self.places_db = self._init_places_database()
+        self.base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+
+        # 채팅 완성 응답 캐시와 재사용 클라이언트 (첫 호출 시 생성)
+        self.completion_cache = completion_cache or CompletionCache()
+        self._openai_client = None
+        self.openai_stream = os.getenv("OPENAI_STREAM", "true").lower().strip() == "true"
+
+        # 관심사별 데이터 소스 동시 조회 마감 시간(초)
+        self.fetch_deadline = fetch_deadline or float(os.getenv("RECOMMEND_FETCH_DEADLINE", "8.0"))
+
+        # 실제 데이터/OpenAI 경로 경합: 전체 마감(초), OpenAI 취소 기준 코스 수, OpenAI 호출 지연(초)
+        self.race_deadline = float(os.getenv("RECOMMEND_RACE_DEADLINE", "12.0"))
+        self.race_min_courses = int(os.getenv("RECOMMEND_RACE_MIN_COURSES", "5"))
+        self.openai_hedge_delay = float(os.getenv("OPENAI_HEDGE_DELAY", "0.3"))
+        
+        # 지역별 장소 데이터 (카탈로그 파일이 있으면 메모리 매핑된 카탈로그 사용)
+        if place_catalog is not None:
+            self.places_db = place_catalog.as_places_db()
+        else:
+            self.places_db = self._init_places_database()
+
+        # 좌표가 있는 장소의 공간 색인 (지역명이 일치하지 않을 때 주변 장소 검색)
+        self.places_index = self._build_places_index(self.places_db)
+        self.nearby_radius_m = float(os.getenv("PLACES_NEARBY_RADIUS_M", "5000"))
+        self.nearby_limit = int(os.getenv("PLACES_NEARBY_LIMIT", "10"))
+
+        # 장소 목록별 점수 계산 엔진 (장소 부호화 결과 재사용)
+        self._scorers: Dict[Hashable, PlaceScorer] = {}
         
         # 문화 데이터 서비스 (주입되거나 새로 생성)
         if culture_service is None:
@@ -52,7 +110,7 @@ class OpenAIService(AIService):
         # 명시적으로 설정된 경우
         if use_openai_env in ["true", "false"]:
             result = use_openai_env == "true"
-            print(f"ℹ️ 환경 변수 설정: USE_OPENAI={use_openai_env} → OpenAI 사용: {result}")
+            logger.debug("환경 변수 설정: USE_OPENAI=%s → OpenAI 사용: %s", use_openai_env, result)
             return result
         
         # 자동 판단: 프로덕션 도메인 체크
@@ -82,148 +140,291 @@ class OpenAIService(AIService):
         # 판단 결과
         if is_production and not is_local:
             result = True
-            print(f"ℹ️ 환경 자동 감지: 프로덕션 환경 → OpenAI 사용: {result}")
+            logger.debug("환경 자동 감지: 프로덕션 환경 → OpenAI 사용: %s", result)
         else:
             result = False
-            print(f"ℹ️ 환경 자동 감지: 로컬 환경 → OpenAI 사용: {result}")
+            logger.debug("환경 자동 감지: 로컬 환경 → OpenAI 사용: %s", result)
         
         return result
 
-    def _init_places_database(self) -> Dict[str, List[Dict[str, Any]]]:
-        """한국 주요 지역별 데이트 장소 데이터베이스"""
+    @staticmethod
+    def _init_places_database() -> Dict[str, List[Dict[str, Any]]]:
+        """한국 주요 지역별 데이트 장소 데이터베이스 (내장 기본 데이터)"""
         return {
             "홍대": [
-                {"name": "연트럴파크", "category": "카페", "price": "보통", "tags": ["카페", "브런치"], "rating": 4.5, "duration": 90},
-                {"name": "앤트러사이트 홍대", "category": "카페", "price": "보통", "tags": ["카페", "디저트"], "rating": 4.3, "duration": 60},
-                {"name": "놀부보쌈 홍대점", "category": "식당", "price": "보통", "tags": ["맛집", "한식"], "rating": 4.2, "duration": 90},
-                {"name": "홍대 피카소거리", "category": "산책", "price": "저렴", "tags": ["공원", "산책", "문화"], "rating": 4.0, "duration": 60},
-                {"name": "무브홀", "category": "공연장", "price": "보통", "tags": ["문화", "공연"], "rating": 4.4, "duration": 120},
+                {"name": "연트럴파크", "category": "카페", "price": "보통", "tags": ["카페", "브런치"], "rating": 4.5, "duration": 90, "lat": 37.5605, "lng": 126.9226},
+                {"name": "앤트러사이트 홍대", "category": "카페", "price": "보통", "tags": ["카페", "디저트"], "rating": 4.3, "duration": 60, "lat": 37.5535, "lng": 126.9185},
+                {"name": "놀부보쌈 홍대점", "category": "식당", "price": "보통", "tags": ["맛집", "한식"], "rating": 4.2, "duration": 90, "lat": 37.5568, "lng": 126.9237},
+                {"name": "홍대 피카소거리", "category": "산책", "price": "저렴", "tags": ["공원", "산책", "문화"], "rating": 4.0, "duration": 60, "lat": 37.551, "lng": 126.922},
+                {"name": "무브홀", "category": "공연장", "price": "보통", "tags": ["문화", "공연"], "rating": 4.4, "duration": 120, "lat": 37.5497, "lng": 126.9168},
             ],
             "합정": [
-                {"name": "카페 보통", "category": "카페", "price": "보통", "tags": ["카페", "브런치"], "rating": 4.6, "duration": 90},
-                {"name": "앨리웨이", "category": "식당", "price": "보통", "tags": ["맛집", "양식"], "rating": 4.5, "duration": 100},
-                {"name": "망원한강공원", "category": "공원", "price": "저렴", "tags": ["공원", "산책", "야외활동"], "rating": 4.7, "duration": 120},
-                {"name": "성미산", "category": "산책", "price": "저렴", "tags": ["공원", "산책", "자연"], "rating": 4.3, "duration": 90},
+                {"name": "카페 보통", "category": "카페", "price": "보통", "tags": ["카페", "브런치"], "rating": 4.6, "duration": 90, "lat": 37.55, "lng": 126.913},
+                {"name": "앨리웨이", "category": "식당", "price": "보통", "tags": ["맛집", "양식"], "rating": 4.5, "duration": 100, "lat": 37.5485, "lng": 126.915},
+                {"name": "망원한강공원", "category": "공원", "price": "저렴", "tags": ["공원", "산책", "야외활동"], "rating": 4.7, "duration": 120, "lat": 37.5552, "lng": 126.895},
+                {"name": "성미산", "category": "산책", "price": "저렴", "tags": ["공원", "산책", "자연"], "rating": 4.3, "duration": 90, "lat": 37.5677, "lng": 126.9112},
             ],
             "강남": [
-                {"name": "테라로사 강남", "category": "카페", "price": "비쌈", "tags": ["카페", "디저트"], "rating": 4.5, "duration": 80},
-                {"name": "미쉐린 가이드 레스토랑", "category": "식당", "price": "비쌈", "tags": ["맛집", "고급"], "rating": 4.8, "duration": 120},
-                {"name": "코엑스 별마당도서관", "category": "문화", "price": "저렴", "tags": ["문화", "쇼핑"], "rating": 4.6, "duration": 90},
-                {"name": "봉은사", "category": "관광", "price": "저렴", "tags": ["문화", "산책"], "rating": 4.4, "duration": 60},
+                {"name": "테라로사 강남", "category": "카페", "price": "비쌈", "tags": ["카페", "디저트"], "rating": 4.5, "duration": 80, "lat": 37.5012, "lng": 127.0254},
+                {"name": "미쉐린 가이드 레스토랑", "category": "식당", "price": "비쌈", "tags": ["맛집", "고급"], "rating": 4.8, "duration": 120, "lat": 37.5232, "lng": 127.0393},
+                {"name": "코엑스 별마당도서관", "category": "문화", "price": "저렴", "tags": ["문화", "쇼핑"], "rating": 4.6, "duration": 90, "lat": 37.51, "lng": 127.06},
+                {"name": "봉은사", "category": "관광", "price": "저렴", "tags": ["문화", "산책"], "rating": 4.4, "duration": 60, "lat": 37.5147, "lng": 127.0577},
             ],
             "여의도": [
-                {"name": "여의도 한강공원", "category": "공원", "price": "저렴", "tags": ["공원", "산책", "야외활동"], "rating": 4.7, "duration": 120},
-                {"name": "63빌딩 스카이아트", "category": "전망대", "price": "보통", "tags": ["전망", "데이트"], "rating": 4.5, "duration": 90},
-                {"name": "더현대 서울", "category": "쇼핑", "price": "비쌈", "tags": ["쇼핑", "카페"], "rating": 4.6, "duration": 120},
+                {"name": "여의도 한강공원", "category": "공원", "price": "저렴", "tags": ["공원", "산책", "야외활동"], "rating": 4.7, "duration": 120, "lat": 37.5284, "lng": 126.9341},
+                {"name": "63빌딩 스카이아트", "category": "전망대", "price": "보통", "tags": ["전망", "데이트"], "rating": 4.5, "duration": 90, "lat": 37.5198, "lng": 126.9401},
+                {"name": "더현대 서울", "category": "쇼핑", "price": "비쌈", "tags": ["쇼핑", "카페"], "rating": 4.6, "duration": 120, "lat": 37.5259, "lng": 126.9284},
             ],
             "성수": [
-                {"name": "대림창고", "category": "카페", "price": "보통", "tags": ["카페", "문화"], "rating": 4.5, "duration": 80},
-                {"name": "어니언", "category": "카페", "price": "보통", "tags": ["카페", "디저트"], "rating": 4.6, "duration": 70},
-                {"name": "성수연방", "category": "카페", "price": "보통", "tags": ["카페", "갤러리"], "rating": 4.4, "duration": 90},
-                {"name": "서울숲", "category": "공원", "price": "저렴", "tags": ["공원", "산책", "자연"], "rating": 4.8, "duration": 120},
+                {"name": "대림창고", "category": "카페", "price": "보통", "tags": ["카페", "문화"], "rating": 4.5, "duration": 80, "lat": 37.5418, "lng": 127.0565},
+                {"name": "어니언", "category": "카페", "price": "보통", "tags": ["카페", "디저트"], "rating": 4.6, "duration": 70, "lat": 37.5447, "lng": 127.0583},
+                {"name": "성수연방", "category": "카페", "price": "보통", "tags": ["카페", "갤러리"], "rating": 4.4, "duration": 90, "lat": 37.5426, "lng": 127.0546},
+                {"name": "서울숲", "category": "공원", "price": "저렴", "tags": ["공원", "산책", "자연"], "rating": 4.8, "duration": 120, "lat": 37.5444, "lng": 127.0374},
             ],
             "이태원": [
-                {"name": "이태원 앤틱 가구 거리", "category": "쇼핑", "price": "보통", "tags": ["쇼핑", "문화"], "rating": 4.3, "duration": 90},
-                {"name": "트라비", "category": "식당", "price": "비쌈", "tags": ["맛집", "양식"], "rating": 4.7, "duration": 100},
-                {"name": "남산타워", "category": "전망대", "price": "보통", "tags": ["전망", "데이트"], "rating": 4.6, "duration": 120},
+                {"name": "이태원 앤틱 가구 거리", "category": "쇼핑", "price": "보통", "tags": ["쇼핑", "문화"], "rating": 4.3, "duration": 90, "lat": 37.532, "lng": 126.996},
+                {"name": "트라비", "category": "식당", "price": "비쌈", "tags": ["맛집", "양식"], "rating": 4.7, "duration": 100, "lat": 37.5344, "lng": 126.9947},
+                {"name": "남산타워", "category": "전망대", "price": "보통", "tags": ["전망", "데이트"], "rating": 4.6, "duration": 120, "lat": 37.5512, "lng": 126.9882},
             ],
         }
 
+    @timed("ai.recommend_date_courses")
     async def recommend_date_courses(
         self,
         preference: Preference,
-        existing_courses: List[DateCourse]
+        existing_courses: List[DateCourse],
+        timings: Optional[List[FetchTiming]] = None
     ) -> List[DateCourse]:
         """
         AI를 통한 데이트코스 추천
-        
-        실제 데이터(영화, 전시회 등)를 먼저 가져온 후,
-        OpenAI API로 보강하거나 기본 로직 사용
+
+        실제 데이터(영화, 전시회 등) 경로와 OpenAI 경로를 동시에 실행하고,
+        실제 데이터 코스가 충분하면(race_min_courses개 이상) OpenAI 호출을 취소함.
+        부족하면 race_deadline 안에서 OpenAI 결과로 보강하고,
+        실제 데이터가 없으면 OpenAI 결과만, 둘 다 없으면 기본 로직 결과를 반환
         """
         # 기존 코스가 있으면 우선 반환
         if existing_courses:
             return existing_courses[:3]
 
-        # 1. 실제 데이터 먼저 가져오기 (영화, 전시회, 공연 등)
-        real_data_courses = await self._generate_smart_recommendations(preference)
-        
-        # 실제 데이터가 있으면 우선 사용
+        # OpenAI 사용이 허용되지 않으면 실제 데이터(없으면 기본 로직)만 사용
+        if not self._should_supplement_with_openai(0):
+            return await self._generate_smart_recommendations(preference, timings)
+
+        results, race_timings = await race(
+            {
+                "real_data": self._generate_smart_recommendations(preference, timings, rule_based_fallback=False),
+                "openai": self._hedged_openai_courses(preference),
+            },
+            self.race_deadline,
+            lambda done: len(done.get("real_data", ())) >= self.race_min_courses
+        )
+        real_data_sufficient = len(results.get("real_data", ())) >= self.race_min_courses
+        for timing in race_timings:
+            RACE_RESULTS.inc(timing.source, timing.status)
+            if timings is not None:
+                # 실제 데이터가 충분해 취소된 OpenAI 경로는 빠진 결과가 아님
+                if timing.source == "openai" and timing.status == "timeout" and real_data_sufficient:
+                    timing = replace(timing, status="skipped")
+                timings.append(timing)
+
+        real_data_courses = results.get("real_data", [])
+        ai_courses = results.get("openai", [])
+        logger.info(
+            "추천 경로 경합 결과: 실제 데이터 %d개, OpenAI %d개",
+            len(real_data_courses), len(ai_courses)
+        )
         if real_data_courses:
-            print(f"✅ 실제 데이터 기반 코스 {len(real_data_courses)}개 생성 완료")
-            
-            # OpenAI API 사용 여부 확인
-            use_openai = self._should_use_openai()
-            
-            # OpenAI API로 보강 (선택적, USE_OPENAI=true일 때만)
-            if use_openai and self.api_key and self.api_key != "" and len(real_data_courses) < 5:
-                try:
-                    print("🤖 OpenAI API로 추가 추천 생성 시도...")
-                    ai_courses = await self._call_openai_api(preference)
-                    if ai_courses:
-                        # 실제 데이터와 AI 추천을 합침 (중복 제거)
-                        combined = real_data_courses + ai_courses
-                        # 제목 기준으로 중복 제거
-                        seen_titles = set()
-                        unique_courses = []
-                        for course in combined:
-                            if course.title not in seen_titles:
-                                seen_titles.add(course.title)
-                                unique_courses.append(course)
-                        return unique_courses[:10]
-                except Exception as e:
-                    print(f"⚠️ OpenAI API 호출 실패, 실제 데이터만 사용: {str(e)}")
-            else:
-                if not use_openai:
-                    print("ℹ️ OpenAI API 사용 비활성화됨 (USE_OPENAI=false 또는 미설정)")
-                elif not self.api_key or self.api_key == "":
-                    print("ℹ️ OpenAI API 키가 설정되지 않아 실제 데이터만 사용합니다.")
-            
-            return real_data_courses[:10]
-        
-        # 실제 데이터가 없으면 OpenAI API 또는 기본 로직 사용
+            # 실제 데이터와 AI 추천을 합침 (제목 기준 중복 제거)
+            return self._unique_by_title(real_data_courses + ai_courses)[:10]
+
+        # 실제 데이터가 없으면 AI 추천만 사용
+        if ai_courses:
+            return ai_courses
+
+        # 두 경로 모두 마감 안에 결과가 없으면 외부 호출 없이 기본 로직 사용
+        return self._rule_based_courses(preference)
+
+    async def _hedged_openai_courses(self, preference: Preference) -> List[DateCourse]:
+        """
+        openai_hedge_delay만큼 기다린 뒤 OpenAI 추천 호출
+
+        실제 데이터 경로가 그 전에 충분한 결과를 내면 API 호출 없이 취소됨
+        """
+        if self.openai_hedge_delay > 0:
+            await asyncio.sleep(self.openai_hedge_delay)
+        logger.info("OpenAI API로 추가 추천 생성 시도")
+        return await self._call_openai_api(preference) or []
+
+    async def stream_date_courses(
+        self,
+        preference: Preference,
+        existing_courses: List[DateCourse],
+        timings: Optional[List[FetchTiming]] = None
+    ) -> AsyncIterator[List[DateCourse]]:
+        """
+        데이터 소스가 응답하는 순서대로 코스를 내보내는 스트리밍 추천
+
+        recommend_date_courses와 같은 소스/변환 규칙과 최대 10개 제한을 따르되,
+        코스 순서는 소스 응답 순서. 실제 데이터가 없으면 기본 로직 결과를,
+        코스가 5개 미만이면 마지막에 OpenAI 보강 코스를 완성되는 대로 하나씩 내보냄
+        """
+        if existing_courses:
+            yield existing_courses[:3]
+            return
+
+        multiplicity = Counter(self._course_sources(preference))
+        fetch_timings: List[FetchTiming] = []
+        emitted: List[DateCourse] = []
+        try:
+            async with aclosing(iter_fan_out(
+                self._build_source_fetches(preference),
+                self.fetch_deadline,
+                fetch_timings
+            )) as completed_sources:
+                async for source, items in completed_sources:
+                    courses = self._courses_from_source(source, items, preference) * multiplicity[source]
+                    courses = courses[:10 - len(emitted)]
+                    if courses:
+                        emitted.extend(courses)
+                        yield courses
+        finally:
+            self._record_fetch_timings(fetch_timings, timings)
+
+        if not emitted:
+            # 이미 내보낸 묶음이 뒤이은 OpenAI 코스 추가로 바뀌지 않도록 emitted와 따로 둠
+            rule_based = self._rule_based_courses(preference)
+            emitted.extend(rule_based)
+            yield rule_based
+
+        if not self._should_supplement_with_openai(len(emitted)):
+            return
+
+        # OpenAI 보강 코스는 응답에서 코스 객체가 완성될 때마다 하나씩 내보냄
+        titles = {course.title for course in emitted}
+        try:
+            async with aclosing(self._iter_openai_courses(preference)) as ai_courses:
+                async for course in ai_courses:
+                    if len(emitted) >= 10:
+                        break
+                    if course.title in titles:
+                        continue
+                    titles.add(course.title)
+                    emitted.append(course)
+                    yield [course]
+        except Exception as e:
+            UPSTREAM_ERRORS.inc("openai")
+            logger.warning("OpenAI API 호출 실패, 실제 데이터만 사용: %s", e)
+
+    def _should_supplement_with_openai(self, current_count: int) -> bool:
+        """실제 데이터 코스가 race_min_courses개 미만이고 OpenAI 사용이 허용되는지 확인"""
         use_openai = self._should_use_openai()
-        
-        if use_openai and self.api_key and self.api_key != "":
-            try:
-                print("🤖 실제 데이터가 없어 OpenAI API로 추천 생성 시도...")
-                ai_courses = await self._call_openai_api(preference)
-                if ai_courses:
-                    return ai_courses
-            except Exception as e:
-                print(f"⚠️ OpenAI API 호출 실패, 기본 로직 사용: {str(e)}")
-        else:
-            if not use_openai:
-                print("ℹ️ OpenAI API 사용 비활성화됨, 기본 로직 사용")
+        if use_openai and self.api_key and self.api_key != "" and current_count < self.race_min_courses:
+            return True
+        if not use_openai:
+            logger.debug("OpenAI API 사용 비활성화됨 (USE_OPENAI=false 또는 미설정)")
+        elif not self.api_key or self.api_key == "":
+            logger.debug("OpenAI API 키가 설정되지 않아 실제 데이터만 사용합니다.")
+        return False
 
-        # 기본 추천 로직: 지역/관심사/예산 기반
-        return await self._generate_smart_recommendations(preference)
+    @staticmethod
+    def _unique_by_title(courses: List[DateCourse]) -> List[DateCourse]:
+        """제목 기준 중복 제거 (처음 나온 코스 유지)"""
+        seen_titles = set()
+        unique_courses = []
+        for course in courses:
+            if course.title not in seen_titles:
+                seen_titles.add(course.title)
+                unique_courses.append(course)
+        return unique_courses
 
-    async def _generate_smart_recommendations(self, preference: Preference) -> List[DateCourse]:
-        """지역/관심사/예산 기반 스마트 추천"""
+    @timed("ai.smart_recommendations")
+    async def _generate_smart_recommendations(
+        self,
+        preference: Preference,
+        timings: Optional[List[FetchTiming]] = None,
+        rule_based_fallback: bool = True
+    ) -> List[DateCourse]:
+        """지역/관심사/예산 기반 스마트 추천 (rule_based_fallback=False면 실제 데이터가 없을 때 빈 리스트)"""
         courses = []
-        
-        # 관심사에 따라 실제 데이터 가져오기
-        if '영화' in preference.interests:
-            movies = await self.culture_service.get_movies(preference.location, preference.date)
-            print(f"영화 데이터 가져옴: {len(movies)}개")  # 디버깅용
-            
+
+        # 관심사별 실제 데이터를 동시에 가져오기 (마감 시간 초과 소스는 제외)
+        results, fetch_timings = await fan_out(
+            self._build_source_fetches(preference),
+            self.fetch_deadline
+        )
+        self._record_fetch_timings(fetch_timings, timings)
+
+        # 영화 → 전시회 → 공연 → 나머지 관심사 순서로 코스 변환
+        for source in self._course_sources(preference):
+            courses.extend(self._courses_from_source(source, results.get(source, []), preference))
+
+        # 실제 데이터가 있으면 반환
+        logger.info("최종 코스 목록: %d개", len(courses))
+        if logger.isEnabledFor(logging.DEBUG):
+            for idx, course in enumerate(courses):
+                logger.debug("코스 %d: %s (%s)", idx + 1, course.title, course.category, extra={"sampled": True})
+
+        if courses or not rule_based_fallback:
+            return courses[:10]  # 최대 10개
+
+        # 실제 데이터가 없으면 기존 로직 사용
+        return self._rule_based_courses(preference)
+
+    def _record_fetch_timings(
+        self,
+        fetch_timings: List[FetchTiming],
+        timings: Optional[List[FetchTiming]]
+    ) -> None:
+        """소스별 조회 결과를 메트릭/로그에 기록하고 호출자 리스트에 추가"""
+        if timings is not None:
+            timings.extend(fetch_timings)
+        for timing in fetch_timings:
+            SOURCE_FETCHES.inc(timing.source, timing.status)
+            if timing.status != "ok":
+                logger.warning(
+                    "데이터 소스 '%s' 조회 %s (%.0fms)", timing.source, timing.status, timing.elapsed_ms,
+                    extra={"fields": {"source": timing.source, "status": timing.status, "elapsed_ms": round(timing.elapsed_ms, 1)}}
+                )
+
+    @staticmethod
+    def _course_sources(preference: Preference) -> List[str]:
+        """코스로 변환할 데이터 소스 순서 (영화, 전시회, 공연 다음 나머지 관심사 순서)"""
+        sources = [source for source in ['영화', '전시회', '문화'] if source in preference.interests]
+        sources.extend(interest for interest in preference.interests if interest not in ['영화', '전시회', '문화'])
+        return sources
+
+    def _courses_from_source(
+        self,
+        source: str,
+        items: List[Dict[str, Any]],
+        preference: Preference
+    ) -> List[DateCourse]:
+        """데이터 소스 하나의 조회 결과를 DateCourse 목록으로 변환"""
+        now = datetime.now()  # 같은 묶음의 코스는 생성 시각 공유
+        courses = []
+
+        if source == '영화':
+            movies = items
             if not movies:
-                print("⚠️ 영화 데이터가 없습니다. TMDB API 키를 확인하세요.")
-                print(f"TMDB API 키 존재 여부: {bool(self.culture_service.tmdb_api_key)}")
+                logger.warning(
+                    "영화 데이터가 없습니다. TMDB API 키를 확인하세요. (키 존재 여부: %s)",
+                    bool(self.culture_service.tmdb_api_key)
+                )
             else:
-                print(f"✅ 영화 데이터 {len(movies)}개 수신 성공")
-            
-            movie_courses_count = 0
+                logger.debug("영화 데이터 %d개 수신 성공", len(movies))
+
             for idx, movie in enumerate(movies[:10]):  # 최대 10개로 증가
                 movie_title = movie.get('title', '').strip()
                 if not movie_title:
-                    print(f"⚠️ 제목이 없는 영화 건너뜀: ID={movie.get('id')}, 원제목={movie.get('original_title', 'N/A')}")
+                    logger.debug(
+                        "제목이 없는 영화 건너뜀: ID=%s, 원제목=%s", movie.get('id'), movie.get('original_title', 'N/A'),
+                        extra={"sampled": True}
+                    )
                     continue
-                
-                print(f"✅ 영화 코스 생성: '{movie_title}'")
-                    
+
                 course = DateCourse(
-                    id=f"movie_{movie.get('id')}_{datetime.now().timestamp()}",
+                    id=f"movie_{movie.get('id')}_{now.timestamp()}",
                     title=movie_title,  # 실제 영화 제목 사용
                     description=(movie.get('overview', '') or f"{movie_title}를 관람하세요.").strip(),
                     location=preference.location,
@@ -232,25 +433,25 @@ class OpenAIService(AIService):
                     price_range='보통',
                     tags=['영화', '데이트'],
                     rating=min(movie.get('vote_average', 0) / 2, 5.0),  # TMDB는 10점 만점, 5점 만점으로 변환
-                    created_at=datetime.now(),
-                    updated_at=datetime.now()
+                    created_at=now,
+                    updated_at=now
                 )
                 courses.append(course)
-                movie_courses_count += 1
-                print(f"   → 코스 추가 완료: ID={course.id}, 제목='{course.title}'")
-            
-            print(f"✅ 생성된 영화 코스: {movie_courses_count}개 (전체 courses: {len(courses)}개)")
-        
-        if '전시회' in preference.interests:
-            exhibitions = await self.culture_service.get_exhibitions(preference.location, preference.date)
-            print(f"전시회 데이터 가져옴: {len(exhibitions)}개")  # 디버깅용
+                logger.debug("영화 코스 추가: ID=%s, 제목='%s'", course.id, course.title, extra={"sampled": True})
+
+            logger.debug("생성된 영화 코스: %d개", len(courses))
+            return courses
+
+        if source == '전시회':
+            exhibitions = items
+            logger.debug("전시회 데이터 가져옴: %d개", len(exhibitions))
             for idx, exhibition in enumerate(exhibitions[:5]):  # 최대 5개
                 exhibition_title = exhibition.get('title', '').strip()
                 if not exhibition_title:
                     continue
-                    
+
                 course = DateCourse(
-                    id=f"exhibition_{exhibition.get('seq', idx)}_{datetime.now().timestamp()}",
+                    id=f"exhibition_{exhibition.get('seq', idx)}_{now.timestamp()}",
                     title=exhibition_title,  # 실제 전시회 제목 사용
                     description=(exhibition.get('description', '') or f"{exhibition_title}를 관람하세요.").strip(),
                     location=exhibition.get('place', preference.location) or preference.location,
@@ -259,37 +460,22 @@ class OpenAIService(AIService):
                     price_range='보통',
                     tags=['전시회', '문화'],
                     rating=4.5,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now()
+                    created_at=now,
+                    updated_at=now
                 )
                 courses.append(course)
-        
-        if '문화' in preference.interests:
-            # 문화 세부 옵션 확인
-            genre = None
-            if preference.interest_details:
-                culture_details = preference.interest_details.get('문화', [])
-                if culture_details:
-                    genre_map = {
-                        '뮤지컬': '뮤지컬',
-                        '연극': '연극',
-                        '콘서트': '콘서트',
-                        '공연': '공연'
-                    }
-                    for detail in culture_details:
-                        if detail in genre_map:
-                            genre = genre_map[detail]
-                            break
-            
-            performances = await self.culture_service.get_performances(preference.location, preference.date, genre)
-            print(f"공연 데이터 가져옴: {len(performances)}개")  # 디버깅용
+            return courses
+
+        if source == '문화':
+            performances = items
+            logger.debug("공연 데이터 가져옴: %d개", len(performances))
             for idx, performance in enumerate(performances[:5]):  # 최대 5개
                 performance_title = performance.get('title', '').strip()
                 if not performance_title:
                     continue
-                    
+
                 course = DateCourse(
-                    id=f"performance_{performance.get('seq', idx)}_{datetime.now().timestamp()}",
+                    id=f"performance_{performance.get('seq', idx)}_{now.timestamp()}",
                     title=performance_title,  # 실제 공연 제목 사용
                     description=(performance.get('description', '') or f"{performance_title}를 관람하세요.").strip(),
                     location=performance.get('place', preference.location) or preference.location,
@@ -298,105 +484,62 @@ class OpenAIService(AIService):
                     price_range='비쌈',
                     tags=[performance.get('genre', '문화') or '문화', '공연'],
                     rating=4.5,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now()
+                    created_at=now,
+                    updated_at=now
                 )
                 courses.append(course)
-        
-        # 다른 관심사에 대한 실제 데이터 가져오기
-        for interest in preference.interests:
-            if interest in ['영화', '전시회', '문화']:
-                continue  # 이미 처리됨
-            
-            places = []
-            
+            return courses
+
+        # 다른 관심사: 실제 장소 데이터를 DateCourse로 변환
+        interest = source
+        places = items
+        for idx, place in enumerate(places[:3]):  # 각 관심사당 최대 3개
+            # 가격대 추정 (카테고리별)
+            price_range = '보통'
             if interest == '카페':
-                places = await self.place_service.get_cafes(preference.location)
-            elif interest == '맛집':
-                # 맛집 세부 옵션 확인
-                cuisine_type = None
-                if preference.interest_details:
-                    restaurant_details = preference.interest_details.get('맛집', [])
-                    if restaurant_details:
-                        cuisine_type = restaurant_details[0]  # 첫 번째 옵션 사용
-                places = await self.place_service.get_restaurants(preference.location, cuisine_type)
-            elif interest == '산책':
-                places = await self.place_service.get_parks(preference.location)
-            elif interest == '쇼핑':
-                places = await self.place_service.get_shopping(preference.location)
-            elif interest == '실내활동':
-                # 실내활동 세부 옵션 확인
-                activity_type = None
-                if preference.interest_details:
-                    indoor_details = preference.interest_details.get('실내활동', [])
-                    if indoor_details:
-                        activity_type = indoor_details[0]
-                places = await self.place_service.get_indoor_activities(preference.location, activity_type)
-            elif interest == '야외활동':
-                # 야외활동 세부 옵션 확인
-                activity_type = None
-                if preference.interest_details:
-                    outdoor_details = preference.interest_details.get('야외활동', [])
-                    if outdoor_details:
-                        activity_type = outdoor_details[0]
-                places = await self.place_service.get_outdoor_activities(preference.location, activity_type)
-            
-            # 실제 장소 데이터를 DateCourse로 변환
-            for idx, place in enumerate(places[:3]):  # 각 관심사당 최대 3개
-                # 가격대 추정 (카테고리별)
+                price_range = '저렴'
+            elif interest in ['맛집', '쇼핑']:
                 price_range = '보통'
-                if interest == '카페':
-                    price_range = '저렴'
-                elif interest in ['맛집', '쇼핑']:
-                    price_range = '보통'
-                elif interest in ['실내활동', '야외활동']:
-                    price_range = '저렴'
-                
-                # 소요시간 추정
-                duration_map = {
-                    '카페': 60,
-                    '맛집': 90,
-                    '산책': 120,
-                    '쇼핑': 180,
-                    '실내활동': 120,
-                    '야외활동': 180,
-                }
-                duration = duration_map.get(interest, 120)
-                
-                course = DateCourse(
-                    id=f"{interest}_{place.get('id', idx)}_{datetime.now().timestamp()}",
-                    title=place.get('name', f"{interest} 장소"),
-                    description=f"{place.get('address', preference.location)}에 위치한 {place.get('name', interest)}입니다. {place.get('category', '')}",
-                    location=place.get('address', preference.location),
-                    category=interest,
-                    duration=duration,
-                    price_range=price_range,
-                    tags=[interest, place.get('category', '')],
-                    rating=place.get('rating', 4.0),
-                    created_at=datetime.now(),
-                    updated_at=datetime.now()
-                )
-                courses.append(course)
-        
-        # 실제 데이터가 있으면 반환
-        print(f"=== 최종 코스 목록 ===")
-        print(f"총 코스 개수: {len(courses)}")
-        for idx, course in enumerate(courses):
-            print(f"코스 {idx+1}: {course.title} ({course.category})")
-        print(f"===================")
-        
-        if courses:
-            return courses[:10]  # 최대 10개
-        
-        # 실제 데이터가 없으면 기존 로직 사용
-        location_places = self._get_places_for_location(preference.location)
-        filtered_places = self._filter_by_preferences(location_places, preference)
-        recommended_places = self._compose_course_by_time(filtered_places, preference.time_of_day)
-        
+            elif interest in ['실내활동', '야외활동']:
+                price_range = '저렴'
+
+            # 소요시간 추정
+            duration_map = {
+                '카페': 60,
+                '맛집': 90,
+                '산책': 120,
+                '쇼핑': 180,
+                '실내활동': 120,
+                '야외활동': 180,
+            }
+            duration = duration_map.get(interest, 120)
+
+            course = DateCourse(
+                id=f"{interest}_{place.get('id', idx)}_{now.timestamp()}",
+                title=place.get('name', f"{interest} 장소"),
+                description=f"{place.get('address', preference.location)}에 위치한 {place.get('name', interest)}입니다. {place.get('category', '')}",
+                location=place.get('address', preference.location),
+                category=interest,
+                duration=duration,
+                price_range=price_range,
+                tags=[interest, place.get('category', '')],
+                rating=place.get('rating', 4.0),
+                created_at=now,
+                updated_at=now
+            )
+            courses.append(course)
+        return courses
+
+    def _rule_based_courses(self, preference: Preference) -> List[DateCourse]:
+        """실제 데이터가 없을 때 장소 DB 점수 기반 추천 (없으면 기본 코스 1개)"""
+        now = datetime.now()  # 같은 묶음의 코스는 생성 시각 공유
+        courses = []
+        recommended_places = self._rank_places(preference, k=3)
+
         # DateCourse 엔티티로 변환
-        for idx, place in enumerate(recommended_places[:3]):
+        for idx, place in enumerate(recommended_places):
             course = DateCourse(
-                id=f"rec_{idx}_{datetime.now().timestamp()}",
+                id=f"rec_{idx}_{now.timestamp()}",
                 title=f"{place['name']} 데이트",
                 description=self._generate_description(place, preference),
                 location=preference.location,
@@ -405,91 +548,123 @@ class OpenAIService(AIService):
                 price_range=place['price'],
                 tags=place['tags'],
                 rating=place['rating'],
-                created_at=datetime.now(),
-                updated_at=datetime.now()
+                created_at=now,
+                updated_at=now
             )
             courses.append(course)
-        
+
         return courses if courses else [self._create_fallback_course(preference)]
 
-    def _get_places_for_location(self, location: str) -> List[Dict[str, Any]]:
-        """지역에 맞는 장소 가져오기"""
+    async def prefetch_sources(self, location: str, interests: List[str], date: str) -> List[FetchTiming]:
+        """관심사별 데이터 소스를 미리 조회해 캐시만 채움 (코스는 만들지 않음)"""
+        preference = Preference(budget="보통", location=location, interests=interests, date=date, time_of_day="오후")
+        _, fetch_timings = await fan_out(self._build_source_fetches(preference), self.fetch_deadline)
+        return fetch_timings
+
+    def _build_source_fetches(self, preference: Preference) -> Dict[str, Awaitable[List[Dict[str, Any]]]]:
+        """관심사별 데이터 소스 조회 코루틴 구성 (관심사 순서 유지)"""
+        fetches: Dict[str, Awaitable[List[Dict[str, Any]]]] = {}
+        details = preference.interest_details or {}
+
+        if '영화' in preference.interests:
+            fetches['영화'] = self.culture_service.get_movies(preference.location, preference.date)
+
+        if '전시회' in preference.interests:
+            fetches['전시회'] = self.culture_service.get_exhibitions(preference.location, preference.date)
+
+        if '문화' in preference.interests:
+            # 문화 세부 옵션 확인
+            genre = None
+            culture_details = details.get('문화', [])
+            if culture_details:
+                genre_map = {
+                    '뮤지컬': '뮤지컬',
+                    '연극': '연극',
+                    '콘서트': '콘서트',
+                    '공연': '공연'
+                }
+                for detail in culture_details:
+                    if detail in genre_map:
+                        genre = genre_map[detail]
+                        break
+            fetches['문화'] = self.culture_service.get_performances(preference.location, preference.date, genre)
+
+        for interest in preference.interests:
+            if interest in fetches or interest in ['영화', '전시회', '문화']:
+                continue
+
+            if interest == '카페':
+                fetches[interest] = self.place_service.get_cafes(preference.location)
+            elif interest == '맛집':
+                # 맛집 세부 옵션 확인 (첫 번째 옵션 사용)
+                restaurant_details = details.get('맛집', [])
+                cuisine_type = restaurant_details[0] if restaurant_details else None
+                fetches[interest] = self.place_service.get_restaurants(preference.location, cuisine_type)
+            elif interest == '산책':
+                fetches[interest] = self.place_service.get_parks(preference.location)
+            elif interest == '쇼핑':
+                fetches[interest] = self.place_service.get_shopping(preference.location)
+            elif interest == '실내활동':
+                indoor_details = details.get('실내활동', [])
+                activity_type = indoor_details[0] if indoor_details else None
+                fetches[interest] = self.place_service.get_indoor_activities(preference.location, activity_type)
+            elif interest == '야외활동':
+                outdoor_details = details.get('야외활동', [])
+                activity_type = outdoor_details[0] if outdoor_details else None
+                fetches[interest] = self.place_service.get_outdoor_activities(preference.location, activity_type)
+
+        return fetches
+
+    @staticmethod
+    def _build_places_index(places_db: Mapping[str, Sequence[Dict[str, Any]]]) -> GridSpatialIndex:
+        """좌표가 있는 장소로 공간 색인 구성 (항목은 (지역, 지역 내 인덱스))"""
+        index = GridSpatialIndex()
+        if isinstance(places_db, CatalogPlacesDB):
+            coordinates = places_db.catalog.iter_coordinates()
+        else:
+            coordinates = (
+                (area, idx, place['lat'], place['lng'])
+                for area, places in places_db.items()
+                for idx, place in enumerate(places)
+                if place.get('lat') is not None and place.get('lng') is not None
+            )
+        for area, idx, lat, lng in coordinates:
+            index.insert((area, idx), lat, lng, (area, idx))
+        return index
+
+    def _rank_places(self, preference: Preference, k: int) -> List[Dict[str, Any]]:
+        """지역 장소 중 관심사/예산/시간대 점수 상위 k개 선택"""
+        location_key, places = self._get_places_for_location(preference.location)
+        scorer = self._scorers.get(location_key)
+        if scorer is None:
+            scorer = self._scorers[location_key] = PlaceScorer(places)
+        return scorer.top_places(preference, k)
+
+    def _get_places_for_location(self, location: str) -> Tuple[Hashable, Sequence[Dict[str, Any]]]:
+        """지역에 맞는 장소 가져오기 (장소 목록을 식별하는 키와 함께 반환)"""
         # 정확히 일치하는 지역
         if location in self.places_db:
-            return self.places_db[location]
+            return location, self.places_db[location]
         
         # 부분 일치하는 지역 찾기
         for key in self.places_db.keys():
             if key in location or location in key:
-                return self.places_db[key]
+                return key, self.places_db[key]
+
+        # 알려진 지역/구 중심 좌표가 있으면 반경 내 가까운 장소 반환
+        center = find_district_center(location)
+        if center is not None:
+            nearby = self.places_index.nearest(
+                center[0], center[1], self.nearby_limit, max_radius_m=self.nearby_radius_m
+            )
+            if nearby:
+                return center, [self.places_db[area][idx] for _, (area, idx) in nearby]
         
         # 일치하는 지역이 없으면 모든 장소 반환
         all_places = []
         for places in self.places_db.values():
             all_places.extend(places)
-        return all_places
-
-    def _filter_by_preferences(self, places: List[Dict[str, Any]], preference: Preference) -> List[Dict[str, Any]]:
-        """관심사와 예산에 맞게 필터링"""
-        filtered = []
-        
-        for place in places:
-            # 예산 체크
-            if place['price'] != preference.budget:
-                # 예산이 다르면 점수 감소하지만 제외하지는 않음
-                place_score = 0.5
-            else:
-                place_score = 1.0
-            
-            # 관심사 체크
-            for interest in preference.interests:
-                if interest in place['tags'] or interest in place['category']:
-                    place_score += 1.0
-                    
-                    # 세부 옵션 체크 (추가 점수)
-                    if preference.interest_details and interest in preference.interest_details:
-                        details = preference.interest_details[interest]
-                        for detail in details:
-                            # 세부 옵션이 태그나 카테고리에 포함되면 추가 점수
-                            if detail in place['tags'] or detail.lower() in str(place.get('name', '')).lower():
-                                place_score += 0.5
-            
-            if place_score > 0:
-                filtered.append({**place, 'score': place_score})
-        
-        # 점수순으로 정렬
-        filtered.sort(key=lambda x: x.get('score', 0), reverse=True)
-        return filtered
-
-    def _compose_course_by_time(self, places: List[Dict[str, Any]], time_of_day: str) -> List[Dict[str, Any]]:
-        """시간대에 맞는 코스 구성"""
-        time_category_map = {
-            "아침": ["카페", "브런치", "산책"],
-            "점심": ["식당", "맛집", "카페"],
-            "오후": ["카페", "쇼핑", "문화", "갤러리", "공원"],
-            "저녁": ["식당", "맛집", "전망대", "공연"],
-            "밤": ["바", "전망대", "야경"]
-        }
-        
-        preferred_categories = time_category_map.get(time_of_day, ["카페", "식당"])
-        
-        # 시간대에 맞는 장소 우선 선택
-        prioritized = []
-        for place in places:
-            priority = 0
-            for cat in preferred_categories:
-                if cat in place['category'] or cat in place['tags']:
-                    priority += 2
-            
-            if priority > 0:
-                prioritized.append({**place, 'time_priority': priority})
-            else:
-                prioritized.append({**place, 'time_priority': 0})
-        
-        # 시간대 우선순위와 점수를 합산하여 정렬
-        prioritized.sort(key=lambda x: (x.get('time_priority', 0) + x.get('score', 0)), reverse=True)
-        
-        return prioritized
+        return None, all_places
 
     def _generate_description(self, place: Dict[str, Any], preference: Preference) -> str:
         """장소 설명 생성"""
@@ -512,6 +687,7 @@ class OpenAIService(AIService):
 
     def _create_fallback_course(self, preference: Preference) -> DateCourse:
         """기본 대체 코스 생성"""
+        now = datetime.now()
         return DateCourse(
             id=None,
             title=f"{preference.location} 추천 데이트 코스",
@@ -522,91 +698,209 @@ class OpenAIService(AIService):
             price_range=preference.budget,
             tags=preference.interests,
             rating=4.0,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=now,
+            updated_at=now
         )
 
+    @timed("openai.call_api")
     async def _call_openai_api(self, preference: Preference) -> List[DateCourse]:
-        """OpenAI API를 호출하여 데이트 코스 추천"""
+        """OpenAI API를 호출하여 데이트 코스 추천 (실패 시 그때까지 받은 코스 또는 None)"""
+        courses: List[DateCourse] = []
+        try:
+            async with aclosing(self._iter_openai_courses(preference)) as ai_courses:
+                async for course in ai_courses:
+                    courses.append(course)
+        except Exception as e:
+            UPSTREAM_ERRORS.inc("openai")
+            logger.error("OpenAI API 호출 중 오류: %s", e)
+        return courses if courses else None
+
+    async def _iter_openai_courses(self, preference: Preference) -> AsyncIterator[DateCourse]:
+        """OpenAI 추천 코스를 만들어지는 대로 내보냄 (OPENAI_STREAM=true면 스트리밍 응답을 증분 파싱)"""
+        # 관심사 순서나 세부 옵션 키 순서만 다른 요청이 같은 프롬프트(같은 캐시 항목)를 쓰도록 정규화
+        prompt = self._build_prompt(preference.canonical_for_prompt())
+
+        if not self.openai_stream:
+            content = await self.completion_cache.get_or_create(
+                self.model, _SYSTEM_PROMPT, prompt, _TEMPERATURE,
+                lambda: self._request_completion(prompt)
+            )
+            for course in self._parse_completion(content, preference) or []:
+                yield course
+            return
+
+        while True:
+            cached = await self.completion_cache.get(self.model, _SYSTEM_PROMPT, prompt, _TEMPERATURE)
+            if cached is not None:
+                for course in self._parse_completion(cached, preference) or []:
+                    yield course
+                return
+
+            # 같은 프롬프트의 동시 요청은 하나만 스트리밍하고 나머지는 그 결과가 캐시되기를 기다림.
+            # 리더가 결과 없이 끝나면(실패, 중단) 다시 확인해 직접 요청
+            async with self.completion_cache.stream_flight(
+                self.model, _SYSTEM_PROMPT, prompt, _TEMPERATURE
+            ) as leader:
+                if leader:
+                    async with aclosing(self._stream_openai_courses(prompt, preference)) as courses:
+                        async for course in courses:
+                            yield course
+                    return
+
+    async def _stream_openai_courses(self, prompt: str, preference: Preference) -> AsyncIterator[DateCourse]:
+        """스트리밍 응답을 증분 파싱해 코스를 내보내고 완료된 응답을 캐시에 저장"""
+        parser = JsonArrayObjectParser()
+        courses_data: List[Dict[str, Any]] = []
+        parts: List[str] = []
+        started = time.perf_counter()
+        stream = await self._get_openai_client().chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=_TEMPERATURE,
+            max_tokens=_MAX_TOKENS,
+            stream=True
+        )
+        try:
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                parts.append(delta)
+                for course_data in parser.feed(delta):
+                    courses_data.append(course_data)
+                    if len(courses_data) == 1:
+                        STAGE_DURATION.observe(time.perf_counter() - started, "openai.upstream.first_course")
+                    yield self._course_from_ai_data(course_data, preference, len(courses_data) - 1)
+                    if len(courses_data) >= _MAX_COURSES:
+                        break
+                if len(courses_data) >= _MAX_COURSES:
+                    break
+        finally:
+            # 필요한 코스를 모두 받았거나 호출자가 중단하면 연결을 끊어 남은 토큰 생성을 멈춤
+            await stream.response.aclose()
+            STAGE_DURATION.observe(time.perf_counter() - started, "openai.upstream.chat_completion_stream")
+
+        if courses_data:
+            # 중간에 끊은 응답도 다음 요청에서 그대로 파싱되도록 받은 코스만 JSON 배열로 저장
+            await self.completion_cache.set(
+                self.model, _SYSTEM_PROMPT, prompt, _TEMPERATURE,
+                json.dumps(courses_data, ensure_ascii=False)
+            )
+            return
+
+        # 배열 원소 객체가 없는 응답(단일 객체, 일반 텍스트)은 전체 본문으로 파싱
+        content = "".join(parts)
+        await self.completion_cache.set(self.model, _SYSTEM_PROMPT, prompt, _TEMPERATURE, content)
+        for course in self._parse_completion(content, preference) or []:
+            yield course
+
+    def _parse_completion(self, content: str, preference: Preference) -> Optional[List[DateCourse]]:
+        """채팅 완성 응답 본문을 코스 목록으로 변환 (JSON이 아니면 텍스트 코스 1개)"""
+        now = datetime.now()  # 같은 묶음의 코스는 생성 시각 공유
+        if not content:
+            return None
+
+        # JSON 파싱 시도
         try:
+            # JSON 블록 추출 (```json ... ``` 형식일 수 있음)
+            if "```json" in content:
+                json_start = content.find("```json") + 7
+                json_end = content.find("```", json_start)
+                content = content[json_start:json_end].strip()
+            elif "```" in content:
+                json_start = content.find("```") + 3
+                json_end = content.find("```", json_start)
+                content = content[json_start:json_end].strip()
+
+            with stage_timer("openai.parse_response"):
+                data = json.loads(content)
+
+            # 응답 형식에 따라 처리
+            courses_data = data.get("courses", [data]) if isinstance(data, dict) else data
+
+            courses = []
+            for course_data in courses_data[:_MAX_COURSES]:  # 최대 3개
+                if isinstance(course_data, dict):
+                    courses.append(self._course_from_ai_data(course_data, preference, len(courses), now))
+
+            return courses if courses else None
+
+        except json.JSONDecodeError:
+            # JSON 파싱 실패 시 텍스트 기반으로 처리
+            logger.warning("JSON 파싱 실패, 텍스트 응답: %s", content[:200])
+
+            # 간단한 텍스트 기반 코스 생성
+            course = DateCourse(
+                id=f"ai_text_{now.timestamp()}",
+                title=f"AI 추천: {preference.location} 데이트",
+                description=content[:500],  # 첫 500자만 사용
+                location=preference.location,
+                category=preference.interests[0] if preference.interests else "일반",
+                duration=120,
+                price_range=preference.budget,
+                tags=preference.interests,
+                rating=4.5,
+                created_at=now,
+                updated_at=now
+            )
+            return [course]
+
+    @staticmethod
+    def _course_from_ai_data(
+        course_data: Dict[str, Any],
+        preference: Preference,
+        index: int,
+        now: Optional[datetime] = None
+    ) -> DateCourse:
+        """AI 응답의 코스 객체 하나를 DateCourse로 변환 (빠진 필드는 선호도로 채움)"""
+        now = now or datetime.now()
+        return DateCourse(
+            id=f"ai_{now.timestamp()}_{index}",
+            title=course_data.get("title", f"{preference.location} 데이트"),
+            description=course_data.get("description", "AI 추천 데이트 코스"),
+            location=course_data.get("location", preference.location),
+            category=course_data.get("category", preference.interests[0] if preference.interests else "일반"),
+            duration=course_data.get("duration", 120),
+            price_range=course_data.get("price_range", preference.budget),
+            tags=course_data.get("tags", preference.interests),
+            rating=float(course_data.get("rating", 4.5)),
+            created_at=now,
+            updated_at=now
+        )
+
+    def _get_openai_client(self):
+        """AsyncOpenAI 클라이언트 (연결 풀 재사용을 위해 한 번만 생성)"""
+        if self._openai_client is None:
             from openai import AsyncOpenAI
-            
-            client = AsyncOpenAI(api_key=self.api_key)
-            
-            prompt = self._build_prompt(preference)
-            
-            response = await client.chat.completions.create(
+            self._openai_client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        return self._openai_client
+
+    async def _request_completion(self, prompt: str) -> str:
+        """채팅 완성 API 호출 후 응답 본문 반환"""
+        with stage_timer("openai.upstream.chat_completion"):
+            response = await self._get_openai_client().chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "당신은 한국의 데이트 코스 추천 전문가입니다. 사용자의 선호도에 맞는 실제 존재하는 장소와 활동을 추천해주세요."},
+                    {"role": "system", "content": _SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.7,
-                max_tokens=1500
+                temperature=_TEMPERATURE,
+                max_tokens=_MAX_TOKENS
             )
-            
-            content = response.choices[0].message.content
-            
-            # JSON 파싱 시도
-            try:
-                # JSON 블록 추출 (```json ... ``` 형식일 수 있음)
-                if "```json" in content:
-                    json_start = content.find("```json") + 7
-                    json_end = content.find("```", json_start)
-                    content = content[json_start:json_end].strip()
-                elif "```" in content:
-                    json_start = content.find("```") + 3
-                    json_end = content.find("```", json_start)
-                    content = content[json_start:json_end].strip()
-                
-                data = json.loads(content)
-                
-                # 응답 형식에 따라 처리
-                courses_data = data.get("courses", [data]) if isinstance(data, dict) else data
-                
-                courses = []
-                for course_data in courses_data[:3]:  # 최대 3개
-                    if isinstance(course_data, dict):
-                        course = DateCourse(
-                            id=f"ai_{datetime.now().timestamp()}_{len(courses)}",
-                            title=course_data.get("title", f"{preference.location} 데이트"),
-                            description=course_data.get("description", "AI 추천 데이트 코스"),
-                            location=course_data.get("location", preference.location),
-                            category=course_data.get("category", preference.interests[0] if preference.interests else "일반"),
-                            duration=course_data.get("duration", 120),
-                            price_range=course_data.get("price_range", preference.budget),
-                            tags=course_data.get("tags", preference.interests),
-                            rating=float(course_data.get("rating", 4.5)),
-                            created_at=datetime.now(),
-                            updated_at=datetime.now()
-                        )
-                        courses.append(course)
-                
-                return courses if courses else None
-                
-            except json.JSONDecodeError:
-                # JSON 파싱 실패 시 텍스트 기반으로 처리
-                print(f"JSON 파싱 실패, 텍스트 응답: {content[:200]}")
-                
-                # 간단한 텍스트 기반 코스 생성
-                course = DateCourse(
-                    id=f"ai_text_{datetime.now().timestamp()}",
-                    title=f"AI 추천: {preference.location} 데이트",
-                    description=content[:500],  # 첫 500자만 사용
-                    location=preference.location,
-                    category=preference.interests[0] if preference.interests else "일반",
-                    duration=120,
-                    price_range=preference.budget,
-                    tags=preference.interests,
-                    rating=4.5,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now()
-                )
-                return [course]
-                
-        except Exception as e:
-            print(f"OpenAI API 호출 중 오류: {str(e)}")
-            return None
+        return response.choices[0].message.content or ""
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """채팅 완성 캐시 통계"""
+        return {"completions": self.completion_cache.stats()}
+
+    async def aclose(self) -> None:
+        """OpenAI 클라이언트 연결 정리 (FastAPI shutdown)"""
+        if self._openai_client is not None:
+            await self._openai_client.close()
+            self._openai_client = None
 
     def _build_prompt(self, preference: Preference) -> str:
         """AI 프롬프트 생성 (OpenAI API용)"""
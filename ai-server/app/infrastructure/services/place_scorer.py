@@ -0,0 +1,176 @@
+from typing import Any, Dict, List, Sequence
+from app.domain.value_objects.preference import Preference
+
+# 시간대별 우선 카테고리
+TIME_CATEGORY_MAP: Dict[str, List[str]] = {
+    "아침": ["카페", "브런치", "산책"],
+    "점심": ["식당", "맛집", "카페"],
+    "오후": ["카페", "쇼핑", "문화", "갤러리", "공원"],
+    "저녁": ["식당", "맛집", "전망대", "공연"],
+    "밤": ["바", "전망대", "야경"]
+}
+DEFAULT_TIME_CATEGORIES = ["카페", "식당"]
+
+# 점수는 0.5 단위이므로 내부적으로 0.5를 1로 하는 정수 단위로 계산
+_HALF = 1
+_ONE = 2
+_TIME_PRIORITY = 4  # 시간대 카테고리 일치 시 +2
+
+# 관심사/세부 옵션 조건별 비트셋 캐시 상한 (요청마다 임의 문자열이 들어와도 메모리가 늘지 않도록)
+_MAX_CACHED_TERMS = 256
+
+
+def _add(planes: List[int], mask: int, units: int) -> None:
+    """
+    비트 슬라이스 카운터에 mask에 속한 모든 장소의 값을 units만큼 더함
+
+    planes[b]의 i번째 비트 = 장소 i 값의 b번째 이진 자리.
+    장소 수와 무관하게 정수 비트 연산 몇 번으로 전체 장소를 한 번에 갱신
+    """
+    bit = 0
+    while units:
+        if units & 1:
+            carry = mask
+            position = bit
+            while carry:
+                # 상위 자리(예: 시간대 가중치 4)는 아직 없는 비트 평면에 바로 더해질 수 있음
+                while position >= len(planes):
+                    planes.append(0)
+                plane = planes[position]
+                planes[position] = plane ^ carry
+                carry &= plane
+                position += 1
+        units >>= 1
+        bit += 1
+
+
+def _value(planes: List[int], index: int) -> int:
+    return sum(((plane >> index) & 1) << bit for bit, plane in enumerate(planes))
+
+
+def _remember(cache: Dict[str, int], key: str, mask: int) -> None:
+    """상한을 넘으면 가장 먼저 넣은 항목을 버리고 저장"""
+    if len(cache) >= _MAX_CACHED_TERMS:
+        del cache[next(iter(cache))]
+    cache[key] = mask
+
+
+def _lowest_indices(mask: int, count: int) -> List[int]:
+    indices = []
+    while mask and len(indices) < count:
+        lowest = mask & -mask
+        indices.append(lowest.bit_length() - 1)
+        mask ^= lowest
+    return indices
+
+
+class PlaceScorer:
+    """
+    장소 목록을 비트셋으로 미리 부호화해 두고 선호도별 점수를 일괄 계산하는 엔진
+
+    태그/카테고리/이름 조건은 "조건을 만족하는 장소 집합" 비트셋으로 캐시하고,
+    점수는 비트 슬라이스 카운터로 전체 장소에 대해 한 번에 더한 뒤
+    상위 비트부터 후보를 좁혀 top-k만 고름 (전체 정렬 없음)
+    """
+
+    def __init__(self, places: Sequence[Dict[str, Any]]):
+        self.places = list(places)
+        self._size = len(self.places)
+        self._all = (1 << self._size) - 1
+        self._names = [str(place.get('name', '')).lower() for place in self.places]
+
+        self._price_masks: Dict[str, int] = {}
+        self._tag_masks: Dict[str, int] = {}
+        self._category_masks: Dict[str, int] = {}
+        for index, place in enumerate(self.places):
+            bit = 1 << index
+            self._price_masks[place['price']] = self._price_masks.get(place['price'], 0) | bit
+            self._category_masks[place['category']] = self._category_masks.get(place['category'], 0) | bit
+            for tag in set(place['tags']):
+                self._tag_masks[tag] = self._tag_masks.get(tag, 0) | bit
+
+        self._term_masks: Dict[str, int] = {}
+        self._detail_masks: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _term_mask(self, term: str) -> int:
+        """태그에 있거나 카테고리 문자열에 포함된 장소 집합"""
+        mask = self._term_masks.get(term)
+        if mask is None:
+            mask = self._tag_masks.get(term, 0)
+            for category, category_mask in self._category_masks.items():
+                if term in category:
+                    mask |= category_mask
+            _remember(self._term_masks, term, mask)
+        return mask
+
+    def _detail_mask(self, detail: str) -> int:
+        """세부 옵션이 태그에 있거나 이름에 포함된 장소 집합"""
+        mask = self._detail_masks.get(detail)
+        if mask is None:
+            mask = self._tag_masks.get(detail, 0)
+            needle = detail.lower()
+            for index, name in enumerate(self._names):
+                if needle in name:
+                    mask |= 1 << index
+            _remember(self._detail_masks, detail, mask)
+        return mask
+
+    def top_places(self, preference: Preference, k: int) -> List[Dict[str, Any]]:
+        """
+        선호도 점수 + 시간대 우선순위 기준 상위 k개 장소
+
+        순서는 (시간대 우선순위 + 점수) 내림차순, 점수 내림차순, 원래 순서 기준이며
+        반환 항목에는 'score'와 'time_priority'가 추가됨
+        """
+        if k <= 0 or not self._size:
+            return []
+
+        # 선호도 점수: 예산 일치 1.0 / 불일치 0.5, 관심사 일치 +1.0, 세부 옵션 일치 +0.5
+        score: List[int] = []
+        _add(score, self._all, _HALF)
+        _add(score, self._price_masks.get(preference.budget, 0), _HALF)
+        details = preference.interest_details or {}
+        for interest in preference.interests:
+            interest_mask = self._term_mask(interest)
+            if not interest_mask:
+                continue
+            _add(score, interest_mask, _ONE)
+            for detail in details.get(interest, []):
+                _add(score, interest_mask & self._detail_mask(detail), _HALF)
+
+        # 시간대 우선순위를 더한 합산 점수
+        combined = list(score)
+        preferred_categories = TIME_CATEGORY_MAP.get(preference.time_of_day, DEFAULT_TIME_CATEGORIES)
+        for category in preferred_categories:
+            _add(combined, self._term_mask(category), _TIME_PRIORITY)
+
+        # 정렬 키 = 합산 점수(상위 자리) + 점수(하위 자리)
+        ranking = score + combined
+
+        # 상위 비트부터 후보를 좁혀 top-k 선택
+        selected, tied = 0, self._all
+        k = min(k, self._size)
+        for plane in reversed(ranking):
+            with_bit = selected | (tied & plane)
+            count = with_bit.bit_count()
+            if count > k:
+                tied &= plane
+            elif count < k:
+                selected = with_bit
+                tied &= ~plane
+            else:
+                selected, tied = with_bit, 0
+                break
+        remaining = k - selected.bit_count()
+        indices = _lowest_indices(selected, k) + _lowest_indices(tied, remaining)
+
+        ranked = []
+        for index in indices:
+            place_score = _value(score, index) / _ONE
+            time_priority = (_value(combined, index) - _value(score, index)) // _ONE
+            ranked.append({**self.places[index], 'score': place_score, 'time_priority': time_priority})
+        ranked.sort(key=lambda place: (place['time_priority'] + place['score'], place['score']), reverse=True)
+        return ranked
@@ -1,15 +1,40 @@
+import logging
 import os
-import httpx
 from typing import List, Dict, Any, Optional
+from app.infrastructure.http.pooled_http_client import PooledHttpClient
+from app.infrastructure.http.circuit_breaker import CircuitOpenError
+from app.infrastructure.cache.single_flight import SingleFlight, normalize_key
+from app.infrastructure.cache.tiered_cache import CachedLoadError, TieredCache
+from app.infrastructure.observability.metrics import UPSTREAM_ERRORS, timed
+
+logger = logging.getLogger(__name__)
 
 
 class PlaceService:
     """실제 장소 데이터 서비스 (카카오 로컬 API)"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: Optional[PooledHttpClient] = None,
+        cache: Optional[TieredCache] = None
+    ):
+        # 공유 커넥션 풀 (주입되거나 새로 생성)
+        self.http_client = http_client or PooledHttpClient()
+        # L1(LRU) + L2(Redis) 캐시 (주입되거나 새로 생성)
+        self.cache = cache or TieredCache()
         self.kakao_api_key = os.getenv("KAKAO_REST_API_KEY", "")
-        self.kakao_base_url = "https://dapi.kakao.com/v2/local"
+        self.kakao_base_url = os.getenv("KAKAO_API_BASE_URL", "https://dapi.kakao.com") + "/v2/local"
+
+        # 동일 검색의 동시 호출을 하나의 카카오 API 호출로 합침
+        self._single_flight = SingleFlight()
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """합침 계층 통계 (공유 TieredCache 통계는 cache.stats()로 별도 조회)"""
+        return {
+            "single_flight": self._single_flight.stats(),
+        }
 
+    @timed("place.search_places")
     async def search_places(
         self,
         query: str,
@@ -17,52 +42,87 @@ class PlaceService:
         location: str,
         radius: int = 5000
     ) -> List[Dict[str, Any]]:
-        """카카오 로컬 API로 장소 검색"""
+        """카카오 로컬 API로 장소 검색 (동일 검색 동시 호출은 합침)"""
         if not self.kakao_api_key:
             return []
 
+        key = normalize_key(f"{location} {query}", self._get_category_code(category), radius)
+        try:
+            places = await self._single_flight.do(
+                key,
+                lambda: self.cache.get_or_load(
+                    "places",
+                    key,
+                    lambda: self._search_places(query, category, location, radius)
+                )
+            )
+        except CachedLoadError as e:
+            logger.debug("장소 검색 건너뜀 (%s): %s", category, e)
+            return []
+        except Exception:
+            # 실패는 로더가 기록했고 캐시가 error_ttl 동안 보관함
+            return []
+        return list(places)
+
+    @timed("place.upstream.kakao_search")
+    async def _search_places(
+        self,
+        query: str,
+        category: str,
+        location: str,
+        radius: int
+    ) -> List[Dict[str, Any]]:
+        """
+        카카오 키워드 검색 API 호출
+
+        Raises:
+            CircuitOpenError, httpx.HTTPError: 실패를 기록한 뒤 그대로 전파 (캐시가 error_ttl 동안 보관)
+        """
         try:
             # 지역명을 좌표로 변환 (간단한 예시 - 실제로는 주소 검색 API 사용)
             # 여기서는 키워드 검색 사용
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "Authorization": f"KakaoAK {self.kakao_api_key}"
-                }
-                
-                # 키워드 검색
-                search_query = f"{location} {query}"
-                response = await client.get(
-                    f"{self.kakao_base_url}/search/keyword.json",
-                    headers=headers,
-                    params={
-                        "query": search_query,
-                        "category_group_code": self._get_category_code(category),
-                        "radius": radius,
-                        "size": 15,
-                    },
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                places = []
-                for item in data.get("documents", [])[:10]:
-                    places.append({
-                        "id": item.get("id"),
-                        "name": item.get("place_name", ""),
-                        "address": item.get("address_name", ""),
-                        "road_address": item.get("road_address_name", ""),
-                        "phone": item.get("phone", ""),
-                        "category": item.get("category_name", ""),
-                        "x": float(item.get("x", 0)),
-                        "y": float(item.get("y", 0)),
-                        "place_url": item.get("place_url", ""),
-                        "rating": 4.0,  # 카카오 API에는 평점이 없으므로 기본값
-                    })
-                return places
+            headers = {
+                "Authorization": f"KakaoAK {self.kakao_api_key}"
+            }
+            
+            # 키워드 검색
+            search_query = f"{location} {query}"
+            response = await self.http_client.get(
+                f"{self.kakao_base_url}/search/keyword.json",
+                upstream="kakao",
+                headers=headers,
+                params={
+                    "query": search_query,
+                    "category_group_code": self._get_category_code(category),
+                    "radius": radius,
+                    "size": 15,
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            places = []
+            for item in data.get("documents", [])[:10]:
+                places.append({
+                    "id": item.get("id"),
+                    "name": item.get("place_name", ""),
+                    "address": item.get("address_name", ""),
+                    "road_address": item.get("road_address_name", ""),
+                    "phone": item.get("phone", ""),
+                    "category": item.get("category_name", ""),
+                    "x": float(item.get("x", 0)),
+                    "y": float(item.get("y", 0)),
+                    "place_url": item.get("place_url", ""),
+                    "rating": 4.0,  # 카카오 API에는 평점이 없으므로 기본값
+                })
+            return places
+        except CircuitOpenError as e:
+            logger.warning("장소 검색 건너뜀 (%s): %s", category, e)
+            raise
         except Exception as e:
-            print(f"장소 검색 실패 ({category}): {e}")
-            return []
+            UPSTREAM_ERRORS.inc("kakao")
+            logger.warning("장소 검색 실패 (%s): %s", category, e)
+            raise
 
     def _get_category_code(self, category: str) -> Optional[str]:
         """카테고리를 카카오 카테고리 코드로 변환"""
@@ -77,10 +137,12 @@ class PlaceService:
         }
         return category_map.get(category)
 
+    @timed("place.get_cafes")
     async def get_cafes(self, location: str) -> List[Dict[str, Any]]:
         """카페 검색"""
         return await self.search_places("카페", "카페", location)
 
+    @timed("place.get_restaurants")
     async def get_restaurants(self, location: str, cuisine_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """맛집 검색"""
         query = "맛집"
@@ -88,14 +150,17 @@ class PlaceService:
             query = f"{cuisine_type} {query}"
         return await self.search_places(query, "맛집", location)
 
+    @timed("place.get_parks")
     async def get_parks(self, location: str) -> List[Dict[str, Any]]:
         """공원 검색 (산책)"""
         return await self.search_places("공원", "산책", location)
 
+    @timed("place.get_shopping")
     async def get_shopping(self, location: str) -> List[Dict[str, Any]]:
         """쇼핑몰 검색"""
         return await self.search_places("쇼핑몰", "쇼핑", location)
 
+    @timed("place.get_cultural_places")
     async def get_cultural_places(self, location: str, place_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """문화시설 검색"""
         query = "문화시설"
@@ -103,6 +168,7 @@ class PlaceService:
             query = place_type
         return await self.search_places(query, "문화", location)
 
+    @timed("place.get_indoor_activities")
     async def get_indoor_activities(self, location: str, activity_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """실내활동 장소 검색"""
         query_map = {
@@ -117,6 +183,7 @@ class PlaceService:
         query = query_map.get(activity_type, "실내활동") if activity_type else "실내활동"
         return await self.search_places(query, "실내활동", location)
 
+    @timed("place.get_outdoor_activities")
     async def get_outdoor_activities(self, location: str, activity_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """야외활동 장소 검색"""
         query_map = {
@@ -0,0 +1,127 @@
+import asyncio
+import time
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Tuple
+from app.domain.value_objects.fetch_timing import FetchTiming
+
+
+async def iter_fan_out(
+    fetches: Dict[str, Awaitable[List[Any]]],
+    deadline: float,
+    timings: List[FetchTiming]
+) -> AsyncIterator[Tuple[str, List[Any]]]:
+    """
+    여러 데이터 소스 조회를 동시에 실행하고 끝나는 순서대로 결과를 내보냄
+
+    Args:
+        fetches: 소스 이름 → 조회 코루틴
+        deadline: 전체 조회 마감 시간(초)
+        timings: 종료 시 소스별 조회 시간(삽입 순서)을 추가할 리스트
+
+    Yields:
+        성공한 소스의 (소스 이름, 결과) 튜플.
+        마감을 넘기거나 실패한 소스는 건너뛰고 timeout/error로 기록됨.
+        호출자가 중간에 순회를 멈추면 남은 조회는 취소됨
+    """
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    ends_at = loop.time() + deadline
+    finished_at: Dict[str, float] = {}
+    statuses: Dict[str, str] = {}
+    item_counts: Dict[str, int] = {}
+
+    async def run(source: str, fetch: Awaitable[List[Any]]) -> List[Any]:
+        try:
+            return await fetch
+        finally:
+            finished_at[source] = time.perf_counter()
+
+    tasks = {
+        source: asyncio.ensure_future(run(source, fetch))
+        for source, fetch in fetches.items()
+    }
+    pending = set(tasks.values())
+    try:
+        while pending:
+            remaining = ends_at - loop.time()
+            if remaining <= 0:
+                break
+            _, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            # 같은 시점에 끝난 소스는 삽입 순서대로 처리
+            for source, task in tasks.items():
+                if source in statuses or not task.done():
+                    continue
+                if task.cancelled() or task.exception() is not None:
+                    statuses[source] = "error"
+                    continue
+                statuses[source] = "ok"
+                result = task.result() or []
+                item_counts[source] = len(result)
+                yield source, result
+    finally:
+        now = time.perf_counter()
+        for source, task in tasks.items():
+            if not task.done():
+                task.cancel()
+            elif source not in statuses and (task.cancelled() or task.exception() is not None):
+                statuses[source] = "error"
+            timings.append(FetchTiming(
+                source=source,
+                elapsed_ms=(finished_at.get(source, now) - started) * 1000,
+                status=statuses.get(source, "timeout"),
+                item_count=item_counts.get(source, 0),
+            ))
+
+
+async def fan_out(
+    fetches: Dict[str, Awaitable[List[Any]]],
+    deadline: float
+) -> Tuple[Dict[str, List[Any]], List[FetchTiming]]:
+    """
+    여러 데이터 소스 조회를 동시에 실행하고 하나의 마감 시간 안에 결과 수집
+
+    Args:
+        fetches: 소스 이름 → 조회 코루틴 (삽입 순서가 결과 순서)
+        deadline: 전체 조회 마감 시간(초)
+
+    Returns:
+        (마감 전에 성공한 소스별 결과, 소스별 조회 시간) 튜플.
+        마감을 넘기거나 실패한 소스는 결과에서 빠지고 timeout/error로 기록됨
+    """
+    timings: List[FetchTiming] = []
+    completed: Dict[str, List[Any]] = {}
+    # 호출자가 취소돼도 남은 조회 취소와 조회 시간 기록이 GC까지 미뤄지지 않도록 즉시 닫음
+    async with aclosing(iter_fan_out(fetches, deadline, timings)) as finished:
+        async for source, result in finished:
+            completed[source] = result
+
+    results = {source: completed[source] for source in fetches if source in completed}
+    return results, timings
+
+
+async def race(
+    fetches: Dict[str, Awaitable[List[Any]]],
+    deadline: float,
+    is_sufficient: Callable[[Dict[str, List[Any]]], bool]
+) -> Tuple[Dict[str, List[Any]], List[FetchTiming]]:
+    """
+    여러 경로를 동시에 실행하고 결과가 충분해지는 즉시 나머지를 취소
+
+    Args:
+        fetches: 경로 이름 → 실행 코루틴
+        deadline: 전체 마감 시간(초), 지나면 남은 경로를 취소하고 그때까지의 결과 반환
+        is_sufficient: 지금까지 끝난 경로별 결과를 받아 더 기다릴 필요가 없으면 True
+
+    Returns:
+        (끝난 경로별 결과, 경로별 실행 시간) 튜플. 취소되거나 마감을 넘긴 경로는 timeout으로 기록됨
+    """
+    timings: List[FetchTiming] = []
+    completed: Dict[str, List[Any]] = {}
+    async with aclosing(iter_fan_out(fetches, deadline, timings)) as finished:
+        async for source, result in finished:
+            completed[source] = result
+            if is_sufficient(completed):
+                break
+    return completed, timings
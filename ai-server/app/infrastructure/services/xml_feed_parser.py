@@ -0,0 +1,106 @@
+import xml.etree.ElementTree as ET
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# 출력 필드 → 원본 XML 태그 후보 (앞쪽 태그일수록 우선)
+FieldAliases = Dict[str, Sequence[str]]
+
+EXHIBITION_FIELDS: FieldAliases = {
+    "seq": ("seq",),
+    "title": ("title", "exhibitionname"),
+    "place": ("place",),
+    "start_date": ("startdate",),
+    "end_date": ("enddate",),
+    "description": ("description", "exhibitiondesc"),
+    "image_url": ("poster", "posterurl"),
+}
+
+PERFORMANCE_FIELDS: FieldAliases = {
+    "seq": ("seq", "mt20id"),
+    "title": ("prfnm", "title"),
+    "place": ("fcltynm", "place", "area"),
+    "start_date": ("prfpdfrom", "startdate"),
+    "end_date": ("prfpdto", "enddate"),
+    "description": ("prfcast", "description", "pcseguidance"),
+    "genre": ("genrenm", "genre"),
+    "image_url": ("poster", "posterurl"),
+}
+
+# 로컬 저장소 수집용: 시설명과 지역(시도)을 따로 보관
+EXHIBITION_RECORD_FIELDS: FieldAliases = {**EXHIBITION_FIELDS, "area": ("area",)}
+PERFORMANCE_RECORD_FIELDS: FieldAliases = {**PERFORMANCE_FIELDS, "place": ("fcltynm", "place"), "area": ("area",)}
+
+
+class AliasTable(NamedTuple):
+    """출력 필드 순서와 태그 이름 → (출력 필드, 우선순위) 조회표"""
+    fields: Tuple[str, ...]
+    lookup: Dict[str, Tuple[str, int]]
+
+
+def compile_aliases(fields: FieldAliases) -> AliasTable:
+    """필드 별칭 정의를 태그 한 번 조회로 매핑할 수 있는 표로 변환"""
+    lookup: Dict[str, Tuple[str, int]] = {}
+    for field, tags in fields.items():
+        for priority, tag in enumerate(tags):
+            lookup.setdefault(tag, (field, priority))
+    return AliasTable(tuple(fields), lookup)
+
+
+def _local_name(tag: str) -> str:
+    """{네임스페이스}item → item"""
+    return tag.rpartition("}")[2]
+
+
+class XmlItemStreamParser:
+    """
+    공공데이터포털 XML 응답 바이트 조각에서 <item>을 닫히는 즉시 dict로 꺼내는 증분 파서
+
+    네임스페이스 유무와 관계없이 태그의 로컬 이름으로 매칭하고, 필드 별칭은 미리 만든 조회표 한 번으로 처리.
+    변환한 <item> 요소는 비워 응답 크기와 관계없이 메모리를 거의 일정하게 유지
+    """
+
+    def __init__(self, table: AliasTable, required: str = "title"):
+        self._table = table
+        self._required = required
+        self._parser = ET.XMLPullParser(events=("end",))
+        # 응답 본문의 <totalCount> (페이지 단위 수집 시 전체 페이지 수 계산용)
+        self.total_count: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[Dict[str, str]]:
+        """바이트 조각을 추가하고 이번 조각으로 완성된 item 목록 반환 (필수 필드가 빈 item은 제외)"""
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> List[Dict[str, str]]:
+        """본문 끝까지 읽은 뒤 호출 (문서가 중간에 잘렸으면 ET.ParseError)"""
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> List[Dict[str, str]]:
+        items: List[Dict[str, str]] = []
+        for _, element in self._parser.read_events():
+            tag = element.tag
+            if tag != "item" and not tag.endswith("}item"):
+                if _local_name(tag) == "totalCount" and (element.text or "").strip().isdigit():
+                    self.total_count = int(element.text)
+                continue
+            item = self._to_dict(element)
+            element.clear()
+            if item[self._required]:
+                items.append(item)
+        return items
+
+    def _to_dict(self, element: ET.Element) -> Dict[str, str]:
+        """<item>의 자식 태그를 별칭 우선순위에 따라 출력 필드로 매핑 (값이 빈 태그는 다음 별칭으로)"""
+        lookup = self._table.lookup
+        values: Dict[str, str] = {}
+        priorities: Dict[str, int] = {}
+        for child in element:
+            alias = lookup.get(_local_name(child.tag))
+            if alias is None:
+                continue
+            field, priority = alias
+            text = (child.text or "").strip()
+            if text and priority < priorities.get(field, len(lookup)):
+                values[field] = text
+                priorities[field] = priority
+        return {field: values.get(field, "") for field in self._table.fields}
@@ -0,0 +1,57 @@
+from typing import Dict, Optional, Tuple
+
+# 서울 주요 지역/구 중심 좌표 (위도, 경도)
+DISTRICT_CENTERS: Dict[str, Tuple[float, float]] = {
+    # 주요 데이트 지역
+    "홍대": (37.5563, 126.9220),
+    "합정": (37.5495, 126.9139),
+    "연남": (37.5620, 126.9255),
+    "망원": (37.5560, 126.9104),
+    "신촌": (37.5551, 126.9368),
+    "강남": (37.4979, 127.0276),
+    "압구정": (37.5270, 127.0286),
+    "여의도": (37.5219, 126.9245),
+    "성수": (37.5446, 127.0557),
+    "건대": (37.5404, 127.0692),
+    "이태원": (37.5345, 126.9946),
+    "명동": (37.5636, 126.9827),
+    "종로": (37.5704, 126.9921),
+    "잠실": (37.5133, 127.1001),
+    # 서울 25개 구
+    "종로구": (37.5735, 126.9790),
+    "중구": (37.5641, 126.9979),
+    "용산구": (37.5324, 126.9900),
+    "성동구": (37.5634, 127.0369),
+    "광진구": (37.5385, 127.0823),
+    "동대문구": (37.5744, 127.0396),
+    "중랑구": (37.6063, 127.0925),
+    "성북구": (37.5894, 127.0167),
+    "강북구": (37.6397, 127.0256),
+    "도봉구": (37.6688, 127.0471),
+    "노원구": (37.6542, 127.0568),
+    "은평구": (37.6027, 126.9291),
+    "서대문구": (37.5791, 126.9368),
+    "마포구": (37.5663, 126.9019),
+    "양천구": (37.5170, 126.8666),
+    "강서구": (37.5509, 126.8495),
+    "구로구": (37.4954, 126.8874),
+    "금천구": (37.4569, 126.8955),
+    "영등포구": (37.5264, 126.8962),
+    "동작구": (37.5124, 126.9393),
+    "관악구": (37.4784, 126.9516),
+    "서초구": (37.4837, 127.0324),
+    "강남구": (37.5172, 127.0473),
+    "송파구": (37.5145, 127.1059),
+    "강동구": (37.5301, 127.1238),
+}
+
+# 긴 이름부터 확인해야 "강남구"가 "강남"보다 우선함
+_NAMES_BY_LENGTH = sorted(DISTRICT_CENTERS, key=len, reverse=True)
+
+
+def find_district_center(location: str) -> Optional[Tuple[float, float]]:
+    """위치 문자열에 포함된 지역/구 이름의 중심 좌표 (없으면 None)"""
+    for name in _NAMES_BY_LENGTH:
+        if name in location:
+            return DISTRICT_CENTERS[name]
+    return None
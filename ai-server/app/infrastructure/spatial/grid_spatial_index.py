@@ -0,0 +1,156 @@
+import heapq
+import math
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEGREE_LAT = 111320.0
+
+Cell = Tuple[int, int]
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 위경도 좌표 사이의 거리(m)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+class GridSpatialIndex:
+    """
+    위경도 격자 기반 공간 색인
+
+    좌표를 cell_size_deg 크기의 격자 셀로 나누어 저장하고,
+    반경 검색은 반경에 걸치는 셀만, k-최근접 검색은 가까운 셀부터 링 단위로 확인
+    """
+
+    def __init__(self, cell_size_deg: float = 0.01):
+        if cell_size_deg <= 0:
+            raise ValueError("격자 크기는 0보다 커야 합니다.")
+        self.cell_size_deg = cell_size_deg
+        self._cells: Dict[Cell, Set[Hashable]] = {}
+        self._items: Dict[Hashable, Tuple[float, float, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _cell(self, lat: float, lon: float) -> Cell:
+        return (math.floor(lat / self.cell_size_deg), math.floor(lon / self.cell_size_deg))
+
+    def insert(self, key: Hashable, lat: float, lon: float, item: Any) -> None:
+        """항목 등록 (같은 key가 있으면 교체)"""
+        if key in self._items:
+            self.remove(key)
+        self._items[key] = (lat, lon, item)
+        self._cells.setdefault(self._cell(lat, lon), set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        entry = self._items.pop(key, None)
+        if entry is None:
+            return
+        cell = self._cell(entry[0], entry[1])
+        keys = self._cells.get(cell)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._cells[cell]
+
+    def _cell_span(self, lat: float, radius_m: float) -> Tuple[int, int]:
+        """반경을 덮는 위도/경도 방향 셀 수"""
+        lat_deg = radius_m / METERS_PER_DEGREE_LAT
+        lon_deg = radius_m / (METERS_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 1e-6))
+        return (
+            math.ceil(lat_deg / self.cell_size_deg),
+            math.ceil(lon_deg / self.cell_size_deg),
+        )
+
+    def _collect(self, lat: float, lon: float, cells: List[Cell]) -> List[Tuple[float, Any]]:
+        found = []
+        for cell in cells:
+            for key in self._cells.get(cell, ()):
+                item_lat, item_lon, item = self._items[key]
+                found.append((haversine_m(lat, lon, item_lat, item_lon), item))
+        return found
+
+    def within_radius(self, lat: float, lon: float, radius_m: float) -> List[Tuple[float, Any]]:
+        """반경(m) 안의 항목을 (거리, 항목) 목록으로 가까운 순 반환"""
+        lat_span, lon_span = self._cell_span(lat, radius_m)
+        center_lat, center_lon = self._cell(lat, lon)
+        cells = [
+            (center_lat + d_lat, center_lon + d_lon)
+            for d_lat in range(-lat_span, lat_span + 1)
+            for d_lon in range(-lon_span, lon_span + 1)
+        ]
+        found = [entry for entry in self._collect(lat, lon, cells) if entry[0] <= radius_m]
+        found.sort(key=lambda entry: entry[0])
+        return found
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: int,
+        max_radius_m: Optional[float] = None
+    ) -> List[Tuple[float, Any]]:
+        """가장 가까운 k개 항목을 (거리, 항목) 목록으로 반환 (max_radius_m 밖은 제외)"""
+        if k <= 0 or not self._items:
+            return []
+
+        center_lat, center_lon = self._cell(lat, lon)
+        # 링 하나가 보장하는 최소 탐색 거리 (경도 방향 셀이 더 짧음)
+        ring_m = self.cell_size_deg * METERS_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 1e-6)
+        max_ring = None
+        if max_radius_m is not None:
+            max_ring = max(self._cell_span(lat, max_radius_m))
+
+        found: List[Tuple[float, Any]] = []
+        seen = 0
+        ring = 0
+        while True:
+            if ring == 0:
+                cells = [(center_lat, center_lon)]
+            elif 8 * ring > len(self._cells):
+                # 링이 점유 셀 수보다 넓어지면 남은 셀 전체를 한 번에 확인
+                cells = [
+                    cell for cell in self._cells
+                    if max(abs(cell[0] - center_lat), abs(cell[1] - center_lon)) >= ring
+                ]
+                if max_ring is not None:
+                    cells = [
+                        cell for cell in cells
+                        if max(abs(cell[0] - center_lat), abs(cell[1] - center_lon)) <= max_ring
+                    ]
+                found = self._closest(found + self._collect(lat, lon, cells), k, max_radius_m)
+                break
+            else:
+                cells = [
+                    (center_lat + d_lat, center_lon + d_lon)
+                    for d_lat in range(-ring, ring + 1)
+                    for d_lon in range(-ring, ring + 1)
+                    if max(abs(d_lat), abs(d_lon)) == ring
+                ]
+            for cell in cells:
+                seen += len(self._cells.get(cell, ()))
+            # 지금까지의 상위 k개 밖의 항목은 최종 결과에 들 수 없으므로 버림
+            found = self._closest(found + self._collect(lat, lon, cells), k, max_radius_m)
+
+            # ring 칸까지 확인하면 ring * ring_m 이내 항목은 모두 찾은 상태
+            covered_m = ring * ring_m
+            if len(found) >= k and found[k - 1][0] <= covered_m:
+                break
+            if seen >= len(self._items) or (max_ring is not None and ring >= max_ring):
+                break
+            ring += 1
+
+        return found
+
+    @staticmethod
+    def _closest(
+        entries: List[Tuple[float, Any]],
+        k: int,
+        max_radius_m: Optional[float]
+    ) -> List[Tuple[float, Any]]:
+        if max_radius_m is not None:
+            entries = [entry for entry in entries if entry[0] <= max_radius_m]
+        return heapq.nsmallest(k, entries, key=lambda entry: entry[0])
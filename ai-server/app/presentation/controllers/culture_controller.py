@@ -1,13 +1,16 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
 from app.infrastructure.services.culture_service import CultureService
+from app.presentation.responses.fast_json_response import FastJSONResponse, ResponseBodyCache
 
 
 class CultureController:
     """문화 데이터 컨트롤러"""
 
-    def __init__(self):
-        self.culture_service = CultureService()
+    def __init__(self, culture_service: CultureService, response_cache: Optional[ResponseBodyCache] = None):
+        self.culture_service = culture_service
+        self.response_cache = response_cache or ResponseBodyCache()
         self.router = APIRouter(prefix="/api/v1/culture", tags=["culture"])
 
         # 라우트 등록
@@ -15,55 +18,82 @@ class CultureController:
             "/movies",
             self.get_movies,
             methods=["GET"],
-            response_model=dict
+            response_model=dict,
+            response_class=FastJSONResponse
         )
         self.router.add_api_route(
             "/exhibitions",
             self.get_exhibitions,
             methods=["GET"],
-            response_model=dict
+            response_model=dict,
+            response_class=FastJSONResponse
         )
         self.router.add_api_route(
             "/performances",
             self.get_performances,
             methods=["GET"],
-            response_model=dict
+            response_model=dict,
+            response_class=FastJSONResponse
         )
 
     async def get_movies(
         self,
+        request: Request,
         location: str = Query(..., description="지역"),
         date: str = Query(..., description="날짜 (YYYY-MM-DD)")
-    ) -> dict:
-        """현재 상영 중인 영화 가져오기"""
-        try:
-            movies = await self.culture_service.get_movies(location, date)
-            return {"movies": movies}
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"영화 데이터 가져오기 실패: {str(e)}")
+    ) -> Response:
+        """현재 상영 중인 영화 가져오기 (상영작 목록은 지역/날짜와 무관해 하나의 캐시 항목을 공유)"""
+        return await self._cached_response(
+            request, ("movies",), "movies",
+            lambda: self.culture_service.get_movies(location, date), "영화"
+        )
 
     async def get_exhibitions(
         self,
+        request: Request,
         location: str = Query(..., description="지역"),
         date: str = Query(..., description="날짜 (YYYY-MM-DD)")
-    ) -> dict:
+    ) -> Response:
         """전시회 정보 가져오기"""
-        try:
-            exhibitions = await self.culture_service.get_exhibitions(location, date)
-            return {"exhibitions": exhibitions}
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"전시회 데이터 가져오기 실패: {str(e)}")
+        return await self._cached_response(
+            request, ("exhibitions", location, date), "exhibitions",
+            lambda: self.culture_service.get_exhibitions(location, date), "전시회"
+        )
 
     async def get_performances(
         self,
+        request: Request,
         location: str = Query(..., description="지역"),
         date: str = Query(..., description="날짜 (YYYY-MM-DD)"),
         genre: Optional[str] = Query(None, description="장르 (뮤지컬, 연극, 콘서트 등)")
-    ) -> dict:
+    ) -> Response:
         """공연 정보 가져오기"""
-        try:
-            performances = await self.culture_service.get_performances(location, date, genre)
-            return {"performances": performances}
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"공연 데이터 가져오기 실패: {str(e)}")
+        return await self._cached_response(
+            request, ("performances", location, date, genre), "performances",
+            lambda: self.culture_service.get_performances(location, date, genre), "공연"
+        )
+
+    async def _cached_response(
+        self,
+        request: Request,
+        key: Tuple[Any, ...],
+        field: str,
+        load: Callable[[], Awaitable[List[dict]]],
+        label: str
+    ) -> Response:
+        """
+        직렬화된 응답 본문을 캐시해 두고 그대로 보냄
 
+        같은 ETag를 If-None-Match로 보낸 클라이언트에는 본문 없이 304 응답.
+        빈 결과(외부 API 실패 포함)는 캐시하지 않아 다음 요청에서 다시 조회함
+        """
+        entry = await self.response_cache.get(key)
+        if entry is None:
+            try:
+                items = await load()
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"{label} 데이터 가져오기 실패: {str(e)}")
+            if not items:
+                return FastJSONResponse({field: items})
+            entry = await self.response_cache.set(key, {field: items})
+        return self.response_cache.respond(entry, request.headers.get("if-none-match"))
@@ -1,31 +1,26 @@
+import logging
 from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi.responses import Response, StreamingResponse
+from typing import Any, AsyncIterator, Dict, List, Optional
 from app.application.use_cases.recommend_date_course import RecommendDateCourseUseCase
+from app.application.use_cases.recommend_date_courses_batch import RecommendDateCoursesBatchUseCase
 from app.application.dto.date_course_dto import (
     RecommendDateCourseRequest,
     RecommendDateCourseResponse,
-    DateCourseDTO,
-    PreferenceDTO
+    PreferenceDTO,
+    FetchTimingDTO,
+    RecommendStreamSummaryDTO,
+    BatchRecommendDateCourseRequest,
+    BatchRecommendDateCourseResponse
 )
 from app.domain.value_objects.preference import Preference
 from app.domain.entities.date_course import DateCourse
+from app.domain.value_objects.fetch_timing import FetchTiming
+from app.infrastructure.observability.metrics import stage_timer
+from app.presentation.responses.fast_json_response import FastJSONResponse
+from app.presentation.serializers.json_serializer import courses_response, dumps, ndjson_frame
 
-
-def date_course_entity_to_dto(entity: DateCourse) -> DateCourseDTO:
-    """엔티티를 DTO로 변환"""
-    return DateCourseDTO(
-        id=entity.id,
-        title=entity.title,
-        description=entity.description,
-        location=entity.location,
-        category=entity.category,
-        duration=entity.duration,
-        price_range=entity.price_range,
-        tags=entity.tags,
-        rating=entity.rating,
-        created_at=entity.created_at,
-        updated_at=entity.updated_at
-    )
+logger = logging.getLogger(__name__)
 
 
 def preference_dto_to_value_object(dto: PreferenceDTO) -> Preference:
@@ -52,8 +47,13 @@ def preference_dto_to_value_object(dto: PreferenceDTO) -> Preference:
 class DateCourseController:
     """데이트코스 컨트롤러"""
 
-    def __init__(self, recommend_use_case: RecommendDateCourseUseCase):
+    def __init__(
+        self,
+        recommend_use_case: RecommendDateCourseUseCase,
+        batch_use_case: Optional[RecommendDateCoursesBatchUseCase] = None
+    ):
         self._recommend_use_case = recommend_use_case
+        self._batch_use_case = batch_use_case or RecommendDateCoursesBatchUseCase(recommend_use_case)
         self.router = APIRouter(prefix="/api/v1/date-courses", tags=["date-courses"])
 
         # 라우트 등록
@@ -61,15 +61,31 @@ class DateCourseController:
             "/recommend",
             self.recommend,
             methods=["POST"],
-            response_model=RecommendDateCourseResponse
+            response_model=RecommendDateCourseResponse,
+            response_class=FastJSONResponse
+        )
+        self.router.add_api_route(
+            "/recommend/stream",
+            self.recommend_stream,
+            methods=["POST"],
+            response_class=StreamingResponse
+        )
+        self.router.add_api_route(
+            "/recommend/batch",
+            self.recommend_batch,
+            methods=["POST"],
+            response_model=BatchRecommendDateCourseResponse,
+            response_class=FastJSONResponse
         )
 
     async def recommend(
         self,
         request: RecommendDateCourseRequest
-    ) -> RecommendDateCourseResponse:
+    ) -> Response:
         """
         데이트코스 추천 API
+
+        응답은 RecommendDateCourseResponse 형태이며, DTO 변환 없이 엔티티를 바로 JSON 바이트로 직렬화
         
         Args:
             request: 추천 요청 데이터
@@ -82,17 +98,138 @@ class DateCourseController:
             preference = preference_dto_to_value_object(request.preference)
 
             # 유스케이스 실행
-            courses = await self._recommend_use_case.execute(preference)
+            with stage_timer("recommend.execute"):
+                courses = await self._recommend_use_case.execute(preference)
 
-            # 엔티티를 DTO로 변환
-            course_dtos = [date_course_entity_to_dto(course) for course in courses]
+            # 엔티티를 JSON 바이트로 직렬화
+            with stage_timer("recommend.serialize"):
+                content = courses_response(courses)
 
-            return RecommendDateCourseResponse(
-                courses=course_dtos,
-                count=len(course_dtos)
-            )
+            return FastJSONResponse(content)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
+    async def recommend_stream(
+        self,
+        request: RecommendDateCourseRequest
+    ) -> StreamingResponse:
+        """
+        데이트코스 스트리밍 추천 API (NDJSON)
+
+        데이터 소스가 응답하는 대로 {"type": "course", "data": DateCourseDTO} 줄을 보내고,
+        마지막에 {"type": "summary", "data": RecommendStreamSummaryDTO} 줄을 보냄.
+        처리 중 오류가 나면 {"type": "error", "detail": ...} 줄로 끝남
+
+        Args:
+            request: 추천 요청 데이터
+
+        Returns:
+            application/x-ndjson 스트리밍 응답
+        """
+        try:
+            preference = preference_dto_to_value_object(request.preference)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        return StreamingResponse(
+            self._stream_frames(preference),
+            media_type="application/x-ndjson",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    async def recommend_batch(
+        self,
+        request: BatchRecommendDateCourseRequest
+    ) -> Response:
+        """
+        데이트코스 일괄 추천 API
+
+        선호도별 추천을 동시에 실행하고 항목별 결과와 오류를 입력 순서대로 반환
+        (한 항목의 실패가 다른 항목에 영향을 주지 않음)
+
+        Args:
+            request: 선호도 리스트
+
+        Returns:
+            항목별 추천 결과 (BatchRecommendDateCourseResponse 형태의 JSON)
+        """
+        # 변환에 실패할 항목까지 포함한 요청 크기로 제한 (결과 목록은 요청 항목 수만큼 만들어짐)
+        try:
+            self._batch_use_case.check_size(len(request.preferences))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(request.preferences)
+        preferences: Dict[int, Preference] = {}
+        for index, preference_dto in enumerate(request.preferences):
+            try:
+                preferences[index] = preference_dto_to_value_object(preference_dto)
+            except ValueError as e:
+                results[index] = _batch_item(index, 400, error=str(e))
+
+        if preferences:
+            try:
+                with stage_timer("recommend.execute_batch"):
+                    outcomes = await self._batch_use_case.execute(list(preferences.values()))
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            for index, outcome in zip(preferences, outcomes):
+                if isinstance(outcome, BaseException):
+                    status_code = 400 if isinstance(outcome, ValueError) else 500
+                    error = str(outcome) if status_code == 400 else f"서버 오류: {str(outcome)}"
+                    results[index] = _batch_item(index, status_code, error=error)
+                    continue
+                results[index] = _batch_item(index, 200, courses=outcome)
+
+        succeeded = sum(1 for item in results if item["status_code"] == 200)
+        with stage_timer("recommend.serialize"):
+            content = dumps({"results": results, "succeeded": succeeded, "failed": len(results) - succeeded})
+        return FastJSONResponse(content)
+
+    async def _stream_frames(self, preference: Preference) -> AsyncIterator[bytes]:
+        """추천 코스 묶음을 NDJSON 프레임으로 변환"""
+        timings: List[FetchTiming] = []
+        count = 0
+        try:
+            async for courses in self._recommend_use_case.execute_stream(preference, timings):
+                for course in courses:
+                    count += 1
+                    yield ndjson_frame("course", course)
+        except Exception as e:
+            logger.exception("스트리밍 추천 실패: %s", e)
+            yield dumps({"type": "error", "detail": f"서버 오류: {str(e)}"}) + b"\n"
+            return
+
+        summary = RecommendStreamSummaryDTO(
+            count=count,
+            sources=[
+                FetchTimingDTO(
+                    source=timing.source,
+                    status=timing.status,
+                    elapsed_ms=round(timing.elapsed_ms, 1),
+                    item_count=timing.item_count
+                )
+                for timing in timings
+            ]
+        )
+        yield ndjson_frame("summary", summary.model_dump())
+
+
+def _batch_item(
+    index: int,
+    status_code: int,
+    courses: Optional[List[DateCourse]] = None,
+    error: Optional[str] = None
+) -> Dict[str, Any]:
+    """BatchRecommendItemDTO 형태의 일괄 추천 항목 (코스는 엔티티 그대로 직렬화)"""
+    courses = courses or []
+    return {
+        "index": index,
+        "status_code": status_code,
+        "courses": courses,
+        "count": len(courses),
+        "error": error,
+    }
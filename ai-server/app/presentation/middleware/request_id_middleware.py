@@ -0,0 +1,42 @@
+import uuid
+from app.infrastructure.observability.logging_config import request_id_var
+
+
+class RequestIdMiddleware:
+    """
+    요청별 상관관계 ID 설정 ASGI 미들웨어
+
+    X-Request-ID 헤더가 있으면 그 값을, 없으면 새 ID를 사용하고 응답 헤더에도 기록
+    """
+
+    header_name = b"x-request-id"
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get("headers", []):
+            if name == self.header_name:
+                request_id = value.decode("latin-1")[:64]
+                break
+        if not request_id:
+            request_id = uuid.uuid4().hex[:16]
+
+        token = request_id_var.set(request_id)
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((self.header_name, request_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
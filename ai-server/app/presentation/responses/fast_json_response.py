@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, NamedTuple, Optional
+from fastapi.responses import JSONResponse, Response
+from app.infrastructure.cache.memory_cache import LRUMemoryCache, MISSING
+from app.infrastructure.cache.redis_cache import RedisCache
+from app.presentation.serializers.json_serializer import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    jsonable_encoder를 거치지 않고 json_serializer로 바로 직렬화하는 JSON 응답
+
+    이미 직렬화된 bytes를 content로 주면 그대로 보냄
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+class CachedBody(NamedTuple):
+    """전송할 준비가 된 응답 본문과 ETag"""
+    body: bytes
+    etag: str
+
+
+def make_etag(body: bytes) -> str:
+    """응답 본문 내용 기반 강한 ETag (워커가 달라도 같은 본문이면 같은 값)"""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(목록, W/ 약한 태그, * 포함)가 etag와 일치하는지 확인"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ResponseBodyCache:
+    """
+    직렬화된 응답 본문(bytes)과 ETag를 TTL 동안 보관하는 캐시 (프로세스 내 LRU + Redis)
+
+    Redis를 사용할 수 있으면 다른 워커가 만든 본문도 그대로 보냄 (ETag는 본문에서 다시 계산하므로 워커 간 동일)
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        l2: Optional[RedisCache] = None
+    ):
+        self.ttl = ttl or float(os.getenv("CULTURE_RESPONSE_CACHE_TTL", "60"))
+        self._cache = LRUMemoryCache(max_size or int(os.getenv("CULTURE_RESPONSE_CACHE_MAX_SIZE", "256")))
+        self.l2 = l2 or RedisCache()
+        self.l2_hits = 0
+        self.not_modified = 0
+
+    @staticmethod
+    def _l2_key(key: Any) -> str:
+        digest = hashlib.blake2b(
+            json.dumps(key, ensure_ascii=False, default=str).encode("utf-8"), digest_size=12
+        ).hexdigest()
+        return f"response:{digest}"
+
+    async def get(self, key: Any) -> Optional[CachedBody]:
+        entry = self._cache.get(key)
+        if entry is not MISSING:
+            return entry
+        body = await self.l2.get(self._l2_key(key))
+        if body is None:
+            return None
+        entry = CachedBody(body, make_etag(body))
+        self.l2_hits += 1
+        self._cache.set(key, entry, self.ttl)
+        return entry
+
+    async def set(self, key: Any, payload: Any) -> CachedBody:
+        """payload를 직렬화해 저장하고 본문/ETag 반환"""
+        body = dumps(payload)
+        entry = CachedBody(body, make_etag(body))
+        self._cache.set(key, entry, self.ttl)
+        await self.l2.set(self._l2_key(key), body, self.ttl)
+        return entry
+
+    def respond(self, entry: CachedBody, if_none_match: Optional[str]) -> Response:
+        """클라이언트가 같은 ETag를 갖고 있으면 304, 아니면 저장된 본문 그대로 응답"""
+        headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+        if etag_matches(if_none_match, entry.etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return FastJSONResponse(entry.body, headers=headers)
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._cache.stats(), "l2_hits": self.l2_hits, "not_modified": self.not_modified}
@@ -1,12 +1,15 @@
 from fastapi import APIRouter
 from app.presentation.controllers.date_course_controller import DateCourseController
+from typing import Optional
 from app.application.use_cases.recommend_date_course import RecommendDateCourseUseCase
+from app.application.use_cases.recommend_date_courses_batch import RecommendDateCoursesBatchUseCase
 
 
 def create_date_course_routes(
-    recommend_use_case: RecommendDateCourseUseCase
+    recommend_use_case: RecommendDateCourseUseCase,
+    batch_use_case: Optional[RecommendDateCoursesBatchUseCase] = None
 ) -> APIRouter:
     """데이트코스 라우트 생성"""
-    controller = DateCourseController(recommend_use_case)
+    controller = DateCourseController(recommend_use_case, batch_use_case)
     return controller.router
 
@@ -0,0 +1,43 @@
+import dataclasses
+import json
+from datetime import datetime
+from typing import Any, List
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 직렬화
+    orjson = None
+
+from app.domain.entities.date_course import DateCourse
+
+
+def _default(value: Any) -> Any:
+    """표준 json 직렬화용 변환 (orjson이 기본 지원하는 타입만 처리)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if dataclasses.is_dataclass(value):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입: {type(value).__name__}")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    JSON 바이트로 직렬화
+
+    orjson이 설치되어 있으면 DateCourse 같은 dataclass와 datetime을 C 구현에서 바로 직렬화하고,
+    없으면 표준 json으로 같은 형태(ISO 8601 시각, 공백 없는 구분자, 한글 그대로)를 만듦
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def courses_response(courses: List[DateCourse]) -> bytes:
+    """RecommendDateCourseResponse 형태({"courses": [...], "count": n})의 JSON 바이트"""
+    return dumps({"courses": courses, "count": len(courses)})
+
+
+def ndjson_frame(frame_type: str, data: Any) -> bytes:
+    """NDJSON 한 줄 프레임 ({"type": ..., "data": ...})"""
+    return dumps({"type": frame_type, "data": data}) + b"\n"
+
@@ -0,0 +1,91 @@
+"""
+InMemoryDateCourseRepository 보조 색인 대 전체 순회 비교 (1k → 1M 코스)
+
+사용법:
+    python -m benchmarks.bench_date_course_index --courses 1000,10000,100000,1000000
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime
+from typing import List
+from app.domain.entities.date_course import DateCourse
+from app.domain.value_objects.preference import Preference
+from app.infrastructure.repositories.in_memory_date_course_repository import InMemoryDateCourseRepository
+
+GU = ["강남구", "종로구", "마포구", "용산구", "송파구", "성동구", "서초구", "중구", "영등포구", "광진구"]
+DONG = ["역삼동", "삼청동", "연남동", "이태원동", "잠실동", "성수동", "반포동", "명동", "여의도동", "화양동"]
+TAGS = ["카페", "맛집", "산책", "문화", "야경", "쇼핑", "디저트", "자연", "전시", "공연", "한식", "양식"]
+BUDGETS = ["저렴", "보통", "비쌈"]
+
+# (지역, 관심사): 좁은 지역 + 드문 태그 / 넓은 지역 + 흔한 태그
+QUERIES = [
+    ("서울시 마포구 연남동", ["전시"]),
+    ("성수동", ["카페", "디저트"]),
+    ("강남구", ["맛집"]),
+    ("서울시", ["카페", "산책", "야경"]),
+]
+
+
+def _courses(rng: random.Random, count: int) -> List[DateCourse]:
+    now = datetime.now()
+    return [
+        DateCourse(
+            id=str(i), title=f"코스 {i}", description="", category="일반", duration=60,
+            location=f"서울시 {rng.choice(GU)} {rng.choice(DONG)}", price_range=rng.choice(BUDGETS),
+            tags=rng.sample(TAGS, 3), rating=4.0, created_at=now, updated_at=now
+        )
+        for i in range(count)
+    ]
+
+
+def _linear_scan(courses: List[DateCourse], preference: Preference) -> List[DateCourse]:
+    return [
+        course for course in courses
+        if course.price_range == preference.budget
+        and preference.location in course.location
+        and any(tag in course.tags for tag in preference.interests)
+    ]
+
+
+async def _run(count: int, repeat: int) -> None:
+    courses = _courses(random.Random(count), count)
+    repository = InMemoryDateCourseRepository()
+    started = time.perf_counter()
+    await repository.save_many(courses)
+    build_s = time.perf_counter() - started
+    stored = await repository.find_all()
+
+    for location, interests in QUERIES:
+        preference = Preference(
+            budget="보통", location=location, interests=interests, date="2026-10-20", time_of_day="저녁"
+        )
+        started = time.perf_counter()
+        for _ in range(repeat):
+            expected = _linear_scan(stored, preference)
+        scan_ms = (time.perf_counter() - started) / repeat * 1000
+        started = time.perf_counter()
+        for _ in range(repeat):
+            found = await repository.find_by_preference(preference)
+        index_ms = (time.perf_counter() - started) / repeat * 1000
+        assert found == expected
+        print(
+            f"{count:>8} {build_s:>8.1f} {location + ' ' + '/'.join(interests):<24} "
+            f"{len(found):>7} {scan_ms:>9.2f} {index_ms:>9.2f} {scan_ms / index_ms:>7.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="데이트코스 보조 색인 벤치마크")
+    parser.add_argument("--courses", default="1000,10000,100000,1000000", help="쉼표로 구분한 코스 수 목록")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'courses':>8} {'build_s':>8} {'query':<24} {'matches':>7} {'scan_ms':>9} {'index_ms':>9} {'speedup':>8}")
+    for count in (int(value) for value in args.courses.split(",")):
+        asyncio.run(_run(count, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
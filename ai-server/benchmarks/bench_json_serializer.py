@@ -0,0 +1,96 @@
+"""
+DateCourse 응답 직렬화: DateCourseDTO 복사 + jsonable_encoder 대 json_serializer 직접 직렬화
+
+사용법:
+    python -m benchmarks.bench_json_serializer --courses 10000 --page 10
+"""
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, List, Tuple
+from fastapi.encoders import jsonable_encoder
+from app.application.dto.date_course_dto import DateCourseDTO, RecommendDateCourseResponse
+from app.domain.entities.date_course import DateCourse
+from app.presentation.serializers import json_serializer
+
+TAGS = ["카페", "맛집", "산책", "문화", "야경", "쇼핑", "디저트", "자연"]
+
+
+def _courses(count: int) -> List[DateCourse]:
+    rng = random.Random(0)
+    now = datetime.now()
+    return [
+        DateCourse(
+            id=str(i), title=f"코스 {i}", description="한강을 따라 걷는 저녁 산책 코스", location="서울시 마포구 연남동",
+            category="산책", duration=rng.choice([60, 90, 120]), price_range=rng.choice(["저렴", "보통", "비쌈"]),
+            tags=rng.sample(TAGS, 3), rating=round(rng.uniform(3, 5), 1), created_at=now, updated_at=now
+        )
+        for i in range(count)
+    ]
+
+
+def _dto_path(courses: List[DateCourse]) -> bytes:
+    """json_serializer 도입 전 경로: DTO 복사 → jsonable_encoder → JSONResponse 렌더링"""
+    response = RecommendDateCourseResponse(
+        courses=[DateCourseDTO.model_validate(course) for course in courses], count=len(courses)
+    )
+    return json.dumps(
+        jsonable_encoder(response), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _stdlib_path(courses: List[DateCourse]) -> bytes:
+    """orjson이 설치된 환경에서도 표준 json 폴백을 따로 측정"""
+    orjson, json_serializer.orjson = json_serializer.orjson, None
+    try:
+        return json_serializer.courses_response(courses)
+    finally:
+        json_serializer.orjson = orjson
+
+
+def _measure(render: Callable[[List[DateCourse]], bytes], pages: List[List[DateCourse]]) -> Tuple[float, int]:
+    started = time.perf_counter()
+    for page in pages:
+        render(page)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    for page in pages[:100]:
+        render(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DateCourse 응답 직렬화 벤치마크")
+    parser.add_argument("--courses", type=int, default=10000, help="직렬화할 전체 코스 수")
+    parser.add_argument("--page", type=int, default=10, help="응답 하나에 담기는 코스 수")
+    args = parser.parse_args()
+
+    courses = _courses(args.courses)
+    pages = [courses[i:i + args.page] for i in range(0, len(courses), args.page)]
+    paths = [("DTO + jsonable_encoder", _dto_path)]
+    if json_serializer.orjson is not None:
+        paths.append(("json_serializer (orjson)", json_serializer.courses_response))
+    paths.append(("json_serializer (표준 json)", _stdlib_path))
+
+    expected = json.loads(_dto_path(pages[0]))
+    assert all(json.loads(render(pages[0])) == expected for _, render in paths)
+
+    measured = sum(len(page) for page in pages[:100])
+    print(f"{args.courses} courses, {args.page} per response")
+    print(f"{'path':<28} {'total_ms':>9} {'courses/s':>11} {'peak_kib/1k':>12}")
+    for name, render in paths:
+        elapsed, peak = _measure(render, pages)
+        print(
+            f"{name:<28} {elapsed * 1000:>9.1f} {args.courses / elapsed:>11,.0f} "
+            f"{peak / 1024 / measured * 1000:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+추천 요청 한 건의 로그 출력 비용: print() 대 큐 기반 app 로거
+
+도입 전 추천 경로가 요청마다 남기던 print() 줄(영화/코스 항목별 줄 포함)과
+현재 코드가 같은 지점에서 남기는 로거 호출을 재현하고, 호출한 쪽(이벤트 루프)에서 걸린 시간을 잼.
+stdout은 컨테이너 로그 수집기처럼 다른 스레드가 읽어가는 파이프
+
+사용법:
+    python -m benchmarks.bench_logging --requests 2000
+"""
+import argparse
+import io
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+from typing import Callable, List
+from app.infrastructure.observability import logging_config
+
+MOVIES = [f"영화 {i}" for i in range(15)]
+COURSES = [(f"코스 {i}", "카페") for i in range(20)]
+logger = logging.getLogger("app.bench")
+
+
+def _print_request() -> None:
+    """logging 도입 전 추천 요청 한 건의 print() 호출"""
+    print("ℹ️ 환경 자동 감지: 로컬 환경 → OpenAI 사용: False")
+    print(f"TMDB API 응답: {len(MOVIES)}개 영화 발견")
+    for title in MOVIES:
+        print(f"영화 추가: {title}")
+    print(f"최종 영화 목록: {len(MOVIES)}개")
+    print(f"영화 데이터 가져옴: {len(MOVIES)}개")
+    print(f"✅ 영화 데이터 {len(MOVIES)}개 수신 성공")
+    for index, title in enumerate(MOVIES):
+        print(f"✅ 영화 코스 생성: '{title}'")
+        print(f"   → 코스 추가 완료: ID=movie_{index}, 제목='{title}'")
+    print(f"✅ 생성된 영화 코스: {len(MOVIES)}개 (전체 courses: {len(COURSES)}개)")
+    print("전시회 데이터 가져옴: 10개")
+    print("공연 데이터 가져옴: 15개")
+    print("=== 최종 코스 목록 ===")
+    print(f"총 코스 개수: {len(COURSES)}")
+    for index, (title, category) in enumerate(COURSES):
+        print(f"코스 {index + 1}: {title} ({category})")
+    print("===================")
+    print(f"✅ 실제 데이터 기반 코스 {len(COURSES)}개 생성 완료")
+
+
+def _logging_request() -> None:
+    """현재 코드가 같은 지점에서 남기는 로거 호출"""
+    logger.debug("환경 자동 감지: 로컬 환경 → OpenAI 사용: %s", False)
+    logger.info("TMDB API 응답: %d개 영화 발견", len(MOVIES))
+    for title in MOVIES:
+        logger.debug("영화 추가: %s", title, extra={"sampled": True})
+    logger.info("영화 데이터 %d개 수신", len(MOVIES))
+    for index, title in enumerate(MOVIES):
+        logger.debug("영화 코스 추가: ID=%s, 제목='%s'", f"movie_{index}", title, extra={"sampled": True})
+    logger.info("전시회 %d개, 공연 %d개", 10, 15)
+    for index, (title, category) in enumerate(COURSES):
+        logger.debug("코스 %d: %s (%s)", index + 1, title, category, extra={"sampled": True})
+    logger.info(
+        "실제 데이터 기반 코스 %d개 생성", len(COURSES),
+        extra={"fields": {"source": "real_data", "count": len(COURSES)}}
+    )
+
+
+def _pipe_stdout() -> Callable[[], int]:
+    """sys.stdout을 읽기 스레드가 비우는 버퍼 없는 파이프로 교체하고, 읽은 바이트 수 조회 함수 반환"""
+    read_fd, write_fd = os.pipe()
+    received = [0]
+
+    def drain() -> None:
+        while True:
+            chunk = os.read(read_fd, 65536)
+            if not chunk:
+                return
+            received[0] += len(chunk)
+
+    threading.Thread(target=drain, daemon=True).start()
+    sys.stdout = io.TextIOWrapper(io.FileIO(write_fd, "w"), encoding="utf-8", write_through=True)
+    return lambda: received[0]
+
+
+def _run(name: str, request: Callable[[], None], count: int, received: Callable[[], int]) -> None:
+    before = received()
+    samples: List[float] = []
+    started = time.perf_counter()
+    for _ in range(count):
+        begin = time.perf_counter()
+        request()
+        samples.append((time.perf_counter() - begin) * 1_000_000)
+    caller_s = time.perf_counter() - started
+    logging_config.shutdown_logging()  # 남은 로그를 모두 출력
+    drained_s = time.perf_counter() - started
+    samples.sort()
+    sys.__stdout__.write(
+        f"{name:<28} {statistics.median(samples):>9.1f} {samples[int(len(samples) * 0.99)]:>9.1f} "
+        f"{caller_s / count * 1_000_000:>9.1f} {drained_s / count * 1_000_000:>10.1f} "
+        f"{(received() - before) / count / 1024:>8.1f}\n"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="요청당 로그 출력 비용 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    real_stdout = sys.stdout
+    received = _pipe_stdout()
+    real_stdout.write(f"{'path':<28} {'p50_us':>9} {'p99_us':>9} {'mean_us':>9} {'drained_us':>10} {'kib/req':>8}\n")
+    real_stdout.flush()
+
+    _run("print()", _print_request, args.requests, received)
+    for level, rate in (("INFO", "0.1"), ("DEBUG", "0.1"), ("DEBUG", "1")):
+        os.environ["LOG_LEVEL"], os.environ["LOG_DEBUG_SAMPLE_RATE"] = level, rate
+        logging_config.configure_logging()
+        _run(f"logging {level} sample={rate}", _logging_request, args.requests, received)
+
+
+if __name__ == "__main__":
+    main()
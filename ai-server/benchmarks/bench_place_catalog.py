@@ -0,0 +1,113 @@
+"""
+장소 카탈로그(mmap) 대 places_db 딕셔너리: 시작 시간과 워커당 메모리
+
+표현마다 새 프로세스에서 열어 시작 시간과 RSS 증가량을 잼.
+RssAnon은 워커마다 따로 드는 메모리, RssFile은 같은 파일을 연 워커끼리 공유되는 페이지
+
+사용법:
+    python -m benchmarks.bench_place_catalog --places 10000,100000,1000000
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+from app.infrastructure.catalog.place_catalog import PlaceCatalog, write_place_catalog
+
+AREAS = [f"{city} {district}" for city in ("서울", "부산", "대구", "인천", "광주") for district in "가나다라마바사아자차"]
+CATEGORIES = ["카페", "식당", "공원", "쇼핑몰", "갤러리", "공연장", "전망대", "바"]
+TAGS = ["카페", "맛집", "공원", "쇼핑", "산책", "야경", "한식", "양식", "디저트", "문화", "전망대", "바"]
+
+
+def _places_db(count: int) -> Dict[str, List[Dict[str, Any]]]:
+    rng = random.Random(count)
+    places_db: Dict[str, List[Dict[str, Any]]] = {area: [] for area in AREAS}
+    for i in range(count):
+        places_db[rng.choice(AREAS)].append({
+            "name": f"장소 {i}", "category": rng.choice(CATEGORIES), "price": rng.choice(["저렴", "보통", "비쌈"]),
+            "tags": rng.sample(TAGS, 3), "rating": round(rng.uniform(3, 5), 1), "duration": rng.choice([60, 90, 120]),
+            "lat": 37.5 + rng.uniform(-0.1, 0.1), "lng": 127.0 + rng.uniform(-0.1, 0.1),
+        })
+    return places_db
+
+
+def _rss_kib() -> Dict[str, int]:
+    with open("/proc/self/status") as f:
+        fields = dict(line.split(":", 1) for line in f)
+    return {name: int(fields[name].split()[0]) for name in ("RssAnon", "RssFile")}
+
+
+def _child(kind: str, path: str) -> None:
+    """새 프로세스에서 표현 하나를 열고 모든 지역을 한 번씩 훑은 뒤 결과를 JSON 한 줄로 출력"""
+    before = _rss_kib()
+    started = time.perf_counter()
+    if kind == "dict":
+        with open(path, encoding="utf-8") as f:
+            places_db = json.load(f)
+    else:
+        places_db = PlaceCatalog.open(path).as_places_db()
+    open_ms = (time.perf_counter() - started) * 1000
+
+    # 추천 요청처럼 지역별 앞쪽 장소와 좌표 전체를 읽음
+    started = time.perf_counter()
+    for area in places_db:
+        places = places_db[area]
+        for place in places[:20]:
+            place["name"]
+    if kind == "catalog":
+        sum(1 for _ in places_db.catalog.iter_coordinates())
+    else:
+        sum(1 for places in places_db.values() for place in places if "lat" in place)
+    touch_ms = (time.perf_counter() - started) * 1000
+
+    after = _rss_kib()
+    print(json.dumps({
+        "open_ms": open_ms,
+        "touch_ms": touch_ms,
+        "anon_mib": (after["RssAnon"] - before["RssAnon"]) / 1024,
+        "file_mib": (after["RssFile"] - before["RssFile"]) / 1024,
+    }))
+
+
+def _measure(kind: str, path: str) -> Dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_place_catalog", "--child", kind, path],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="장소 카탈로그 시작 시간/메모리 벤치마크")
+    parser.add_argument("--places", default="10000,100000,1000000", help="쉼표로 구분한 장소 수 목록")
+    parser.add_argument("--child", nargs=2, metavar=("KIND", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(*args.child)
+        return
+
+    print(f"{'places':>8} {'format':<8} {'size_mib':>9} {'open_ms':>9} {'touch_ms':>9} {'anon_mib':>9} {'file_mib':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for count in (int(value) for value in args.places.split(",")):
+            places_db = _places_db(count)
+            paths = {"dict": os.path.join(directory, "places.json"), "catalog": os.path.join(directory, "places.catalog")}
+            with open(paths["dict"], "w", encoding="utf-8") as f:
+                json.dump(places_db, f, ensure_ascii=False)
+            write_place_catalog(places_db, paths["catalog"])
+            del places_db
+
+            for kind, path in paths.items():
+                result = _measure(kind, path)
+                print(
+                    f"{count:>8} {kind:<8} {os.path.getsize(path) / 1024 / 1024:>9.1f} {result['open_ms']:>9.1f} "
+                    f"{result['touch_ms']:>9.1f} {result['anon_mib']:>9.1f} {result['file_mib']:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
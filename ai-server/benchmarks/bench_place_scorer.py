@@ -0,0 +1,71 @@
+"""
+PlaceScorer(비트셋 + top-k) 대 기존 필터/두 번 정렬 비교
+
+사용법:
+    python -m benchmarks.bench_place_scorer --places 1000,10000 --k 5
+"""
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+from app.domain.value_objects.preference import Preference
+from app.infrastructure.services.place_scorer import TIME_CATEGORY_MAP, DEFAULT_TIME_CATEGORIES, PlaceScorer
+
+TAGS = ["카페", "맛집", "공원", "쇼핑", "산책", "야경", "한식", "양식", "디저트", "문화", "전망대", "바"]
+CATEGORIES = ["카페", "식당", "공원", "쇼핑몰", "갤러리", "공연장", "전망대", "바"]
+
+
+def sort_top(places: List[Dict[str, Any]], preference: Preference, k: int) -> List[Dict[str, Any]]:
+    scored = []
+    for place in places:
+        score = 1.0 if place['price'] == preference.budget else 0.5
+        for interest in preference.interests:
+            if interest in place['tags'] or interest in place['category']:
+                score += 1.0
+                for detail in (preference.interest_details or {}).get(interest, []):
+                    if detail in place['tags'] or detail.lower() in place['name'].lower():
+                        score += 0.5
+        scored.append({**place, 'score': score})
+    scored.sort(key=lambda x: x['score'], reverse=True)
+    categories = TIME_CATEGORY_MAP.get(preference.time_of_day, DEFAULT_TIME_CATEGORIES)
+    for place in scored:
+        place['time_priority'] = sum(2 for cat in categories if cat in place['category'] or cat in place['tags'])
+    scored.sort(key=lambda x: x['time_priority'] + x['score'], reverse=True)
+    return scored[:k]
+
+
+def _timed(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PlaceScorer 벤치마크")
+    parser.add_argument("--places", default="100,1000,10000", help="쉼표로 구분한 장소 수 목록")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    preference = Preference(
+        budget="보통", location="강남", interests=["카페", "맛집"], date="2026-10-20",
+        time_of_day="오후", interest_details={"맛집": ["한식"]},
+    )
+    print(f"{'places':>8} {'sort_ms':>9} {'bitset_ms':>10} {'speedup':>8}")
+    for count in (int(value) for value in args.places.split(",")):
+        places = [
+            {"name": f"장소{i}", "category": rng.choice(CATEGORIES), "price": rng.choice(["저렴", "보통", "비쌈"]),
+             "tags": rng.sample(TAGS, 3)}
+            for i in range(count)
+        ]
+        scorer = PlaceScorer(places)
+        scorer.top_places(preference, args.k)  # 조건별 비트셋 캐시 예열
+        sort_ms = _timed(lambda: sort_top(places, preference, args.k), args.repeat)
+        bitset_ms = _timed(lambda: scorer.top_places(preference, args.k), args.repeat)
+        print(f"{count:>8} {sort_ms:>9.2f} {bitset_ms:>10.2f} {sort_ms / bitset_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+GridSpatialIndex 대 전체 스캔 비교 (반경 검색, k-최근접 검색)
+
+사용법:
+    python -m benchmarks.bench_spatial_index --points 1000,10000,100000 --k 10
+"""
+import argparse
+import heapq
+import random
+import time
+from app.infrastructure.spatial.grid_spatial_index import GridSpatialIndex, haversine_m
+
+
+def _timed(fn, queries) -> float:
+    started = time.perf_counter()
+    for lat, lon in queries:
+        fn(lat, lon)
+    return (time.perf_counter() - started) / len(queries) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="공간 색인 벤치마크")
+    parser.add_argument("--points", default="1000,10000,100000", help="쉼표로 구분한 장소 수 목록")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--radius", type=float, default=1000.0, help="반경 검색 거리(m)")
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    queries = [(37.35 + rng.random() * 0.4, 126.8 + rng.random() * 0.45) for _ in range(args.queries)]
+    print(f"{'points':>8} {'build_ms':>9} {'scan_r_ms':>10} {'grid_r_ms':>10} {'scan_k_ms':>10} {'grid_k_ms':>10}")
+    for count in (int(value) for value in args.points.split(",")):
+        points = [(37.35 + rng.random() * 0.4, 126.8 + rng.random() * 0.45) for _ in range(count)]
+
+        started = time.perf_counter()
+        index = GridSpatialIndex()
+        for i, (lat, lon) in enumerate(points):
+            index.insert(i, lat, lon, i)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        def scan_radius(lat, lon):
+            return sorted(
+                (d, i) for i, (p_lat, p_lon) in enumerate(points)
+                if (d := haversine_m(lat, lon, p_lat, p_lon)) <= args.radius
+            )
+
+        def scan_nearest(lat, lon):
+            return heapq.nsmallest(
+                args.k, ((haversine_m(lat, lon, p_lat, p_lon), i) for i, (p_lat, p_lon) in enumerate(points))
+            )
+
+        scan_r = _timed(scan_radius, queries)
+        grid_r = _timed(lambda lat, lon: index.within_radius(lat, lon, args.radius), queries)
+        scan_k = _timed(scan_nearest, queries)
+        grid_k = _timed(lambda lat, lon: index.nearest(lat, lon, args.k), queries)
+        print(f"{count:>8} {build_ms:>9.1f} {scan_r:>10.2f} {grid_r:>10.3f} {scan_k:>10.2f} {grid_k:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+SqliteDateCourseRepository 대 InMemoryDateCourseRepository (일괄 저장, 선호도 조회, 전체 순회)
+
+사용법:
+    python -m benchmarks.bench_sqlite_date_course_repository --courses 1000,10000,100000
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+from typing import List
+from app.domain.entities.date_course import DateCourse
+from app.domain.value_objects.preference import Preference
+from app.infrastructure.repositories.in_memory_date_course_repository import InMemoryDateCourseRepository
+from app.infrastructure.repositories.sqlite_date_course_repository import SqliteDateCourseRepository
+
+GU = ["강남구", "종로구", "마포구", "용산구", "송파구", "성동구", "서초구", "중구", "영등포구", "광진구"]
+DONG = ["역삼동", "삼청동", "연남동", "이태원동", "잠실동", "성수동", "반포동", "명동", "여의도동", "화양동"]
+TAGS = ["카페", "맛집", "산책", "문화", "야경", "쇼핑", "디저트", "자연", "전시", "공연", "한식", "양식"]
+BUDGETS = ["저렴", "보통", "비쌈"]
+
+# (지역, 관심사): 좁은 지역 + 드문 태그 / 넓은 지역 + 흔한 태그
+QUERIES = [
+    ("서울시 마포구 연남동", ["전시"]),
+    ("강남구", ["맛집"]),
+    ("서울시", ["카페", "산책", "야경"]),
+]
+
+
+def _courses(count: int) -> List[DateCourse]:
+    rng = random.Random(count)
+    now = datetime.now()
+    return [
+        DateCourse(
+            id=None, title=f"코스 {i}", description="", category="일반", duration=60,
+            location=f"서울시 {rng.choice(GU)} {rng.choice(DONG)}", price_range=rng.choice(BUDGETS),
+            tags=rng.sample(TAGS, 3), rating=4.0, created_at=now, updated_at=now
+        )
+        for i in range(count)
+    ]
+
+
+async def _timed(coro_fn, repeat: int = 1) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await coro_fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+async def _run(count: int, repeat: int, directory: str) -> None:
+    memory = InMemoryDateCourseRepository()
+    sqlite = SqliteDateCourseRepository(os.path.join(directory, f"courses_{count}.db"))
+    # 첫 사용 시 연결을 열고 샘플 데이터를 넣으므로 저장 시간과 따로 잼
+    open_ms = await _timed(sqlite.find_all)
+
+    memory_save = await _timed(lambda: memory.save_many(_courses(count)))
+    sqlite_save = await _timed(lambda: sqlite.save_many(_courses(count)))
+    print(f"{count:>8} {'open':<26} {'':>7} {'':>10} {open_ms:>10.1f}")
+    print(f"{count:>8} {'save_many':<26} {count:>7} {memory_save:>10.1f} {sqlite_save:>10.1f}")
+
+    for location, interests in QUERIES:
+        preference = Preference(
+            budget="보통", location=location, interests=interests, date="2026-10-20", time_of_day="저녁"
+        )
+        expected = await memory.find_by_preference(preference)
+        found = await sqlite.find_by_preference(preference)
+        assert [course.id for course in found] == [course.id for course in expected]
+        memory_ms = await _timed(lambda: memory.find_by_preference(preference), repeat)
+        sqlite_ms = await _timed(lambda: sqlite.find_by_preference(preference), repeat)
+        label = location + " " + "/".join(interests)
+        print(f"{count:>8} {label:<26} {len(found):>7} {memory_ms:>10.2f} {sqlite_ms:>10.2f}")
+
+    async def drain(repository) -> None:
+        async for _ in repository.iter_all():
+            pass
+
+    memory_iter = await _timed(lambda: drain(memory))
+    sqlite_iter = await _timed(lambda: drain(sqlite))
+    print(f"{count:>8} {'iter_all':<26} {count + 3:>7} {memory_iter:>10.1f} {sqlite_iter:>10.1f}")
+    sqlite.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SQLite 데이트코스 저장소 벤치마크")
+    parser.add_argument("--courses", default="1000,10000,100000", help="쉼표로 구분한 코스 수 목록")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'courses':>8} {'operation':<26} {'rows':>7} {'memory_ms':>10} {'sqlite_ms':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for count in (int(value) for value in args.courses.split(",")):
+            asyncio.run(_run(count, args.repeat, directory))
+
+
+if __name__ == "__main__":
+    main()
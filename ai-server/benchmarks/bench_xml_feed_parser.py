@@ -0,0 +1,120 @@
+"""
+공공데이터포털 공연 XML: ET.fromstring + findall/findtext 대 XmlItemStreamParser 증분 파싱
+
+녹화해 둔 응답 파일(--feed)이 없으면 같은 형태의 합성 응답을 만들어 사용
+
+사용법:
+    python -m benchmarks.bench_xml_feed_parser --items 1000,20000 --chunk 8192
+    python -m benchmarks.bench_xml_feed_parser --feed recorded_performances.xml
+"""
+import argparse
+import random
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from typing import Callable, Dict, List, Optional, Tuple
+from app.infrastructure.services.xml_feed_parser import PERFORMANCE_FIELDS, XmlItemStreamParser, compile_aliases
+
+GENRES = ["뮤지컬", "연극", "콘서트", "무용", "국악", "클래식"]
+VENUES = ["블루스퀘어", "예술의전당", "세종문화회관", "대학로 예술극장", "부산시민회관", "LG아트센터"]
+TABLE = compile_aliases(PERFORMANCE_FIELDS)
+
+
+def _synthetic_feed(count: int) -> bytes:
+    rng = random.Random(count)
+    items = []
+    for i in range(count):
+        title = "" if i % 10 == 9 else f"공연 {i} {rng.choice(GENRES)}"
+        items.append(
+            f"<item><mt20id>PF{i:06d}</mt20id><prfnm>{title}</prfnm><fcltynm>{rng.choice(VENUES)}</fcltynm>"
+            f"<area>서울</area><prfpdfrom>2026.10.01</prfpdfrom><prfpdto>2026.12.31</prfpdto>"
+            f"<prfcast>{'출연진 ' * rng.randint(20, 120)}</prfcast><genrenm>{rng.choice(GENRES)}</genrenm>"
+            f"<poster>http://www.kopis.or.kr/upload/pfmPoster/PF{i:06d}.jpg</poster></item>"
+        )
+    return (
+        "<response><header><resultCode>00</resultCode></header><body>"
+        f"<totalCount>{count}</totalCount><items>{''.join(items)}</items></body></response>"
+    ).encode("utf-8")
+
+
+def _legacy(body: bytes, chunk: int, limit: Optional[int]) -> List[Dict[str, str]]:
+    """스트리밍 파서 도입 전: 본문 전체를 모은 뒤 트리로 파싱"""
+    text = b"".join(body[i:i + chunk] for i in range(0, len(body), chunk)).decode("utf-8")
+    root = ET.fromstring(text)
+    items = root.findall(".//{http://www.openapi.org/ns}item") or root.findall(".//item")
+    performances = []
+    for item in items:
+        title = (item.findtext("prfnm", "") or item.findtext("title", "")).strip()
+        if not title:
+            continue
+        performances.append({
+            "seq": item.findtext("seq", "") or item.findtext("mt20id", ""),
+            "title": title,
+            "place": (item.findtext("fcltynm", "") or item.findtext("place", "") or item.findtext("area", "")).strip(),
+            "start_date": item.findtext("prfpdfrom", "") or item.findtext("startdate", ""),
+            "end_date": item.findtext("prfpdto", "") or item.findtext("enddate", ""),
+            "description": (
+                item.findtext("prfcast", "") or item.findtext("description", "") or item.findtext("pcseguidance", "")
+            ).strip(),
+            "genre": (item.findtext("genrenm", "") or item.findtext("genre", "")).strip(),
+            "image_url": item.findtext("poster", "") or item.findtext("posterurl", ""),
+        })
+    return performances if limit is None else performances[:limit]
+
+
+def _streaming(body: bytes, chunk: int, limit: Optional[int]) -> List[Dict[str, str]]:
+    """CultureService._stream_feed_items와 같은 방식: 조각마다 파싱하고 limit개가 모이면 중단"""
+    parser = XmlItemStreamParser(TABLE)
+    items: List[Dict[str, str]] = []
+    for position in range(0, len(body), chunk):
+        items.extend(parser.feed(body[position:position + chunk]))
+        if limit is not None and len(items) >= limit:
+            return items[:limit]
+    items.extend(parser.close())
+    return items if limit is None else items[:limit]
+
+
+def _measure(parse: Callable[[], List[Dict[str, str]]], repeat: int) -> Tuple[float, float]:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parse()
+    elapsed_ms = (time.perf_counter() - started) / repeat * 1000
+    tracemalloc.start()
+    parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 1024 / 1024
+
+
+def _run(label: str, body: bytes, chunk: int, repeat: int) -> None:
+    for limit in (15, None):
+        expected = _legacy(body, chunk, limit)
+        assert _streaming(body, chunk, limit) == expected
+        legacy_ms, legacy_mb = _measure(lambda: _legacy(body, chunk, limit), repeat)
+        stream_ms, stream_mb = _measure(lambda: _streaming(body, chunk, limit), repeat)
+        scope = f"first {limit}" if limit else "whole feed"
+        print(
+            f"{label:<14} {len(body) / 1024 / 1024:>7.1f} {scope:<11} {legacy_ms:>10.1f} {legacy_mb:>10.1f} "
+            f"{stream_ms:>10.1f} {stream_mb:>10.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="공공데이터포털 XML 스트리밍 파서 벤치마크")
+    parser.add_argument("--items", default="1000,20000", help="합성 응답의 item 수 목록 (쉼표 구분)")
+    parser.add_argument("--feed", help="녹화한 공연 목록 XML 응답 파일 (지정하면 합성 응답 대신 사용)")
+    parser.add_argument("--chunk", type=int, default=8192, help="응답 본문 조각 크기 (바이트)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'feed':<14} {'size_mb':>7} {'scope':<11} {'tree_ms':>10} {'tree_mb':>10} {'stream_ms':>10} {'stream_mb':>10}")
+    if args.feed:
+        with open(args.feed, "rb") as file:
+            _run(args.feed.rpartition("/")[2][:14], file.read(), args.chunk, args.repeat)
+        return
+    for count in (int(value) for value in args.items.split(",")):
+        _run(f"{count} items", _synthetic_feed(count), args.chunk, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
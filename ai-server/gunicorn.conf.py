@@ -0,0 +1,35 @@
+"""
+gunicorn 설정 (운영 멀티 워커 모드)
+
+    gunicorn -c gunicorn.conf.py main:app
+
+- 바인드 주소: GUNICORN_BIND (기본: 0.0.0.0:$PORT). HOST는 OpenAIService의 운영 도메인 판단에 쓰이므로 사용하지 않음
+- 워커 수: WEB_CONCURRENCY (기본: 사용 가능한 CPU 코어 수, 최대 2)
+- preload_app: 마스터에서 앱을 한 번 만든 뒤 fork 하므로 장소 카탈로그(mmap),
+  내장 장소 데이터와 공간 색인 같은 읽기 전용 데이터를 워커들이 copy-on-write로 공유
+- HTTP 커넥션 풀, Redis 연결, 프리페치 스케줄러는 워커별 lifespan에서 생성
+- 워커 간 캐시 공유/조정은 REDIS_URL(L2 캐시, 락, 추천 캐시 무효화)이 설정되어 있어야 동작하며,
+  REDIS_URL 없이 워커가 여럿이면 추천 결과 캐시는 사용하지 않음
+"""
+import gc
+import os
+
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '8000')}")
+# 컨테이너 안에서는 CPU 수가 호스트 코어 수로 보이는 경우가 많아, 기본값은 최대 2개로 제한
+workers = int(os.getenv("WEB_CONCURRENCY", str(min(len(os.sched_getaffinity(0)), 2))))
+# 프리로드되는 앱이 워커 수를 보고 Redis 없는 멀티 워커에서 워커 간 무효화가 필요한 캐시를 끄도록 전달
+os.environ["WEB_CONCURRENCY"] = str(workers)
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+accesslog = None
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info").lower()
+
+
+def when_ready(server):
+    # 프리로드한 객체를 GC 추적 대상에서 빼서, 워커의 GC가 공유 페이지에 쓰기(복사)를 일으키지 않도록 함
+    gc.freeze()
+    server.log.info("앱 프리로드 완료, 워커 %d개 시작", server.cfg.workers)
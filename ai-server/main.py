@@ -2,19 +2,58 @@
 데이트코스 추천 AI API 서버
 DDD 구조로 구현된 FastAPI 애플리케이션
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from app.dependencies import get_recommend_date_course_use_case
+from app.dependencies import (
+    get_recommend_date_course_use_case,
+    get_recommend_date_courses_batch_use_case,
+    get_culture_service,
+    get_culture_response_cache,
+    get_culture_store,
+    get_date_course_repository,
+    get_http_client,
+    get_upstream_cache,
+    get_ai_service,
+    get_metrics_registry,
+    get_prefetch_scheduler,
+)
 from app.presentation.routes.date_course_routes import create_date_course_routes
 from app.presentation.controllers.culture_controller import CultureController
+from app.presentation.middleware.request_id_middleware import RequestIdMiddleware
+from app.infrastructure.observability.logging_config import configure_logging
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 생명주기: 공유 HTTP 커넥션 풀/캐시 연결 생성, 프리페치 스케줄러 실행 및 종료 (로컬 저장소/코스 저장소 연결도 닫음)"""
+    http_client = get_http_client()
+    await http_client.start()
+    prefetch_scheduler = get_prefetch_scheduler()
+    await prefetch_scheduler.start()
+    try:
+        yield
+    finally:
+        await prefetch_scheduler.aclose()
+        await get_ai_service().aclose()
+        await http_client.aclose()
+        await get_upstream_cache().aclose()
+        culture_store = get_culture_store()
+        if culture_store is not None:
+            culture_store.close()
+        get_date_course_repository().close()
 
 
 def create_app() -> FastAPI:
     """애플리케이션 팩토리"""
+    configure_logging()
+
     app = FastAPI(
         title="데이트코스 추천 AI API",
         description="DDD 구조로 구현된 데이트코스 추천 서비스",
-        version="1.0.0"
+        version="1.0.0",
+        lifespan=lifespan
     )
 
     # CORS 설정 - ngrok 및 Vercel 지원
@@ -44,15 +83,21 @@ def create_app() -> FastAPI:
         max_age=3600,
     )
 
+    # 요청별 상관관계 ID (X-Request-ID) 설정
+    app.add_middleware(RequestIdMiddleware)
+
     # 의존성 주입
     recommend_use_case = get_recommend_date_course_use_case()
 
     # 라우트 등록
-    date_course_router = create_date_course_routes(recommend_use_case)
+    date_course_router = create_date_course_routes(
+        recommend_use_case,
+        get_recommend_date_courses_batch_use_case()
+    )
     app.include_router(date_course_router)
     
     # 문화 데이터 라우트 등록
-    culture_controller = CultureController()
+    culture_controller = CultureController(get_culture_service(), get_culture_response_cache())
     app.include_router(culture_controller.router)
 
     @app.get("/")
@@ -65,8 +110,26 @@ def create_app() -> FastAPI:
 
     @app.get("/health")
     async def health_check():
+        # 시작 워밍업(캐시 프리페치)이 끝나기 전에는 트래픽을 받지 않도록 503 반환
+        if not get_prefetch_scheduler().ready:
+            return JSONResponse(status_code=503, content={"status": "warming_up"})
         return {"status": "healthy"}
 
+    @app.get("/health/upstreams")
+    async def upstream_health():
+        """외부 API별 회로 차단기 상태와 적응형 타임아웃"""
+        return {"upstreams": get_http_client().breakers.snapshot()}
+
+    metrics_registry = get_metrics_registry()
+
+    @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+    async def metrics():
+        """Prometheus 텍스트 형식 메트릭"""
+        return PlainTextResponse(
+            metrics_registry.render(),
+            media_type="text/plain; version=0.0.4"
+        )
+
     return app
 
 
@@ -0,0 +1,177 @@
+"""
+추천 API 부하 테스트 하니스
+
+사용법:
+    # 이미 실행 중인 서버에 부하
+    python scripts/load_test.py --url http://localhost:8000 --concurrency 64 --duration 20
+
+    # 워커 수별로 gunicorn을 직접 띄워 처리량 확장성 측정 (1, 2, 4 워커)
+    python scripts/load_test.py --workers 1,2,4 --concurrency 64 --duration 20 --processes 4
+
+요청마다 지역/관심사/날짜/시간대를 무작위로 골라 추천 캐시에만 의존하지 않도록 하고,
+외부 API 없이 동작하는 관심사(카페/맛집/공원/쇼핑)만 사용함.
+부하 생성기 자체가 병목이 되지 않도록 --processes로 여러 프로세스에서 요청을 보냄
+"""
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+RECOMMEND_PATH = "/api/v1/date-courses/recommend"
+LOCATIONS = ["강남", "홍대", "성수", "이태원", "잠실", "신촌", "종로", "여의도"]
+INTERESTS = ["카페", "맛집", "공원", "쇼핑"]
+BUDGETS = ["저렴", "보통", "비쌈"]
+TIMES_OF_DAY = ["아침", "점심", "오후", "저녁", "밤"]
+
+
+def _random_preference(rng: random.Random) -> Dict[str, object]:
+    return {
+        "budget": rng.choice(BUDGETS),
+        "location": rng.choice(LOCATIONS),
+        "interests": rng.sample(INTERESTS, rng.randint(1, 3)),
+        "date": (date.today() + timedelta(days=rng.randint(0, 30))).isoformat(),
+        "time_of_day": rng.choice(TIMES_OF_DAY),
+    }
+
+
+async def _run_load(url: str, concurrency: int, duration: float, seed: int) -> Tuple[List[float], int]:
+    """duration초 동안 concurrency개 연결로 요청을 보내고 (성공 지연 목록, 실패 수) 반환"""
+    rng = random.Random(seed)
+    latencies: List[float] = []
+    errors = 0
+    ends_at = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30.0) as client:
+        async def worker() -> None:
+            nonlocal errors
+            while time.perf_counter() < ends_at:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(RECOMMEND_PATH, json={"preference": _random_preference(rng)})
+                    if response.status_code == 200:
+                        latencies.append(time.perf_counter() - started)
+                    else:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors
+
+
+def _load_process(url: str, concurrency: int, duration: float, seed: int) -> Tuple[List[float], int]:
+    return asyncio.run(_run_load(url, concurrency, duration, seed))
+
+
+def run_load(url: str, concurrency: int, duration: float, processes: int) -> Dict[str, float]:
+    """여러 프로세스로 부하를 나눠 보내고 처리량/지연 백분위 집계"""
+    per_process = max(concurrency // processes, 1)
+    with ProcessPoolExecutor(processes) as pool:
+        futures = [
+            pool.submit(_load_process, url, per_process, duration, seed)
+            for seed in range(processes)
+        ]
+        results = [future.result() for future in futures]
+
+    latencies = sorted(latency for process_latencies, _ in results for latency in process_latencies)
+    errors = sum(process_errors for _, process_errors in results)
+
+    def percentile(p: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / duration,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+    }
+
+
+def _wait_until_healthy(url: str, timeout: float) -> None:
+    ends_at = time.monotonic() + timeout
+    while time.monotonic() < ends_at:
+        try:
+            if httpx.get(url + "/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"{timeout:.0f}초 안에 서버가 준비되지 않았습니다: {url}")
+
+
+def _start_server(workers: int, port: int) -> subprocess.Popen:
+    """gunicorn을 지정한 워커 수로 실행 (외부 API 프리페치/OpenAI는 끔)"""
+    server_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {
+        **os.environ,
+        "WEB_CONCURRENCY": str(workers),
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        "PREFETCH_ENABLED": "false",
+        "USE_OPENAI": "false",
+        "LOG_LEVEL": os.getenv("LOG_LEVEL", "WARNING"),
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "main:app"],
+        cwd=server_dir,
+        env=env,
+    )
+
+
+def _print_row(label: str, result: Dict[str, float], baseline_rps: Optional[float]) -> None:
+    scaling = f"{result['rps'] / baseline_rps:5.2f}x" if baseline_rps else "    -"
+    print(
+        f"{label:>8} {result['rps']:9.1f} {scaling} {result['p50_ms']:8.1f} "
+        f"{result['p95_ms']:8.1f} {result['p99_ms']:8.1f} {int(result['errors']):7d}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="추천 API 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="대상 서버 주소 (--workers 미지정 시)")
+    parser.add_argument("--workers", help="쉼표로 구분한 워커 수 목록, 지정하면 gunicorn을 직접 실행")
+    parser.add_argument("--port", type=int, default=8099, help="--workers 모드에서 사용할 포트")
+    parser.add_argument("--concurrency", type=int, default=64, help="동시 연결 수")
+    parser.add_argument("--duration", type=float, default=20.0, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=3.0, help="측정 전 예열 시간(초)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="부하 생성 프로세스 수")
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'rps':>9} {'scale':>6} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8} {'errors':>7}")
+
+    if not args.workers:
+        if args.warmup > 0:
+            run_load(args.url, args.concurrency, args.warmup, args.processes)
+        _print_row("-", run_load(args.url, args.concurrency, args.duration, args.processes), None)
+        return
+
+    baseline_rps: Optional[float] = None
+    url = f"http://127.0.0.1:{args.port}"
+    for workers in (int(value) for value in args.workers.split(",")):
+        server = _start_server(workers, args.port)
+        try:
+            _wait_until_healthy(url, timeout=60.0)
+            if args.warmup > 0:
+                run_load(url, args.concurrency, args.warmup, args.processes)
+            result = run_load(url, args.concurrency, args.duration, args.processes)
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+        baseline_rps = baseline_rps or result["rps"]
+        _print_row(str(workers), result, baseline_rps)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import asyncio
+import httpx
+import pytest
+from app.infrastructure.http import circuit_breaker
+from app.infrastructure.http.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitBreakerSettings,
+    CircuitOpenError,
+)
+from app.infrastructure.http.pooled_http_client import HttpClientSettings, PooledHttpClient
+
+_SETTINGS = CircuitBreakerSettings(
+    window_size=10, window_seconds=60, min_calls=4, failure_rate_threshold=0.5,
+    slow_call_seconds=2.0, slow_call_rate_threshold=0.75, open_seconds=30,
+    half_open_max_calls=1, timeout_multiplier=2.0, min_timeout=0.5, max_timeout=8.0,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(circuit_breaker, "time", fake)
+    return fake
+
+
+def _call(breaker: CircuitBreaker, ok: bool, elapsed: float = 0.1) -> None:
+    breaker.before_call()
+    if ok:
+        breaker.record_success(elapsed)
+    else:
+        breaker.record_failure(elapsed)
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(4):
+        _call(breaker, ok=False)
+    assert breaker.state == OPEN
+
+
+def test_stays_closed_until_min_calls(clock):
+    breaker = CircuitBreaker("api", _SETTINGS)
+    for _ in range(3):
+        _call(breaker, ok=False)
+    assert breaker.state == CLOSED
+
+
+def test_opens_on_failure_rate_and_rejects_until_open_seconds(clock):
+    breaker = CircuitBreaker("api", _SETTINGS)
+    for ok in (True, False, True, False):
+        _call(breaker, ok)
+    assert breaker.state == OPEN
+
+    clock.now += 10
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_call()
+    assert error.value.upstream == "api" and error.value.retry_after == pytest.approx(20)
+    assert breaker.snapshot()["rejected"] == 1
+
+
+def test_opens_on_slow_call_rate(clock):
+    breaker = CircuitBreaker("api", _SETTINGS)
+    for elapsed in (3.0, 3.0, 0.1, 3.0):
+        _call(breaker, ok=True, elapsed=elapsed)
+    assert breaker.state == OPEN
+
+
+def test_old_calls_leave_the_window(clock):
+    breaker = CircuitBreaker("api", _SETTINGS)
+    for _ in range(3):
+        _call(breaker, ok=False)
+    clock.now += 61
+    _call(breaker, ok=False)
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["calls"] == 1
+
+
+def test_half_open_probe_success_closes(clock):
+    breaker = CircuitBreaker("api", _SETTINGS)
+    _open(breaker)
+    clock.now += 30
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # 시험 호출은 하나만
+    breaker.record_success(0.1)
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["failures"] == 0
+
+
+def test_half_open_probe_failure_reopens(clock):
+    breaker = CircuitBreaker("api", _SETTINGS)
+    _open(breaker)
+    clock.now += 30
+    _call(breaker, ok=False)
+    assert breaker.state == OPEN
+    assert breaker.snapshot()["opened"] == 2
+
+
+def test_released_probe_frees_half_open_slot(clock):
+    breaker = CircuitBreaker("api", _SETTINGS)
+    _open(breaker)
+    clock.now += 30
+    breaker.before_call()
+    breaker.release()
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+
+
+def test_adaptive_timeout_follows_p99_within_bounds(clock):
+    breaker = CircuitBreaker("api", _SETTINGS)
+    assert breaker.timeout() == 8.0  # 기록 부족
+    for elapsed in (0.1, 0.2, 0.3, 1.5):
+        _call(breaker, ok=True, elapsed=elapsed)
+    assert breaker.timeout() == pytest.approx(3.0)
+    for _ in range(10):
+        _call(breaker, ok=True, elapsed=0.01)
+    assert breaker.timeout() == 0.5  # 하한
+    for _ in range(10):
+        _call(breaker, ok=True, elapsed=1.9)
+    assert breaker.timeout() == 3.8
+
+
+def test_registry_shares_one_breaker_per_upstream(clock):
+    registry = CircuitBreakerRegistry(_SETTINGS)
+    assert registry.get("tmdb") is registry.get("tmdb")
+    registry.get("kakao")
+    assert list(registry.snapshot()) == ["kakao", "tmdb"]
+
+
+def test_open_circuit_skips_upstream_request(clock):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503)
+
+    client = PooledHttpClient(HttpClientSettings(http2=False), CircuitBreakerRegistry(_SETTINGS))
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def scenario():
+        for _ in range(4):
+            assert (await client.get("http://upstream/", upstream="api")).status_code == 503
+        with pytest.raises(CircuitOpenError):
+            await client.get("http://upstream/", upstream="api")
+
+    asyncio.run(scenario())
+    assert len(requests) == 4
+    assert client.breakers.get("api").state == OPEN
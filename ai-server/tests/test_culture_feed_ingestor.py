@@ -0,0 +1,139 @@
+import asyncio
+import pytest
+from app.infrastructure.catalog.culture_feed_ingestor import CultureFeedIngestor
+from app.infrastructure.catalog.culture_store import CultureStore
+from app.infrastructure.services.xml_feed_parser import PERFORMANCE_RECORD_FIELDS, XmlItemStreamParser, compile_aliases
+
+
+def _items(page_no: int, count: int):
+    return [
+        {"seq": f"EX{page_no}-{i}", "title": f"전시 {page_no}-{i}", "place": "미술관", "area": "서울",
+         "start_date": "20261001", "end_date": "20261231"}
+        for i in range(count)
+    ]
+
+
+class _StubCultureService:
+    """fetch_feed_page 호출을 기록하고 페이지 번호별로 지정한 결과(또는 예외)를 돌려주는 서비스"""
+
+    def __init__(self, pages, total_count=None, delay=0.0):
+        self.pages = pages
+        self.total_count = total_count
+        self.delay = delay
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+
+    async def fetch_feed_page(self, kind, start_date, end_date, page_no, page_size):
+        self.calls.append((kind, start_date, end_date, page_no, page_size))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            page = self.pages.get(page_no, [])
+            if isinstance(page, Exception):
+                raise page
+            return page, self.total_count
+        finally:
+            self.running -= 1
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CultureStore(str(tmp_path / "culture.db"))
+    yield store
+    store.close()
+
+
+def _ingest(service, store, **settings):
+    settings = {"page_size": 3, "max_concurrency": 2, "max_pages": 10, **settings}
+    ingestor = CultureFeedIngestor(service, store, **settings)
+    return asyncio.run(ingestor.ingest("exhibitions", "20261001", "20261231"))
+
+
+def test_pages_follow_total_count_with_bounded_concurrency(store):
+    service = _StubCultureService({n: _items(n, 3 if n < 4 else 1) for n in range(1, 5)}, total_count=10, delay=0.01)
+
+    result = _ingest(service, store)
+
+    assert sorted(call[3] for call in service.calls) == [1, 2, 3, 4]
+    assert service.calls[0] == ("exhibitions", "20261001", "20261231", 1, 3)
+    assert service.max_running == 2
+    assert (result.pages, result.fetched, result.stored, result.failed_pages) == (4, 10, 10, 0)
+    assert store.count("exhibitions") == 10
+
+
+def test_page_count_is_capped_at_max_pages(store):
+    service = _StubCultureService({n: _items(n, 3) for n in range(1, 100)}, total_count=10_000)
+
+    result = _ingest(service, store, max_pages=5)
+
+    assert sorted(call[3] for call in service.calls) == [1, 2, 3, 4, 5]
+    assert result.pages == 5 and store.count("exhibitions") == 15
+
+
+def test_without_total_count_pages_are_fetched_until_short_page(store):
+    service = _StubCultureService({1: _items(1, 3), 2: _items(2, 3), 3: _items(3, 2), 4: _items(4, 3)})
+
+    result = _ingest(service, store)
+
+    assert [call[3] for call in service.calls] == [1, 2, 3]
+    assert (result.pages, result.stored) == (3, 8)
+
+
+def test_sequential_fallback_stops_at_failed_page_or_max_pages(store):
+    failing = _StubCultureService({1: _items(1, 3), 2: RuntimeError("502"), 3: _items(3, 3)})
+    result = _ingest(failing, store)
+    assert [call[3] for call in failing.calls] == [1, 2]
+    assert (result.pages, result.failed_pages, result.stored) == (1, 1, 3)
+
+    endless = _StubCultureService({n: _items(n, 3) for n in range(1, 100)})
+    result = _ingest(endless, store, max_pages=4)
+    assert [call[3] for call in endless.calls] == [1, 2, 3, 4]
+
+
+def test_failed_pages_are_counted_and_skipped(store):
+    pages = {1: _items(1, 3), 2: ValueError("깨진 XML"), 3: _items(3, 3), 4: TimeoutError()}
+    service = _StubCultureService(pages, total_count=12)
+
+    result = _ingest(service, store)
+
+    assert (result.pages, result.failed_pages, result.fetched, result.stored) == (2, 2, 6, 6)
+    assert store.count("exhibitions") == 6
+
+
+def test_failed_first_page_stops_ingest(store):
+    service = _StubCultureService({1: RuntimeError("회로 열림")}, total_count=30)
+    result = _ingest(service, store)
+    assert len(service.calls) == 1 and (result.pages, result.failed_pages) == (0, 1)
+
+
+def test_items_repeated_across_pages_are_stored_once(store):
+    repeated = {"seq": "EX1-0", "title": "전시 (수정)", "place": "미술관", "start_date": "2026.10.01", "end_date": "2026.12.31"}
+    no_seq = {"title": "무료 전시", "place": "광장", "start_date": "2026-10-05"}
+    pages = {1: _items(1, 2) + [no_seq], 2: [repeated, dict(no_seq, end_date="20261010")]}
+    service = _StubCultureService(pages, total_count=6)
+
+    result = _ingest(service, store)
+
+    assert result.fetched == 5 and store.count("exhibitions") == 3
+    found = {item["seq"]: item for item in store.find("exhibitions", "2026-10-06", limit=10)}
+    assert found["EX1-0"]["title"] == "전시 (수정)"
+    assert found["무료 전시|광장|2026-10-05"]["end_date"] == "2026-10-10"
+
+
+def test_performances_are_keyed_by_mt20id(store):
+    def page(*ids):
+        xml = "<response><body><items>" + "".join(
+            f"<item><mt20id>{pid}</mt20id><prfnm>공연 {pid}</prfnm><fcltynm>극장</fcltynm><area>서울</area>"
+            f"<prfpdfrom>2026.10.01</prfpdfrom><prfpdto>2026.10.31</prfpdto></item>"
+            for pid in ids
+        ) + "</items></body></response>"
+        return XmlItemStreamParser(compile_aliases(PERFORMANCE_RECORD_FIELDS)).feed(xml.encode("utf-8"))
+
+    service = _StubCultureService({1: page("PF1", "PF2"), 2: page("PF2", "PF3")}, total_count=4)
+    ingestor = CultureFeedIngestor(service, store, page_size=2, max_concurrency=2, max_pages=10)
+    result = asyncio.run(ingestor.ingest("performances", "20261001", "20261031"))
+
+    assert result.fetched == 4 and store.count("performances") == 3
+    assert sorted(item["seq"] for item in store.find("performances", "2026-10-15")) == ["PF1", "PF2", "PF3"]
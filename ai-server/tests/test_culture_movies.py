@@ -0,0 +1,121 @@
+import asyncio
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.infrastructure.cache.stale_while_revalidate_cache import StaleWhileRevalidateCache
+from app.infrastructure.cache.tiered_cache import CacheSettings, TieredCache
+from app.infrastructure.http.pooled_http_client import HttpClientSettings, PooledHttpClient
+from app.infrastructure.services.culture_service import CultureService
+from app.presentation.controllers.culture_controller import CultureController
+from app.presentation.responses.fast_json_response import ResponseBodyCache
+
+_MOVIE = {"id": 1, "title": "영화", "overview": "줄거리"}
+
+
+def _service(monkeypatch, responses):
+    """TMDB 응답을 순서대로 돌려주는 가짜 전송 계층을 쓰는 CultureService와 요청 수 목록"""
+    monkeypatch.setenv("TMDB_API_KEY", "test")
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return responses[min(len(requests), len(responses)) - 1]
+
+    http_client = PooledHttpClient(HttpClientSettings(http2=False))
+    http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    service = CultureService(http_client=http_client, cache=TieredCache(CacheSettings()))
+    return service, requests
+
+
+def test_movies_are_cached_once_without_tiered_cache(monkeypatch):
+    service, requests = _service(monkeypatch, [httpx.Response(200, json={"results": [_MOVIE]})])
+
+    async def scenario():
+        return [await service.get_movies(location, "2026-10-18") for location in ("서울", "부산")]
+
+    first, second = asyncio.run(scenario())
+    assert first == second and first[0]["title"] == "영화"
+    assert len(requests) == 1
+    assert service.cache.stats()["loads"] == 0
+
+
+def test_failed_movie_fetch_is_not_cached(monkeypatch):
+    service, requests = _service(monkeypatch, [
+        httpx.Response(500),
+        httpx.Response(200, json={"results": [_MOVIE]}),
+    ])
+
+    async def scenario():
+        return [await service.get_movies("서울", "2026-10-18") for _ in range(2)]
+
+    failed, recovered = asyncio.run(scenario())
+    assert failed == [] and len(recovered) == 1
+    assert len(requests) == 2
+
+
+def test_empty_result_expires_after_negative_ttl(monkeypatch):
+    monkeypatch.setattr("time.monotonic", lambda: clock[0])
+    clock = [0.0]
+    cache = StaleWhileRevalidateCache(ttl=3600, max_stale=86400, negative_ttl=60)
+    results = [[], [_MOVIE]]
+
+    async def load():
+        return results.pop(0)
+
+    async def scenario():
+        empty = await cache.get_or_load("k", load)
+        clock[0] = 30.0
+        cached_empty = await cache.get_or_load("k", load)
+        clock[0] = 61.0
+        loaded = await cache.get_or_load("k", load)
+        return empty, cached_empty, loaded
+
+    assert asyncio.run(scenario()) == ([], [], [_MOVIE])
+    assert cache.stats()["misses"] == 2
+
+
+def test_empty_refresh_keeps_stale_value(monkeypatch):
+    monkeypatch.setattr("time.monotonic", lambda: clock[0])
+    clock = [0.0]
+    cache = StaleWhileRevalidateCache(ttl=10, max_stale=100, negative_ttl=60)
+    results = [[_MOVIE], []]
+
+    async def load():
+        return results.pop(0)
+
+    async def scenario():
+        await cache.get_or_load("k", load)
+        clock[0] = 20.0
+        stale = await cache.get_or_load("k", load)
+        await asyncio.sleep(0)  # 백그라운드 갱신(빈 결과) 완료
+        await asyncio.sleep(0)
+        return stale, await cache.get_or_load("k", load)
+
+    assert asyncio.run(scenario()) == ([_MOVIE], [_MOVIE])
+    assert results == []
+
+
+def test_movie_responses_share_one_cache_entry_across_locations_and_dates():
+    calls = []
+
+    class _FakeCultureService:
+        async def get_movies(self, location, date):
+            calls.append((location, date))
+            return [_MOVIE]
+
+    app = FastAPI()
+    app.include_router(CultureController(_FakeCultureService(), ResponseBodyCache(ttl=60)).router)
+    client = TestClient(app)
+
+    responses = [
+        client.get("/api/v1/culture/movies", params={"location": location, "date": date})
+        for location, date in (("서울", "2026-10-18"), ("부산", "2026-10-18"), ("서울", "2026-10-19"))
+    ]
+    assert len(calls) == 1
+    assert len({response.headers["etag"] for response in responses}) == 1
+    revalidated = client.get(
+        "/api/v1/culture/movies",
+        params={"location": "대구", "date": "2026-10-20"},
+        headers={"If-None-Match": responses[0].headers["etag"]},
+    )
+    assert revalidated.status_code == 304
@@ -0,0 +1,113 @@
+import os
+import pytest
+from app.infrastructure.catalog import culture_store
+from app.infrastructure.catalog.culture_store import CultureStore, normalize_date, normalize_record
+
+_PERFORMANCE = {
+    "seq": "PF1", "title": "뮤지컬", "place": "블루스퀘어", "area": "서울",
+    "start_date": "2026.10.01", "end_date": "2026.12.31", "genre": "뮤지컬",
+}
+
+
+def test_connection_is_opened_on_first_use(tmp_path):
+    path = tmp_path / "culture.db"
+    store = CultureStore(str(path))
+    assert store._conn is None and not path.exists()
+
+    assert store.upsert_many("performances", [_PERFORMANCE]) == 1
+    assert [item["title"] for item in store.find("performances", "2026-10-18", "서울")] == ["뮤지컬"]
+    store.close()
+
+
+def test_forked_worker_opens_its_own_connection(tmp_path, monkeypatch):
+    store = CultureStore(str(tmp_path / "culture.db"))
+    store.upsert_many("performances", [_PERFORMANCE])
+    parent_conn = store._conn
+
+    # preload_app으로 fork된 워커처럼 프로세스 ID만 바뀐 상황
+    worker_pid = os.getpid() + 1
+    monkeypatch.setattr(culture_store.os, "getpid", lambda: worker_pid)
+    assert store.count("performances") == 1
+    assert store._conn is not parent_conn
+    # 부모 프로세스의 연결은 닫지 않음
+    assert parent_conn.execute("SELECT 1").fetchone()[0] == 1
+    store.close()
+    parent_conn.close()
+
+
+def test_close_releases_connection_and_store_reopens_on_next_use(tmp_path):
+    store = CultureStore(str(tmp_path / "culture.db"))
+    store.upsert_many("performances", [_PERFORMANCE])
+    store.close()
+    assert store._conn is None
+    store.close()  # 두 번 닫아도 안전
+
+    assert store.count("performances") == 1
+    store.close()
+
+
+def _item(seq, title, place="", area="", start="2026.10.01", end="2026.10.31", genre=""):
+    return {"seq": seq, "title": title, "place": place, "area": area, "start_date": start, "end_date": end, "genre": genre}
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2026.10.01", "2026-10-01"),
+    ("20261001", "2026-10-01"),
+    ("2026-10-01", "2026-10-01"),
+    (" 2026/10/01 ", "2026-10-01"),
+    ("2026.10", ""),
+    ("미정", ""),
+    ("", ""),
+    (None, ""),
+])
+def test_normalize_date(value, expected):
+    assert normalize_date(value) == expected
+
+
+def test_normalize_record():
+    record = normalize_record({
+        "seq": " PF1 ", "title": " 뮤지컬 ", "place": "블루스퀘어", "start_date": "2026.10.01",
+        "end_date": None, "genre": 3, "unknown": "버림",
+    })
+    assert record == {
+        "seq": "PF1", "title": "뮤지컬", "place": "블루스퀘어", "area": "", "start_date": "2026-10-01",
+        # 종료일이 없으면 시작일 하루짜리 항목
+        "end_date": "2026-10-01", "description": "", "genre": "3", "image_url": "",
+    }
+    assert normalize_record({"seq": "PF2", "title": "  "}) is None
+    fallback = normalize_record({"title": "전시", "place": "미술관", "start_date": "20261005"})
+    assert fallback["seq"] == "전시|미술관|2026-10-05"
+
+
+def test_find_filters_by_date_range_and_orders_matching_area_first(tmp_path):
+    store = CultureStore(str(tmp_path / "culture.db"))
+    store.upsert_many("performances", [
+        _item("P1", "부산 공연", area="부산", end="2026.10.20"),
+        _item("P2", "서울 늦게 끝남", area="서울", end="2026.12.31"),
+        _item("P3", "서울 곧 끝남", area="서울", end="2026.10.19"),
+        _item("P4", "시설명 일치", place="서울 예술의전당", area="경기", end="2026.11.30"),
+        _item("P5", "지난 공연", area="서울", start="2026.09.01", end="2026.10.17"),
+        _item("P6", "예정 공연", area="서울", start="2026.10.19"),
+    ])
+    store.upsert_many("exhibitions", [_item("E1", "서울 전시", area="서울")])
+
+    titles = [item["title"] for item in store.find("performances", "20261018", "서울")]
+    assert titles == ["서울 곧 끝남", "시설명 일치", "서울 늦게 끝남", "부산 공연"]
+    # 시작일/종료일 당일도 포함
+    assert {item["seq"] for item in store.find("performances", "2026-10-19", "부산")} == {"P1", "P2", "P3", "P4", "P6"}
+    assert [item["seq"] for item in store.find("performances", "2026-10-18", "서울", limit=2)] == ["P3", "P4"]
+    assert store.find("performances", "날짜 없음") == []
+    store.close()
+
+
+def test_find_genre_filter_matches_substring(tmp_path):
+    store = CultureStore(str(tmp_path / "culture.db"))
+    store.upsert_many("performances", [
+        _item("P1", "뮤지컬", genre="뮤지컬"),
+        _item("P2", "연극", genre="연극"),
+        _item("P3", "대중 콘서트", genre="대중음악(콘서트)"),
+    ])
+    assert [item["seq"] for item in store.find("performances", "2026-10-18", genre="콘서트")] == ["P3"]
+    assert len(store.find("performances", "2026-10-18", genre=None)) == 3
+    assert store.find("performances", "2026-10-18", genre="무용") == []
+    store.close()
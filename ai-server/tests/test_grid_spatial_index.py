@@ -0,0 +1,68 @@
+import random
+from app.infrastructure.spatial.grid_spatial_index import GridSpatialIndex, haversine_m
+
+
+def _random_points(rng: random.Random, count: int):
+    # 서울 주변 약 40km x 40km
+    return [(i, 37.35 + rng.random() * 0.4, 126.8 + rng.random() * 0.45) for i in range(count)]
+
+
+def _index(points, cell_size_deg=0.01) -> GridSpatialIndex:
+    index = GridSpatialIndex(cell_size_deg)
+    for key, lat, lon in points:
+        index.insert(key, lat, lon, key)
+    return index
+
+
+def _distances(points, lat, lon):
+    return sorted((haversine_m(lat, lon, p_lat, p_lon), key) for key, p_lat, p_lon in points)
+
+
+def test_haversine_matches_known_distance():
+    # 경선 위 위도 1도 ≈ 111.2km, 위도 60도에서 경도 1도 ≈ 55.6km
+    assert abs(haversine_m(37.0, 127.0, 38.0, 127.0) - 111195) < 10
+    assert abs(haversine_m(60.0, 10.0, 60.0, 11.0) - 55597) < 100
+
+
+def test_within_radius_matches_brute_force():
+    rng = random.Random(7)
+    points = _random_points(rng, 2000)
+    for cell_size in (0.005, 0.01, 0.05):
+        index = _index(points, cell_size)
+        for _ in range(50):
+            lat, lon = 37.35 + rng.random() * 0.4, 126.8 + rng.random() * 0.45
+            radius = rng.choice([100, 800, 2500, 6000])
+            expected = [key for distance, key in _distances(points, lat, lon) if distance <= radius]
+            assert [key for _, key in index.within_radius(lat, lon, radius)] == expected
+
+
+def test_nearest_matches_brute_force():
+    rng = random.Random(11)
+    points = _random_points(rng, 3000)
+    index = _index(points)
+    for _ in range(100):
+        # 색인 범위 밖 좌표도 포함
+        lat, lon = 37.2 + rng.random() * 0.7, 126.6 + rng.random() * 0.8
+        k = rng.choice([1, 5, 20])
+        max_radius = rng.choice([None, 1500, 8000])
+        expected = [
+            key for distance, key in _distances(points, lat, lon)
+            if max_radius is None or distance <= max_radius
+        ][:k]
+        assert [key for _, key in index.nearest(lat, lon, k, max_radius_m=max_radius)] == expected
+
+
+def test_nearest_on_sparse_index_scans_remaining_cells():
+    index = _index([("near", 37.5, 127.0), ("far", 35.1, 129.0)])
+    assert [key for _, key in index.nearest(37.5, 127.0, 2)] == ["near", "far"]
+    assert [key for _, key in index.nearest(37.5, 127.0, 2, max_radius_m=1000)] == ["near"]
+
+
+def test_insert_replaces_and_remove_clears_cells():
+    index = _index([("a", 37.5, 127.0)])
+    index.insert("a", 35.1, 129.0, "a")
+    assert len(index) == 1
+    assert index.within_radius(37.5, 127.0, 1000) == []
+    index.remove("a")
+    index.remove("missing")
+    assert len(index) == 0 and index.nearest(35.1, 129.0, 1) == []
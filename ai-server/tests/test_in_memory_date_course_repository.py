@@ -0,0 +1,86 @@
+import asyncio
+import random
+import pytest
+from datetime import datetime
+from typing import List
+from app.domain.entities.date_course import DateCourse
+from app.domain.value_objects.preference import Preference
+from app.infrastructure.repositories import in_memory_date_course_repository
+from app.infrastructure.repositories.in_memory_date_course_repository import InMemoryDateCourseRepository
+
+DISTRICTS = ["서울시 강남구", "서울시 종로구", "서울시 마포구", "부산시 해운대구", "강남", "강", "서울"]
+TAGS = ["카페", "맛집", "산책", "문화", "야경", "쇼핑", "디저트", "자연"]
+BUDGETS = ["저렴", "보통", "비쌈"]
+
+
+def _course(rng: random.Random, course_id) -> DateCourse:
+    now = datetime.now()
+    return DateCourse(
+        id=course_id, title=f"코스 {course_id}", description="", location=rng.choice(DISTRICTS),
+        category="일반", duration=60, price_range=rng.choice(BUDGETS),
+        tags=rng.sample(TAGS, rng.randint(0, 3)), rating=4.0, created_at=now, updated_at=now
+    )
+
+
+def _linear_scan(courses: List[DateCourse], preference: Preference) -> List[DateCourse]:
+    """색인 도입 전 find_by_preference와 같은 전체 순회"""
+    return [
+        course for course in courses
+        if course.price_range == preference.budget
+        and preference.location in course.location
+        and any(tag in course.tags for tag in preference.interests)
+    ]
+
+
+@pytest.mark.parametrize("scan_ratio", [0.0, 0.25, 2.0])  # 항상 순회 / 기본값 / 항상 색인
+def test_find_by_preference_matches_linear_scan_after_inserts_and_updates(monkeypatch, scan_ratio):
+    monkeypatch.setattr(in_memory_date_course_repository, "_SCAN_RATIO", scan_ratio)
+    rng = random.Random(3)
+    repository = InMemoryDateCourseRepository()
+
+    async def scenario():
+        for step in range(600):
+            # 기존 ID 재저장(색인 교체), 새 ID, ID 없는 코스를 섞어서 저장
+            course_id = rng.choice([str(rng.randint(1, 200)), None])
+            await repository.save(_course(rng, course_id))
+            if step % 20:
+                continue
+            courses = await repository.find_all()
+            for _ in range(30):
+                preference = Preference(
+                    budget=rng.choice(BUDGETS),
+                    location=rng.choice(["강남", "서울시", "구", "해운대", "강남구", "", "없는지역"]),
+                    interests=rng.sample(TAGS, rng.randint(1, 3)),
+                    date="2026-10-18",
+                    time_of_day="저녁",
+                )
+                found = await repository.find_by_preference(preference)
+                assert [c.id for c in found] == [c.id for c in _linear_scan(courses, preference)]
+
+    asyncio.run(scenario())
+
+
+def test_saved_course_replaces_old_index_entries():
+    repository = InMemoryDateCourseRepository()
+    now = datetime.now()
+
+    def course(location, tags):
+        return DateCourse(
+            id="x", title="코스", description="", location=location, category="카페", duration=60,
+            price_range="보통", tags=tags, rating=4.0, created_at=now, updated_at=now
+        )
+
+    def preference(location, interests):
+        return Preference(budget="보통", location=location, interests=interests, date="2026-10-18", time_of_day="저녁")
+
+    async def scenario():
+        await repository.save(course("서울시 마포구", ["야경"]))
+        await repository.save(course("부산시 해운대구", ["바다"]))
+        return (
+            await repository.find_by_preference(preference("마포", ["야경"])),
+            await repository.find_by_preference(preference("해운대", ["바다"])),
+        )
+
+    old, new = asyncio.run(scenario())
+    assert old == [] and [c.id for c in new] == ["x"]
+
@@ -0,0 +1,70 @@
+import json
+from datetime import datetime
+import pytest
+from fastapi.encoders import jsonable_encoder
+from app.application.dto.date_course_dto import DateCourseDTO, RecommendDateCourseResponse
+from app.domain.entities.date_course import DateCourse
+from app.presentation.serializers import json_serializer
+from app.presentation.serializers.json_serializer import courses_response, dumps, ndjson_frame
+
+_NOW = datetime(2026, 10, 18, 19, 30, 5, 123456)
+
+
+def _courses():
+    return [
+        DateCourse(
+            id="1", title="한강 \"야경\" 산책", description="줄바꿈\n탭\t역슬래시 \\", location="서울시 마포구",
+            category="산책", duration=120, price_range="저렴", tags=["야경", "산책"], rating=4,
+            created_at=_NOW, updated_at=_NOW
+        ),
+        DateCourse(
+            id=None, title="이모지 ☕ 카페", description="", location="서울시 성동구 성수동",
+            category="카페", duration=90, price_range="보통", tags=[], rating=4.5,
+            created_at=_NOW, updated_at=datetime(2026, 10, 18)
+        ),
+    ]
+
+
+def _dto_response(courses):
+    """직렬화 경로 도입 전 DateCourseDTO 복사 + jsonable_encoder 결과"""
+    response = RecommendDateCourseResponse(
+        courses=[DateCourseDTO.model_validate(course) for course in courses], count=len(courses)
+    )
+    return jsonable_encoder(response)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_serializer, "orjson", None)
+    return request.param
+
+
+def test_courses_response_matches_dto_path(backend):
+    courses = _courses()
+    assert json.loads(courses_response(courses)) == _dto_response(courses)
+
+
+def test_integer_rating_is_serialized_as_float(backend):
+    body = courses_response(_courses()[:1])
+    assert b'"rating":4.0' in body
+
+
+def test_output_is_compact_utf8(backend):
+    body = dumps({"title": "카페 ☕", "tags": ["a", "b"]})
+    assert body == '{"title":"카페 ☕","tags":["a","b"]}'.encode("utf-8")
+
+
+def test_ndjson_frame_is_one_line(backend):
+    course = _courses()[0]
+    frame = ndjson_frame("course", course)
+    assert frame.endswith(b"\n") and frame.count(b"\n") == 1
+    assert json.loads(frame) == {"type": "course", "data": _dto_response([course])["courses"][0]}
+
+
+def test_fallback_rejects_unknown_types(monkeypatch):
+    monkeypatch.setattr(json_serializer, "orjson", None)
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
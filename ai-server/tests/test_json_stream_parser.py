@@ -0,0 +1,59 @@
+import json
+import random
+from app.infrastructure.services.json_stream_parser import JsonArrayObjectParser
+
+_OBJECTS = [
+    {"title": "한강 {야경} [산책]", "tags": ["야경", "산책"], "meta": {"rating": 4.5, "ok": True}},
+    {"title": "따옴표 \"인용\"과 역슬래시 \\ 경로", "description": "줄바꿈\n탭\t유니코드 \u00e9"},
+    {"title": "빈 값", "tags": [], "nested": [{"a": [1, {"b": "}"}]}]},
+]
+
+
+def _feed_all(text: str, sizes) -> list:
+    parser = JsonArrayObjectParser()
+    objects, position = [], 0
+    for size in sizes:
+        objects.extend(parser.feed(text[position:position + size]))
+        position += size
+    objects.extend(parser.feed(text[position:]))
+    return objects
+
+
+def test_every_single_split_point_yields_same_objects():
+    text = json.dumps(_OBJECTS, ensure_ascii=False)
+    for split in range(len(text) + 1):
+        assert _feed_all(text, [split]) == _OBJECTS
+
+
+def test_random_chunking_of_wrapped_responses():
+    rng = random.Random(5)
+    bodies = [
+        json.dumps(_OBJECTS, ensure_ascii=False, indent=2),
+        json.dumps({"courses": _OBJECTS}, ensure_ascii=False),
+        "추천 코스입니다:\n```json\n" + json.dumps({"courses": _OBJECTS}) + "\n```\n즐거운 데이트 되세요!",
+    ]
+    for body in bodies:
+        for _ in range(200):
+            sizes = [rng.randint(1, 8) for _ in range(len(body))]
+            assert _feed_all(body, sizes) == _OBJECTS
+
+
+def test_objects_are_emitted_as_soon_as_they_close():
+    parser = JsonArrayObjectParser()
+    assert parser.feed('[{"title": "첫') == []
+    assert parser.feed('번째"}, {"title"') == [{"title": "첫번째"}]
+    assert parser.feed(': "두번째"}]') == [{"title": "두번째"}]
+
+
+def test_escaped_backslash_at_chunk_boundary():
+    parser = JsonArrayObjectParser()
+    assert parser.feed('[{"path": "C:\\') == []
+    assert parser.feed('\\dir", "q": "\\') == []
+    assert parser.feed('"}]') == []  # 이스케이프된 따옴표라 문자열이 계속됨
+    assert parser.feed('"}]') == [{"path": "C:\\dir", "q": '"}]'}]
+
+
+def test_non_array_content_and_invalid_objects_are_skipped():
+    assert JsonArrayObjectParser().feed('{"title": "단일 객체"}') == []
+    assert JsonArrayObjectParser().feed("코스를 추천할 수 없습니다.") == []
+    assert JsonArrayObjectParser().feed('[{"title": 1,}, {"title": 2}]') == [{"title": 2}]
@@ -0,0 +1,172 @@
+import json
+import logging
+import os
+import queue
+import sys
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.infrastructure.observability import logging_config
+from app.infrastructure.observability.logging_config import (
+    JsonFormatter,
+    RequestIdFilter,
+    SamplingFilter,
+    _DeferredQueueHandler,
+    configure_logging,
+    request_id_var,
+    shutdown_logging,
+)
+from app.presentation.middleware.request_id_middleware import RequestIdMiddleware
+
+
+def _record(level=logging.DEBUG, msg="메시지", args=None, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("app.test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def app_logger(monkeypatch):
+    """app 로거 설정을 테스트 뒤 원래대로 되돌림"""
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    monkeypatch.setenv("LOG_DEBUG_SAMPLE_RATE", "1")
+    logger = logging.getLogger("app")
+    saved = (logger.handlers[:], logger.level, logger.propagate)
+    shutdown_logging()
+    yield logger
+    shutdown_logging()
+    logger.handlers, logger.level, logger.propagate = saved
+
+
+def test_sampling_filter_only_samples_item_debug_lines(monkeypatch):
+    drop_all, keep_all = SamplingFilter(0.0), SamplingFilter(1.0)
+    assert not drop_all.filter(_record(sampled=True))
+    assert keep_all.filter(_record(sampled=True))
+    # 샘플링 대상이 아니거나 INFO 이상이면 비율과 관계없이 통과
+    assert drop_all.filter(_record())
+    assert drop_all.filter(_record(level=logging.INFO, sampled=True))
+
+    values = iter([0.05, 0.5, 0.09, 0.99])
+    monkeypatch.setattr(logging_config.random, "random", lambda: next(values))
+    tenth = SamplingFilter(0.1)
+    assert [tenth.filter(_record(sampled=True)) for _ in range(4)] == [True, False, True, False]
+
+
+def test_request_id_filter_reads_context():
+    token = request_id_var.set("req-1")
+    try:
+        record = _record()
+        RequestIdFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+    assert record.request_id == "req-1"
+    RequestIdFilter().filter(other := _record())
+    assert other.request_id == "-"
+
+
+def test_middleware_propagates_request_id_to_logs_and_response():
+    seen = []
+
+    class _Capture(logging.Handler):
+        def emit(self, record):
+            seen.append(record.request_id)
+
+    logger = logging.getLogger("app.test.middleware")
+    handler = _Capture()
+    handler.addFilter(RequestIdFilter())
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        logger.info("ping")
+        return {"ok": True}
+
+    app.add_middleware(RequestIdMiddleware)
+    client = TestClient(app)
+    try:
+        given = client.get("/ping", headers={"X-Request-ID": "abc-123"})
+        generated = client.get("/ping")
+    finally:
+        logger.removeHandler(handler)
+
+    assert given.headers["x-request-id"] == "abc-123"
+    assert len(generated.headers["x-request-id"]) == 16
+    assert seen == ["abc-123", generated.headers["x-request-id"]]
+
+
+def test_prepare_formats_message_before_args_change():
+    log_queue = queue.SimpleQueue()
+    handler = _DeferredQueueHandler(log_queue)
+    courses = ["한강 산책"]
+    handler.handle(_record(level=logging.INFO, msg="코스 %s", args=(courses,), fields={"count": 1}))
+    courses.append("나중에 추가")
+
+    record = log_queue.get_nowait()
+    assert record.msg == "코스 ['한강 산책']" and record.args is None
+    assert json.loads(JsonFormatter().format(record))["message"] == "코스 ['한강 산책']"
+
+
+def test_prepare_renders_exception_on_calling_thread():
+    log_queue = queue.SimpleQueue()
+    handler = _DeferredQueueHandler(log_queue)
+    try:
+        raise ValueError("잘못된 값")
+    except ValueError:
+        record = _record(level=logging.ERROR, msg="실패")
+        record.exc_info = sys.exc_info()
+    handler.handle(record)
+
+    queued = log_queue.get_nowait()
+    assert queued.exc_info is None and "ValueError: 잘못된 값" in queued.exc_text
+    assert "ValueError: 잘못된 값" in json.loads(JsonFormatter().format(queued))["exc_info"]
+    assert "ValueError: 잘못된 값" in logging.Formatter().format(queued)
+
+
+def test_bad_format_args_are_reported_on_calling_thread(monkeypatch):
+    log_queue = queue.SimpleQueue()
+    handler = _DeferredQueueHandler(log_queue)
+    errors = []
+    monkeypatch.setattr(handler, "handleError", errors.append)
+    handler.handle(_record(level=logging.INFO, msg="%d개", args=("많음",)))
+    assert len(errors) == 1 and log_queue.empty()
+
+
+def test_configured_logger_writes_json_lines(app_logger, capfd):
+    configure_logging()
+    token = request_id_var.set("req-9")
+    try:
+        app_logger.getChild("test").info("추천 %d건", 3, extra={"fields": {"source": "openai"}})
+    finally:
+        request_id_var.reset(token)
+    shutdown_logging()
+
+    entry = json.loads(capfd.readouterr().out.strip().splitlines()[-1])
+    assert entry["message"] == "추천 3건" and entry["request_id"] == "req-9"
+    assert entry["source"] == "openai" and entry["level"] == "INFO"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork 미지원 플랫폼")
+def test_forked_child_logs_through_new_listener(app_logger, capfd):
+    configure_logging()
+    parent_listener = logging_config._listener
+    pid = os.fork()
+    if pid == 0:  # 자식: 새 리스너로 출력되는지 확인 후 종료
+        status = 1
+        try:
+            if logging_config._listener is not parent_listener and logging_config._listener._thread is not None:
+                app_logger.warning("워커 로그")
+                shutdown_logging()
+                status = 0
+        finally:
+            os._exit(status)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert logging_config._listener is parent_listener
+
+    app_logger.warning("부모 로그")
+    shutdown_logging()
+    messages = [json.loads(line)["message"] for line in capfd.readouterr().out.strip().splitlines()]
+    assert "워커 로그" in messages and "부모 로그" in messages
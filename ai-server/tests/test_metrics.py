@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+import pytest
+from fastapi.testclient import TestClient
+from app.infrastructure.observability import metrics
+from app.infrastructure.observability.logging_config import shutdown_logging
+from app.infrastructure.observability.metrics import MetricsRegistry, timed
+
+
+@pytest.fixture
+def stage_metrics(monkeypatch):
+    """timed가 기록하는 전역 단계 메트릭을 테스트 전용 레지스트리로 교체"""
+    registry = MetricsRegistry()
+    monkeypatch.setattr(metrics, "STAGE_DURATION", registry.histogram("stage_seconds", "h", ("stage",), (0.5, 1.0)))
+    monkeypatch.setattr(metrics, "STAGE_ERRORS", registry.counter("stage_errors_total", "c", ("stage",)))
+    ticks = iter([10.0, 10.25, 20.0, 21.5, 30.0, 30.75, 40.0, 40.1])
+    monkeypatch.setattr(metrics, "time", SimpleNamespace(perf_counter=lambda: next(ticks)))
+    return registry
+
+
+def test_render_golden_text():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Stage latency", ("stage",), (0.1, 1.0))
+    requests = registry.counter("requests_total", "Requests", ("path", "status"))
+    registry.counter("empty_total", "Never incremented")
+    latency.observe(0.05, "db")
+    latency.observe(0.1, "db")  # 경계값은 해당 버킷(le)에 포함
+    latency.observe(3.0, "db")
+    latency.observe(0.5, 'a"b\\c\nd')
+    requests.inc("/recommend", "200")
+    requests.inc("/recommend", "200", amount=2)
+    requests.inc('/say"hi"', "500")
+    registry.register_collector(lambda: [("queue_depth", "Queue depth", ("queue",), [(("logs",), 3), (("jobs",), 0.5)])])
+
+    assert registry.render() == "\n".join([
+        "# HELP latency_seconds Stage latency",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{stage="a\\"b\\\\c\\nd",le="0.1"} 0',
+        'latency_seconds_bucket{stage="a\\"b\\\\c\\nd",le="1.0"} 1',
+        'latency_seconds_bucket{stage="a\\"b\\\\c\\nd",le="+Inf"} 1',
+        'latency_seconds_sum{stage="a\\"b\\\\c\\nd"} 0.5',
+        'latency_seconds_count{stage="a\\"b\\\\c\\nd"} 1',
+        'latency_seconds_bucket{stage="db",le="0.1"} 2',
+        'latency_seconds_bucket{stage="db",le="1.0"} 2',
+        'latency_seconds_bucket{stage="db",le="+Inf"} 3',
+        'latency_seconds_sum{stage="db"} 3.15',
+        'latency_seconds_count{stage="db"} 3',
+        "# HELP requests_total Requests",
+        "# TYPE requests_total counter",
+        'requests_total{path="/recommend",status="200"} 3',
+        'requests_total{path="/say\\"hi\\"",status="500"} 1',
+        "# HELP empty_total Never incremented",
+        "# TYPE empty_total counter",
+        "# HELP queue_depth Queue depth",
+        "# TYPE queue_depth gauge",
+        'queue_depth{queue="logs"} 3',
+        'queue_depth{queue="jobs"} 0.5',
+    ]) + "\n"
+
+
+def test_unlabelled_metrics_and_registry_reuse():
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "Hits")
+    assert registry.counter("hits_total", "다른 도움말") is counter
+    counter.inc(amount=0.5)
+    assert counter.value() == 0.5
+    assert "hits_total 0.5\n" in registry.render()
+
+
+def test_timed_records_sync_and_async_functions(stage_metrics):
+    @timed("sync")
+    def add(a, b):
+        return a + b
+
+    @timed("async")
+    async def fetch(value):
+        await asyncio.sleep(0)
+        return value
+
+    assert add(1, 2) == 3 and add.__name__ == "add"
+    assert asyncio.run(fetch("ok")) == "ok" and asyncio.iscoroutinefunction(fetch)
+
+    duration = metrics.STAGE_DURATION
+    assert duration.count("sync") == 1 and duration.count("async") == 1
+    assert duration._sums[("sync",)] == 0.25 and duration._sums[("async",)] == 1.5
+    assert metrics.STAGE_ERRORS.value("sync") == 0
+
+
+def test_timed_counts_errors_and_reraises(stage_metrics):
+    @timed("sync")
+    def broken():
+        raise ValueError("sync")
+
+    @timed("async")
+    async def cancelled():
+        raise asyncio.CancelledError
+
+    with pytest.raises(ValueError):
+        broken()
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancelled())
+
+    assert metrics.STAGE_ERRORS.value("sync") == 1 and metrics.STAGE_ERRORS.value("async") == 1
+    assert metrics.STAGE_DURATION.count("sync") == 1 and metrics.STAGE_DURATION.count("async") == 1
+
+
+def test_metrics_endpoint_serves_registry():
+    logger = logging.getLogger("app")
+    saved = (logger.handlers[:], logger.level, logger.propagate)
+    try:
+        import main
+
+        metrics.UPSTREAM_ERRORS.inc("metrics-test")
+        response = TestClient(main.app).get("/metrics")
+    finally:
+        shutdown_logging()
+        logger.handlers, logger.level, logger.propagate = saved
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE ai_server_stage_duration_seconds histogram" in response.text
+    assert 'ai_server_upstream_errors_total{upstream="metrics-test"} ' in response.text
+    assert "ai_server_cache_stat" in response.text and "ai_server_circuit_state" in response.text
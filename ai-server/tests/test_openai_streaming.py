@@ -0,0 +1,139 @@
+import asyncio
+import json
+from contextlib import aclosing
+from types import SimpleNamespace
+import pytest
+from app.domain.value_objects.preference import Preference
+from app.infrastructure.services.openai_service import OpenAIService
+
+_PREFERENCE = Preference(
+    budget="보통", location="서울 강남", interests=["카페"], date="2026-10-18", time_of_day="저녁"
+)
+_COURSES = [{"title": f"AI 코스 {i}", "description": "설명", "duration": 90} for i in range(3)]
+
+
+class _FakeStream:
+    """OpenAI 스트리밍 응답 흉내: 본문을 작은 조각으로 나눠 천천히 내보냄"""
+
+    def __init__(self, content: str, chunk_size: int = 16, delay: float = 0.005):
+        self._chunks = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+        self._delay = delay
+        self.closed = False
+        self.response = self
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            await asyncio.sleep(self._delay)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=chunk))])
+
+
+class _FakeCompletions:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+        self.streams = []
+
+    async def create(self, **kwargs):
+        assert kwargs["stream"] is True
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        stream = _FakeStream(outcome)
+        self.streams.append(stream)
+        return stream
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setenv("OPENAI_STREAM", "true")
+    return OpenAIService(api_key="test")
+
+
+def _use(service: OpenAIService, *outcomes) -> _FakeCompletions:
+    completions = _FakeCompletions(outcomes)
+    service._openai_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return completions
+
+
+def _titles(courses):
+    return [course.title for course in courses or []]
+
+
+def test_concurrent_identical_prompts_share_one_stream(service):
+    completions = _use(service, "```json\n" + json.dumps({"courses": _COURSES}, ensure_ascii=False) + "\n```")
+
+    async def scenario():
+        return await asyncio.gather(*(service._call_openai_api(_PREFERENCE) for _ in range(4)))
+
+    results = asyncio.run(scenario())
+    assert completions.calls == 1
+    assert all(_titles(courses) == ["AI 코스 0", "AI 코스 1", "AI 코스 2"] for courses in results)
+    assert service.completion_cache.stats()["stream_shared"] == 3
+
+    # 완료된 응답은 캐시되어 다음 요청은 API를 호출하지 않음
+    assert _titles(asyncio.run(service._call_openai_api(_PREFERENCE))) == _titles(results[0])
+    assert completions.calls == 1
+
+
+def test_followers_request_themselves_when_leader_fails(service):
+    completions = _use(service, RuntimeError("upstream down"), json.dumps(_COURSES, ensure_ascii=False))
+
+    async def scenario():
+        return await asyncio.gather(*(service._call_openai_api(_PREFERENCE) for _ in range(3)))
+
+    failed, *followers = asyncio.run(scenario())
+    assert failed is None
+    assert completions.calls == 2
+    assert all(len(courses) == 3 for courses in followers)
+
+
+def test_followers_request_themselves_when_leader_stops_early(service):
+    completions = _use(service, *[json.dumps(_COURSES, ensure_ascii=False)] * 2)
+
+    async def first_course_only():
+        async with aclosing(service._iter_openai_courses(_PREFERENCE)) as courses:
+            async for course in courses:
+                return course
+
+    async def scenario():
+        leader = asyncio.ensure_future(first_course_only())
+        await asyncio.sleep(0)
+        return await asyncio.gather(leader, service._call_openai_api(_PREFERENCE))
+
+    first, follower = asyncio.run(scenario())
+    assert first.title == "AI 코스 0"
+    assert completions.streams[0].closed
+    assert completions.calls == 2 and len(follower) == 3
+
+
+def test_stream_stops_after_max_courses_and_caches_received_courses(service):
+    extra = _COURSES + [{"title": "AI 코스 3"}, {"title": "AI 코스 4"}]
+    completions = _use(service, json.dumps(extra, ensure_ascii=False))
+
+    courses = asyncio.run(service._call_openai_api(_PREFERENCE))
+    assert _titles(courses) == ["AI 코스 0", "AI 코스 1", "AI 코스 2"]
+    assert completions.streams[0].closed
+    assert _titles(asyncio.run(service._call_openai_api(_PREFERENCE))) == _titles(courses)
+    assert completions.calls == 1
+
+
+def test_permuted_interests_share_one_completion_cache_entry(service):
+    completions = _use(service, json.dumps(_COURSES, ensure_ascii=False))
+    first = Preference(
+        budget="보통", location="서울 강남", interests=["카페", "맛집", "산책"], date="2026-10-18",
+        time_of_day="저녁", interest_details={"맛집": ["한식"], "카페": ["디저트"]}
+    )
+    permuted = Preference(
+        budget="보통", location="서울  강남", interests=["산책", "카페", "맛집"], date="2026-10-18",
+        time_of_day="저녁", interest_details={"카페": ["디저트"], "맛집": ["한식"]}
+    )
+
+    assert _titles(asyncio.run(service._call_openai_api(first))) == ["AI 코스 0", "AI 코스 1", "AI 코스 2"]
+    assert _titles(asyncio.run(service._call_openai_api(permuted))) == ["AI 코스 0", "AI 코스 1", "AI 코스 2"]
+    assert completions.calls == 1
+    assert service.completion_cache.stats()["size"] == 1
@@ -0,0 +1,148 @@
+import struct
+import sys
+import pytest
+from app.infrastructure.catalog.place_catalog import (
+    MAGIC,
+    CatalogAreaPlaces,
+    CatalogPlacesDB,
+    PlaceCatalog,
+    write_place_catalog,
+)
+from app.infrastructure.services.openai_service import OpenAIService
+
+_PLACES_DB = {
+    "서울 강남": [
+        {"name": "카페 A", "category": "카페", "price": "보통", "tags": ["카페", "디저트"], "rating": 4.5,
+         "duration": 60, "lat": 37.4979, "lng": 127.0276},
+        {"name": "레스토랑 B", "category": "식당", "price": "비쌈", "tags": [], "rating": 4.0, "duration": 90},
+        {"name": "공원 C", "category": "공원", "price": "저렴", "tags": ["산책", "카페"], "rating": 5.0,
+         "duration": 120, "lat": 37.5, "lng": None},
+    ],
+    "부산 해운대": [
+        {"name": "해변 😀", "category": "자연", "price": "저렴", "tags": ["바다"], "rating": 4.8,
+         "duration": 120, "lat": 35.1587, "lng": 129.1604},
+    ],
+    "빈 지역": [],
+}
+
+
+def _expected(place):
+    """카탈로그가 복원하는 형태 (좌표는 둘 다 있을 때만, rating은 실수)"""
+    restored = {key: place[key] for key in ("name", "category", "price", "tags", "duration")}
+    restored["rating"] = float(place["rating"])
+    if place.get("lat") is not None and place.get("lng") is not None:
+        restored["lat"], restored["lng"] = place["lat"], place["lng"]
+    return restored
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    path = str(tmp_path / "places.catalog")
+    assert write_place_catalog(_PLACES_DB, path) == 4
+    catalog = PlaceCatalog.open(path)
+    yield catalog
+    catalog.close()
+
+
+def test_round_trip_restores_places_db(catalog):
+    assert len(catalog) == 4
+    assert catalog.areas() == list(_PLACES_DB)
+    for area, places in _PLACES_DB.items():
+        assert [catalog.place(i) for i in catalog.area_range(area)] == [_expected(p) for p in places]
+
+
+def test_missing_or_partial_coordinates_are_dropped(catalog):
+    gangnam = catalog.as_places_db()["서울 강남"]
+    assert "lat" not in gangnam[1] and "lng" not in gangnam[1]
+    assert "lat" not in gangnam[2]  # 경도만 없어도 좌표 전체를 생략
+    assert list(catalog.iter_coordinates()) == [
+        ("서울 강남", 0, 37.4979, 127.0276),
+        ("부산 해운대", 0, 35.1587, 129.1604),
+    ]
+
+
+def test_places_db_view_supports_mapping_and_sequence_access(catalog):
+    places_db = catalog.as_places_db()
+    assert isinstance(places_db, CatalogPlacesDB)
+    assert len(places_db) == 3 and list(places_db) == list(_PLACES_DB)
+    assert "부산 해운대" in places_db and "대구" not in places_db
+    with pytest.raises(KeyError):
+        places_db["대구"]
+
+    gangnam = places_db["서울 강남"]
+    assert isinstance(gangnam, CatalogAreaPlaces) and len(gangnam) == 3
+    assert gangnam[-1]["name"] == "공원 C"
+    assert [p["name"] for p in gangnam[1:]] == ["레스토랑 B", "공원 C"]
+    assert [p["name"] for p in gangnam[::-2]] == ["공원 C", "카페 A"]
+    assert [p["name"] for p in gangnam] == ["카페 A", "레스토랑 B", "공원 C"]
+    assert list(places_db["빈 지역"]) == []
+    with pytest.raises(IndexError):
+        gangnam[3]
+
+
+def test_builtin_places_round_trip(tmp_path):
+    places_db = OpenAIService._init_places_database()
+    path = str(tmp_path / "builtin.catalog")
+    write_place_catalog(places_db, path)
+    catalog = PlaceCatalog.open(path)
+    try:
+        view = catalog.as_places_db()
+        assert list(view) == list(places_db)
+        for area, places in places_db.items():
+            assert list(view[area]) == [_expected(place) for place in places]
+    finally:
+        catalog.close()
+
+
+def test_bad_magic_is_rejected(tmp_path):
+    path = tmp_path / "not.catalog"
+    path.write_bytes(b"NOTACAT\x00" + b"\x00" * 256)
+    with pytest.raises(ValueError, match="장소 카탈로그 파일이 아닙니다"):
+        PlaceCatalog.open(str(path))
+
+
+def test_foreign_byteorder_is_rejected(tmp_path):
+    path = tmp_path / "places.catalog"
+    write_place_catalog(_PLACES_DB, str(path))
+    data = bytearray(path.read_bytes())
+    assert data[:8] == MAGIC
+    other = {"little": 1, "big": 0}[sys.byteorder]
+    struct.pack_into("<B", data, 8, other)
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="바이트 순서"):
+        PlaceCatalog.open(str(path))
+
+
+def test_rejected_file_is_closed(tmp_path):
+    path = tmp_path / "not.catalog"
+    path.write_bytes(b"NOTACAT\x00" + b"\x00" * 256)
+    catalog = PlaceCatalog.__new__(PlaceCatalog)
+    with pytest.raises(ValueError):
+        catalog.__init__(str(path))
+    assert catalog._mmap.closed and catalog._file.closed
+
+
+def test_close_releases_mapping(tmp_path):
+    path = str(tmp_path / "places.catalog")
+    write_place_catalog(_PLACES_DB, path)
+    catalog = PlaceCatalog.open(path)
+    catalog.place(0)
+    catalog.close()
+    assert catalog._mmap.closed and catalog._file.closed
+    with pytest.raises((KeyError, ValueError)):
+        catalog.place(0)
+
+
+def test_strings_are_deduplicated(tmp_path):
+    path = tmp_path / "places.catalog"
+    places_db = {"서울": [{"name": f"카페 {i}", "category": "카페", "price": "보통", "tags": ["카페"] * 3,
+                          "rating": 4.0, "duration": 60} for i in range(100)]}
+    write_place_catalog(places_db, str(path))
+    catalog = PlaceCatalog.open(str(path))
+    try:
+        # 지역 1 + 이름 100 + "카페", "보통" = 103개
+        assert len(catalog._strings) == 103
+        assert catalog.place(99)["tags"] == ["카페"] * 3
+    finally:
+        catalog.close()
+
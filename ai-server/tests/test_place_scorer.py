@@ -0,0 +1,88 @@
+import random
+from typing import Any, Dict, List
+from app.domain.value_objects.preference import Preference
+from app.infrastructure.services import place_scorer
+from app.infrastructure.services.place_scorer import TIME_CATEGORY_MAP, DEFAULT_TIME_CATEGORIES, PlaceScorer
+
+TAGS = ["카페", "맛집", "공원", "쇼핑", "산책", "야경", "한식", "양식", "디저트", "문화", "전망대", "바"]
+CATEGORIES = ["카페", "식당", "공원", "쇼핑몰", "갤러리", "공연장", "전망대", "바", "브런치 카페"]
+BUDGETS = ["저렴", "보통", "비쌈"]
+TIMES = list(TIME_CATEGORY_MAP) + ["새벽"]
+
+
+def _baseline_top(places: List[Dict[str, Any]], preference: Preference, k: int) -> List[Dict[str, Any]]:
+    """기존 필터 + 두 번 정렬 로직 (점수 정렬 후 시간대 우선순위 합산으로 안정 정렬)"""
+    filtered = []
+    for place in places:
+        score = 1.0 if place['price'] == preference.budget else 0.5
+        for interest in preference.interests:
+            if interest in place['tags'] or interest in place['category']:
+                score += 1.0
+                for detail in (preference.interest_details or {}).get(interest, []):
+                    if detail in place['tags'] or detail.lower() in str(place.get('name', '')).lower():
+                        score += 0.5
+        filtered.append({**place, 'score': score})
+    filtered.sort(key=lambda x: x['score'], reverse=True)
+
+    categories = TIME_CATEGORY_MAP.get(preference.time_of_day, DEFAULT_TIME_CATEGORIES)
+    prioritized = []
+    for place in filtered:
+        priority = sum(2 for cat in categories if cat in place['category'] or cat in place['tags'])
+        prioritized.append({**place, 'time_priority': priority})
+    prioritized.sort(key=lambda x: x['time_priority'] + x['score'], reverse=True)
+    return prioritized[:k]
+
+
+def _random_places(rng: random.Random, count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": f"장소{index} {rng.choice(TAGS)}",
+            "category": rng.choice(CATEGORIES),
+            "price": rng.choice(BUDGETS),
+            "tags": rng.sample(TAGS, rng.randint(0, 4)),
+        }
+        for index in range(count)
+    ]
+
+
+def _random_preference(rng: random.Random) -> Preference:
+    interests = rng.sample(TAGS, rng.randint(1, 4))
+    details = {interest: rng.sample(TAGS, rng.randint(0, 3)) for interest in interests if rng.random() < 0.5}
+    return Preference(
+        budget=rng.choice(BUDGETS),
+        location="강남",
+        interests=interests,
+        date="2026-10-20",
+        time_of_day=rng.choice(TIMES),
+        interest_details=details or None,
+    )
+
+
+def test_top_places_matches_baseline_sorting():
+    rng = random.Random(7)
+    for _ in range(500):
+        places = _random_places(rng, rng.randint(1, 40))
+        preference = _random_preference(rng)
+        k = rng.randint(1, 12)
+        assert PlaceScorer(places).top_places(preference, k) == _baseline_top(places, preference, k)
+
+
+def test_time_priority_above_current_plane_width():
+    # 모든 점수가 낮은 상태에서 시간대 가중치(4)가 새 비트 평면을 만들어야 하는 경우
+    places = [{"name": "공원", "category": "공원", "price": "보통", "tags": []}]
+    preference = Preference(budget="저렴", location="잠실", interests=["맛집"], date="2026-10-20", time_of_day="오후")
+    top = PlaceScorer(places).top_places(preference, 1)
+    assert top[0]["time_priority"] == 2 and top[0]["score"] == 0.5
+
+
+def test_mask_caches_are_bounded(monkeypatch):
+    monkeypatch.setattr(place_scorer, "_MAX_CACHED_TERMS", 8)
+    scorer = PlaceScorer(_random_places(random.Random(1), 10))
+    for index in range(50):
+        preference = Preference(
+            budget="보통", location="강남", interests=[f"관심사{index}", "카페"], date="2026-10-20",
+            time_of_day="오후", interest_details={"카페": [f"옵션{index}"]},
+        )
+        scorer.top_places(preference, 3)
+    assert len(scorer._term_masks) <= 8
+    assert len(scorer._detail_masks) <= 8
@@ -0,0 +1,120 @@
+import asyncio
+import xml.etree.ElementTree as ET
+import httpx
+import pytest
+from app.infrastructure.http.pooled_http_client import HttpClientSettings, PooledHttpClient
+
+
+def _client(handler) -> PooledHttpClient:
+    client = PooledHttpClient(HttpClientSettings(http2=False))
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def _calls(client: PooledHttpClient):
+    snapshot = client.breakers.snapshot()["api"]
+    return snapshot["calls"], snapshot["failures"]
+
+
+async def _body(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def test_stream_records_success_on_early_exit():
+    client = _client(lambda request: httpx.Response(200, content=_body([b"a", b"b", b"c"])))
+
+    async def scenario():
+        async with client.stream("http://x/", upstream="api") as response:
+            async for _ in response.aiter_bytes():
+                break
+
+    asyncio.run(scenario())
+    assert _calls(client) == (1, 0)
+
+
+def test_stream_records_failure_when_body_cannot_be_parsed():
+    client = _client(lambda request: httpx.Response(200, content=b"<broken"))
+
+    async def scenario():
+        async with client.stream("http://x/", upstream="api") as response:
+            ET.fromstring(await response.aread())
+
+    with pytest.raises(ET.ParseError):
+        asyncio.run(scenario())
+    assert _calls(client) == (1, 1)
+
+
+def test_stream_classifies_raise_for_status_by_code():
+    client = _client(lambda request: httpx.Response(int(request.url.path.strip("/"))))
+
+    async def scenario(code: int):
+        async with client.stream(f"http://x/{code}", upstream="api") as response:
+            response.raise_for_status()
+
+    for code in (404, 503):
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(scenario(code))
+    assert _calls(client) == (2, 1)
+
+
+def test_stream_cancellation_records_nothing():
+    async def slow_body():
+        yield b"a"
+        await asyncio.sleep(5)
+        yield b"b"
+
+    client = _client(lambda request: httpx.Response(200, content=slow_body()))
+
+    async def consume():
+        async with client.stream("http://x/", upstream="api") as response:
+            async for _ in response.aiter_bytes():
+                pass
+
+    async def scenario():
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+    assert _calls(client) == (0, 0)
+
+
+@pytest.mark.parametrize("method", ["get", "stream"])
+def test_cancelled_queued_call_does_not_hold_half_open_trial_slot(method):
+    release = asyncio.Event()
+
+    async def handler(request):
+        if request.url.path == "/slow":
+            await release.wait()
+        return httpx.Response(200)
+
+    client = PooledHttpClient(HttpClientSettings(http2=False, max_connections_per_host=1))
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    breaker = client.breakers.get("api")
+    breaker.state = "half_open"
+
+    async def call(path: str, upstream: str):
+        if method == "get":
+            return await client.get(f"http://x/{path}", upstream=upstream)
+        async with client.stream(f"http://x/{path}", upstream=upstream) as response:
+            return response
+
+    async def scenario():
+        # 다른 외부 API 호출이 같은 호스트의 동시성 슬롯을 차지한 동안 반열림 회로 호출이 대기하다 취소됨
+        holder = asyncio.ensure_future(call("slow", "other"))
+        await asyncio.sleep(0.01)
+        queued = asyncio.ensure_future(call("trial", "api"))
+        await asyncio.sleep(0.01)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        release.set()
+        await holder
+        # 시험 호출 자리가 남아 있어 다음 호출이 회로를 닫음
+        return await call("trial", "api")
+
+    assert asyncio.run(scenario()).status_code == 200
+    assert breaker.state == "closed"
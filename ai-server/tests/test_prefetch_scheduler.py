@@ -0,0 +1,268 @@
+import asyncio
+import logging
+from datetime import date
+import fakeredis.aioredis
+from fastapi.testclient import TestClient
+from app.domain.value_objects.fetch_timing import FetchTiming
+from app.domain.value_objects.preference import Preference
+from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.http.circuit_breaker import CircuitBreakerRegistry
+from app.infrastructure.observability.logging_config import shutdown_logging
+from app.infrastructure.prefetch.prefetch_scheduler import PrefetchScheduler, PrefetchSettings
+from app.infrastructure.prefetch.request_stats import RequestStatsTracker
+
+TODAY = date.today().isoformat()
+_SETTINGS = PrefetchSettings(interval=0.05, jitter=0.0, top_n=3, request_spacing=0.0, warmup_timeout=1.0)
+
+
+def _preference(location="서울 강남", interests=("카페",), day=TODAY) -> Preference:
+    return Preference(budget="보통", location=location, interests=list(interests), date=day, time_of_day="저녁")
+
+
+class _StubAIService:
+    """prefetch_sources 호출을 기록하고, gate가 있으면 열릴 때까지 기다리는 AI 서비스"""
+
+    def __init__(self, gate=None, delay=0.0):
+        self.gate = gate
+        self.delay = delay
+        self.calls = []
+
+    async def prefetch_sources(self, location, interests, day):
+        self.calls.append((location, interests[0], day))
+        if self.gate is not None:
+            await self.gate.wait()
+        await asyncio.sleep(self.delay)
+        return [FetchTiming(interests[0], 1.0, "ok", 1)]
+
+
+def _store(server) -> RedisCache:
+    store = RedisCache(url="redis://fake")
+    store._client = fakeredis.aioredis.FakeRedis(server=server)
+    return store
+
+
+def _scheduler(ai_service, stats=None, store=None, settings=_SETTINGS, breakers=None) -> PrefetchScheduler:
+    return PrefetchScheduler(
+        ai_service, stats or RequestStatsTracker(decay_factor=0.5), breakers or CircuitBreakerRegistry(),
+        store=store, settings=settings, hot_locations=["서울 강남", "부산 해운대"]
+    )
+
+
+# 요청 통계
+
+def test_stats_count_each_interest_once_per_request_and_rank_by_score():
+    stats = RequestStatsTracker(decay_factor=0.5)
+    stats.record(_preference(location=" 서울  강남 ", interests=("카페", "카페", "맛집")))
+    stats.record(_preference(interests=("카페",)))
+    stats.record(_preference(location="부산", interests=("영화",), day="2020-01-01"))
+
+    assert stats.top(10) == [("서울 강남", "카페", TODAY), ("부산", "영화", "2020-01-01"), ("서울 강남", "맛집", TODAY)]
+    assert stats.top(1) == [("서울 강남", "카페", TODAY)]
+    # 지난 날짜 조합은 min_date로 제외
+    assert ("부산", "영화", "2020-01-01") not in stats.top(10, min_date=TODAY)
+
+
+def test_stats_decay_favours_recent_requests_and_drops_faded_keys():
+    stats = RequestStatsTracker(decay_factor=0.5)
+    for _ in range(4):
+        stats.record(_preference(interests=("카페",)))
+    for _ in range(3):
+        stats.decay()  # 카페 4 → 0.5
+    stats.record(_preference(interests=("맛집",)))
+    assert [key[1] for key in stats.top(2)] == ["맛집", "카페"]
+
+    for _ in range(4):
+        stats.decay()  # 0.05 미만이 된 조합은 제거 (카페 0.03125, 맛집 0.0625)
+    assert [key[1] for key in stats.top(2)] == ["맛집"]
+
+
+def test_stats_prune_and_drain():
+    stats = RequestStatsTracker(max_keys=4, decay_factor=0.5)
+    stats.record(_preference(location="인기"))
+    stats.record(_preference(location="인기"))
+    for i in range(4):
+        stats.record(_preference(location=f"지역 {i}"))
+    assert len(stats) == 3 and stats.top(1) == [("인기", "카페", TODAY)]
+
+    # drain은 마지막 drain 이후 늘어난 점수만 꺼내고, 반영하지 못한 점수는 다시 넣을 수 있음
+    increments = stats.drain()
+    assert increments[("인기", "카페", TODAY)] == 2.0 and stats.drain() == {}
+    stats.requeue(increments)
+    stats.record(_preference(location="인기"))
+    assert stats.drain()[("인기", "카페", TODAY)] == 3.0
+
+
+# 스케줄러
+
+def test_warm_up_uses_hot_locations_and_skips_open_circuits():
+    breakers = CircuitBreakerRegistry()
+    breakers.get("tmdb").state = "open"
+    ai_service = _StubAIService()
+    scheduler = _scheduler(ai_service, breakers=breakers,
+                           settings=PrefetchSettings(top_n=4, request_spacing=0.0, warmup_interests=("카페", "영화")))
+
+    asyncio.run(scheduler.warm_up())
+
+    # 통계가 없으면 주요 지역 × 기본 관심사 (영화는 회로가 열려 건너뜀)
+    assert ai_service.calls == [("서울 강남", "카페", TODAY), ("부산 해운대", "카페", TODAY)]
+
+
+def test_spacing_only_follows_combinations_that_reached_an_upstream():
+    breakers = CircuitBreakerRegistry()
+
+    class _CachingAIService(_StubAIService):
+        """맛집만 외부 API(kakao)를 호출하고 나머지는 캐시 적중으로 끝나는 AI 서비스"""
+
+        async def prefetch_sources(self, location, interests, day):
+            if interests[0] == "맛집":
+                breakers.get("kakao").before_call()
+            return await super().prefetch_sources(location, interests, day)
+
+    settings = PrefetchSettings(top_n=4, request_spacing=0.3, warmup_interests=("카페", "영화"))
+    loop_time = []
+
+    async def timed_warm_up(scheduler):
+        started = asyncio.get_running_loop().time()
+        await scheduler.warm_up()
+        loop_time.append(asyncio.get_running_loop().time() - started)
+
+    cached = _scheduler(_CachingAIService(), breakers=breakers, settings=settings)
+    asyncio.run(timed_warm_up(cached))
+    fetched = _scheduler(_CachingAIService(), breakers=breakers,
+                         settings=PrefetchSettings(top_n=4, request_spacing=0.3, warmup_interests=("맛집",)))
+    asyncio.run(timed_warm_up(fetched))
+
+    assert len(cached.ai_service.calls) == 4 and loop_time[0] < 0.3
+    assert loop_time[1] >= 0.6  # 외부 API를 호출한 두 조합 뒤에만 간격을 둠
+
+
+def test_ready_after_warm_up_then_cycles_refresh_top_combinations():
+    ai_service = _StubAIService()
+    stats = RequestStatsTracker(decay_factor=0.5)
+    stats.record(_preference(interests=("맛집",)))
+    scheduler = _scheduler(ai_service, stats=stats)
+
+    async def scenario():
+        assert not scheduler.ready
+        await scheduler.start()
+        await asyncio.sleep(0.01)
+        ready_after_warm_up = scheduler.ready
+        await asyncio.sleep(0.12)
+        await scheduler.aclose()
+        return ready_after_warm_up
+
+    assert asyncio.run(scenario())
+    assert scheduler.cycles >= 1
+    assert ai_service.calls[0] == ("서울 강남", "맛집", TODAY)
+    assert all(call == ai_service.calls[0] for call in ai_service.calls)
+
+
+def test_ready_after_timeout_while_warm_up_continues():
+    gate = asyncio.Event()
+    ai_service = _StubAIService(gate=gate)
+    settings = PrefetchSettings(interval=60, top_n=2, request_spacing=0.0, warmup_timeout=0.02, warmup_interests=("카페",))
+    scheduler = _scheduler(ai_service, settings=settings)
+
+    async def scenario():
+        await scheduler.start()
+        await asyncio.sleep(0.01)
+        before_timeout = scheduler.ready
+        await asyncio.sleep(0.03)
+        after_timeout = scheduler.ready
+        # 준비 완료 뒤에도 워밍업은 나머지 조합까지 이어서 진행
+        gate.set()
+        await asyncio.sleep(0.01)
+        await scheduler.aclose()
+        return before_timeout, after_timeout
+
+    assert asyncio.run(scenario()) == (False, True)
+    assert ai_service.calls == [("서울 강남", "카페", TODAY), ("부산 해운대", "카페", TODAY)]
+
+
+def test_overlapping_cycle_on_another_worker_is_skipped():
+    server = fakeredis.FakeServer()
+    stats = RequestStatsTracker(decay_factor=0.5)
+    stats.record(_preference())
+    first_ai, second_ai = _StubAIService(delay=0.05), _StubAIService()
+    first = _scheduler(first_ai, stats=stats, store=_store(server))
+    second = _scheduler(second_ai, stats=stats, store=_store(server))
+
+    async def scenario():
+        running = asyncio.ensure_future(first.run_cycle())
+        await asyncio.sleep(0.01)
+        await second.run_cycle()
+        await running
+
+    asyncio.run(scenario())
+    assert (first.cycles, second.cycles) == (1, 0)
+    assert len(first_ai.calls) == 1 and second_ai.calls == []
+
+
+def test_aclose_cancels_loop_and_saves_stats():
+    server = fakeredis.FakeServer()
+    gate = asyncio.Event()
+    ai_service = _StubAIService(gate=gate)
+    stats = RequestStatsTracker(decay_factor=0.5)
+    stats.record(_preference(location="대구"))
+    scheduler = _scheduler(ai_service, stats=stats, store=_store(server))
+
+    async def scenario():
+        await scheduler.start()
+        await asyncio.sleep(0.01)
+        task = scheduler._task
+        await scheduler.aclose()  # 워밍업이 멈춰 있는 중에 중지
+        return task, await _store(server).ztop("prefetch:request_scores", 10)
+
+    task, saved = asyncio.run(scenario())
+    assert task.cancelled() and scheduler._task is None
+    assert saved == [(f'["대구", "카페", "{TODAY}"]', 1.0)]
+
+
+def test_cycle_ranks_combinations_by_requests_from_every_worker():
+    server = fakeredis.FakeServer()
+    settings = PrefetchSettings(interval=60, jitter=0.0, top_n=1, request_spacing=0.0)
+    first_stats, second_stats = RequestStatsTracker(decay_factor=0.5), RequestStatsTracker(decay_factor=0.5)
+    # 락을 잡는 워커는 카페 요청이 더 많지만, 모든 워커를 합치면 맛집 요청이 더 많음
+    for _ in range(2):
+        first_stats.record(_preference(interests=("카페",)))
+    first_stats.record(_preference(interests=("맛집",)))
+    for _ in range(3):
+        second_stats.record(_preference(interests=("맛집",)))
+    first_ai, second_ai = _StubAIService(), _StubAIService()
+    first = _scheduler(first_ai, stats=first_stats, store=_store(server), settings=settings)
+    second = _scheduler(second_ai, stats=second_stats, store=_store(server), settings=settings)
+
+    async def scenario():
+        await second.aclose()  # 종료하는 워커의 집계도 합산됨
+        await first.run_cycle()
+        return await _store(server).ztop("prefetch:request_scores", 10)
+
+    scores = asyncio.run(scenario())
+    assert first_ai.calls == [("서울 강남", "맛집", TODAY)]
+    # 주기를 실행한 워커가 합산 점수를 감쇠
+    assert scores == [(f'["서울 강남", "맛집", "{TODAY}"]', 2.0), (f'["서울 강남", "카페", "{TODAY}"]', 1.0)]
+
+
+def test_disabled_scheduler_is_ready_without_task():
+    scheduler = _scheduler(_StubAIService(), settings=PrefetchSettings(enabled=False))
+    asyncio.run(scheduler.start())
+    assert scheduler.ready and scheduler._task is None
+
+
+def test_health_is_unavailable_until_warm_up_finishes(monkeypatch):
+    logger = logging.getLogger("app")
+    saved = (logger.handlers[:], logger.level, logger.propagate)
+    try:
+        import main
+    finally:
+        shutdown_logging()
+        logger.handlers, logger.level, logger.propagate = saved
+
+    scheduler = _scheduler(_StubAIService())
+    monkeypatch.setattr(main, "get_prefetch_scheduler", lambda: scheduler)
+    client = TestClient(main.app)
+
+    response = client.get("/health")
+    assert response.status_code == 503 and response.json() == {"status": "warming_up"}
+    scheduler.ready = True
+    assert client.get("/health").json() == {"status": "healthy"}
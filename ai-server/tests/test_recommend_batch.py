@@ -0,0 +1,146 @@
+import asyncio
+import json
+from datetime import datetime
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.application.use_cases.recommend_date_courses_batch import RecommendDateCoursesBatchUseCase
+from app.domain.entities.date_course import DateCourse
+from app.domain.value_objects.preference import Preference
+from app.presentation.routes.date_course_routes import create_date_course_routes
+
+
+def _preference(location="서울 강남", **overrides) -> Preference:
+    values = dict(budget="보통", location=location, interests=["카페"], date="2026-10-18", time_of_day="저녁")
+    values.update(overrides)
+    return Preference(**values)
+
+
+def _course(title: str) -> DateCourse:
+    now = datetime.now()
+    return DateCourse(
+        id=None, title=title, description="", location="서울", category="카페", duration=60,
+        price_range="보통", tags=[], rating=4.0, created_at=now, updated_at=now
+    )
+
+
+class _StubUseCase:
+    """지역명이 "실패"로 시작하면 예외, 아니면 지역명 코스 하나를 돌려주고 동시 실행 수를 기록"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+
+    async def execute(self, preference, timings=None):
+        self.calls.append(preference)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if preference.location.startswith("실패"):
+                raise RuntimeError(f"{preference.location} 조회 실패")
+            if preference.location.startswith("잘못"):
+                raise ValueError("지원하지 않는 지역입니다.")
+            return [_course(preference.location)]
+        finally:
+            self.running -= 1
+
+
+def _execute(use_case, preferences):
+    return asyncio.run(RecommendDateCoursesBatchUseCase(use_case, max_concurrency=2, max_size=5).execute(preferences))
+
+
+def test_equivalent_preferences_are_recommended_once():
+    use_case = _StubUseCase()
+    outcomes = _execute(use_case, [_preference("서울 강남"), _preference(" 서울  강남 "), _preference("부산")])
+
+    assert [p.location for p in use_case.calls] == ["서울 강남", "부산"]
+    assert outcomes[0] is outcomes[1]
+    assert [[c.title for c in outcome] for outcome in outcomes] == [["서울 강남"], ["서울 강남"], ["부산"]]
+
+
+def test_item_error_does_not_fail_batch():
+    outcomes = _execute(_StubUseCase(), [_preference("실패 지역"), _preference("부산"), _preference("실패 지역")])
+
+    assert isinstance(outcomes[0], RuntimeError) and outcomes[2] is outcomes[0]
+    assert [c.title for c in outcomes[1]] == ["부산"]
+
+
+def test_concurrency_is_bounded():
+    use_case = _StubUseCase(delay=0.01)
+    outcomes = _execute(use_case, [_preference(f"지역 {i}") for i in range(5)])
+
+    assert len(use_case.calls) == 5 and use_case.max_running == 2
+    assert [outcome[0].title for outcome in outcomes] == [f"지역 {i}" for i in range(5)]
+
+
+@pytest.mark.parametrize("preferences, message", [([], "비어"), ([_preference(f"지역 {i}") for i in range(6)], "최대 5개")])
+def test_empty_or_oversized_batch_is_rejected(preferences, message):
+    use_case = _StubUseCase()
+    with pytest.raises(ValueError, match=message):
+        _execute(use_case, preferences)
+    assert use_case.calls == []
+
+
+def test_limits_default_from_environment(monkeypatch):
+    monkeypatch.setenv("RECOMMEND_BATCH_CONCURRENCY", "3")
+    monkeypatch.setenv("RECOMMEND_BATCH_MAX_SIZE", "7")
+    batch = RecommendDateCoursesBatchUseCase(_StubUseCase())
+    assert (batch.max_concurrency, batch.max_size) == (3, 7)
+
+
+# 일괄 추천 라우트
+
+def _post_batch(preferences, max_size=3):
+    use_case = _StubUseCase()
+    app = FastAPI()
+    app.include_router(create_date_course_routes(use_case, RecommendDateCoursesBatchUseCase(use_case, 2, max_size)))
+    response = TestClient(app).post("/api/v1/date-courses/recommend/batch", json={"preferences": preferences})
+    return response, use_case
+
+
+def _body(location, budget="보통"):
+    return {"budget": budget, "location": location, "interests": ["카페"], "date": "2026-10-18", "time_of_day": "저녁"}
+
+
+def test_batch_route_reports_each_item_in_request_order():
+    response, use_case = _post_batch(
+        [_body("서울 강남"), _body("부산", budget="무제한"), _body("실패 지역"), _body("잘못된 지역")], max_size=4
+    )
+
+    assert response.status_code == 200
+    payload = json.loads(response.content)
+    assert (payload["succeeded"], payload["failed"]) == (1, 3)
+    results = payload["results"]
+    assert [(item["index"], item["status_code"]) for item in results] == [(0, 200), (1, 400), (2, 500), (3, 400)]
+    assert results[0]["count"] == 1 and results[0]["courses"][0]["title"] == "서울 강남" and results[0]["error"] is None
+    assert "예산" in results[1]["error"] and results[1]["courses"] == []
+    assert results[2]["error"] == "서버 오류: 실패 지역 조회 실패"
+    assert results[3]["error"] == "지원하지 않는 지역입니다."
+    # 선호도 변환에 실패한 항목은 유스케이스로 넘어가지 않음
+    assert [p.location for p in use_case.calls] == ["서울 강남", "실패 지역", "잘못된 지역"]
+
+
+def test_batch_route_rejects_oversized_batch():
+    response, use_case = _post_batch([_body(f"지역 {i}") for i in range(4)])
+    assert response.status_code == 400
+    assert "최대 3개" in response.json()["detail"]
+    assert use_case.calls == []
+
+
+def test_batch_route_counts_invalid_items_toward_the_limit():
+    # 유효한 항목은 한도 이하여도 변환에 실패할 항목까지 합쳐 한도를 넘으면 거부
+    response, use_case = _post_batch([_body("서울 강남")] * 3 + [_body("부산", budget="무제한")] * 2)
+    assert response.status_code == 400
+    assert "최대 3개" in response.json()["detail"]
+    assert use_case.calls == []
+
+    response, _ = _post_batch([_body("부산", budget="무제한")] * 4)
+    assert response.status_code == 400
+
+
+def test_batch_route_rejects_empty_batch():
+    response, _ = _post_batch([])
+    assert response.status_code == 422
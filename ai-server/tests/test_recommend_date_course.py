@@ -0,0 +1,174 @@
+import asyncio
+from datetime import datetime
+from app.application.use_cases.recommend_date_course import RecommendDateCourseUseCase
+from app.domain.entities.date_course import DateCourse
+from app.domain.value_objects.fetch_timing import FetchTiming
+from app.domain.value_objects.preference import Preference
+from app.infrastructure.cache.recommendation_cache import RecommendationCache
+from app.infrastructure.services.openai_service import OpenAIService
+
+
+def _preference(**overrides) -> Preference:
+    values = dict(
+        budget="보통",
+        location="서울 강남",
+        interests=["카페", "맛집"],
+        date="2026-10-18",
+        time_of_day="저녁",
+        interest_details={"맛집": ["한식", "양식"], "카페": ["디저트"]},
+    )
+    values.update(overrides)
+    return Preference(**values)
+
+
+def _course(title: str) -> DateCourse:
+    now = datetime.now()
+    return DateCourse(
+        id=None, title=title, description="", location="서울", category="카페", duration=60,
+        price_range="보통", tags=[], rating=4.0, created_at=now, updated_at=now
+    )
+
+
+class _EmptyRepository:
+    async def find_by_preference(self, preference):
+        return []
+
+
+class _StubAIService:
+    """호출마다 지정한 조회 상태를 timings에 추가하는 AI 서비스"""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.preferences = []
+
+    async def recommend_date_courses(self, preference, existing_courses, timings=None):
+        self.preferences.append(preference)
+        if timings is not None:
+            timings.extend(FetchTiming(source, 1.0, status) for source, status in self.statuses)
+        return [_course(f"코스 {len(self.preferences)}")]
+
+
+def _run(statuses, *preferences):
+    ai_service = _StubAIService(statuses)
+    use_case = RecommendDateCourseUseCase(_EmptyRepository(), ai_service, RecommendationCache(ttl=60))
+
+    async def scenario():
+        return [await use_case.execute(preference) for preference in preferences]
+
+    return asyncio.run(scenario()), ai_service
+
+
+def test_canonical_key_ignores_only_result_neutral_differences():
+    base = _preference()
+    assert base.canonical_key() == _preference(
+        location=" 서울  강남 ",
+        interest_details={"카페": ["디저트"], "맛집": ["한식", "양식"], "산책": []},
+    ).canonical_key()
+    # 관심사 순서(코스 순서)와 첫 번째 세부 옵션(조회 조건)이 다르면 다른 키
+    assert base.canonical_key() != _preference(interests=["맛집", "카페"]).canonical_key()
+    assert base.canonical_key() != _preference(
+        interest_details={"맛집": ["양식", "한식"], "카페": ["디저트"]}
+    ).canonical_key()
+
+
+def test_canonical_key_matches_canonical_preference():
+    preference = _preference(location="서울   강남", interest_details={"카페": [], "맛집": ["한식"]})
+    canonical = preference.canonical()
+    assert canonical.location == "서울 강남"
+    assert canonical.interest_details == {"맛집": ["한식"]}
+    assert canonical.canonical_key() == preference.canonical_key()
+
+
+def test_canonical_for_prompt_sorts_interests_and_detail_keys():
+    preference = _preference(
+        interests=["카페", "맛집"], location=" 서울 강남", interest_details={"카페": ["디저트"], "맛집": ["한식", "양식"]}
+    )
+    prompt_preference = preference.canonical_for_prompt()
+    assert prompt_preference.interests == ["맛집", "카페"]
+    assert list(prompt_preference.interest_details) == ["맛집", "카페"]
+    assert prompt_preference.location == "서울 강남"
+    assert prompt_preference == _preference(interests=["맛집", "카페"]).canonical_for_prompt()
+    # 세부 옵션 값 순서는 그대로 유지하고, 추천 캐시 키는 관심사 순서를 계속 구분
+    assert prompt_preference.interest_details["맛집"] == ["한식", "양식"]
+    assert preference.canonical_key() != _preference(interests=["맛집", "카페"]).canonical_key()
+
+
+def test_use_case_recommends_with_canonical_preference():
+    _, ai_service = _run([("카페", "ok")], _preference(location="서울  강남"))
+    assert ai_service.preferences[0].location == "서울 강남"
+
+
+def test_complete_results_are_cached():
+    (first, second), ai_service = _run(
+        [("카페", "ok"), ("real_data", "ok"), ("openai", "skipped")], _preference(), _preference()
+    )
+    assert first == second
+    assert len(ai_service.preferences) == 1
+
+
+def test_results_with_unfinished_race_leg_are_not_cached():
+    for statuses in ([("real_data", "timeout"), ("openai", "ok")], [("real_data", "ok"), ("openai", "timeout")]):
+        _, ai_service = _run(statuses, _preference(), _preference())
+        assert len(ai_service.preferences) == 2
+
+
+def test_openai_service_reports_race_legs(monkeypatch):
+    def service(real_count: int, real_delay: float):
+        ai_service = OpenAIService(api_key="test")
+        ai_service.race_deadline, ai_service.race_min_courses = 0.2, 2
+
+        async def real_data(preference, timings, rule_based_fallback=True):
+            await asyncio.sleep(real_delay)
+            return [_course(f"실제 {i}") for i in range(real_count)]
+
+        async def openai(preference):
+            await asyncio.sleep(0.05)
+            return [_course("AI")]
+
+        monkeypatch.setattr(ai_service, "_should_supplement_with_openai", lambda count: True)
+        monkeypatch.setattr(ai_service, "_generate_smart_recommendations", real_data)
+        monkeypatch.setattr(ai_service, "_hedged_openai_courses", openai)
+        return ai_service
+
+    def statuses(ai_service):
+        timings = []
+        asyncio.run(ai_service.recommend_date_courses(_preference(), [], timings))
+        return {timing.source: timing.status for timing in timings}
+
+    assert statuses(service(real_count=3, real_delay=0.0)) == {"real_data": "ok", "openai": "skipped"}
+    assert statuses(service(real_count=1, real_delay=0.0)) == {"real_data": "ok", "openai": "ok"}
+    assert statuses(service(real_count=3, real_delay=1.0)) == {"real_data": "timeout", "openai": "ok"}
+
+
+class _NoDataSources:
+    """모든 관심사 조회가 빈 결과를 돌려주는 외부 데이터 서비스"""
+    tmdb_api_key = ""
+
+    def __getattr__(self, name):
+        async def empty(*args, **kwargs):
+            return []
+        return empty
+
+
+class _CafeSources(_NoDataSources):
+    async def get_cafes(self, location):
+        return [{"id": 1, "name": "실제 카페"}]
+
+
+def test_openai_service_merges_only_real_data_with_ai_courses(monkeypatch):
+    def recommend(sources, ai_titles):
+        ai_service = OpenAIService(api_key="test", culture_service=sources, place_service=sources)
+        ai_service.openai_hedge_delay = 0
+
+        async def openai(preference):
+            return [_course(title) for title in ai_titles]
+
+        monkeypatch.setattr(ai_service, "_should_supplement_with_openai", lambda count: True)
+        monkeypatch.setattr(ai_service, "_hedged_openai_courses", openai)
+        monkeypatch.setattr(ai_service, "_rule_based_courses", lambda preference: [_course("기본 코스")])
+        return [course.title for course in asyncio.run(ai_service.recommend_date_courses(_preference(), []))]
+
+    # 실제 데이터가 없으면 기본 로직 코스를 섞지 않고 AI 추천만 반환
+    assert recommend(_NoDataSources(), ["AI 1", "AI 2"]) == ["AI 1", "AI 2"]
+    assert recommend(_NoDataSources(), []) == ["기본 코스"]
+    assert recommend(_CafeSources(), ["AI 1", "실제 카페"]) == ["실제 카페", "AI 1"]
@@ -0,0 +1,251 @@
+import asyncio
+import json
+from datetime import datetime
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.application.use_cases.recommend_date_course import RecommendDateCourseUseCase
+from app.domain.entities.date_course import DateCourse
+from app.domain.value_objects.fetch_timing import FetchTiming
+from app.domain.value_objects.preference import Preference
+from app.infrastructure.cache.recommendation_cache import RecommendationCache
+from app.infrastructure.services.openai_service import OpenAIService
+from app.presentation.routes.date_course_routes import create_date_course_routes
+
+_REQUEST = {
+    "preference": {
+        "budget": "보통", "location": "서울 강남", "interests": ["카페", "영화"],
+        "date": "2026-10-18", "time_of_day": "저녁",
+    }
+}
+
+
+def _preference(**overrides) -> Preference:
+    values = dict(budget="보통", location="서울 강남", interests=["영화", "카페"], date="2026-10-18", time_of_day="저녁")
+    values.update(overrides)
+    return Preference(**values)
+
+
+def _course(title: str) -> DateCourse:
+    now = datetime.now()
+    return DateCourse(
+        id=None, title=title, description="", location="서울", category="카페", duration=60,
+        price_range="보통", tags=[], rating=4.0, created_at=now, updated_at=now
+    )
+
+
+def _titles(batches):
+    return [[course.title for course in batch] for batch in batches]
+
+
+async def _collect(stream):
+    return [batch async for batch in stream]
+
+
+# 유스케이스
+
+class _Repository:
+    def __init__(self, courses=()):
+        self.courses = list(courses)
+
+    async def find_by_preference(self, preference):
+        return self.courses
+
+
+class _StreamingAIService:
+    def __init__(self):
+        self.calls = []
+
+    async def stream_date_courses(self, preference, existing_courses, timings=None):
+        self.calls.append((preference, existing_courses))
+        timings.append(FetchTiming("카페", 1.0, "ok", 1))
+        yield [_course("첫 묶음")]
+        yield [_course("둘째 묶음")]
+
+
+class _Stats:
+    def __init__(self):
+        self.recorded = []
+
+    def record(self, preference):
+        self.recorded.append(preference)
+
+
+def test_execute_stream_passes_batches_through_without_caching():
+    ai_service, stats, cache = _StreamingAIService(), _Stats(), RecommendationCache(ttl=60)
+    use_case = RecommendDateCourseUseCase(_Repository([_course("기존")]), ai_service, cache, stats)
+    timings = []
+
+    batches = asyncio.run(_collect(use_case.execute_stream(_preference(location=" 서울  강남 "), timings)))
+
+    assert _titles(batches) == [["첫 묶음"], ["둘째 묶음"]]
+    assert [t.source for t in timings] == ["카페"]
+    preference, existing = ai_service.calls[0]
+    assert preference.location == "서울 강남" and [c.title for c in existing] == ["기존"]
+    assert stats.recorded == [preference]
+    # 스트리밍 결과는 소스 응답 순서라 추천 캐시에 저장하지 않음
+    assert asyncio.run(cache.get(preference)) is None
+
+
+def test_execute_stream_returns_cached_result_in_one_batch():
+    ai_service, cache = _StreamingAIService(), RecommendationCache(ttl=60)
+    asyncio.run(cache.set(_preference(), [_course("캐시 1"), _course("캐시 2")]))
+    use_case = RecommendDateCourseUseCase(_Repository(), ai_service, cache)
+
+    batches = asyncio.run(_collect(use_case.execute_stream(_preference(location="서울   강남"), [])))
+
+    assert _titles(batches) == [["캐시 1", "캐시 2"]]
+    assert ai_service.calls == []
+
+
+# OpenAIService.stream_date_courses
+
+class _CultureService:
+    tmdb_api_key = "test"
+
+    def __init__(self, movies, delay):
+        self.movies, self.delay = movies, delay
+
+    async def get_movies(self, location, date):
+        await asyncio.sleep(self.delay)
+        return self.movies
+
+
+class _PlaceService:
+    def __init__(self, cafes, delay):
+        self.cafes, self.delay = cafes, delay
+
+    async def get_cafes(self, location):
+        await asyncio.sleep(self.delay)
+        return self.cafes
+
+
+def _service(monkeypatch, movies=(), cafes=(), movie_delay=0.0, cafe_delay=0.0, ai_titles=None):
+    service = OpenAIService(
+        api_key="test",
+        culture_service=_CultureService([{"id": i, "title": t} for i, t in enumerate(movies)], movie_delay),
+        place_service=_PlaceService([{"id": i, "name": n} for i, n in enumerate(cafes)], cafe_delay),
+        fetch_deadline=0.2,
+    )
+    monkeypatch.setattr(service, "_should_supplement_with_openai", lambda count: ai_titles is not None and count < 5)
+
+    async def ai_courses(preference):
+        for title in ai_titles or []:
+            await asyncio.sleep(0)
+            yield _course(title)
+
+    monkeypatch.setattr(service, "_iter_openai_courses", ai_courses)
+    return service
+
+
+def test_stream_yields_sources_in_completion_order(monkeypatch):
+    service = _service(monkeypatch, movies=["영화 A", "영화 B"], cafes=["카페 A"], movie_delay=0.05)
+    timings = []
+
+    batches = asyncio.run(_collect(service.stream_date_courses(_preference(), [], timings)))
+
+    # 카페가 먼저 응답하므로 관심사 순서(영화 먼저)와 달리 카페 묶음이 먼저 나옴
+    assert _titles(batches) == [["카페 A"], ["영화 A", "영화 B"]]
+    assert {t.source: (t.status, t.item_count) for t in timings} == {"카페": ("ok", 1), "영화": ("ok", 2)}
+
+
+def test_stream_reports_timed_out_source_and_caps_at_ten(monkeypatch):
+    service = _service(monkeypatch, movies=[f"영화 {i}" for i in range(12)], cafes=["카페 A"], cafe_delay=1.0)
+    timings = []
+
+    batches = asyncio.run(_collect(service.stream_date_courses(_preference(), [], timings)))
+
+    assert sum(len(batch) for batch in batches) == 10
+    assert {t.source: t.status for t in timings} == {"영화": "ok", "카페": "timeout"}
+
+
+def test_stream_falls_back_to_rule_based_then_streams_openai_courses(monkeypatch):
+    service = _service(monkeypatch, ai_titles=["AI 1", "AI 1", "AI 2"])
+    rule_based = [_course("기본 코스")]
+    monkeypatch.setattr(service, "_rule_based_courses", lambda preference: rule_based)
+
+    batches = asyncio.run(_collect(service.stream_date_courses(_preference(), [], [])))
+
+    # 기본 로직 결과 다음에 OpenAI 코스를 하나씩 (같은 제목은 한 번만)
+    assert _titles(batches) == [["기본 코스"], ["AI 1"], ["AI 2"]]
+
+
+def test_stream_returns_existing_courses_without_fetching(monkeypatch):
+    service = _service(monkeypatch, movies=["영화 A"])
+    existing = [_course(f"기존 {i}") for i in range(5)]
+    timings = []
+
+    batches = asyncio.run(_collect(service.stream_date_courses(_preference(), existing, timings)))
+
+    assert _titles(batches) == [["기존 0", "기존 1", "기존 2"]]
+    assert timings == []
+
+
+# NDJSON 라우트
+
+class _StubUseCase:
+    """지정한 코스 묶음과 조회 결과를 스트리밍하고, error가 있으면 마지막에 예외를 던지는 유스케이스"""
+
+    def __init__(self, batches, timings=(), error=None):
+        self.batches, self.timings, self.error = batches, list(timings), error
+
+    async def execute(self, preference, timings=None):
+        return [course for batch in self.batches for course in batch]
+
+    async def execute_stream(self, preference, timings=None):
+        timings.extend(self.timings)
+        for batch in self.batches:
+            yield batch
+        if self.error is not None:
+            raise self.error
+
+
+def _post_stream(use_case, body=_REQUEST):
+    app = FastAPI()
+    app.include_router(create_date_course_routes(use_case))
+    return TestClient(app).post("/api/v1/date-courses/recommend/stream", json=body)
+
+
+def _frames(response):
+    assert response.text.endswith("\n")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_stream_route_frames_courses_then_summary():
+    use_case = _StubUseCase(
+        [[_course("카페 A"), _course("카페 B")], [_course("AI 1")]],
+        [FetchTiming("카페", 12.34, "ok", 2), FetchTiming("real_data", 20.0, "ok", 2), FetchTiming("openai", 5.0, "skipped")],
+    )
+
+    response = _post_stream(use_case)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["cache-control"] == "no-cache" and response.headers["x-accel-buffering"] == "no"
+    frames = _frames(response)
+    assert [frame["type"] for frame in frames] == ["course", "course", "course", "summary"]
+    assert [frame["data"]["title"] for frame in frames[:3]] == ["카페 A", "카페 B", "AI 1"]
+    assert set(frames[0]["data"]) >= {"title", "description", "duration", "price_range", "rating", "tags"}
+    assert frames[-1]["data"] == {
+        "count": 3,
+        "sources": [
+            {"source": "카페", "status": "ok", "elapsed_ms": 12.3, "item_count": 2},
+            {"source": "real_data", "status": "ok", "elapsed_ms": 20.0, "item_count": 2},
+            {"source": "openai", "status": "skipped", "elapsed_ms": 5.0, "item_count": 0},
+        ],
+    }
+
+
+def test_stream_route_ends_with_error_line_when_stream_fails():
+    response = _post_stream(_StubUseCase([[_course("카페 A")]], error=RuntimeError("소스 실패")))
+
+    assert response.status_code == 200
+    frames = _frames(response)
+    assert [frame["type"] for frame in frames] == ["course", "error"]
+    assert frames[-1] == {"type": "error", "detail": "서버 오류: 소스 실패"}
+
+
+def test_stream_route_rejects_invalid_preference_before_streaming():
+    body = {"preference": dict(_REQUEST["preference"], budget="무제한")}
+    response = _post_stream(_StubUseCase([]), body)
+    assert response.status_code == 400
+    assert "예산" in response.json()["detail"]
@@ -0,0 +1,83 @@
+import asyncio
+import pytest
+from app.infrastructure.cache.single_flight import SingleFlight, normalize_key
+
+
+def test_concurrent_callers_share_one_load():
+    flight = SingleFlight()
+    loads = []
+
+    async def load():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return ["공연"]
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do("key", load) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+    assert len(loads) == 1
+    assert all(result == ["공연"] for result in results)
+    assert flight.stats() == {"calls": 1, "shared": 4, "in_flight": 0}
+
+
+def test_exception_reaches_every_waiter_and_clears_key():
+    flight = SingleFlight()
+    attempts = []
+
+    async def failing():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def ok():
+        return "복구"
+
+    async def scenario():
+        results = await asyncio.gather(*(flight.do("key", failing) for _ in range(3)), return_exceptions=True)
+        assert flight.stats()["in_flight"] == 0
+        return results, await flight.do("key", ok)
+
+    results, recovered = asyncio.run(scenario())
+    assert len(attempts) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert recovered == "복구"
+
+
+def test_cancelled_waiter_does_not_cancel_shared_load():
+    flight = SingleFlight()
+    finished = []
+
+    async def load():
+        await asyncio.sleep(0.02)
+        finished.append(1)
+        return "결과"
+
+    async def scenario():
+        first = asyncio.ensure_future(flight.do("key", load))
+        second = asyncio.ensure_future(flight.do("key", load))
+        await asyncio.sleep(0.005)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "결과"
+    assert finished == [1]
+
+
+def test_distinct_keys_load_separately():
+    flight = SingleFlight()
+
+    async def scenario():
+        return await asyncio.gather(
+            flight.do("a", lambda: asyncio.sleep(0, "a")),
+            flight.do("b", lambda: asyncio.sleep(0, "b")),
+        )
+
+    assert asyncio.run(scenario()) == ["a", "b"]
+    assert flight.stats()["calls"] == 2
+
+
+def test_normalize_key_folds_whitespace_and_case():
+    assert normalize_key("performances", "  Seoul   Gangnam ", None) == ("performances", "seoul gangnam", None)
@@ -0,0 +1,64 @@
+import asyncio
+from app.infrastructure.services.source_fan_out import fan_out, race
+
+
+async def _after(delay: float, value, fail: bool = False):
+    await asyncio.sleep(delay)
+    if fail:
+        raise RuntimeError("boom")
+    return value
+
+
+def test_fan_out_keeps_insertion_order_and_records_statuses():
+    async def scenario():
+        return await fan_out({
+            "slow": _after(0.05, [1]),
+            "fast": _after(0.0, [2, 3]),
+            "broken": _after(0.0, [], fail=True),
+            "late": _after(5, [4]),
+        }, deadline=0.2)
+
+    results, timings = asyncio.run(scenario())
+    assert list(results) == ["slow", "fast"]
+    assert {t.source: (t.status, t.item_count) for t in timings} == {
+        "slow": ("ok", 1), "fast": ("ok", 2), "broken": ("error", 0), "late": ("timeout", 0),
+    }
+
+
+def test_cancelled_fan_out_cancels_fetches_immediately():
+    cancelled = []
+
+    async def fetch():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return []
+
+    async def scenario():
+        task = asyncio.ensure_future(fan_out({"a": fetch(), "b": fetch()}, deadline=10))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        # 다음 루프 턴 안에 하위 조회가 취소되어야 함 (GC를 기다리지 않음)
+        await asyncio.sleep(0)
+        return len(cancelled)
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_race_stops_when_sufficient():
+    async def scenario():
+        return await race(
+            {"quick": _after(0.0, [1, 2]), "slow": _after(5, [3])},
+            deadline=1,
+            is_sufficient=lambda completed: len(completed.get("quick", [])) >= 2,
+        )
+
+    completed, timings = asyncio.run(scenario())
+    assert completed == {"quick": [1, 2]}
+    assert {t.source: t.status for t in timings} == {"quick": "ok", "slow": "timeout"}
@@ -0,0 +1,151 @@
+import asyncio
+import os
+import random
+from datetime import datetime
+import pytest
+from app.domain.entities.date_course import DateCourse
+from app.domain.value_objects.preference import Preference
+from app.infrastructure.repositories import sqlite_date_course_repository
+from app.infrastructure.repositories.in_memory_date_course_repository import InMemoryDateCourseRepository
+from app.infrastructure.repositories.sqlite_date_course_repository import SqliteDateCourseRepository
+
+DISTRICTS = ["서울시 강남구", "서울시 종로구", "서울시 마포구", "부산시 해운대구", "강남", "강", "서울"]
+TAGS = ["카페", "맛집", "산책", "문화", "야경", "쇼핑", "디저트", "자연"]
+BUDGETS = ["저렴", "보통", "비쌈"]
+
+
+def _course(rng: random.Random, course_id) -> DateCourse:
+    now = datetime(2026, 10, 18, 12, 0, 0)
+    return DateCourse(
+        id=course_id, title=f"코스 {course_id}", description="설명", location=rng.choice(DISTRICTS),
+        category="일반", duration=60, price_range=rng.choice(BUDGETS),
+        tags=rng.sample(TAGS, rng.randint(0, 3)), rating=rng.choice([3, 4.5, 5]), created_at=now, updated_at=now
+    )
+
+
+def _snapshot(courses):
+    """저장 시각(created_at/updated_at)을 뺀 비교용 값 (샘플 데이터는 생성 시각이 저장소마다 다름)"""
+    return [
+        (c.id, c.title, c.description, c.location, c.category, c.duration, c.price_range, c.tags, c.rating)
+        for c in courses
+    ]
+
+
+@pytest.fixture
+def repositories(tmp_path):
+    sqlite = SqliteDateCourseRepository(str(tmp_path / "courses.db"))
+    yield InMemoryDateCourseRepository(), sqlite
+    sqlite.close()
+
+
+def test_sample_data_and_queries_match_in_memory_repository(repositories):
+    memory, sqlite = repositories
+    rng = random.Random(11)
+
+    async def scenario():
+        assert _snapshot(await sqlite.find_all()) == _snapshot(await memory.find_all())
+        for step in range(300):
+            # 기존 ID 재저장(저장 순서 유지), 새 ID, ID 없는 코스를 섞고 가끔 save_many로 묶어 저장
+            ids = [rng.choice([str(rng.randint(1, 80)), None]) for _ in range(rng.choice([1, 1, 4]))]
+            seed = rng.random()
+            for repository in (memory, sqlite):
+                batch_rng = random.Random(seed)
+                batch = [_course(batch_rng, course_id) for course_id in ids]
+                if len(batch) == 1:
+                    await repository.save(batch[0])
+                else:
+                    await repository.save_many(batch)
+            if step % 25:
+                continue
+            assert _snapshot(await sqlite.find_all()) == _snapshot(await memory.find_all())
+            for _ in range(20):
+                preference = Preference(
+                    budget=rng.choice(BUDGETS),
+                    location=rng.choice(["강남", "서울시", "구", "해운대", "", "없는지역"]),
+                    interests=rng.sample(TAGS, rng.randint(1, 3)),
+                    date="2026-10-18",
+                    time_of_day="저녁",
+                )
+                expected = await memory.find_by_preference(preference)
+                assert _snapshot(await sqlite.find_by_preference(preference)) == _snapshot(expected)
+
+        assert _snapshot([c async for c in sqlite.iter_all(batch_size=7)]) == _snapshot(await memory.find_all())
+        for course_id in ("1", "40", "없는 ID"):
+            expected = await memory.find_by_id(course_id)
+            found = await sqlite.find_by_id(course_id)
+            assert _snapshot([found] if found else []) == _snapshot([expected] if expected else [])
+
+    asyncio.run(scenario())
+
+
+def test_id_allocation_skips_explicit_ids_like_in_memory_repository(repositories):
+    rng = random.Random(2)
+
+    async def allocate(repository):
+        await repository.save(_course(rng, "4"))
+        courses = await repository.save_many([_course(rng, None) for _ in range(3)])
+        return [course.id for course in courses]
+
+    for repository in repositories:
+        assert asyncio.run(allocate(repository)) == ["5", "6", "7"]
+
+
+def test_id_allocation_matches_with_explicit_ids_ahead_and_re_saves(repositories):
+    rng = random.Random(4)
+
+    async def allocate(repository):
+        await repository.save_many([_course(rng, "6"), _course(rng, "8")])
+        await repository.save(_course(rng, "1"))  # 기존 코스 재저장은 번호를 소비하지 않음
+        return [(await repository.save(_course(rng, None))).id for _ in range(5)]
+
+    for repository in repositories:
+        assert asyncio.run(allocate(repository)) == ["4", "5", "7", "9", "10"]
+
+
+def test_rolled_back_save_leaves_courses_unchanged(repositories):
+    memory, sqlite = repositories
+    rng = random.Random(5)
+    course, broken = _course(rng, None), _course(rng, None)
+    broken.tags = [object()]  # JSON으로 저장할 수 없어 트랜잭션 중간에 실패
+    original_updated_at = course.updated_at
+
+    with pytest.raises(TypeError):
+        asyncio.run(sqlite.save_many([course, broken]))
+    assert course.id is None and course.updated_at == original_updated_at
+
+    # 롤백된 저장은 번호를 소비하지 않음
+    expected_id = asyncio.run(memory.save(_course(rng, None))).id
+    assert asyncio.run(sqlite.save(course)).id == expected_id
+    assert asyncio.run(sqlite.find_by_id(expected_id)) is not None
+
+
+def test_connection_is_opened_on_first_use_and_reopened_after_close(tmp_path):
+    path = tmp_path / "courses.db"
+    repository = SqliteDateCourseRepository(str(path))
+    assert repository._conn is None and not path.exists()
+
+    assert len(asyncio.run(repository.find_all())) == 3
+    repository.close()
+    assert repository._conn is None
+    repository.close()  # 두 번 닫아도 안전
+    # 다시 열어도 샘플 데이터를 중복 저장하지 않고 ID 번호도 이어서 부여
+    assert len(asyncio.run(repository.find_all())) == 3
+    repository.close()
+    reopened = SqliteDateCourseRepository(str(path))
+    assert asyncio.run(reopened.save(_course(random.Random(1), None))).id == "4"
+    reopened.close()
+
+
+def test_forked_worker_opens_its_own_connection(tmp_path, monkeypatch):
+    repository = SqliteDateCourseRepository(str(tmp_path / "courses.db"))
+    asyncio.run(repository.find_all())
+    parent_conn = repository._conn
+
+    # preload_app으로 fork된 워커처럼 프로세스 ID만 바뀐 상황
+    worker_pid = os.getpid() + 1
+    monkeypatch.setattr(sqlite_date_course_repository.os, "getpid", lambda: worker_pid)
+    assert asyncio.run(repository.find_by_id("1")) is not None
+    assert repository._conn is not parent_conn
+    assert parent_conn.execute("SELECT 1").fetchone()[0] == 1
+    repository.close()
+    parent_conn.close()
@@ -0,0 +1,267 @@
+import asyncio
+import fakeredis.aioredis
+import pytest
+from app.infrastructure.cache.distributed_lock import DistributedLock
+from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.cache.tiered_cache import (
+    CacheSettings,
+    CachedLoadError,
+    LoadFailure,
+    TieredCache,
+    decode_value,
+    encode_value,
+    refresh_ahead,
+)
+
+_SETTINGS = CacheSettings(
+    ttls={"places": 100.0}, negative_ttl=5.0, error_ttl=2.0, fill_lock_ttl=2.0, fill_wait=1.0
+)
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def _redis(server) -> RedisCache:
+    """같은 가짜 Redis 서버를 공유하는 L2 (워커 하나에 해당)"""
+    cache = RedisCache(url="redis://fake")
+    cache._client = fakeredis.aioredis.FakeRedis(server=server)
+    return cache
+
+
+def _worker(server) -> TieredCache:
+    return TieredCache(_SETTINGS, l2=_redis(server))
+
+
+def _loader(calls, value, delay=0.0):
+    async def load():
+        calls.append(value)
+        await asyncio.sleep(delay)
+        return value
+    return load
+
+
+def test_encode_value_round_trips_small_and_compressed_values():
+    small = {"name": "카페"}
+    large = [{"name": "장소" * 50, "index": i} for i in range(20)]
+    assert encode_value(small)[:1] == b"j"
+    assert encode_value(large)[:1] == b"z"
+    assert decode_value(encode_value(small)) == small
+    assert decode_value(encode_value(large)) == large
+    assert decode_value(encode_value(LoadFailure("RuntimeError: 실패"))) == LoadFailure("RuntimeError: 실패")
+
+
+def test_second_worker_reads_value_from_l2(server):
+    first, second = _worker(server), _worker(server)
+    calls = []
+
+    async def scenario():
+        await first.get_or_load("places", ("서울",), _loader(calls, ["a"]))
+        return await second.get_or_load("places", ("서울",), _loader(calls, ["b"]))
+
+    assert asyncio.run(scenario()) == ["a"]
+    assert calls == [["a"]]
+    assert second.stats()["l2_hits"] == 1
+
+
+def test_empty_results_use_negative_ttl(server):
+    cache = _worker(server)
+    client = cache.l2._get_client()
+
+    async def scenario():
+        await cache.get_or_load("places", ("empty",), _loader([], []))
+        await cache.get_or_load("places", ("full",), _loader([], ["a"]))
+        prefix = cache.l2.key_prefix
+        return (
+            await client.pttl(prefix + TieredCache.make_key("places", ("empty",))),
+            await client.pttl(prefix + TieredCache.make_key("places", ("full",))),
+        )
+
+    empty_ttl, full_ttl = asyncio.run(scenario())
+    assert 0 < empty_ttl <= 5000
+    assert 5000 < full_ttl <= 100000
+    assert cache.stats()["negative_stores"] == 1
+
+
+def test_loader_error_is_cached_briefly_for_every_worker(server):
+    first, second = _worker(server), _worker(server)
+    calls = []
+
+    async def failing():
+        calls.append("fail")
+        raise RuntimeError("upstream down")
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await first.get_or_load("places", ("서울",), failing)
+        # error_ttl 동안은 같은 워커(L1)와 다른 워커(L2) 모두 외부 API를 다시 호출하지 않음
+        for cache in (first, second):
+            with pytest.raises(CachedLoadError, match="RuntimeError: upstream down"):
+                await cache.get_or_load("places", ("서울",), failing)
+        client = first.l2._get_client()
+        return await client.pttl(first.l2.key_prefix + TieredCache.make_key("places", ("서울",)))
+
+    error_ttl_ms = asyncio.run(scenario())
+    assert calls == ["fail"]
+    assert 0 < error_ttl_ms <= 2000
+    assert first.stats()["load_errors"] == 1
+    assert first.stats()["error_hits"] == 1 and second.stats()["error_hits"] == 1
+
+
+def test_loader_is_retried_after_error_ttl(server):
+    settings = CacheSettings(ttls={"places": 100.0}, error_ttl=0.1, fill_lock_ttl=2.0, fill_wait=1.0)
+    cache = TieredCache(settings, l2=_redis(server))
+    calls = []
+
+    async def failing():
+        calls.append("fail")
+        raise RuntimeError("upstream down")
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("places", ("서울",), failing)
+        await asyncio.sleep(0.15)
+        return await cache.get_or_load("places", ("서울",), _loader(calls, ["a"]))
+
+    assert asyncio.run(scenario()) == ["a"]
+    assert calls == ["fail", ["a"]]
+
+
+def test_loader_errors_are_not_cached_when_error_ttl_is_zero(server):
+    settings = CacheSettings(ttls={"places": 100.0}, error_ttl=0, fill_lock_ttl=2.0, fill_wait=1.0)
+    cache = TieredCache(settings, l2=_redis(server))
+    calls = []
+
+    async def failing():
+        calls.append("fail")
+        raise RuntimeError("upstream down")
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("places", ("서울",), failing)
+        return await cache.get_or_load("places", ("서울",), _loader(calls, ["a"]))
+
+    assert asyncio.run(scenario()) == ["a"]
+    assert calls == ["fail", ["a"]]
+
+
+def test_concurrent_miss_across_workers_loads_once(server):
+    first, second = _worker(server), _worker(server)
+    calls = []
+
+    async def scenario():
+        return await asyncio.gather(
+            first.get_or_load("places", ("서울",), _loader(calls, ["first"], delay=0.1)),
+            second.get_or_load("places", ("서울",), _loader(calls, ["second"], delay=0.1)),
+        )
+
+    assert asyncio.run(scenario()) == [["first"], ["first"]]
+    assert calls == [["first"]]
+    assert second.stats()["fill_waits"] == 1
+
+
+def _expire_l2(cache: TieredCache, key: str, ttl_ms: int):
+    return cache.l2._client.pexpire(cache.l2.key_prefix + key, ttl_ms)
+
+
+def test_refresh_ahead_reloads_entries_near_expiry(server):
+    cache = _worker(server)
+    key = TieredCache.make_key("places", ("서울",))
+    calls = []
+
+    async def scenario():
+        await cache.get_or_load("places", ("서울",), _loader(calls, ["old"]))
+        with refresh_ahead(0.5):
+            fresh = await cache.get_or_load("places", ("서울",), _loader(calls, ["unused"]))
+        cache.l1.set(key, ["old"], 10.0)
+        await _expire_l2(cache, key, 10_000)
+        with refresh_ahead(0.5):
+            reloaded = await cache.get_or_load("places", ("서울",), _loader(calls, ["new"]))
+        return fresh, reloaded
+
+    assert asyncio.run(scenario()) == (["old"], ["new"])
+    assert calls == [["old"], ["new"]]
+
+
+def test_refresh_ahead_uses_fresh_l2_value_missing_from_l1(server):
+    first, second = _worker(server), _worker(server)
+    key = TieredCache.make_key("places", ("서울",))
+    calls = []
+
+    async def scenario():
+        await first.get_or_load("places", ("서울",), _loader(calls, ["old"]))
+        with refresh_ahead(0.5):
+            fresh = await second.get_or_load("places", ("서울",), _loader(calls, ["unused"]))
+        second.invalidate_local()
+        await _expire_l2(first, key, 10_000)
+        with refresh_ahead(0.5):
+            reloaded = await second.get_or_load("places", ("서울",), _loader(calls, ["new"]))
+        return fresh, reloaded
+
+    assert asyncio.run(scenario()) == (["old"], ["new"])
+    assert calls == [["old"], ["new"]]
+
+
+def test_l2_hit_is_kept_in_l1_only_for_the_remaining_l2_ttl(server):
+    first, second = _worker(server), _worker(server)
+    key = TieredCache.make_key("places", ("서울",))
+    calls = []
+
+    async def scenario():
+        await first.get_or_load("places", ("서울",), _loader(calls, ["a"]))
+        await _expire_l2(first, key, 30_000)
+        return await second.get_or_load("places", ("서울",), _loader(calls, ["unused"]))
+
+    assert asyncio.run(scenario()) == ["a"]
+    assert 0 < second.l1.ttl_remaining(key) <= 30.0
+
+
+def test_redis_failure_falls_back_to_l1():
+    class BrokenRedis:
+        async def get(self, *args, **kwargs):
+            raise ConnectionError("refused")
+
+        set = get
+
+        def pipeline(self, *args, **kwargs):
+            raise ConnectionError("refused")
+
+    l2 = RedisCache(url="redis://broken", retry_after=60)
+    l2._client = BrokenRedis()
+    cache = TieredCache(_SETTINGS, l2=l2)
+    calls = []
+
+    async def scenario():
+        for _ in range(3):
+            await cache.get_or_load("places", ("서울",), _loader(calls, ["a"]))
+
+    asyncio.run(scenario())
+    assert calls == [["a"]]
+    assert l2.errors == 1 and not l2.available
+
+
+def test_distributed_lock_is_exclusive_and_only_released_by_holder(server):
+    store = _redis(server)
+
+    async def scenario():
+        holder = DistributedLock(store, "k", ttl=5)
+        other = DistributedLock(store, "k", ttl=5)
+        assert await holder.acquire()
+        assert not await other.acquire()
+        await other.release()  # 잡지 않은 락 해제는 무시
+        assert not await DistributedLock(store, "k", ttl=5).acquire()
+        await holder.release()
+        assert await other.acquire()
+
+    asyncio.run(scenario())
+
+
+def test_distributed_lock_without_redis_always_acquires():
+    async def scenario():
+        lock = DistributedLock(None, "k", ttl=5)
+        assert await lock.acquire()
+        assert await DistributedLock(None, "k", ttl=5).acquire()
+        await lock.release()
+
+    asyncio.run(scenario())
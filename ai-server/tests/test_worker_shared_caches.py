@@ -0,0 +1,109 @@
+import asyncio
+from datetime import datetime
+import fakeredis.aioredis
+import pytest
+from app.domain.entities.date_course import DateCourse
+from app.domain.value_objects.preference import Preference
+from app.infrastructure.cache.completion_cache import CompletionCache
+from app.infrastructure.cache.recommendation_cache import RecommendationCache, decode_courses, encode_courses
+from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.repositories.sqlite_date_course_repository import SqliteDateCourseRepository
+from app.presentation.responses.fast_json_response import ResponseBodyCache
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def _redis(server) -> RedisCache:
+    """같은 가짜 Redis 서버를 공유하는 L2 (워커 하나에 해당)"""
+    cache = RedisCache(url="redis://fake")
+    cache._client = fakeredis.aioredis.FakeRedis(server=server)
+    return cache
+
+
+def _preference() -> Preference:
+    return Preference(
+        budget="보통", location="서울 강남", interests=["카페"], date="2026-10-18", time_of_day="저녁"
+    )
+
+
+def _course(title: str) -> DateCourse:
+    now = datetime(2026, 10, 18, 12, 0, 0)
+    return DateCourse(
+        id="1", title=title, description="설명", location="서울", category="카페", duration=60,
+        price_range="보통", tags=["카페", "디저트"], rating=4.5, created_at=now, updated_at=now
+    )
+
+
+def test_encode_courses_round_trips():
+    courses = [_course("코스 1"), _course("코스 2")]
+    assert decode_courses(encode_courses(courses)) == courses
+
+
+def test_save_on_one_worker_invalidates_recommendations_on_every_worker(server, tmp_path):
+    first, second = RecommendationCache(ttl=60, l2=_redis(server)), RecommendationCache(ttl=60, l2=_redis(server))
+    # 같은 SQLite 파일을 여는 두 워커의 저장소
+    repositories = [SqliteDateCourseRepository(str(tmp_path / "courses.db")) for _ in range(2)]
+    repositories[0].add_change_listener(first.invalidate)
+    repositories[1].add_change_listener(second.invalidate)
+
+    async def scenario():
+        await first.set(_preference(), [_course("캐시")])
+        shared = await second.get(_preference())
+        await second.get(_preference())  # L1에 보관된 결과
+        await repositories[0].save(_course("새 코스"))
+        return shared, await first.get(_preference()), await second.get(_preference())
+
+    try:
+        shared, after_first, after_second = asyncio.run(scenario())
+    finally:
+        for repository in repositories:
+            repository.close()
+    assert [c.title for c in shared] == ["캐시"]
+    assert after_first is None and after_second is None
+    assert second.stats()["l2_hits"] == 1 and first.stats()["invalidations"] == 1
+
+
+def test_recommendations_fall_back_to_local_cache_without_redis():
+    cache = RecommendationCache(ttl=60, l2=RedisCache(url=""))
+
+    async def scenario():
+        await cache.set(_preference(), [_course("캐시")])
+        cached = await cache.get(_preference())
+        await cache.invalidate()
+        return cached, await cache.get(_preference())
+
+    cached, invalidated = asyncio.run(scenario())
+    assert [c.title for c in cached] == ["캐시"] and invalidated is None
+
+
+def test_completion_created_on_one_worker_is_reused_by_another(server):
+    first, second = CompletionCache(ttl=60, l2=_redis(server)), CompletionCache(ttl=60, l2=_redis(server))
+    calls = []
+
+    async def create():
+        calls.append(1)
+        return "[{\"title\": \"코스\"}]"
+
+    async def scenario():
+        created = await first.get_or_create("gpt", "system", "prompt", 0.7, create)
+        return created, await second.get_or_create("gpt", "system", "prompt", 0.7, create)
+
+    created, reused = asyncio.run(scenario())
+    assert created == reused and calls == [1]
+    assert second.stats()["l2_hits"] == 1
+
+
+def test_response_body_is_shared_with_the_same_etag(server):
+    first, second = ResponseBodyCache(ttl=60, l2=_redis(server)), ResponseBodyCache(ttl=60, l2=_redis(server))
+    key = ("exhibitions", "서울", "2026-10-18")
+
+    async def scenario():
+        stored = await first.set(key, {"exhibitions": [{"title": "전시"}]})
+        return stored, await second.get(key)
+
+    stored, shared = asyncio.run(scenario())
+    assert shared == stored
+    assert second.stats()["l2_hits"] == 1
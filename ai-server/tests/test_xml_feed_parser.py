@@ -0,0 +1,173 @@
+import asyncio
+import random
+import xml.etree.ElementTree as ET
+import httpx
+import pytest
+from app.infrastructure.cache.tiered_cache import CacheSettings, TieredCache
+from app.infrastructure.http.pooled_http_client import HttpClientSettings, PooledHttpClient
+from app.infrastructure.services.culture_service import CultureService
+from app.infrastructure.services.xml_feed_parser import (
+    EXHIBITION_FIELDS,
+    PERFORMANCE_FIELDS,
+    XmlItemStreamParser,
+    compile_aliases,
+)
+
+_PERFORMANCE_TABLE = compile_aliases(PERFORMANCE_FIELDS)
+
+
+def _item(**tags) -> str:
+    return "<item>" + "".join(f"<{tag}>{text}</{tag}>" for tag, text in tags.items()) + "</item>"
+
+
+def _feed(items, namespace: str = "", total_count=None) -> bytes:
+    xmlns = f' xmlns="{namespace}"' if namespace else ""
+    total = f"<totalCount>{total_count}</totalCount>" if total_count is not None else ""
+    body = f"<response{xmlns}><header><resultCode>00</resultCode></header><body>{total}<items>"
+    return (body + "".join(items) + "</items></body></response>").encode("utf-8")
+
+
+_PERFORMANCES = [
+    _item(mt20id="PF1", prfnm="뮤지컬 &lt;레미제라블&gt;", fcltynm="블루스퀘어", area="서울", genrenm="뮤지컬",
+          prfpdfrom="2026.10.01", prfpdto="2026.12.31", poster="http://img/1.jpg"),
+    _item(seq="2", title="연극 햄릿", place="대학로", startdate="20261018", enddate="20261020", genre="연극"),
+    _item(mt20id="PF3", prfnm="", fcltynm="", area="부산", genrenm="콘서트"),  # 제목 없음 → 제외
+    _item(mt20id="PF4", prfnm="뮤지컬 2", fcltynm="", place="", area="대구", prfcast="", description="설명"),
+]
+
+
+def _legacy_performances(body: bytes):
+    """스트리밍 파서 도입 전 ET.fromstring + findall/findtext 변환 (네임스페이스 없는 응답 기준)"""
+    performances = []
+    for item in ET.fromstring(body).findall(".//item"):
+        title = (item.findtext("prfnm", "") or item.findtext("title", "")).strip()
+        if not title:
+            continue
+        performances.append({
+            "seq": item.findtext("seq", "") or item.findtext("mt20id", ""),
+            "title": title,
+            "place": (item.findtext("fcltynm", "") or item.findtext("place", "") or item.findtext("area", "")).strip(),
+            "start_date": item.findtext("prfpdfrom", "") or item.findtext("startdate", ""),
+            "end_date": item.findtext("prfpdto", "") or item.findtext("enddate", ""),
+            "description": (
+                item.findtext("prfcast", "") or item.findtext("description", "") or item.findtext("pcseguidance", "")
+            ).strip(),
+            "genre": (item.findtext("genrenm", "") or item.findtext("genre", "")).strip(),
+            "image_url": item.findtext("poster", "") or item.findtext("posterurl", ""),
+        })
+    return performances
+
+
+def _parse_in_chunks(body: bytes, sizes) -> list:
+    parser = XmlItemStreamParser(_PERFORMANCE_TABLE)
+    items, position = [], 0
+    for size in sizes:
+        items.extend(parser.feed(body[position:position + size]))
+        position += size
+    items.extend(parser.feed(body[position:]))
+    return items + parser.close()
+
+
+def test_matches_legacy_parser_for_plain_feed():
+    body = _feed(_PERFORMANCES)
+    parsed = _parse_in_chunks(body, [])
+    assert parsed == _legacy_performances(body)
+    assert [item["title"] for item in parsed] == ["뮤지컬 <레미제라블>", "연극 햄릿", "뮤지컬 2"]
+
+
+def test_every_split_point_and_random_chunking_yield_same_items():
+    body = _feed(_PERFORMANCES)
+    expected = _parse_in_chunks(body, [])
+    for split in range(len(body) + 1):
+        assert _parse_in_chunks(body, [split]) == expected
+    rng = random.Random(7)
+    for _ in range(50):
+        assert _parse_in_chunks(body, [rng.randint(1, 16) for _ in range(len(body))]) == expected
+
+
+def test_multibyte_characters_split_across_chunks():
+    body = _feed([_item(prfnm="한글 제목", fcltynm="예술의전당")])
+    one_byte_chunks = _parse_in_chunks(body, [1] * len(body))
+    assert one_byte_chunks[0]["title"] == "한글 제목" and one_byte_chunks[0]["place"] == "예술의전당"
+
+
+def test_namespaced_feed_matches_plain_feed():
+    plain = _parse_in_chunks(_feed(_PERFORMANCES), [])
+    namespaced = _parse_in_chunks(_feed(_PERFORMANCES, namespace="http://www.openapi.org/ns"), [])
+    assert namespaced == plain
+
+
+def test_blank_alias_falls_through_to_next_alias():
+    item, = _parse_in_chunks(_feed([_item(prfnm="  ", title="제목 대체", fcltynm="", area="대구")]), [])
+    assert item["title"] == "제목 대체" and item["place"] == "대구"
+
+
+def test_alias_priority_does_not_depend_on_tag_order():
+    body = _feed([_item(title="대체 제목", place="대체 장소", prfnm="원래 제목", area="서울", fcltynm="원래 장소")])
+    item, = _parse_in_chunks(body, [])
+    assert item["title"] == "원래 제목" and item["place"] == "원래 장소"
+
+
+def test_items_are_emitted_as_they_close_and_total_count_is_read():
+    parser = XmlItemStreamParser(compile_aliases(EXHIBITION_FIELDS))
+    assert parser.feed(b"<response><body><totalCount>120</totalCount><items><item><title>") == []
+    assert parser.total_count == 120
+    first = parser.feed("전시 1</title><poster>p.jpg</poster></item><item><exhibitionname>".encode("utf-8"))
+    assert first == [{"seq": "", "title": "전시 1", "place": "", "start_date": "", "end_date": "",
+                      "description": "", "image_url": "p.jpg"}]
+    assert [item["title"] for item in parser.feed("전시 2</exhibitionname></item>".encode("utf-8"))] == ["전시 2"]
+
+
+def test_truncated_feed_raises_on_close():
+    body = _feed(_PERFORMANCES)
+    parser = XmlItemStreamParser(_PERFORMANCE_TABLE)
+    assert len(parser.feed(body[: len(body) // 2])) >= 1
+    with pytest.raises(ET.ParseError):
+        parser.close()
+
+
+def test_service_stops_reading_once_limit_items_are_collected(monkeypatch):
+    monkeypatch.setenv("DATA_GO_KR_API_KEY", "test")
+    items = [_item(mt20id=f"PF{i}", prfnm=f"공연 {i}", fcltynm="극장") for i in range(200)]
+    body = _feed(items, total_count=200)
+    chunks_sent = []
+
+    async def body_stream():
+        for position in range(0, len(body), 512):
+            chunks_sent.append(position)
+            yield body[position:position + 512]
+
+    http_client = PooledHttpClient(HttpClientSettings(http2=False))
+    http_client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body_stream()))
+    )
+    service = CultureService(http_client=http_client, cache=TieredCache(CacheSettings()))
+
+    performances = asyncio.run(service._fetch_performances("20261018", "뮤지컬"))
+    assert [item["title"] for item in performances] == [f"공연 {i}" for i in range(15)]
+    assert all(item["genre"] == "뮤지컬" for item in performances)
+    assert len(chunks_sent) < len(body) // 512 // 4
+
+
+def test_service_caches_upstream_failure_for_error_ttl_and_returns_empty(monkeypatch):
+    monkeypatch.setenv("DATA_GO_KR_API_KEY", "test")
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(500)
+
+    http_client = PooledHttpClient(HttpClientSettings(http2=False))
+    http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    cache = TieredCache(CacheSettings(negative_ttl=60.0, error_ttl=60.0))
+    service = CultureService(http_client=http_client, cache=cache)
+
+    async def scenario():
+        return [await service.get_exhibitions("서울", "20261018") for _ in range(2)]
+
+    assert asyncio.run(scenario()) == [[], []]
+    # 두 번째 요청은 error_ttl 안의 캐시된 실패로 처리되어 외부 API를 다시 호출하지 않음
+    assert len(requests) == 1
+    stats = cache.stats()
+    assert stats["load_errors"] == 1 and stats["error_hits"] == 1
+    assert stats["negative_stores"] == 0